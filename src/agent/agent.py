@@ -3,6 +3,7 @@
 import logging
 import os
 import re
+import sqlite3
 from collections.abc import AsyncIterator
 from importlib import resources
 from pathlib import Path
@@ -12,6 +13,7 @@ from agent.config import load_config
 from agent.config.schema import AgentSettings
 from agent.tools.filesystem import FileSystemTools
 from agent.tools.hello import HelloTools
+from agent.tools.scheduler import ToolScheduler, set_tool_scheduler
 from agent.tools.toolset import AgentToolset
 
 logger = logging.getLogger(__name__)
@@ -70,7 +72,7 @@ class Agent:
 
             # With custom middleware
             >>> from agent.middleware import create_middleware
-            >>> mw = create_middleware()
+            >>> mw = create_middleware(settings)
             >>> agent = Agent(settings=settings, middleware=mw)
         """
         self.settings = settings or load_config()
@@ -112,9 +114,35 @@ class Agent:
                     except (ModuleNotFoundError, AttributeError, TypeError) as e:
                         logger.warning(f"Could not auto-detect bundled_dir: {e}")
 
+                from agent.skills.cache import SkillCache
                 from agent.skills.loader import SkillLoader
+                from agent.skills.result_cache import ScriptResultCache
+                from agent.skills.script_pool import ScriptWorkerPool
 
-                skill_loader = SkillLoader(self.settings)
+                skill_cache = (
+                    SkillCache(self.settings.agent_data_dir / "skills_cache.json")
+                    if self.settings.skills.cache_enabled
+                    else None
+                )
+                worker_pool = (
+                    ScriptWorkerPool(idle_ttl=self.settings.skills.script_worker_ttl)
+                    if self.settings.skills.script_worker_ttl > 0
+                    else None
+                )
+                result_cache = None
+                if self.settings.skills.result_cache_enabled:
+                    try:
+                        result_cache = ScriptResultCache(
+                            self.settings.agent_data_dir / "script_results.db"
+                        )
+                    except sqlite3.Error as e:
+                        logger.warning(f"Script result cache disabled: {e}")
+                skill_loader = SkillLoader(
+                    self.settings,
+                    cache=skill_cache,
+                    worker_pool=worker_pool,
+                    result_cache=result_cache,
+                )
                 skill_toolsets, script_tools, skill_docs = skill_loader.load_enabled_skills()
 
                 # Store skill documentation index for context provider
@@ -142,11 +170,19 @@ class Agent:
         for toolset in self.toolsets:
             self.tools.extend(toolset.get_tools())
 
+        # Enforce tool execution policies (concurrency, timeout, venue) in the middleware
+        self.tool_scheduler = ToolScheduler(
+            max_concurrency=self.settings.agent.tool_max_concurrency
+        )
+        for toolset in self.toolsets:
+            self.tool_scheduler.register(toolset)
+        set_tool_scheduler(self.tool_scheduler)
+
         # Initialize middleware (create default if not provided)
         if middleware is None:
             from agent.middleware import create_middleware
 
-            middleware = create_middleware()
+            middleware = create_middleware(self.settings)
         self.middleware = middleware
 
         # Create agent
@@ -376,7 +412,9 @@ Be helpful, concise, and clear in your responses."""
             from agent.memory import MemoryContextProvider
 
             memory_provider = MemoryContextProvider(
-                self.memory_manager, history_limit=self.settings.memory_history_limit
+                self.memory_manager,
+                history_limit=self.settings.memory_history_limit,
+                token_budget=self.settings.memory_context_token_budget,
             )
             context_providers.append(memory_provider)
             logger.info("Memory context provider enabled")
@@ -389,6 +427,7 @@ Be helpful, concise, and clear in your responses."""
                 skill_docs=self.skill_docs,
                 memory_manager=None,  # Not used in current implementation
                 max_skills=3,
+                token_budget=self.settings.skills.context_token_budget,
             )
             context_providers.append(skill_provider)
             logger.info(f"Skill context provider enabled with {self.skill_docs.count()} skills")
@@ -424,6 +463,17 @@ Be helpful, concise, and clear in your responses."""
         # They manage conversation context automatically through message history
         return None
 
+    def _publish_thread(self, thread: Any | None) -> None:
+        """Let the memory context provider see the thread of this run.
+
+        Args:
+            thread: Thread passed to run()/run_stream(), or None
+        """
+        if self.memory_manager is not None:
+            from agent.memory.context_provider import set_current_thread
+
+            set_current_thread(thread)
+
     async def run(self, prompt: str, thread: Any | None = None) -> str:
         """Run agent with prompt.
 
@@ -444,6 +494,7 @@ Be helpful, concise, and clear in your responses."""
             >>> thread = agent.get_new_thread()
             >>> response = await agent.run("Hello", thread=thread)
         """
+        self._publish_thread(thread)
         if thread:
             result = await self.agent.run(prompt, thread=thread)
         else:
@@ -479,6 +530,7 @@ Be helpful, concise, and clear in your responses."""
             >>> async for chunk in agent.run_stream("Hello", thread=thread):
             ...     print(chunk, end="")
         """
+        self._publish_thread(thread)
         if thread:
             stream = self.agent.run_stream(prompt, thread=thread)
         else:
@@ -487,9 +539,11 @@ Be helpful, concise, and clear in your responses."""
         async for chunk in stream:
             # Handle different provider chunk types
             # OpenAI returns str, Anthropic returns AgentRunResponseUpdate with .text
+            # Updates without text (tool calls, usage) are consumed by the framework
             if isinstance(chunk, str):
                 yield chunk
             elif hasattr(chunk, "text"):
-                yield chunk.text
+                if chunk.text:
+                    yield chunk.text
             else:
                 yield str(chunk)
@@ -120,11 +120,15 @@ async def run_single_prompt(
         if should_enable_otel:
             from agent_framework.observability import setup_observability
 
+            from agent.observability import setup_instruments
+
             setup_observability(
                 enable_sensitive_data=config.enable_sensitive_data,
                 otlp_endpoint=config.otlp_endpoint,
                 applicationinsights_connection_string=config.applicationinsights_connection_string,
             )
+            # Create middleware metric instruments once, bound to the configured providers
+            setup_instruments()
 
         # Setup session-specific logging (follows copilot pattern: ~/.agent/logs/session-{timestamp}.log)
         session_name = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
@@ -163,6 +167,13 @@ async def run_single_prompt(
         if response:
             console.print(response)
 
+        # Deferred memory writes must land before the process exits
+        if agent.memory_manager:
+            try:
+                await agent.memory_manager.flush()
+            except Exception as e:
+                logger.warning(f"Failed to flush memory writes: {e}")
+
         logger.info(
             f"[PERF] Total single-prompt execution: {(time.perf_counter() - perf_start)*1000:.1f}ms"
         )
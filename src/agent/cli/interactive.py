@@ -314,11 +314,15 @@ async def run_chat_mode(
         if should_enable_otel:
             from agent_framework.observability import setup_observability
 
+            from agent.observability import setup_instruments
+
             setup_observability(
                 enable_sensitive_data=config.enable_sensitive_data,
                 otlp_endpoint=config.otlp_endpoint,
                 applicationinsights_connection_string=config.applicationinsights_connection_string,
             )
+            # Create middleware metric instruments once, bound to the configured providers
+            setup_instruments()
 
         # Generate session name for this session (used for both logging and saving)
         session_name = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
@@ -137,6 +137,16 @@ async def auto_save_session(
 
     save_start = time.perf_counter()
 
+    # Wait for background memory writes (e.g. mem0 write-behind queue) before exit
+    if agent and agent.memory_manager:
+        try:
+            await agent.memory_manager.flush()
+            logger.info(
+                f"[PERF] Memory flush completed: {(time.perf_counter() - save_start)*1000:.1f}ms"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to flush memory writes: {e}")
+
     # Skip save for empty sessions (optimization: no conversation = nothing to persist)
     if message_count == 0:
         logger.debug("[PERF] Skipping session save - no messages exchanged")
@@ -156,13 +166,28 @@ async def auto_save_session(
                 messages=messages,
             )
 
-            # Save memory state if agent has memory enabled and using in-memory backend
-            # For semantic backends (mem0), memory is already persisted externally and
-            # fetching all entries can introduce noticeable exit latency.
+            # Fold aged memories into digests before the memory state is saved
+            if agent and agent.memory_manager and agent.settings.memory.compaction_enabled:
+                try:
+                    from agent.memory.compaction import create_compactor
+
+                    compactor = create_compactor(agent.settings, agent.chat_client)
+                    compact_result = await compactor.compact(agent.memory_manager)
+                    if not compact_result.get("success"):
+                        logger.warning(
+                            f"Memory compaction skipped: {compact_result.get('message')}"
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to compact memories: {e}")
+
+            # Save memory state if agent has memory enabled and using a process-local
+            # backend. For semantic backends (mem0), memory is already persisted
+            # externally and fetching all entries can introduce noticeable exit latency.
             if (
                 agent
                 and agent.memory_manager
-                and getattr(agent.config, "memory_type", "in_memory") == "in_memory"
+                and getattr(agent.config, "memory_type", "in_memory")
+                in ("in_memory", "vector_local")
             ):
                 try:
                     memory_result = await agent.memory_manager.get_all()
@@ -13,11 +13,14 @@ from .editor import (
 )
 from .manager import (
     ConfigurationError,
+    SettingsSnapshot,
     get_config_path,
+    get_settings_snapshot,
     load_config,
     load_config_with_env,
     merge_with_env,
     save_config,
+    set_settings_snapshot,
     validate_config,
 )
 from .schema import AgentSettings, MemoryConfig, ProviderConfig, TelemetryConfig
@@ -38,6 +41,9 @@ __all__ = [
     "save_config",
     "merge_with_env",
     "validate_config",
+    "SettingsSnapshot",
+    "get_settings_snapshot",
+    "set_settings_snapshot",
     # Defaults
     "get_default_config",
     # Editor
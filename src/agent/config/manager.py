@@ -1,7 +1,9 @@
 """Configuration file manager for loading, saving, and managing agent settings."""
 
 import json
+import logging
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +11,8 @@ from pydantic import ValidationError
 
 from .schema import AgentSettings
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigurationError(Exception):
     """Raised when configuration operations fail."""
@@ -102,6 +106,117 @@ def load_config_with_env(config_path: Path | None = None) -> AgentSettings:
     return settings
 
 
+class SettingsSnapshot:
+    """Cache of validated settings, invalidated by settings file mtime.
+
+    Hot paths (middleware running on every tool call and LLM turn) read settings
+    from this snapshot instead of calling load_config(), which re-opens the file
+    and re-runs Pydantic validation each time. The only per-read cost is a single
+    stat() of the settings file.
+
+    create_middleware() seeds a snapshot with its agent's own (already env-merged)
+    settings. When the file's mtime changes, the next read reloads via
+    load_config_with_env().
+
+    Example:
+        >>> snapshot = SettingsSnapshot()
+        >>> snapshot.set(settings)
+        >>> snapshot.get() is settings
+        True
+    """
+
+    def __init__(self, config_path: Path | None = None):
+        """Initialize an empty snapshot.
+
+        Args:
+            config_path: Optional path to config file. Defaults to ~/.agent/settings.json
+        """
+        self._config_path = config_path
+        self._settings: AgentSettings | None = None
+        self._mtime_ns: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def config_path(self) -> Path:
+        """Path of the settings file this snapshot tracks."""
+        return self._config_path or get_config_path()
+
+    def _current_mtime(self) -> int | None:
+        """Return settings file mtime in nanoseconds, or None if it doesn't exist."""
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self) -> AgentSettings:
+        """Return cached settings, reloading only if the settings file changed.
+
+        Returns:
+            Current AgentSettings snapshot
+
+        Raises:
+            ConfigurationError: If no snapshot exists yet and the file is invalid
+        """
+        mtime = self._current_mtime()
+        settings = self._settings
+        if settings is not None and mtime == self._mtime_ns:
+            return settings
+
+        with self._lock:
+            if self._settings is not None and mtime == self._mtime_ns:
+                return self._settings
+            try:
+                self._settings = load_config_with_env(self.config_path)
+            except ConfigurationError as e:
+                if self._settings is None:
+                    raise
+                # Keep serving the last good snapshot while the file is mid-edit
+                logger.warning(f"Keeping previous settings snapshot: {e}")
+            self._mtime_ns = mtime
+            return self._settings
+
+    def set(self, settings: AgentSettings) -> None:
+        """Pin settings as the current snapshot for the current file mtime.
+
+        Args:
+            settings: Settings to serve until the settings file changes
+        """
+        with self._lock:
+            self._settings = settings
+            self._mtime_ns = self._current_mtime()
+
+    def invalidate(self) -> None:
+        """Drop the cached settings so the next get() reloads from disk."""
+        with self._lock:
+            self._settings = None
+            self._mtime_ns = None
+
+
+# Global settings snapshot (read by middleware not bound to an agent's settings)
+_settings_snapshot = SettingsSnapshot()
+
+
+def get_settings_snapshot() -> AgentSettings:
+    """Get the process-wide settings snapshot.
+
+    Returns:
+        Cached AgentSettings (reloaded only when settings.json mtime changes)
+    """
+    return _settings_snapshot.get()
+
+
+def set_settings_snapshot(settings: AgentSettings | None) -> None:
+    """Set the process-wide settings snapshot.
+
+    Args:
+        settings: Settings to cache, or None to invalidate the snapshot
+    """
+    if settings is None:
+        _settings_snapshot.invalidate()
+    else:
+        _settings_snapshot.set(settings)
+
+
 def save_config(settings: AgentSettings, config_path: Path | None = None) -> None:
     """Save configuration to JSON file with minimal formatting.
 
@@ -300,6 +415,62 @@ def merge_with_env(settings: AgentSettings) -> dict[str, Any]:
         except ValueError:
             # Invalid value, fallback to default
             env_overrides.setdefault("memory", {})["history_limit"] = 20
+    if os.getenv("MEMORY_MAX_ENTRIES"):
+        try:
+            env_overrides.setdefault("memory", {})["max_entries"] = int(
+                os.getenv("MEMORY_MAX_ENTRIES", "10000")
+            )
+        except ValueError:
+            # Invalid value, fallback to default
+            env_overrides.setdefault("memory", {})["max_entries"] = 10000
+    if os.getenv("MEMORY_EMBEDDING_CACHE_ENTRIES"):
+        try:
+            env_overrides.setdefault("memory", {})["embedding_cache_entries"] = int(
+                os.getenv("MEMORY_EMBEDDING_CACHE_ENTRIES", "10000")
+            )
+        except ValueError:
+            # Invalid value, fallback to default
+            env_overrides.setdefault("memory", {})["embedding_cache_entries"] = 10000
+    if os.getenv("MEMORY_CONTEXT_TOKEN_BUDGET"):
+        try:
+            env_overrides.setdefault("memory", {})["context_token_budget"] = int(
+                os.getenv("MEMORY_CONTEXT_TOKEN_BUDGET", "2000")
+            )
+        except ValueError:
+            # Invalid value, fallback to default
+            env_overrides.setdefault("memory", {})["context_token_budget"] = 2000
+    if os.getenv("MEMORY_COMPACTION_ENABLED"):
+        env_overrides.setdefault("memory", {})["compaction_enabled"] = (
+            os.getenv("MEMORY_COMPACTION_ENABLED", "false").lower() == "true"
+        )
+    if os.getenv("MEMORY_COMPACTION_SUMMARIZER"):
+        env_overrides.setdefault("memory", {})["compaction_summarizer"] = os.getenv(
+            "MEMORY_COMPACTION_SUMMARIZER"
+        )
+    if os.getenv("MEMORY_DEDUP_ENABLED"):
+        env_overrides.setdefault("memory", {})["dedup_enabled"] = (
+            os.getenv("MEMORY_DEDUP_ENABLED", "false").lower() == "true"
+        )
+    if os.getenv("MEMORY_DEDUP_MAX_DISTANCE"):
+        try:
+            env_overrides.setdefault("memory", {})["dedup_max_distance"] = int(
+                os.getenv("MEMORY_DEDUP_MAX_DISTANCE", "3")
+            )
+        except ValueError:
+            # Invalid value, fallback to default
+            env_overrides.setdefault("memory", {})["dedup_max_distance"] = 3
+    if os.getenv("MEMORY_DEDUP_MIN_SIMILARITY"):
+        try:
+            env_overrides.setdefault("memory", {})["dedup_min_similarity"] = float(
+                os.getenv("MEMORY_DEDUP_MIN_SIMILARITY", "0.8")
+            )
+        except ValueError:
+            # Invalid value, fallback to default
+            env_overrides.setdefault("memory", {})["dedup_min_similarity"] = 0.8
+    if os.getenv("MEMORY_EVICTION_POLICY"):
+        env_overrides.setdefault("memory", {})["eviction_policy"] = os.getenv(
+            "MEMORY_EVICTION_POLICY"
+        )
 
     # Mem0 overrides
     if os.getenv("MEM0_STORAGE_PATH"):
@@ -19,7 +19,35 @@ from agent.config.constants import (
 
 # Module-level constants for validation
 VALID_PROVIDERS = {"local", "openai", "anthropic", "azure", "foundry", "gemini", "github"}
-VALID_MEMORY_TYPES = {"in_memory", "mem0"}
+VALID_MEMORY_TYPES = {"in_memory", "vector_local", "sqlite", "mem0"}
+VALID_EVICTION_POLICIES = {"lru", "time_decay", "role_weighted"}
+VALID_COMPACTION_SUMMARIZERS = {"extractive", "llm"}
+VALID_DEDUP_ACTIONS = {"merge", "skip"}
+
+# Performance tuning fields, left out of the minimal config while at their defaults
+_TUNING_FIELDS = {
+    "agent": {"tool_max_concurrency"},
+    "memory": {
+        "context_token_budget",
+        "max_entries",
+        "eviction_policy",
+        "embedding_cache_entries",
+        "compaction_enabled",
+        "compaction_summarizer",
+        "compaction_min_age_hours",
+        "compaction_batch_size",
+        "dedup_enabled",
+        "dedup_max_distance",
+        "dedup_min_similarity",
+        "dedup_action",
+    },
+    "skills": {
+        "script_worker_ttl",
+        "cache_enabled",
+        "result_cache_enabled",
+        "context_token_budget",
+    },
+}
 
 
 class LocalProviderConfig(BaseModel):
@@ -182,6 +210,42 @@ class SkillsConfig(BaseModel):
         default=1_048_576,  # 1MB
         description="Maximum output size in bytes for script execution",
     )
+    script_worker_ttl: int = Field(
+        default=300,
+        description="Seconds idle warm script runners are kept (0 runs every call with uv run)",
+    )
+
+    # Startup configuration
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache parsed skill manifests and scripts across agent starts",
+    )
+    result_cache_enabled: bool = Field(
+        default=True,
+        description="Cache script help output and results of scripts declared cacheable",
+    )
+
+    # Context injection configuration
+    context_token_budget: int = Field(
+        default=3000,
+        description="Maximum tokens of matched skill documentation injected per turn",
+    )
+
+    @field_validator("script_worker_ttl")
+    @classmethod
+    def validate_script_worker_ttl(cls, v: int) -> int:
+        """Validate warm script runner TTL is not negative."""
+        if v < 0:
+            raise ValueError(f"script_worker_ttl must be 0 or greater, got {v}")
+        return v
+
+    @field_validator("context_token_budget")
+    @classmethod
+    def validate_context_token_budget(cls, v: int) -> int:
+        """Validate skill context token budget."""
+        if v < 1:
+            raise ValueError(f"context_token_budget must be at least 1, got {v}")
+        return v
 
     @model_validator(mode="after")
     def expand_paths(self) -> "SkillsConfig":
@@ -220,6 +284,11 @@ class AgentConfig(BaseModel):
         default=1_048_576, description="Maximum content size in bytes for write operations"  # 1MB
     )
 
+    # Tool execution configuration
+    tool_max_concurrency: int = Field(
+        default=8, description="Maximum tool calls running at once across all tools"
+    )
+
     @field_validator("data_dir")
     @classmethod
     def expand_data_dir(cls, v: str) -> str:
@@ -236,6 +305,14 @@ class AgentConfig(BaseModel):
         path = Path(v).expanduser().resolve()
         return path
 
+    @field_validator("tool_max_concurrency")
+    @classmethod
+    def validate_tool_max_concurrency(cls, v: int) -> int:
+        """Validate tool concurrency limit."""
+        if v < 1:
+            raise ValueError(f"tool_max_concurrency must be at least 1, got {v}")
+        return v
+
 
 class TelemetryConfig(BaseModel):
     """Telemetry and observability configuration."""
@@ -270,6 +347,18 @@ class MemoryConfig(BaseModel):
     enabled: bool = True
     type: str = "in_memory"
     history_limit: int = 20
+    context_token_budget: int = 2000
+    max_entries: int = 10000
+    eviction_policy: str = "lru"
+    embedding_cache_entries: int = 10000
+    compaction_enabled: bool = False
+    compaction_summarizer: str = "extractive"
+    compaction_min_age_hours: float = 24.0
+    compaction_batch_size: int = 20
+    dedup_enabled: bool = False
+    dedup_max_distance: int = 3
+    dedup_min_similarity: float = 0.8
+    dedup_action: str = "merge"
     mem0: Mem0Config = Field(default_factory=Mem0Config)
 
     @field_validator("type")
@@ -280,6 +369,83 @@ class MemoryConfig(BaseModel):
             raise ValueError(f"Invalid memory type: {v}. Valid types: {VALID_MEMORY_TYPES}")
         return v
 
+    @field_validator("max_entries")
+    @classmethod
+    def validate_max_entries(cls, v: int) -> int:
+        """Validate in-memory store capacity."""
+        if v < 1:
+            raise ValueError(f"max_entries must be at least 1, got {v}")
+        return v
+
+    @field_validator("context_token_budget")
+    @classmethod
+    def validate_context_token_budget(cls, v: int) -> int:
+        """Validate memory context token budget."""
+        if v < 1:
+            raise ValueError(f"context_token_budget must be at least 1, got {v}")
+        return v
+
+    @field_validator("embedding_cache_entries")
+    @classmethod
+    def validate_embedding_cache_entries(cls, v: int) -> int:
+        """Validate embedding cache capacity (0 disables the cache)."""
+        if v < 0:
+            raise ValueError(f"embedding_cache_entries must be non-negative, got {v}")
+        return v
+
+    @field_validator("compaction_summarizer")
+    @classmethod
+    def validate_compaction_summarizer(cls, v: str) -> str:
+        """Validate compaction summarizer."""
+        if v not in VALID_COMPACTION_SUMMARIZERS:
+            raise ValueError(
+                f"Invalid compaction summarizer: {v}. "
+                f"Valid summarizers: {VALID_COMPACTION_SUMMARIZERS}"
+            )
+        return v
+
+    @field_validator("compaction_batch_size")
+    @classmethod
+    def validate_compaction_batch_size(cls, v: int) -> int:
+        """Validate number of memories folded into each digest."""
+        if v < 2:
+            raise ValueError(f"compaction_batch_size must be at least 2, got {v}")
+        return v
+
+    @field_validator("dedup_max_distance")
+    @classmethod
+    def validate_dedup_max_distance(cls, v: int) -> int:
+        """Validate near-duplicate distance (differing bits of a 64-bit SimHash)."""
+        if not 0 <= v <= 15:
+            raise ValueError(f"dedup_max_distance must be between 0 and 15, got {v}")
+        return v
+
+    @field_validator("dedup_min_similarity")
+    @classmethod
+    def validate_dedup_min_similarity(cls, v: float) -> float:
+        """Validate near-duplicate term-set similarity."""
+        if not 0.0 < v <= 1.0:
+            raise ValueError(f"dedup_min_similarity must be in (0, 1], got {v}")
+        return v
+
+    @field_validator("dedup_action")
+    @classmethod
+    def validate_dedup_action(cls, v: str) -> str:
+        """Validate what happens to near-duplicate writes."""
+        if v not in VALID_DEDUP_ACTIONS:
+            raise ValueError(f"Invalid dedup action: {v}. Valid actions: {VALID_DEDUP_ACTIONS}")
+        return v
+
+    @field_validator("eviction_policy")
+    @classmethod
+    def validate_eviction_policy(cls, v: str) -> str:
+        """Validate eviction policy."""
+        if v not in VALID_EVICTION_POLICIES:
+            raise ValueError(
+                f"Invalid eviction policy: {v}. Valid policies: {VALID_EVICTION_POLICIES}"
+            )
+        return v
+
 
 class AgentSettings(BaseModel):
     """Root configuration model for agent settings."""
@@ -301,6 +467,7 @@ class AgentSettings(BaseModel):
         Only includes:
         - Enabled providers (not disabled ones)
         - Non-null values
+        - Performance tuning fields only when changed from their defaults
 
         This creates a cleaner, more user-friendly config file that shows
         only what the user has explicitly configured.
@@ -347,6 +514,13 @@ class AgentSettings(BaseModel):
                 # Remove empty mem0 config
                 del data["memory"]["mem0"]
 
+        # Drop tuning fields still at their defaults
+        for section, fields in _TUNING_FIELDS.items():
+            config = getattr(self, section)
+            for name in fields:
+                if getattr(config, name) == type(config).model_fields[name].default:
+                    data[section].pop(name, None)
+
         return json.dumps(data, indent=2)
 
     @classmethod
@@ -503,6 +677,15 @@ class AgentSettings(BaseModel):
         """
         return self.memory.history_limit
 
+    @property
+    def memory_context_token_budget(self) -> int:
+        """Get memory context token budget.
+
+        Returns:
+            Maximum number of tokens of memory injected per turn
+        """
+        return self.memory.context_token_budget
+
     @property
     def system_prompt_file(self) -> str | None:
         """Get system prompt file path.
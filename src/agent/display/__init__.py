@@ -41,9 +41,12 @@ from agent.display.events import (
     LLMResponseEvent,
     ToolCompleteEvent,
     ToolErrorEvent,
+    ToolProgressEvent,
     ToolStartEvent,
     get_current_tool_event_id,
     get_event_emitter,
+    pop_tool_cache_info,
+    report_tool_cache_info,
     set_current_tool_event_id,
 )
 from agent.display.tree import ExecutionTreeDisplay
@@ -63,12 +66,16 @@ __all__ = [
     "LLMResponseEvent",
     "ToolCompleteEvent",
     "ToolErrorEvent",
+    "ToolProgressEvent",
     "ToolStartEvent",
     # Event emitter
     "get_event_emitter",
     # Tool event context
     "get_current_tool_event_id",
     "set_current_tool_event_id",
+    # Tool result cache info
+    "pop_tool_cache_info",
+    "report_tool_cache_info",
     # Tree display
     "ExecutionTreeDisplay",
 ]
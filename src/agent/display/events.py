@@ -74,11 +74,32 @@ class ToolCompleteEvent(ExecutionEvent):
         tool_name: Name of the tool that completed
         result_summary: Human-readable summary of results
         duration: Execution duration in seconds
+        cache_hit: Whether the result came from a result cache (None if uncached)
+        cache_hits: Hits of the tool's result cache so far
+        cache_misses: Misses of the tool's result cache so far
     """
 
     tool_name: str = ""
     result_summary: str = ""
     duration: float = 0.0
+    cache_hit: bool | None = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+@dataclass
+class ToolProgressEvent(ExecutionEvent):
+    """Event emitted when a running tool reports partial output.
+
+    Uses the event_id of the tool's ToolStartEvent.
+
+    Attributes:
+        tool_name: Name of the running tool
+        message: Latest progress line (e.g. last line of script output)
+    """
+
+    tool_name: str = ""
+    message: str = ""
 
 
 @dataclass
@@ -248,3 +269,39 @@ def get_current_tool_event_id() -> str | None:
         Current tool event ID, or None if not in a tool context
     """
     return _current_tool_event_id.get()
+
+
+# ============================================================================
+# Tool Result Cache Info
+# ============================================================================
+
+# Result cache info reported by running tools, keyed by tool event ID. Kept out
+# of the tool result so the model is not sent cache counters that change per call.
+_tool_cache_info: dict[str, dict[str, Any]] = {}
+
+
+def report_tool_cache_info(hit: bool, hits: int, misses: int) -> None:
+    """Report result cache info for the current tool's ToolCompleteEvent.
+
+    No-op outside a displayed tool call.
+
+    Args:
+        hit: Whether the result came from the cache
+        hits: Hits of the tool's result cache so far
+        misses: Misses of the tool's result cache so far
+    """
+    event_id = get_current_tool_event_id()
+    if event_id is not None:
+        _tool_cache_info[event_id] = {"hit": hit, "hits": hits, "misses": misses}
+
+
+def pop_tool_cache_info(event_id: str) -> dict[str, Any]:
+    """Take the result cache info reported by a tool call.
+
+    Args:
+        event_id: Tool event ID of the call
+
+    Returns:
+        Dict with "hit", "hits" and "misses", or an empty dict if none was reported
+    """
+    return _tool_cache_info.pop(event_id, {})
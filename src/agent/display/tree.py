@@ -14,6 +14,7 @@ from types import TracebackType
 
 from rich.console import Console, Group, RenderableType
 from rich.live import Live
+from rich.markup import escape
 from rich.text import Text
 from rich.tree import Tree
 
@@ -25,6 +26,7 @@ from agent.display.events import (
     LLMResponseEvent,
     ToolCompleteEvent,
     ToolErrorEvent,
+    ToolProgressEvent,
     ToolStartEvent,
     get_event_emitter,
 )
@@ -238,6 +240,8 @@ class ExecutionTreeDisplay:
 
         # Build label
         label_parts = [symbol, " ", node.label]
+        if node.status == "in_progress" and "progress" in node.metadata:
+            label_parts.append(f" - {escape(node.metadata['progress'])}")
         if node.status == "completed" and "summary" in node.metadata:
             label_parts.append(f" - {node.metadata['summary']}")
         if node.status == "error" and "error" in node.metadata:
@@ -416,10 +420,17 @@ class ExecutionTreeDisplay:
                 if self._current_phase:
                     self._current_phase.add_tool_node(node)
 
+        elif isinstance(event, ToolProgressEvent):
+            if event.event_id in self._node_map:
+                self._node_map[event.event_id].metadata["progress"] = event.message
+
         elif isinstance(event, ToolCompleteEvent):
             if event.event_id in self._node_map:
                 node = self._node_map[event.event_id]
-                node.complete(event.result_summary, event.duration)
+                summary = event.result_summary
+                if event.cache_hit:
+                    summary = f"{summary} (cached)"
+                node.complete(summary, event.duration)
 
         elif isinstance(event, ToolErrorEvent):
             if event.event_id in self._node_map:
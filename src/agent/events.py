@@ -214,6 +214,7 @@ try:
         LLMResponseEvent,
         ToolCompleteEvent,
         ToolErrorEvent,
+        ToolProgressEvent,
         ToolStartEvent,
         get_current_tool_event_id,
         set_current_tool_event_id,
@@ -238,6 +239,7 @@ try:
         "ToolStartEvent",
         "ToolCompleteEvent",
         "ToolErrorEvent",
+        "ToolProgressEvent",
         "get_display_event_emitter",
         "get_current_tool_event_id",
         "set_current_tool_event_id",
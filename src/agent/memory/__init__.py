@@ -8,6 +8,8 @@ experiences.
 Key Components:
     - MemoryManager: Abstract base class for memory operations
     - InMemoryStore: In-memory implementation with keyword search
+    - LocalVectorStore: Local fuzzy search over hashed n-gram vectors (NumPy)
+    - SQLiteMemoryStore: Durable SQLite storage with FTS5 keyword search
     - Mem0Store: Semantic memory with vector-based search (optional)
     - MemoryPersistence: Serialization and persistence utilities
 
@@ -17,11 +19,14 @@ Example:
     >>> await memory.add([{"role": "user", "content": "Hello"}])
 """
 
+import importlib.util
 import logging
+import sqlite3
 from typing import TYPE_CHECKING
 
 from agent.memory.context_provider import MemoryContextProvider
 from agent.memory.manager import MemoryManager
+from agent.memory.sqlite_store import SQLiteMemoryStore
 from agent.memory.store import InMemoryStore
 
 # Conditional import for optional mem0 dependency
@@ -39,10 +44,19 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "MemoryManager",
     "InMemoryStore",
+    "SQLiteMemoryStore",
     "MemoryContextProvider",
     "create_memory_manager",
 ]
 
+# LocalVectorStore needs NumPy (installed with agent-framework)
+try:
+    from agent.memory.vector_store import LocalVectorStore  # noqa: F401
+
+    __all__.append("LocalVectorStore")
+except ImportError:
+    pass
+
 # Only export Mem0Store if it's available
 try:
     from agent.memory.mem0_store import Mem0Store  # noqa: F401
@@ -58,9 +72,13 @@ def create_memory_manager(config: "AgentSettings") -> MemoryManager:
 
     Routes to appropriate memory backend based on config.memory_type:
     - "in_memory": InMemoryStore (keyword search, ephemeral)
+    - "vector_local": LocalVectorStore (hashed-vector fuzzy search, no network)
+    - "sqlite": SQLiteMemoryStore (FTS5 search, persistent across sessions)
     - "mem0": Mem0Store (semantic search, persistent)
 
-    Falls back to InMemoryStore if mem0 initialization fails or provider is incompatible.
+    Falls back to InMemoryStore if mem0 is not installed or the provider is
+    incompatible. Mem0Store itself initializes in the background and degrades
+    to InMemoryStore if that fails.
 
     Args:
         config: AgentSettings instance with memory settings
@@ -90,11 +108,15 @@ def create_memory_manager(config: "AgentSettings") -> MemoryManager:
             pass
 
         try:
+            if importlib.util.find_spec("mem0") is None:
+                raise ImportError("mem0ai package not installed")
+
             # Lazy import to avoid dependency if not using mem0
             from agent.memory.mem0_store import Mem0Store
 
+            # mem0/chromadb load in a background thread, off the startup path
             logger.info("Creating Mem0Store for semantic memory")
-            return Mem0Store(config)
+            return Mem0Store(config, background=True)
         except Exception as e:
             logger.warning(
                 f"Failed to initialize Mem0Store: {e}. "
@@ -103,6 +125,22 @@ def create_memory_manager(config: "AgentSettings") -> MemoryManager:
             )
             # Fall back to InMemoryStore
             return InMemoryStore(config)
+    elif config.memory_type == "vector_local":
+        try:
+            from agent.memory.vector_store import LocalVectorStore
+
+            logger.info("Creating LocalVectorStore for local semantic memory")
+            return LocalVectorStore(config)
+        except ImportError as e:
+            logger.warning(f"vector_local memory unavailable ({e}). Falling back to InMemoryStore.")
+            return InMemoryStore(config)
+    elif config.memory_type == "sqlite":
+        try:
+            logger.info("Creating SQLiteMemoryStore for persistent memory")
+            return SQLiteMemoryStore(config)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to open SQLite memory: {e}. Falling back to InMemoryStore.")
+            return InMemoryStore(config)
     else:
         # Default to InMemoryStore
         logger.debug(f"Creating InMemoryStore for memory type: {config.memory_type}")
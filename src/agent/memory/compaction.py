@@ -0,0 +1,296 @@
+"""Hierarchical compaction of aged memories into summarized digests.
+
+Raw conversation turns are kept verbatim by the memory backends, so the
+retrieval candidate set and the injected context grow with every session.
+MemoryCompactor periodically folds memories older than a minimum age into
+digest entries, in batches. Each digest records provenance (the IDs and time
+span of the memories it replaces) and the backend archives or removes the
+originals, so searches hit the digests first.
+
+Summarizers are plain async callables taking the batch of memory dicts and
+returning the digest text, so custom ones can be passed to MemoryCompactor
+directly. Two are provided: ExtractiveSummarizer (local, no network) and
+ChatClientSummarizer (LLM call through the configured chat client).
+"""
+
+import logging
+import math
+import re
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from agent.utils.responses import create_success_response
+from agent.utils.text_index import tokenize
+
+if TYPE_CHECKING:
+    from agent.config.schema import AgentSettings
+    from agent.memory.manager import MemoryManager
+
+logger = logging.getLogger(__name__)
+
+Summarizer = Callable[[list[dict]], Awaitable[str]]
+
+# Metadata kind of digest entries (raw memories have no kind)
+DIGEST_KIND = "digest"
+
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+def is_digest(memory: dict) -> bool:
+    """Check whether a memory is a compaction digest.
+
+    Args:
+        memory: Memory dict
+
+    Returns:
+        True if the memory was produced by compaction
+    """
+    return (memory.get("metadata") or {}).get("kind") == DIGEST_KIND
+
+
+def _memory_time(memory: dict) -> datetime | None:
+    """Parse a memory's timestamp as an aware datetime (naive values are local time)."""
+    timestamp = memory.get("timestamp") or ""
+    try:
+        return datetime.fromisoformat(str(timestamp).replace("Z", "+00:00")).astimezone(UTC)
+    except ValueError:
+        return None
+
+
+class ExtractiveSummarizer:
+    """Local summarizer that keeps the most central sentences of a batch.
+
+    Sentences are scored by how many memories of the batch share their terms
+    (normalized by sentence length) and the best ones are kept in their
+    original order. No network or model is needed.
+
+    Example:
+        >>> summarize = ExtractiveSummarizer(max_sentences=3)
+        >>> await summarize([{"role": "user", "content": "My name is Alice."}])
+        'user: My name is Alice.'
+    """
+
+    def __init__(self, max_sentences: int = 8):
+        """Initialize summarizer.
+
+        Args:
+            max_sentences: Maximum number of sentences kept in a digest
+        """
+        self.max_sentences = max_sentences
+
+    async def __call__(self, memories: list[dict]) -> str:
+        """Summarize a batch of memories.
+
+        Args:
+            memories: Memory dicts, oldest first
+
+        Returns:
+            Digest text (empty if the memories have no content)
+        """
+        sentences: list[tuple[str, str, list[str]]] = []
+        document_frequency: Counter[str] = Counter()
+        for memory in memories:
+            content = str(memory.get("content") or "").strip()
+            if not content:
+                continue
+            role = memory.get("role", "unknown")
+            document_frequency.update(set(tokenize(content)))
+            for sentence in _SENTENCE_PATTERN.split(content):
+                sentence = sentence.strip()
+                if sentence:
+                    sentences.append((role, sentence, tokenize(sentence)))
+
+        scored = []
+        seen: set[str] = set()
+        for position, (role, sentence, terms) in enumerate(sentences):
+            key = sentence.casefold()
+            if key in seen:
+                continue
+            seen.add(key)
+            score = sum(document_frequency[t] for t in set(terms)) / math.sqrt(len(terms) or 1)
+            scored.append((score, position, f"{role}: {sentence}"))
+
+        best = sorted(scored, key=lambda item: (-item[0], item[1]))[: self.max_sentences]
+        return " ".join(text for _, _, text in sorted(best, key=lambda item: item[1]))
+
+
+class ChatClientSummarizer:
+    """Summarizer that asks the configured LLM to write the digest.
+
+    Falls back to ExtractiveSummarizer if the call fails or returns no text,
+    so compaction never loses a batch to a transient API error.
+
+    Example:
+        >>> summarize = ChatClientSummarizer(agent.chat_client)
+        >>> await summarize(memories)
+    """
+
+    PROMPT = (
+        "Summarize the following conversation excerpts into a concise digest for "
+        "long-term memory. Keep facts about the user, decisions, preferences and "
+        "open tasks; drop small talk. Answer with the digest only."
+    )
+
+    def __init__(self, chat_client: Any, fallback: Summarizer | None = None):
+        """Initialize summarizer.
+
+        Args:
+            chat_client: Agent Framework chat client (get_response())
+            fallback: Summarizer used when the LLM call fails (default: extractive)
+        """
+        self.chat_client = chat_client
+        self.fallback = fallback or ExtractiveSummarizer()
+
+    async def __call__(self, memories: list[dict]) -> str:
+        """Summarize a batch of memories with the LLM.
+
+        Args:
+            memories: Memory dicts, oldest first
+
+        Returns:
+            Digest text
+        """
+        from agent_framework import ChatMessage
+
+        transcript = "\n".join(
+            f"{memory.get('role', 'unknown')}: {memory.get('content', '')}" for memory in memories
+        )
+        try:
+            response = await self.chat_client.get_response(
+                [
+                    ChatMessage(role="system", text=self.PROMPT),
+                    ChatMessage(role="user", text=transcript),
+                ]
+            )
+            text = str(getattr(response, "text", "") or "").strip()
+            if text:
+                return text
+            logger.warning("LLM returned an empty digest, using extractive summary")
+        except Exception as e:
+            logger.warning(f"LLM summarization failed: {e}, using extractive summary")
+        return await self.fallback(memories)
+
+
+class MemoryCompactor:
+    """Fold aged memories into digest entries.
+
+    Raw memories older than min_age are grouped into batches of batch_size
+    (oldest first) and each full batch is summarized into one digest. Nothing
+    happens until at least one full batch of aged memories exists, so the
+    trigger is both age- and count-based. Digests are never compacted again.
+
+    Attributes:
+        summarizer: Async callable producing digest text from a batch
+        min_age: Memories younger than this are left alone
+        batch_size: Number of memories folded into each digest
+
+    Example:
+        >>> compactor = MemoryCompactor(ExtractiveSummarizer(), timedelta(hours=24), 20)
+        >>> await compactor.compact(memory_manager)
+    """
+
+    def __init__(
+        self,
+        summarizer: Summarizer,
+        min_age: timedelta = timedelta(hours=24),
+        batch_size: int = 20,
+    ):
+        """Initialize compactor.
+
+        Args:
+            summarizer: Async callable producing digest text from a batch
+            min_age: Memories younger than this are left alone
+            batch_size: Number of memories folded into each digest
+        """
+        self.summarizer = summarizer
+        self.min_age = min_age
+        self.batch_size = max(batch_size, 2)
+
+    async def compact(self, memory_manager: "MemoryManager") -> dict:
+        """Compact aged memories of a memory manager into digests.
+
+        Args:
+            memory_manager: Backend to compact (must support replace_with_digest())
+
+        Returns:
+            Structured response dict with the created digests
+        """
+        result = await memory_manager.get_all()
+        if not result.get("success"):
+            return result
+
+        cutoff = datetime.now(UTC) - self.min_age
+        aged = []
+        for memory in result["result"] or []:
+            metadata = memory.get("metadata") or {}
+            if is_digest(memory) or metadata.get("compacted_into"):
+                continue
+            created = _memory_time(memory)
+            if created is not None and created <= cutoff:
+                aged.append((created, memory))
+        aged.sort(key=lambda item: item[0])
+        candidates = [memory for _, memory in aged]
+
+        full = len(candidates) - len(candidates) % self.batch_size
+        if not full:
+            return create_success_response(result=[], message="No memories to compact")
+
+        digests = []
+        for start in range(0, full, self.batch_size):
+            batch = candidates[start : start + self.batch_size]
+            summary = (await self.summarizer(batch)).strip()
+            if not summary:
+                continue
+            digest = {
+                "role": "assistant",
+                "content": summary,
+                "metadata": {
+                    "kind": DIGEST_KIND,
+                    "digest_id": uuid.uuid4().hex,
+                    "source_ids": [memory["id"] for memory in batch],
+                    "source_start": batch[0].get("timestamp", ""),
+                    "source_end": batch[-1].get("timestamp", ""),
+                },
+            }
+            replaced = await memory_manager.replace_with_digest(
+                [memory["id"] for memory in batch], digest
+            )
+            if not replaced.get("success"):
+                return replaced
+            digests.append(digest)
+
+        logger.info(f"Compacted {full} memories into {len(digests)} digests")
+        return create_success_response(
+            result=digests, message=f"Compacted {full} memories into {len(digests)} digests"
+        )
+
+
+def create_compactor(config: "AgentSettings", chat_client: Any = None) -> MemoryCompactor:
+    """Create a compactor from memory settings.
+
+    Args:
+        config: Agent settings (memory.compaction_* fields)
+        chat_client: Chat client used by the "llm" summarizer
+
+    Returns:
+        Configured MemoryCompactor
+
+    Raises:
+        ValueError: If the "llm" summarizer is configured without a chat client
+    """
+    memory = config.memory
+    summarizer: Summarizer
+    if memory.compaction_summarizer == "llm":
+        if chat_client is None:
+            raise ValueError("LLM memory compaction requires a chat client")
+        summarizer = ChatClientSummarizer(chat_client)
+    else:
+        summarizer = ExtractiveSummarizer()
+    return MemoryCompactor(
+        summarizer,
+        min_age=timedelta(hours=memory.compaction_min_age_hours),
+        batch_size=memory.compaction_batch_size,
+    )
@@ -4,20 +4,58 @@ This module provides a ContextProvider that manages conversation memory,
 injecting relevant memories before LLM calls and storing new messages after.
 """
 
+import contextvars
 import logging
+import time
 from collections.abc import MutableSequence, Sequence
 from typing import Any
 
 from agent_framework import ChatMessage, Context, ContextProvider
 
+from agent.observability import record_context_provider_duration, record_memory_context_tokens
+from agent.utils.text_index import tokenize
+from agent.utils.tokens import count_tokens
+
 logger = logging.getLogger(__name__)
 
+CONTEXT_HEADER = "Previous conversation history:"
+
+# Memories whose term sets overlap at least this much (Jaccard) with an already
+# selected memory are treated as near-duplicates and injected only once
+NEAR_DUPLICATE_THRESHOLD = 0.9
+
+# Thread of the agent run in progress. Agent Framework does not pass the thread
+# to invoking(), so Agent.run()/run_stream() publish it here.
+_current_thread: contextvars.ContextVar[Any] = contextvars.ContextVar(
+    "memory_current_thread", default=None
+)
+
+
+def set_current_thread(thread: Any) -> None:
+    """Set the thread of the agent run in progress.
+
+    Args:
+        thread: AgentThread being run, or None for a run on a new thread
+    """
+    _current_thread.set(thread)
+
+
+def get_current_thread() -> Any:
+    """Get the thread of the agent run in progress.
+
+    Returns:
+        AgentThread being run, or None if unknown
+    """
+    return _current_thread.get()
+
 
 class MemoryContextProvider(ContextProvider):
     """Manage conversation memory using Agent Framework's ContextProvider pattern.
 
     This context provider:
-    - Injects relevant memories before LLM calls (via invoking())
+    - Injects relevant memories before LLM calls (via invoking()), skipping
+      memories already in the thread's message history and near-duplicates,
+      within a token budget
     - Stores new messages after LLM responds (via invoked())
     - Provides conversation history for context continuity
 
@@ -31,15 +69,20 @@ class MemoryContextProvider(ContextProvider):
         ... )
     """
 
-    def __init__(self, memory_manager: Any, history_limit: int = 20):
+    def __init__(self, memory_manager: Any, history_limit: int = 20, token_budget: int = 2000):
         """Initialize context provider with memory manager.
 
         Args:
             memory_manager: MemoryManager instance for storage/retrieval
             history_limit: Maximum number of memories to inject as context (default: 20)
+            token_budget: Maximum tokens of memory context injected per turn (default: 2000)
         """
         self.memory_manager = memory_manager
         self.history_limit = history_limit
+        self.token_budget = token_budget
+        # Token accounting for the most recent invoking() call
+        self.last_tokens_injected = 0
+        self.last_tokens_saved = 0
         logger.debug("MemoryContextProvider initialized")
 
     async def invoking(
@@ -48,15 +91,22 @@ class MemoryContextProvider(ContextProvider):
         """Inject relevant memories before agent invocation.
 
         Retrieves relevant conversation history from memory using semantic/keyword
-        search and injects it as context instructions for the LLM.
+        search and injects it as context instructions for the LLM. Memories whose
+        content is already in the thread (its stored history or the new messages),
+        and near-duplicates of memories already selected, are dropped; the rest
+        are added in retrieval order while they fit in the token budget.
 
         Args:
-            messages: Current conversation messages
-            **kwargs: Additional context
+            messages: New messages of this run
+            **kwargs: Additional context; ``thread`` is the AgentThread being run
+                (defaults to the one published by set_current_thread())
 
         Returns:
             Context with conversation history instructions
         """
+        start_time = time.perf_counter()
+        self.last_tokens_injected = 0
+        self.last_tokens_saved = 0
         try:
             # Convert ChatMessage to dict format for memory manager
             messages_dicts = []
@@ -74,20 +124,15 @@ class MemoryContextProvider(ContextProvider):
             )
 
             if result.get("success") and result["result"]:
-                memories = result["result"]
-                logger.debug(f"Injecting {len(memories)} relevant memories into context")
-
-                # Build context from relevant memories
-                context_parts = ["Previous conversation history:"]
-                for mem in memories:
-                    role = mem.get("role", "unknown")
-                    content = mem.get("content", "")
-                    context_parts.append(f"{role}: {content}")
-
-                context_text = "\n".join(context_parts)
-                logger.debug(f"Memory context: {context_text[:200]}...")
-
-                return Context(instructions=context_text)
+                thread = kwargs.get("thread") or get_current_thread()
+                thread_texts = [m["content"] for m in messages_dicts]
+                thread_texts.extend(await self._get_thread_texts(thread))
+                context_text = self._build_context(result["result"], thread_texts)
+                if context_text:
+                    logger.debug(f"Memory context: {context_text[:200]}...")
+                    return Context(instructions=context_text)
+                logger.debug("All relevant memories already in context")
+                return Context()
             else:
                 logger.debug("No relevant memories to inject")
                 return Context()
@@ -95,6 +140,8 @@ class MemoryContextProvider(ContextProvider):
         except Exception as e:
             logger.error(f"Error retrieving memories for context: {e}", exc_info=True)
             return Context()
+        finally:
+            record_context_provider_duration("memory", time.perf_counter() - start_time)
 
     async def invoked(
         self,
@@ -140,9 +187,9 @@ class MemoryContextProvider(ContextProvider):
                             {"role": str(getattr(msg, "role", "assistant")), "content": text}
                         )
 
-            # Store in memory
+            # Store in memory (deferred: slow backends write in the background)
             if messages_to_store:
-                result = await self.memory_manager.add(messages_to_store)
+                result = await self.memory_manager.add_deferred(messages_to_store)
                 if result.get("success"):
                     logger.debug(f"Stored {len(messages_to_store)} messages in memory")
                 else:
@@ -153,6 +200,87 @@ class MemoryContextProvider(ContextProvider):
         except Exception as e:
             logger.error(f"Error storing messages in memory: {e}", exc_info=True)
 
+    async def _get_thread_texts(self, thread: Any) -> list[str]:
+        """Get texts of the messages stored in a thread's message history.
+
+        Args:
+            thread: AgentThread being run, or None
+
+        Returns:
+            Message texts (empty for no thread or a service-managed thread)
+        """
+        message_store = getattr(thread, "message_store", None)
+        if message_store is None:
+            return []
+        texts = []
+        for msg in await message_store.list_messages() or []:
+            text = self._get_message_text(msg)
+            if text:
+                texts.append(text)
+        return texts
+
+    def _build_context(self, memories: list[dict[str, Any]], thread_texts: list[str]) -> str:
+        """Format retrieved memories as context within the token budget.
+
+        Records injected and saved tokens for this turn on last_tokens_injected
+        and last_tokens_saved, and as memory context metrics.
+
+        Args:
+            memories: Retrieved memories, most relevant first
+            thread_texts: Texts of the messages already in the thread
+
+        Returns:
+            Context text, or empty string if no memory was selected
+        """
+        thread_contents = {_normalize(text) for text in thread_texts}
+        selected_terms: list[set[str]] = []
+        lines: list[str] = []
+        used = count_tokens(CONTEXT_HEADER)
+        injected = 0
+        saved = 0
+        skipped_thread = skipped_duplicates = skipped_budget = 0
+
+        for mem in memories:
+            content = mem.get("content", "")
+            line = f"{mem.get('role', 'unknown')}: {content}"
+            tokens = count_tokens(line)
+
+            if _normalize(content) in thread_contents:
+                skipped_thread += 1
+                saved += tokens
+                continue
+
+            terms = set(tokenize(content))
+            if any(_is_near_duplicate(terms, other) for other in selected_terms):
+                skipped_duplicates += 1
+                saved += tokens
+                continue
+
+            # Skip (rather than stop at) a memory that doesn't fit: a shorter,
+            # less relevant one may still use the remaining budget
+            if used + tokens > self.token_budget:
+                skipped_budget += 1
+                saved += tokens
+                continue
+
+            lines.append(line)
+            selected_terms.append(terms)
+            used += tokens
+            injected += tokens
+
+        self.last_tokens_injected = injected
+        self.last_tokens_saved = saved
+        record_memory_context_tokens(injected, saved)
+        logger.debug(
+            f"Injecting {len(lines)}/{len(memories)} memories ({injected} tokens); "
+            f"skipped {skipped_thread} in thread, {skipped_duplicates} near-duplicate, "
+            f"{skipped_budget} over budget ({saved} tokens saved)"
+        )
+
+        if not lines:
+            return ""
+        return "\n".join([CONTEXT_HEADER, *lines])
+
     def _get_message_text(self, msg: ChatMessage) -> str:
         """Extract text from a ChatMessage.
 
@@ -177,3 +305,30 @@ class MemoryContextProvider(ContextProvider):
     # Note: Serialization is handled by ThreadPersistence.save_memory_state()
     # and MemoryPersistence, not by this ContextProvider.
     # The provider is stateless and just wraps the memory_manager.
+
+
+def _normalize(text: str) -> str:
+    """Normalize text for exact-duplicate comparison (case and whitespace).
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Case-folded text with whitespace collapsed
+    """
+    return " ".join(text.casefold().split())
+
+
+def _is_near_duplicate(terms: set[str], other: set[str]) -> bool:
+    """Check whether two term sets are near-duplicates.
+
+    Args:
+        terms: Terms of the candidate memory
+        other: Terms of an already selected memory
+
+    Returns:
+        True if their Jaccard similarity reaches NEAR_DUPLICATE_THRESHOLD
+    """
+    if not terms or not other:
+        return terms == other
+    return len(terms & other) / len(terms | other) >= NEAR_DUPLICATE_THRESHOLD
@@ -0,0 +1,236 @@
+"""Near-duplicate detection for memory writes.
+
+Users repeat themselves and restored sessions re-add persisted memories, so
+the add path of the memory backends checks new content against what is
+already stored. Each message gets a 64-bit SimHash over its terms and term
+bigrams; two messages are candidates when their fingerprints differ in at
+most ``max_distance`` bits.
+
+Fingerprints are indexed by locality-sensitive banding: the 64 bits are split
+into ``max_distance + 1`` bands, and by the pigeonhole principle any two
+fingerprints within ``max_distance`` bits agree on at least one whole band. A
+lookup therefore only compares against fingerprints sharing a band, not
+against every stored memory, and never misses a candidate.
+
+SimHash has few features to work with on short messages ("fact 12" and
+"fact 407" can land a few bits apart), so candidates are confirmed by the
+Jaccard similarity of their term sets (``min_similarity``).
+"""
+
+import hashlib
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from agent.observability import record_memory_dedup
+from agent.utils.text_index import tokenize
+
+if TYPE_CHECKING:
+    from agent.config.schema import AgentSettings
+
+FINGERPRINT_BITS = 64
+
+# SimHash fingerprint and term set of a message
+Signature = tuple[int, frozenset[str]]
+
+
+def simhash(text: str) -> int:
+    """Compute the 64-bit SimHash fingerprint of text.
+
+    Features are the text's terms (see agent.utils.text_index.tokenize) and
+    adjacent term pairs, so word order contributes without dominating.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Fingerprint as an unsigned 64-bit integer (0 for text without terms)
+
+    Example:
+        >>> simhash("My name is Alice") == simhash("my name is alice!")
+        True
+    """
+    terms = tokenize(text)
+    if not terms:
+        return 0
+    features = terms + [f"{a} {b}" for a, b in zip(terms, terms[1:], strict=False)]
+
+    # Per-bit counts of set feature bits, kept bit-sliced: planes[k] holds bit
+    # k of all 64 counters, so adding a feature hash is a ripple-carry add over
+    # a few integers instead of a 64-iteration loop.
+    planes: list[int] = []
+    for feature in features:
+        # blake2b is stable across processes (unlike hash())
+        carry = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for k, plane in enumerate(planes):
+            planes[k] = plane ^ carry
+            carry &= plane
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+
+    # A bit is set when more than half of the features set it
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        count = 0
+        for k, plane in enumerate(planes):
+            count |= (plane >> bit & 1) << k
+        if 2 * count > len(features):
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+class NearDuplicateDetector:
+    """LSH index of SimHash fingerprints for stored memories.
+
+    Attributes:
+        max_distance: Maximum differing fingerprint bits for near-duplicate candidates
+        min_similarity: Minimum term-set Jaccard similarity confirming a candidate
+        checked: Number of messages checked with find()
+        duplicates: Number of checks that found a near-duplicate
+
+    Example:
+        >>> detector = NearDuplicateDetector(max_distance=3)
+        >>> detector.add(1, detector.signature("user", "I like Python"))
+        >>> detector.find(detector.signature("user", "I like python."))
+        1
+    """
+
+    def __init__(self, max_distance: int = 3, min_similarity: float = 0.8, backend: str = "memory"):
+        """Initialize an empty detector.
+
+        Args:
+            max_distance: Maximum differing fingerprint bits for near-duplicate candidates
+            min_similarity: Minimum term-set Jaccard similarity confirming a candidate
+            backend: Backend name used as the dedup metric attribute
+        """
+        self.max_distance = max_distance
+        self.min_similarity = min_similarity
+        self.backend = backend
+        self.checked = 0
+        self.duplicates = 0
+        bands = max_distance + 1
+        width = FINGERPRINT_BITS // bands
+        # (shift, mask) per band; the last band takes the remaining bits
+        self._bands = [
+            (i * width, (1 << (width if i < bands - 1 else FINGERPRINT_BITS - i * width)) - 1)
+            for i in range(bands)
+        ]
+        self._buckets: list[dict[int, set[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: dict[Hashable, Signature] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed memories."""
+        return len(self._signatures)
+
+    @property
+    def dedup_rate(self) -> float:
+        """Fraction of checked texts that were near-duplicates."""
+        return self.duplicates / self.checked if self.checked else 0.0
+
+    def signature(self, role: str, content: str) -> Signature:
+        """Compute the signature (SimHash fingerprint and term set) of a message.
+
+        The role is part of the signature, so a user statement and an
+        assistant echo of it are not merged.
+
+        Args:
+            role: Message role
+            content: Message content
+
+        Returns:
+            Signature used by find() and add()
+        """
+        text = f"{role}: {content}"
+        return simhash(text), frozenset(tokenize(text))
+
+    def find(self, signature: Signature) -> Hashable | None:
+        """Find an indexed memory that is a near-duplicate of a message.
+
+        Messages without terms never match. Counts toward the dedup
+        statistics and metrics.
+
+        Args:
+            signature: Signature of the new message
+
+        Returns:
+            Key of the closest near-duplicate, or None
+        """
+        self.checked += 1
+        match = None
+        fingerprint, terms = signature
+        if fingerprint:
+            best = self.max_distance + 1
+            for (shift, mask), buckets in zip(self._bands, self._buckets, strict=True):
+                for key in buckets.get(fingerprint >> shift & mask, ()):
+                    other_fingerprint, other_terms = self._signatures[key]
+                    distance = (fingerprint ^ other_fingerprint).bit_count()
+                    if distance < best and _jaccard(terms, other_terms) >= self.min_similarity:
+                        match, best = key, distance
+        if match is not None:
+            self.duplicates += 1
+        record_memory_dedup(match is not None, self.backend)
+        return match
+
+    def add(self, key: Hashable, signature: Signature) -> None:
+        """Index a stored memory.
+
+        Args:
+            key: Memory ID
+            signature: Signature of the memory (see signature())
+        """
+        fingerprint = signature[0]
+        if not fingerprint:
+            return
+        self._signatures[key] = signature
+        for (shift, mask), buckets in zip(self._bands, self._buckets, strict=True):
+            buckets.setdefault(fingerprint >> shift & mask, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a memory from the index (no-op if not indexed).
+
+        Args:
+            key: Memory ID
+        """
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        fingerprint = signature[0]
+        for (shift, mask), buckets in zip(self._bands, self._buckets, strict=True):
+            band = fingerprint >> shift & mask
+            bucket = buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del buckets[band]
+
+    def clear(self) -> None:
+        """Remove all indexed memories (statistics are kept)."""
+        self._signatures.clear()
+        for buckets in self._buckets:
+            buckets.clear()
+
+
+def create_detector(config: "AgentSettings", backend: str) -> NearDuplicateDetector | None:
+    """Create a near-duplicate detector from memory settings.
+
+    Args:
+        config: Agent settings (memory.dedup_* fields)
+        backend: Backend name used as the dedup metric attribute
+
+    Returns:
+        NearDuplicateDetector, or None if deduplication is disabled
+    """
+    if not config.memory.dedup_enabled:
+        return None
+    return NearDuplicateDetector(
+        max_distance=config.memory.dedup_max_distance,
+        min_similarity=config.memory.dedup_min_similarity,
+        backend=backend,
+    )
+
+
+def _jaccard(terms: frozenset[str], other: frozenset[str]) -> float:
+    """Jaccard similarity of two term sets."""
+    union = len(terms | other)
+    return len(terms & other) / union if union else 1.0
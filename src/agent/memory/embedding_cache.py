@@ -0,0 +1,185 @@
+"""Persistent embedding cache for the mem0 backend.
+
+mem0 embeds text on every add (each extracted fact) and search (the query),
+calling the embedding API even for text it has embedded before, in this
+session or an earlier one. This module keeps embeddings in a SQLite file keyed
+by a hash of the model and text, and wraps mem0's embedder so repeated content
+is served locally.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    vector BLOB NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used);
+"""
+
+
+class EmbeddingCache:
+    """Size-bounded LRU cache of embedding vectors stored in SQLite.
+
+    Vectors are stored as float32. When the cache grows past max_entries the
+    least recently used entries are deleted, plus 5% headroom so eviction
+    does not run on every insert.
+
+    Attributes:
+        path: Path to the SQLite cache file
+        max_entries: Maximum number of cached embeddings
+        hits: Lookups served from the cache
+        misses: Lookups that had to call the embedder
+
+    Example:
+        >>> cache = EmbeddingCache(Path("~/.agent/memory/embedding_cache.db"))
+        >>> key = cache.key("text-embedding-3-small", "My name is Alice")
+        >>> cache.get(key) or cache.put(key, embed("My name is Alice"))
+    """
+
+    def __init__(self, path: Path, max_entries: int = 10000):
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite database file
+            max_entries: Maximum number of cached embeddings
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT COUNT(*), MAX(last_used) FROM embeddings").fetchone()
+        self._count = int(row[0])
+        self._clock = int(row[1] or 0)
+
+    def __len__(self) -> int:
+        """Return the number of cached embeddings."""
+        return self._count
+
+    @staticmethod
+    def key(model: str, text: str, action: str | None = None) -> str:
+        """Build the cache key for a piece of text.
+
+        Args:
+            model: Embedding model name (vectors differ across models)
+            text: Text being embedded
+            action: mem0 memory action, for embedders whose output depends on it
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        return hashlib.sha256(f"{model}\0{action or ''}\0{text}".encode()).hexdigest()
+
+    def get(self, key: str) -> list[float] | None:
+        """Look up an embedding and mark it as recently used.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            The cached vector, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._clock += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?", (self._clock, key)
+                )
+        return array("f", row[0]).tolist()
+
+    def put(self, key: str, vector: list[float]) -> list[float]:
+        """Store an embedding, evicting least recently used entries if full.
+
+        Args:
+            key: Cache key from key()
+            vector: Embedding vector
+
+        Returns:
+            The vector, unchanged
+        """
+        blob = array("f", vector).tobytes()
+        with self._lock, self._conn:
+            self._clock += 1
+            exists = self._conn.execute("SELECT 1 FROM embeddings WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                (key, blob, self._clock),
+            )
+            if exists is None:
+                self._count += 1
+            if self._count > self.max_entries:
+                overflow = self._count - self.max_entries + self.max_entries // 20
+                cursor = self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN "
+                    "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (overflow,),
+                )
+                self._count -= cursor.rowcount
+                logger.debug(f"Evicted {cursor.rowcount} cached embeddings")
+        return vector
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": self._count}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbedder:
+    """Wrap a mem0 embedder so embed() is served from an EmbeddingCache.
+
+    Every other attribute is delegated to the wrapped embedder.
+
+    Args:
+        embedder: mem0 embedder instance (has embed(text, memory_action=None))
+        cache: Embedding cache
+        model: Embedding model name, part of the cache key
+
+    Example:
+        >>> memory.embedding_model = CachedEmbedder(memory.embedding_model, cache, model)
+    """
+
+    def __init__(self, embedder: Any, cache: EmbeddingCache, model: str):
+        self.embedder = embedder
+        self.cache = cache
+        self.model = model
+
+    def embed(self, text: str, memory_action: str | None = None) -> list[float]:
+        """Return the embedding for text, calling the wrapped embedder on a miss."""
+        key = self.cache.key(self.model, text, memory_action)
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.cache.put(key, list(self.embedder.embed(text, memory_action)))
+        return vector
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.embedder, name)
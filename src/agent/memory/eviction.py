@@ -0,0 +1,44 @@
+"""Eviction policies for the bounded in-memory store.
+
+A policy maps a memory entry to a retention score; when InMemoryStore is over
+capacity, the entries with the lowest scores are evicted first. Policies are
+plain callables so custom ones can be passed to InMemoryStore directly.
+"""
+
+import math
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agent.memory.store import MemoryEntry
+
+EvictionPolicy = Callable[["MemoryEntry", float], float]
+
+# Age (seconds) at which a memory's time-decay score halves
+DECAY_HALF_LIFE_SECONDS = 3600.0
+
+# Relative value of memories by role (user statements carry most facts)
+ROLE_WEIGHTS = {"user": 1.0, "system": 1.0, "assistant": 0.5, "tool": 0.25}
+
+
+def lru_score(entry: "MemoryEntry", now: float) -> float:
+    """Least recently retrieved (or added) memories are evicted first."""
+    return entry.last_access
+
+
+def time_decay_score(entry: "MemoryEntry", now: float) -> float:
+    """Older memories decay; each retrieval makes a memory more durable."""
+    age = max(0.0, now - entry.created)
+    return (1 + entry.hits) * math.pow(0.5, age / DECAY_HALF_LIFE_SECONDS)
+
+
+def role_weighted_score(entry: "MemoryEntry", now: float) -> float:
+    """Time decay scaled by role, so assistant/tool chatter is evicted before user facts."""
+    return ROLE_WEIGHTS.get(entry.role, 0.5) * time_decay_score(entry, now)
+
+
+EVICTION_POLICIES: dict[str, EvictionPolicy] = {
+    "lru": lru_score,
+    "time_decay": time_decay_score,
+    "role_weighted": role_weighted_score,
+}
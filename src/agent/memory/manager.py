@@ -3,12 +3,16 @@
 This module defines the interface for memory management operations.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
 from agent.config.schema import AgentSettings
+from agent.utils.redaction import redact
 from agent.utils.responses import create_error_response, create_success_response
 
+logger = logging.getLogger(__name__)
+
 
 class MemoryManager(ABC):
     """Abstract base class for agent memory management.
@@ -104,6 +108,44 @@ class MemoryManager(ABC):
         """
         pass
 
+    async def add_deferred(self, messages: list[dict]) -> dict:
+        """Add messages without waiting for slow storage work to finish.
+
+        Used after each agent turn. The default stores immediately via add();
+        backends with expensive writes (mem0) queue the messages instead and
+        write them in the background. Call flush() before shutdown.
+
+        Args:
+            messages: List of message dicts with role and content
+
+        Returns:
+            Structured response dict with success status
+        """
+        return await self.add(messages)
+
+    async def flush(self) -> None:
+        """Wait for deferred writes to complete (no-op for synchronous backends)."""
+        return None
+
+    async def replace_with_digest(self, ids: list[Any], digest: dict) -> dict:
+        """Replace memories with a compaction digest entry.
+
+        Used by MemoryCompactor. The digest is stored as a new memory and the
+        originals are archived or removed, so they no longer compete with it
+        in retrieval. The default reports that compaction is not supported.
+
+        Args:
+            ids: IDs of the memories folded into the digest
+            digest: Digest message dict (role, content, metadata with provenance)
+
+        Returns:
+            Structured response dict with the stored digest
+        """
+        return self._create_error_response(
+            error="not_supported",
+            message=f"{type(self).__name__} does not support memory compaction",
+        )
+
     async def retrieve_for_context(self, messages: list[dict], limit: int = 10) -> dict:
         """Retrieve memories relevant for context injection.
 
@@ -165,3 +207,19 @@ class MemoryManager(ABC):
             Structured response dict with success=False
         """
         return create_error_response(error, message)
+
+    def _scrub_sensitive_content(self, content: str) -> tuple[str, bool]:
+        """Scrub potential secrets from content before storage.
+
+        Args:
+            content: Message content to check
+
+        Returns:
+            Tuple of (scrubbed_content, was_modified)
+        """
+        content, redactions = redact(content)
+
+        if redactions:
+            logger.warning("Detected and redacted potential secrets from content")
+
+        return content, redactions > 0
@@ -6,23 +6,34 @@ with support for local Chroma storage and cloud mem0.ai service.
 
 import asyncio
 import logging
-import re
+import threading
+import time
+from collections import deque
 from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
 
 from agent.config.schema import AgentSettings
+from agent.memory.dedup import create_detector
 from agent.memory.manager import MemoryManager
 from agent.memory.mem0_utils import create_memory_instance
+from agent.memory.store import InMemoryStore
+from agent.memory.write_behind import WriteBehindQueue
 
 logger = logging.getLogger(__name__)
 
-# Patterns for detecting sensitive data (API keys, tokens, passwords)
-SENSITIVE_PATTERNS = [
-    re.compile(r"sk[-_][a-zA-Z0-9_]{20,}", re.IGNORECASE),  # API keys (sk_...)
-    re.compile(r"bearer\s+[a-zA-Z0-9\-._~+/]+=*", re.IGNORECASE),  # Bearer tokens
-    re.compile(r'api[_-]?key["\s:=]+[a-zA-Z0-9\-._~+/]+', re.IGNORECASE),  # API key assignments
-    re.compile(r'token["\s:=]+[a-zA-Z0-9\-._~+/]{20,}', re.IGNORECASE),  # Token assignments
-    re.compile(r'password["\s:=]+\S+', re.IGNORECASE),  # Password assignments
-]
+
+def _parse_timestamp(memory: dict) -> datetime:
+    """Parse a memory timestamp, falling back to the epoch (oldest possible time)."""
+    timestamp_str = memory.get("timestamp", "")
+    try:
+        dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        # Ensure timezone-aware for comparison
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=UTC)
+        return dt
+    except (ValueError, AttributeError):
+        return datetime.min.replace(tzinfo=UTC)
 
 
 class Mem0Store(MemoryManager):
@@ -31,11 +42,36 @@ class Mem0Store(MemoryManager):
     Integrates mem0 directly into the agent process, reusing the agent's
     existing LLM configuration. Supports local Chroma storage or cloud mem0.ai.
 
+    Per-turn writes go through add_deferred(), which queues messages for a
+    background writer (mem0 runs LLM fact extraction on every add), so turns
+    do not wait on storage. Queued writes become searchable once written;
+    flush() waits for them.
+
+    get_recent() is served from a window of the newest RECENT_WINDOW memories,
+    loaded from mem0 once and then kept current from the results of this
+    store's own add() calls, so it does not re-read and re-sort the whole
+    namespace. Changes made to the namespace by other processes are not seen
+    until clear() or a restart.
+
+    Messages that are near-duplicates of ones this store already sent to mem0
+    (within the last ``memory.max_entries``) are dropped before the write, so
+    repeats cost no embedding or fact-extraction calls; mem0 already holds the
+    facts they carry.
+
+    With background=True (used by create_memory_manager) the mem0 instance is
+    created in a background thread so importing mem0/chromadb and opening the
+    vector store stay off the startup path. Until it is ready,
+    retrieve_for_context() waits at most READY_TIMEOUT seconds and otherwise
+    returns no memories, so the prompt never waits on chromadb; other
+    operations wait for initialization. If initialization fails the store
+    degrades to an InMemoryStore.
+
     Attributes:
         config: Agent configuration with mem0 settings
         memory: mem0.Memory instance
         user_id: User namespace for memory isolation
         namespace: Combined user:project namespace
+        write_queue: Background write-behind queue used by add_deferred()
 
     Example:
         >>> config = AgentConfig.from_env()
@@ -43,24 +79,34 @@ class Mem0Store(MemoryManager):
         >>> await store.add([{"role": "user", "content": "My name is Alice"}])
     """
 
-    def __init__(self, config: AgentSettings):
+    RECENT_WINDOW = 200
+    READY_TIMEOUT = 0.5
+
+    def __init__(self, config: AgentSettings, background: bool = False):
         """Initialize mem0 store with configuration.
 
         Args:
             config: Agent configuration with mem0 settings
+            background: Create the mem0 instance in a background thread
 
         Raises:
-            ValueError: If mem0 configuration is invalid
-            ImportError: If mem0ai or chromadb not installed
+            ValueError: If mem0 configuration is invalid (background=False)
+            ImportError: If mem0ai or chromadb not installed (background=False)
         """
         super().__init__(config)
 
-        try:
-            self.memory = create_memory_instance(config)
-            logger.info("Mem0Store initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Mem0Store: {e}")
-            raise
+        self.memory: Any = None
+        self._ready = threading.Event()
+        self._fallback: MemoryManager | None = None
+
+        if not background:
+            try:
+                self.memory = create_memory_instance(config)
+                logger.info("Mem0Store initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize Mem0Store: {e}")
+                raise
+            self._ready.set()
 
         # Set up namespacing for user/project isolation
         self.user_id = config.mem0_user_id or "default-user"
@@ -73,26 +119,56 @@ class Mem0Store(MemoryManager):
 
         logger.debug(f"Mem0Store namespace: {self.namespace}")
 
-    def _scrub_sensitive_content(self, content: str) -> tuple[str, bool]:
-        """Scrub potential secrets from content before storage.
+        self.write_queue = WriteBehindQueue(self._write_batch)
+        # Event loop of add_deferred() callers (queued fallback writes run on it)
+        self._loop: asyncio.AbstractEventLoop | None = None
 
-        Args:
-            content: Message content to check
+        self._dedup = create_detector(config, backend="mem0")
+        self._dedup_keys: deque[int] = deque()
+        self._dedup_next_key = 0
 
-        Returns:
-            Tuple of (scrubbed_content, was_modified)
-        """
-        modified = False
+        # Newest memories, oldest first; None until loaded from mem0
+        self._recent: deque[dict] | None = None
+        self._recent_complete = False  # window holds the entire namespace
+        self._recent_generation = 0  # bumped on every write, to detect stale loads
+        self._recent_lock = threading.Lock()
+
+        if background:
+            threading.Thread(target=self._initialize, name="mem0-init", daemon=True).start()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether initialization has finished (successfully or not)."""
+        return self._ready.is_set()
+
+    def _initialize(self) -> None:
+        """Create the mem0 instance, degrading to InMemoryStore on failure."""
+        start = time.perf_counter()
+        try:
+            self.memory = create_memory_instance(self.config)
+            logger.info(f"Mem0Store initialized in background ({time.perf_counter() - start:.2f}s)")
+        except Exception as e:
+            logger.warning(
+                f"Failed to initialize Mem0Store: {e}. "
+                "Falling back to InMemoryStore. "
+                "Ensure mem0ai package is installed: uv pip install -e '.[mem0]'"
+            )
+            self._fallback = InMemoryStore(self.config)
+        finally:
+            self._ready.set()
 
-        for pattern in SENSITIVE_PATTERNS:
-            if pattern.search(content):
-                content = pattern.sub("[REDACTED]", content)
-                modified = True
+    async def _wait_ready(self, timeout: float | None = None) -> bool:
+        """Wait for background initialization without blocking the event loop.
 
-        if modified:
-            logger.warning("Detected and redacted potential secrets from content")
+        Args:
+            timeout: Maximum seconds to wait (None waits until ready)
 
-        return content, modified
+        Returns:
+            True if initialization has finished
+        """
+        if not self._ready.is_set():
+            await asyncio.to_thread(self._ready.wait, timeout)
+        return self._ready.is_set()
 
     def _should_save_message(self, msg: dict) -> bool:
         """Check if message should be saved to memory.
@@ -119,6 +195,116 @@ class Mem0Store(MemoryManager):
         role = msg.get("role", "")
         return role in ("user", "assistant")
 
+    def _prepare_messages(self, messages: list[dict]) -> list[dict]:
+        """Validate, filter and scrub messages before storage.
+
+        Args:
+            messages: List of message dicts with role and content
+
+        Returns:
+            Messages that should be stored (role and scrubbed content only)
+        """
+        messages_to_add = []
+        for msg in messages:
+            # Validate message structure
+            if not isinstance(msg, dict) or "role" not in msg or "content" not in msg:
+                logger.warning(f"Skipping invalid message: {msg}")
+                continue
+
+            # Apply safety gates
+            if not self._should_save_message(msg):
+                continue
+
+            content = msg.get("content", "").strip()
+            if not content:
+                continue
+
+            # Scrub sensitive content
+            scrubbed_content, was_scrubbed = self._scrub_sensitive_content(content)
+
+            if self._is_duplicate(msg["role"], scrubbed_content):
+                continue
+
+            messages_to_add.append({"role": msg["role"], "content": scrubbed_content})
+        return messages_to_add
+
+    def _is_duplicate(self, role: str, content: str) -> bool:
+        """Check a message against those already sent to mem0, remembering new ones.
+
+        Args:
+            role: Message role
+            content: Scrubbed message content
+
+        Returns:
+            True if the message is a near-duplicate and should not be written
+        """
+        if self._dedup is None:
+            return False
+        signature = self._dedup.signature(role, content)
+        if self._dedup.find(signature) is not None:
+            logger.debug(f"Skipping near-duplicate {role} message")
+            return True
+
+        key = self._dedup_next_key
+        self._dedup_next_key += 1
+        self._dedup.add(key, signature)
+        self._dedup_keys.append(key)
+        if len(self._dedup_keys) > self.config.memory.max_entries:
+            self._dedup.remove(self._dedup_keys.popleft())
+        return False
+
+    def _write_batch(self, messages: list[dict]) -> None:
+        """Store a batch of prepared messages in mem0 (blocking)."""
+        self._ready.wait()
+        if self._fallback is not None:
+            # The fallback store is used from the event loop without locking:
+            # run the write there instead of on this worker thread
+            assert self._loop is not None
+            asyncio.run_coroutine_threadsafe(self._fallback.add(messages), self._loop).result()
+            return
+        result = self.memory.add(messages=messages, user_id=self.namespace)
+        self._update_recent(result)
+
+    def _update_recent(self, add_result: Any) -> None:
+        """Apply the ADD/UPDATE/DELETE events returned by mem0 to the recent window.
+
+        Args:
+            add_result: Return value of mem0's Memory.add()
+        """
+        events = add_result.get("results") if isinstance(add_result, dict) else add_result
+        with self._recent_lock:
+            self._recent_generation += 1
+            if self._recent is None:
+                return
+            if not isinstance(events, list):
+                # Unknown result shape: reload from mem0 on next use
+                self._recent = None
+                return
+
+            now = datetime.now(UTC).isoformat()
+            for event in events:
+                if not isinstance(event, dict) or not event.get("id"):
+                    continue
+                memory_id = event["id"]
+                kind = event.get("event", "ADD")
+                if kind in ("UPDATE", "DELETE"):
+                    for existing in self._recent:
+                        if existing["id"] == memory_id:
+                            self._recent.remove(existing)
+                            break
+                if kind in ("ADD", "UPDATE"):
+                    if len(self._recent) == self._recent.maxlen:
+                        self._recent_complete = False
+                    self._recent.append(
+                        {
+                            "id": memory_id,
+                            "role": "assistant",
+                            "content": event.get("memory", ""),
+                            "timestamp": now,
+                            "metadata": event.get("metadata") or {},
+                        }
+                    )
+
     async def add(self, messages: list[dict]) -> dict:
         """Add messages to mem0 storage with semantic indexing.
 
@@ -142,27 +328,12 @@ class Mem0Store(MemoryManager):
                 error="invalid_input", message="No messages provided"
             )
 
-        try:
-            # Filter and prepare messages
-            messages_to_add = []
-            for msg in messages:
-                # Validate message structure
-                if not isinstance(msg, dict) or "role" not in msg or "content" not in msg:
-                    logger.warning(f"Skipping invalid message: {msg}")
-                    continue
+        await self._wait_ready()
+        if self._fallback is not None:
+            return await self._fallback.add(messages)
 
-                # Apply safety gates
-                if not self._should_save_message(msg):
-                    continue
-
-                content = msg.get("content", "").strip()
-                if not content:
-                    continue
-
-                # Scrub sensitive content
-                scrubbed_content, was_scrubbed = self._scrub_sensitive_content(content)
-
-                messages_to_add.append({"role": msg["role"], "content": scrubbed_content})
+        try:
+            messages_to_add = self._prepare_messages(messages)
 
             if not messages_to_add:
                 return self._create_success_response(
@@ -170,9 +341,10 @@ class Mem0Store(MemoryManager):
                 )
 
             # Add to mem0 (wrapped to avoid blocking event loop)
-            await asyncio.to_thread(
+            result = await asyncio.to_thread(
                 self.memory.add, messages=messages_to_add, user_id=self.namespace
             )
+            self._update_recent(result)
 
             logger.debug(f"Added {len(messages_to_add)} messages to mem0")
 
@@ -186,6 +358,47 @@ class Mem0Store(MemoryManager):
                 error="storage_error", message=f"Failed to add messages: {str(e)}"
             )
 
+    async def add_deferred(self, messages: list[dict]) -> dict:
+        """Queue messages for a background write to mem0.
+
+        Filtering and secret scrubbing happen immediately; embedding and fact
+        extraction run in the write-behind queue, batched across turns.
+
+        Args:
+            messages: List of message dicts with role and content
+
+        Returns:
+            Structured response dict with the queued messages
+        """
+        if not messages:
+            return self._create_error_response(
+                error="invalid_input", message="No messages provided"
+            )
+
+        if self._ready.is_set() and self._fallback is not None:
+            return await self._fallback.add(messages)
+
+        # Queued even while mem0 is initializing; the writer waits for it
+        messages_to_add = self._prepare_messages(messages)
+
+        if not messages_to_add:
+            return self._create_success_response(
+                result=[], message="No messages to add after filtering"
+            )
+
+        self._loop = asyncio.get_running_loop()
+        await self.write_queue.put(messages_to_add)
+
+        return self._create_success_response(
+            result=messages_to_add,
+            message=f"Queued {len(messages_to_add)} messages for memory "
+            f"({self.write_queue.depth} pending)",
+        )
+
+    async def flush(self) -> None:
+        """Wait for queued background writes to reach mem0."""
+        await self.write_queue.flush()
+
     async def search(self, query: str, limit: int = 5) -> dict:
         """Search memories by semantic similarity.
 
@@ -208,6 +421,10 @@ class Mem0Store(MemoryManager):
                 error="invalid_query", message="Search query cannot be empty"
             )
 
+        await self._wait_ready()
+        if self._fallback is not None:
+            return await self._fallback.search(query, limit)
+
         try:
             # Search mem0 with semantic similarity
             results = await asyncio.to_thread(
@@ -247,6 +464,10 @@ class Mem0Store(MemoryManager):
         Returns:
             Structured response dict with all memories
         """
+        await self._wait_ready()
+        if self._fallback is not None:
+            return await self._fallback.get_all()
+
         try:
             # Get all memories for user
             results = await asyncio.to_thread(self.memory.get_all, user_id=self.namespace)
@@ -272,7 +493,10 @@ class Mem0Store(MemoryManager):
             )
 
     async def get_recent(self, limit: int = 10) -> dict:
-        """Get recent memories.
+        """Get recent memories, most recent first.
+
+        Served from the recent window; the namespace is only fetched and
+        sorted when the window is not loaded yet or limit exceeds it.
 
         Args:
             limit: Number of recent memories to retrieve
@@ -280,31 +504,34 @@ class Mem0Store(MemoryManager):
         Returns:
             Structured response dict with recent memories
         """
+        await self._wait_ready()
+        if self._fallback is not None:
+            return await self._fallback.get_recent(limit)
+
+        limit = max(limit, 0)
+        with self._recent_lock:
+            if self._recent is not None and (limit <= len(self._recent) or self._recent_complete):
+                recent = list(islice(reversed(self._recent), limit))
+                return self._create_success_response(
+                    result=recent, message=f"Retrieved {len(recent)} recent memories"
+                )
+            generation = self._recent_generation
+
         try:
-            # Get all and sort by timestamp
             all_result = await self.get_all()
 
             if not all_result.get("success"):
                 return all_result
 
-            memories = all_result["result"]
-
             # Sort by timestamp (most recent first) with proper datetime parsing
-            def parse_timestamp(memory: dict) -> datetime:
-                """Parse timestamp with fallback to epoch."""
-                timestamp_str = memory.get("timestamp", "")
-                try:
-                    # Try parsing ISO format
-                    dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    # Ensure timezone-aware for comparison
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=UTC)
-                    return dt
-                except (ValueError, AttributeError):
-                    # Fallback to epoch (oldest possible time) in UTC
-                    return datetime.min.replace(tzinfo=UTC)
-
-            sorted_memories = sorted(memories, key=parse_timestamp, reverse=True)
+            sorted_memories = sorted(all_result["result"], key=_parse_timestamp, reverse=True)
+
+            with self._recent_lock:
+                # Skip if a write landed while mem0 was being read (snapshot may miss it)
+                if generation == self._recent_generation:
+                    window = sorted_memories[: self.RECENT_WINDOW]
+                    self._recent = deque(reversed(window), maxlen=self.RECENT_WINDOW)
+                    self._recent_complete = len(window) == len(sorted_memories)
 
             # Take most recent N
             recent = sorted_memories[:limit]
@@ -325,9 +552,19 @@ class Mem0Store(MemoryManager):
         Returns:
             Structured response dict with success status
         """
+        await self._wait_ready()
+        if self._fallback is not None:
+            return await self._fallback.clear()
+
         try:
             # Delete all memories for user
             await asyncio.to_thread(self.memory.delete_all, user_id=self.namespace)
+            if self._dedup is not None:
+                self._dedup.clear()
+                self._dedup_keys.clear()
+            with self._recent_lock:
+                self._recent = None
+                self._recent_generation += 1
 
             logger.info(f"Cleared all memories for namespace: {self.namespace}")
 
@@ -341,6 +578,69 @@ class Mem0Store(MemoryManager):
                 error="clear_error", message=f"Failed to clear memories: {str(e)}"
             )
 
+    async def replace_with_digest(self, ids: list[Any], digest: dict) -> dict:
+        """Store a compaction digest in mem0 and delete the memories it replaces.
+
+        The digest is stored verbatim (no fact extraction). mem0's vector store
+        only accepts scalar metadata, so list values (source_ids) are stored
+        comma-joined.
+
+        Args:
+            ids: mem0 IDs of the memories folded into the digest
+            digest: Digest message dict (role, content, metadata with provenance)
+
+        Returns:
+            Structured response dict with the stored digest
+        """
+        await self._wait_ready()
+        if self._fallback is not None:
+            return await self._fallback.replace_with_digest(ids, digest)
+
+        metadata = {
+            key: ",".join(str(v) for v in value) if isinstance(value, list) else value
+            for key, value in (digest.get("metadata") or {}).items()
+        }
+        message = {"role": digest.get("role", "assistant"), "content": digest.get("content", "")}
+
+        def replace() -> Any:
+            result = self.memory.add(
+                messages=[message], user_id=self.namespace, metadata=metadata, infer=False
+            )
+            for memory_id in ids:
+                self.memory.delete(memory_id=memory_id)
+            return result
+
+        try:
+            result = await asyncio.to_thread(replace)
+            self._forget_recent(ids)
+            self._update_recent(result)
+
+            logger.debug(f"Compacted {len(ids)} mem0 memories into a digest")
+
+            return self._create_success_response(
+                result=result, message=f"Compacted {len(ids)} memories into a digest"
+            )
+
+        except Exception as e:
+            logger.error(f"Error compacting mem0 memories: {e}", exc_info=True)
+            return self._create_error_response(
+                error="storage_error", message=f"Failed to compact memories: {str(e)}"
+            )
+
+    def _forget_recent(self, ids: list[Any]) -> None:
+        """Drop deleted memories from the recent window.
+
+        Args:
+            ids: mem0 IDs of deleted memories
+        """
+        deleted = set(ids)
+        with self._recent_lock:
+            self._recent_generation += 1
+            if self._recent is not None:
+                kept = [memory for memory in self._recent if memory["id"] not in deleted]
+                if len(kept) != len(self._recent):
+                    self._recent = deque(kept, maxlen=self.RECENT_WINDOW)
+
     async def retrieve_for_context(self, messages: list[dict], limit: int = 10) -> dict:
         """Retrieve semantically relevant memories for context injection.
 
@@ -352,8 +652,15 @@ class Mem0Store(MemoryManager):
             limit: Maximum number of memories to retrieve
 
         Returns:
-            Structured response dict with relevant memories
+            Structured response dict with relevant memories (empty while mem0
+            is still initializing after READY_TIMEOUT)
         """
+        if not await self._wait_ready(self.READY_TIMEOUT):
+            logger.debug("mem0 still initializing; skipping memory injection for this turn")
+            return self._create_success_response(result=[], message="Memory is still initializing")
+        if self._fallback is not None:
+            return await self._fallback.retrieve_for_context(messages, limit)
+
         # Extract query from latest user message
         query = None
         for msg in reversed(messages):
@@ -394,6 +394,50 @@ def create_memory_instance(config: AgentSettings) -> Any:
         logger.debug(
             f"mem0 Memory instance created successfully ({'cloud' if is_cloud_mode else 'local'} mode)"
         )
-        return memory
     except Exception as e:
         raise ValueError(f"Failed to initialize mem0 Memory: {e}")
+
+    _enable_embedding_cache(memory, config, embedder_config["config"]["model"])
+    return memory
+
+
+def get_embedding_cache_path(config: AgentSettings) -> Path:
+    """Get the path of the persistent embedding cache (next to the Chroma database).
+
+    Args:
+        config: Agent configuration
+
+    Returns:
+        Path to the embedding cache SQLite file
+    """
+    return get_storage_path(config).parent / "embedding_cache.db"
+
+
+def _enable_embedding_cache(memory: Any, config: AgentSettings, model: str) -> None:
+    """Wrap the mem0 embedder with the persistent embedding cache.
+
+    The cache is an optimization: if it is disabled or cannot be opened,
+    mem0 keeps using its embedder directly.
+
+    Args:
+        memory: mem0 Memory instance
+        config: Agent configuration
+        model: Embedding model name (part of the cache key)
+    """
+    max_entries = config.memory.embedding_cache_entries
+    if max_entries <= 0 or not hasattr(memory, "embedding_model"):
+        return
+
+    import sqlite3
+
+    from agent.memory.embedding_cache import CachedEmbedder, EmbeddingCache
+
+    cache_path = get_embedding_cache_path(config)
+    try:
+        cache = EmbeddingCache(cache_path, max_entries=max_entries)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Embedding cache unavailable ({cache_path}): {e}")
+        return
+
+    memory.embedding_model = CachedEmbedder(memory.embedding_model, cache, model)
+    logger.debug(f"Embedding cache enabled: {cache_path} ({len(cache)} entries)")
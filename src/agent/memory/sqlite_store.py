@@ -0,0 +1,246 @@
+"""SQLite-backed persistent memory storage.
+
+This module provides a durable memory backend: memories are inserted into a
+WAL-mode SQLite database as they are added, searched through an FTS5 index and
+read back in timestamp order, so nothing has to be rewritten at session exit.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from agent.config.schema import AgentSettings
+from agent.memory.manager import MemoryManager
+from agent.utils.text_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_memories_timestamp ON memories(timestamp);
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    content, content='memories', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+"""
+
+
+class SQLiteMemoryStore(MemoryManager):
+    """Persistent memory storage using SQLite with FTS5 full-text search.
+
+    Memories survive crashes (each add is committed), scale to millions of
+    rows, and are ranked by FTS5's BM25 on search. Blocking SQLite calls run
+    in a worker thread so the event loop is never blocked. Writes are stored
+    as-is: ``memory.dedup_enabled`` does not apply to this backend.
+
+    Attributes:
+        config: Agent configuration
+        db_path: Path to the SQLite database file
+
+    Example:
+        >>> store = SQLiteMemoryStore(config)
+        >>> await store.add([{"role": "user", "content": "My name is Alice"}])
+        >>> await store.search("Alice")
+    """
+
+    DB_FILENAME = "memories.db"
+
+    def __init__(self, config: AgentSettings, db_path: Path | None = None):
+        """Open (or create) the memory database.
+
+        Args:
+            config: Agent configuration with memory settings
+            db_path: Database file (default: <memory_dir>/memories.db)
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or lacks FTS5
+        """
+        super().__init__(config)
+        self.db_path = Path(db_path) if db_path else config.memory_dir / self.DB_FILENAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        logger.info(f"SQLiteMemoryStore opened: {self.db_path}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    async def add(self, messages: list[dict]) -> dict:
+        """Insert messages into the database.
+
+        Secrets in the content are redacted before storage.
+
+        Args:
+            messages: List of message dicts with role and content
+
+        Returns:
+            Structured response dict with success status and added memory IDs
+        """
+        if not messages:
+            return self._create_error_response(
+                error="invalid_input", message="No messages provided"
+            )
+
+        rows = []
+        for msg in messages:
+            # Validate message structure
+            if not isinstance(msg, dict) or "role" not in msg or "content" not in msg:
+                logger.warning(f"Skipping invalid message: {msg}")
+                continue
+            content, _ = self._scrub_sensitive_content(str(msg.get("content", "")))
+            rows.append(
+                (
+                    msg.get("role", "unknown"),
+                    content,
+                    datetime.now().isoformat(),
+                    json.dumps(msg.get("metadata") or {}, default=str),
+                )
+            )
+
+        try:
+            added_memories = await asyncio.to_thread(self._insert, rows)
+        except sqlite3.Error as e:
+            logger.error(f"Error adding to SQLite memory: {e}", exc_info=True)
+            return self._create_error_response(
+                error="storage_error", message=f"Failed to add messages: {str(e)}"
+            )
+
+        logger.debug(f"Added {len(added_memories)} messages to memory")
+
+        return self._create_success_response(
+            result=added_memories, message=f"Added {len(added_memories)} messages to memory"
+        )
+
+    async def search(self, query: str, limit: int = 5) -> dict:
+        """Search memories with FTS5 (BM25 ranking).
+
+        Args:
+            query: Search query string (keywords)
+            limit: Maximum number of results
+
+        Returns:
+            Structured response dict with matching memories
+        """
+        if not query or not query.strip():
+            return self._create_error_response(
+                error="invalid_query", message="Search query cannot be empty"
+            )
+
+        # Quote each term so user text is never parsed as FTS5 syntax
+        terms = dict.fromkeys(tokenize(query))
+        results: list[dict] = []
+        if terms:
+            match = " OR ".join(f'"{term}"' for term in terms)
+            try:
+                results = await asyncio.to_thread(
+                    self._fetch,
+                    "SELECT m.* FROM memories_fts JOIN memories m ON m.id = memories_fts.rowid "
+                    "WHERE memories_fts MATCH ? ORDER BY bm25(memories_fts), m.id DESC LIMIT ?",
+                    (match, limit),
+                )
+            except sqlite3.Error as e:
+                logger.error(f"Error searching SQLite memory: {e}", exc_info=True)
+                return self._create_error_response(
+                    error="search_error", message=f"Failed to search memories: {str(e)}"
+                )
+
+        logger.debug(f"Search for '{query}' returned {len(results)} results")
+
+        return self._create_success_response(
+            result=results,
+            message=f"Found {len(results)} matching memories for query: {query}",
+        )
+
+    async def get_all(self) -> dict:
+        """Get all memories, oldest first.
+
+        Returns:
+            Structured response dict with all memories
+        """
+        memories = await asyncio.to_thread(self._fetch, "SELECT * FROM memories ORDER BY id", ())
+        return self._create_success_response(result=memories, message="Retrieved all memories")
+
+    async def get_recent(self, limit: int = 10) -> dict:
+        """Get the most recent memories (oldest first), using the timestamp index.
+
+        Args:
+            limit: Number of recent memories to retrieve
+
+        Returns:
+            Structured response dict with recent memories
+        """
+        newest_first = await asyncio.to_thread(
+            self._fetch,
+            "SELECT * FROM memories ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (max(limit, 0),),
+        )
+        recent = newest_first[::-1]
+        return self._create_success_response(
+            result=recent, message=f"Retrieved {len(recent)} recent memories"
+        )
+
+    async def clear(self) -> dict:
+        """Delete all memories.
+
+        Returns:
+            Structured response dict with success status
+        """
+        count = await asyncio.to_thread(self._delete_all)
+        return self._create_success_response(result=None, message=f"Cleared {count} memories")
+
+    def _insert(self, rows: list[tuple[str, str, str, str]]) -> list[int]:
+        """Insert rows in one transaction and return their IDs."""
+        with self._lock, self._conn:
+            ids = []
+            for row in rows:
+                cursor = self._conn.execute(
+                    "INSERT INTO memories (role, content, timestamp, metadata) VALUES (?, ?, ?, ?)",
+                    row,
+                )
+                ids.append(int(cursor.lastrowid or 0))
+            return ids
+
+    def _fetch(self, sql: str, params: tuple[Any, ...]) -> list[dict]:
+        """Run a query and convert rows to memory dicts."""
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "id": row["id"],
+                "role": row["role"],
+                "content": row["content"],
+                "timestamp": row["timestamp"],
+                "metadata": json.loads(row["metadata"]),
+            }
+            for row in rows
+        ]
+
+    def _delete_all(self) -> int:
+        """Delete every memory and return how many were removed."""
+        with self._lock, self._conn:
+            count = self._conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+            self._conn.execute("DELETE FROM memories")
+            return int(count)
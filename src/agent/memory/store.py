@@ -3,24 +3,104 @@
 This module provides the default in-memory storage for agent memories.
 """
 
+import heapq
 import logging
+import time
 from datetime import datetime
+from itertools import islice
+from typing import Any
 
 from agent.config.schema import AgentSettings
+from agent.memory.dedup import create_detector
+from agent.memory.eviction import EVICTION_POLICIES, EvictionPolicy
 from agent.memory.manager import MemoryManager
+from agent.utils.text_index import InvertedIndex
 
 logger = logging.getLogger(__name__)
 
 
+class MemoryEntry:
+    """A stored memory (compact, slot-based; exposed to callers as a dict).
+
+    Attributes:
+        id: Monotonic memory ID (never reused, even after eviction or clear)
+        role: Message role
+        content: Message content
+        timestamp: ISO timestamp of when the memory was added
+        metadata: Caller-supplied metadata
+        created: Monotonic clock value when added
+        last_access: Monotonic clock value when last added or retrieved
+        hits: Number of times returned by search
+    """
+
+    __slots__ = (
+        "id",
+        "role",
+        "content",
+        "timestamp",
+        "metadata",
+        "created",
+        "last_access",
+        "hits",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        role: str,
+        content: str,
+        metadata: dict[str, Any],
+        timestamp: str | None = None,
+    ):
+        self.id = id
+        self.role = role
+        self.content = content
+        self.timestamp = timestamp or datetime.now().isoformat()
+        self.metadata = metadata
+        self.created = self.last_access = time.monotonic()
+        self.hits = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the public dict form of this memory."""
+        return {
+            "id": self.id,
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "metadata": self.metadata,
+        }
+
+
 class InMemoryStore(MemoryManager):
     """In-memory storage implementation for agent memories.
 
     Stores messages with metadata in memory, providing search, filtering,
-    and retrieval capabilities without external dependencies.
+    and retrieval capabilities without external dependencies. Content is
+    indexed on add (inverted index, BM25 ranking) so searches do not scan
+    every stored memory.
+
+    The store is bounded by ``config.memory.max_entries``. When it overflows,
+    the entries with the lowest retention score under the configured eviction
+    policy (``lru``, ``time_decay`` or ``role_weighted``) are evicted, in
+    batches of ~5% of capacity so that eviction cost is amortized.
+
+    Compaction (see agent.memory.compaction) replaces old memories with
+    digest entries; the originals move to an archive with its own index.
+    Searches rank live memories (digests and recent turns) first and fall back
+    to the archive only when they return fewer than ``limit`` results.
+    Archived memories do not count toward capacity and are dropped when their
+    digest is evicted.
+
+    With ``memory.dedup_enabled``, writes are checked for near-duplicates of
+    live memories (see agent.memory.dedup). Under ``memory.dedup_action``
+    "merge" a duplicate refreshes the existing memory (access time, metadata)
+    and its ID is returned; under "skip" it is dropped. Either way a repeated
+    turn is not added to the history again, so deduplication is off by default.
 
     Attributes:
         config: Agent configuration
-        memories: List of stored memory entries
+        max_entries: Maximum number of stored memories
+        memories: Snapshot of stored memory entries (as dicts), oldest first
 
     Example:
         >>> config = AgentConfig(memory_enabled=True)
@@ -28,20 +108,45 @@ class InMemoryStore(MemoryManager):
         >>> await store.add([{"role": "user", "content": "Hello"}])
     """
 
-    def __init__(self, config: AgentSettings):
+    def __init__(self, config: AgentSettings, eviction_policy: EvictionPolicy | None = None):
         """Initialize in-memory store.
 
         Args:
             config: Agent configuration with memory settings
+            eviction_policy: Custom eviction policy (overrides config.memory.eviction_policy)
         """
         super().__init__(config)
-        self.memories: list[dict] = []
+        self.max_entries = config.memory.max_entries
+        self._eviction_policy = eviction_policy or EVICTION_POLICIES[config.memory.eviction_policy]
+        self._entries: dict[int, MemoryEntry] = {}
+        self._next_id = 0
+        self._index = InvertedIndex()
+        self._archived: dict[int, MemoryEntry] = {}
+        self._archive_index = InvertedIndex()
+        self._digest_sources: dict[str, list[int]] = {}
+        self._dedup = create_detector(config, backend="in_memory")
+        self._dedup_action = config.memory.dedup_action
+
+    @property
+    def memories(self) -> list[dict]:
+        """Stored memories as dicts, in chronological order."""
+        return [entry.to_dict() for entry in self._entries.values()]
+
+    def __len__(self) -> int:
+        """Return the number of stored memories."""
+        return len(self._entries)
 
     async def add(self, messages: list[dict]) -> dict:
         """Add messages to memory storage.
 
         Each message is stored with metadata including timestamp, type, and content.
-        Messages are stored in chronological order.
+        Messages are stored in chronological order. If the store exceeds its
+        capacity, memories are evicted according to the eviction policy.
+        A message's ``timestamp`` is kept if present (restored sessions), so
+        memories keep their age. Messages whose metadata has ``compacted_into``
+        (archived originals from a restored session) go straight to the archive.
+        Near-duplicates of stored memories are merged or skipped. Secrets in
+        the content are redacted before storage.
 
         Args:
             messages: List of message dicts with role and content
@@ -61,6 +166,7 @@ class InMemoryStore(MemoryManager):
             )
 
         added_memories = []
+        duplicates = 0
 
         for msg in messages:
             # Validate message structure
@@ -68,19 +174,53 @@ class InMemoryStore(MemoryManager):
                 logger.warning(f"Skipping invalid message: {msg}")
                 continue
 
-            # Create memory entry with metadata (timestamp per message for accuracy)
-            memory_entry = {
-                "id": len(self.memories),  # Simple incrementing ID
-                "role": msg.get("role", "unknown"),
-                "content": msg.get("content", ""),
-                "timestamp": datetime.now().isoformat(),
-                "metadata": msg.get("metadata", {}),
-            }
-
-            self.memories.append(memory_entry)
-            added_memories.append(memory_entry["id"])
+            content = msg.get("content", "")
+            if isinstance(content, str):
+                content, _ = self._scrub_sensitive_content(content)
+
+            signature = None
+            metadata = msg.get("metadata") or {}
+            # Digests and archived originals come from compaction, not from users
+            if self._dedup is not None and not (
+                metadata.get("compacted_into") or metadata.get("kind") == "digest"
+            ):
+                signature = self._dedup.signature(msg.get("role", "unknown"), str(content))
+                duplicate_id = self._dedup.find(signature)
+                if duplicate_id is not None:
+                    duplicates += 1
+                    if self._dedup_action == "merge":
+                        existing = self._entries[duplicate_id]
+                        existing.last_access = time.monotonic()
+                        if metadata:
+                            existing.metadata = {**existing.metadata, **metadata}
+                        added_memories.append(duplicate_id)
+                    continue
 
-        logger.debug(f"Added {len(added_memories)} messages to memory")
+            # Create memory entry with metadata (timestamp per message for accuracy)
+            entry = MemoryEntry(
+                id=self._next_id,
+                role=msg.get("role", "unknown"),
+                content=content,
+                metadata=metadata,
+                timestamp=msg.get("timestamp"),
+            )
+            self._next_id += 1
+
+            if entry.metadata.get("compacted_into"):
+                self._archive(entry)
+            else:
+                self._entries[entry.id] = entry
+                self._index.add(entry.id, str(entry.content))
+                if signature is not None:
+                    self._dedup.add(entry.id, signature)
+            added_memories.append(entry.id)
+
+        if len(self._entries) > self.max_entries:
+            self._evict()
+
+        logger.debug(
+            f"Added {len(added_memories)} messages to memory ({duplicates} near-duplicates)"
+        )
 
         return self._create_success_response(
             result=added_memories, message=f"Added {len(added_memories)} messages to memory"
@@ -89,8 +229,10 @@ class InMemoryStore(MemoryManager):
     async def search(self, query: str, limit: int = 5) -> dict:
         """Search memories by keyword query.
 
-        Performs case-insensitive keyword search across message content.
-        Returns memories ranked by relevance (number of keyword matches).
+        Performs case-insensitive keyword search across message content using
+        the inverted index. Returns memories ranked by BM25 relevance, with a
+        small boost for more recent memories. Archived (compacted) memories are
+        only searched when live memories return fewer than ``limit`` results.
 
         Args:
             query: Search query string (keywords)
@@ -107,25 +249,18 @@ class InMemoryStore(MemoryManager):
                 error="invalid_query", message="Search query cannot be empty"
             )
 
-        query_lower = query.lower()
-        keywords = query_lower.split()
-
-        # Search and rank by relevance
-        matches = []
-        for memory in self.memories:
-            content_lower = memory.get("content", "").lower()
-
-            # Count keyword matches
-            match_count = sum(1 for keyword in keywords if keyword in content_lower)
-
-            if match_count > 0:
-                matches.append((memory, match_count))
-
-        # Sort by relevance (match count) and recency
-        matches.sort(key=lambda x: (x[1], x[0].get("timestamp", "")), reverse=True)
+        now = time.monotonic()
+        results = []
+        for doc_id, _ in self._index.search(query, limit):
+            entry = self._entries[doc_id]
+            # Retrieval keeps a memory alive under the lru/decay policies
+            entry.last_access = now
+            entry.hits += 1
+            results.append(entry.to_dict())
 
-        # Extract top matches
-        results = [match[0] for match in matches[:limit]]
+        if len(results) < limit and self._archived:
+            for doc_id, _ in self._archive_index.search(query, limit - len(results)):
+                results.append(self._archived[doc_id].to_dict())
 
         logger.debug(f"Search for '{query}' returned {len(results)} results")
 
@@ -137,10 +272,16 @@ class InMemoryStore(MemoryManager):
     async def get_all(self) -> dict:
         """Get all memories from storage.
 
+        Live memories come first, followed by archived (compacted) memories, so
+        that saving and restoring a session keeps digest provenance.
+
         Returns:
             Structured response dict with all memories
         """
-        return self._create_success_response(result=self.memories, message="Retrieved all memories")
+        archived = [entry.to_dict() for entry in self._archived.values()]
+        return self._create_success_response(
+            result=self.memories + archived, message="Retrieved all memories"
+        )
 
     async def get_recent(self, limit: int = 10) -> dict:
         """Get recent memories.
@@ -154,7 +295,8 @@ class InMemoryStore(MemoryManager):
         Returns:
             Structured response dict with recent memories
         """
-        recent = self.memories[-limit:] if self.memories else []
+        newest_first = islice(reversed(self._entries.values()), max(limit, 0))
+        recent = [entry.to_dict() for entry in newest_first][::-1]
         return self._create_success_response(
             result=recent, message=f"Retrieved {len(recent)} recent memories"
         )
@@ -162,9 +304,73 @@ class InMemoryStore(MemoryManager):
     async def clear(self) -> dict:
         """Clear all memories from storage.
 
+        IDs are not reused after clearing.
+
         Returns:
             Structured response dict with success status
         """
-        count = len(self.memories)
-        self.memories = []
+        count = len(self._entries)
+        self._entries = {}
+        self._index.clear()
+        self._archived = {}
+        self._archive_index.clear()
+        if self._dedup is not None:
+            self._dedup.clear()
+        self._digest_sources = {}
         return self._create_success_response(result=None, message=f"Cleared {count} memories")
+
+    async def replace_with_digest(self, ids: list[Any], digest: dict) -> dict:
+        """Store a compaction digest and move the memories it replaces to the archive.
+
+        Args:
+            ids: IDs of the memories folded into the digest
+            digest: Digest message dict (metadata must carry a ``digest_id``)
+
+        Returns:
+            Structured response dict with the digest's memory ID
+        """
+        digest_id = (digest.get("metadata") or {}).get("digest_id")
+        sources = [self._entries[i] for i in ids if i in self._entries]
+        if not digest_id or not sources:
+            return self._create_error_response(
+                error="invalid_input", message="Digest needs a digest_id and stored source memories"
+            )
+
+        for entry in sources:
+            del self._entries[entry.id]
+            self._index.remove(entry.id, str(entry.content))
+            if self._dedup is not None:
+                self._dedup.remove(entry.id)
+            entry.metadata = {**entry.metadata, "compacted_into": digest_id}
+            self._archive(entry)
+
+        result = await self.add([digest])
+        logger.debug(f"Compacted {len(sources)} memories into digest {digest_id}")
+        return result
+
+    def _archive(self, entry: MemoryEntry) -> None:
+        """Add a compacted memory to the archive."""
+        self._archived[entry.id] = entry
+        self._archive_index.add(entry.id, str(entry.content))
+        self._digest_sources.setdefault(entry.metadata["compacted_into"], []).append(entry.id)
+
+    def _evict(self) -> None:
+        """Evict the lowest-scoring memories until the store is under capacity."""
+        overflow = len(self._entries) - self.max_entries
+        count = overflow + self.max_entries // 20
+        now = time.monotonic()
+        policy = self._eviction_policy
+        victims = heapq.nsmallest(
+            count, self._entries.values(), key=lambda entry: (policy(entry, now), entry.id)
+        )
+        for entry in victims:
+            del self._entries[entry.id]
+            self._index.remove(entry.id, str(entry.content))
+            if self._dedup is not None:
+                self._dedup.remove(entry.id)
+            # A digest's archived originals go with it
+            for source_id in self._digest_sources.pop(entry.metadata.get("digest_id"), []):
+                source = self._archived.pop(source_id, None)
+                if source is not None:
+                    self._archive_index.remove(source.id, str(source.content))
+        logger.debug(f"Evicted {len(victims)} memories (capacity {self.max_entries})")
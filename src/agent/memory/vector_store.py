@@ -0,0 +1,247 @@
+"""Local semantic memory backed by hashed n-gram vectors.
+
+This module provides a fuzzy-recall memory backend that needs no embedding
+model or network access. Each memory is turned into a feature-hashed vector of
+word unigrams and character trigrams; vectors live in one contiguous float32
+matrix so retrieval is a single matrix-vector product plus a top-k selection.
+"""
+
+import logging
+import re
+import zlib
+from datetime import datetime
+from itertools import islice
+
+import numpy as np
+
+from agent.config.schema import AgentSettings
+from agent.memory.dedup import create_detector
+from agent.memory.manager import MemoryManager
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class LocalVectorStore(MemoryManager):
+    """Semantic-ish memory using hashed n-gram vectors and cosine similarity.
+
+    Character trigrams make matching robust to inflections and typos
+    ("running" ~ "runs", "colour" ~ "color") without an embedding model.
+    Memories are persisted like InMemoryStore, through MemoryPersistence on
+    session save and re-added on restore. With ``memory.dedup_enabled``,
+    near-duplicate writes are merged into (or, with ``memory.dedup_action``
+    "skip", dropped in favour of) the existing memory.
+
+    Attributes:
+        config: Agent configuration
+        dimensions: Width of the hashed feature space
+        min_similarity: Cosine similarity below which results are dropped
+
+    Example:
+        >>> store = LocalVectorStore(config)
+        >>> await store.add([{"role": "user", "content": "I prefer dark roast coffee"}])
+        >>> await store.search("coffee preferences")
+    """
+
+    DIMENSIONS = 512
+    MIN_SIMILARITY = 0.1
+    _INITIAL_CAPACITY = 256
+
+    def __init__(
+        self,
+        config: AgentSettings,
+        dimensions: int = DIMENSIONS,
+        min_similarity: float = MIN_SIMILARITY,
+    ):
+        """Initialize an empty vector store.
+
+        Args:
+            config: Agent configuration with memory settings
+            dimensions: Width of the hashed feature space
+            min_similarity: Cosine similarity below which results are dropped
+        """
+        super().__init__(config)
+        self.dimensions = dimensions
+        self.min_similarity = min_similarity
+        self._matrix = np.zeros((self._INITIAL_CAPACITY, dimensions), dtype=np.float32)
+        self._entries: list[dict] = []
+        self._next_id = 0
+        self._dedup = create_detector(config, backend="vector_local")
+        self._dedup_action = config.memory.dedup_action
+
+    def __len__(self) -> int:
+        """Return the number of stored memories."""
+        return len(self._entries)
+
+    def embed(self, text: str) -> np.ndarray:
+        """Compute the normalized hashed feature vector for text.
+
+        Args:
+            text: Text to vectorize
+
+        Returns:
+            L2-normalized float32 vector (all zeros for text without words)
+        """
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        features: list[str] = []
+        for word in _WORD_PATTERN.findall(text.casefold()):
+            features.append(word)
+            padded = f"#{word}#"
+            features.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+        if not features:
+            return vector
+
+        # crc32 is stable across processes (unlike hash()); the top bit picks the sign
+        hashes = np.fromiter(
+            (zlib.crc32(f.encode()) for f in features), dtype=np.uint32, count=len(features)
+        )
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+        np.add.at(vector, hashes % self.dimensions, signs)
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    async def add(self, messages: list[dict]) -> dict:
+        """Add messages to memory storage.
+
+        A message's ``timestamp`` is kept if present (restored sessions), so
+        memories keep their age. Secrets in the content are redacted before
+        storage.
+
+        Args:
+            messages: List of message dicts with role and content
+
+        Returns:
+            Structured response dict with success status and added memory IDs
+        """
+        if not messages:
+            return self._create_error_response(
+                error="invalid_input", message="No messages provided"
+            )
+
+        added_memories = []
+        duplicates = 0
+
+        for msg in messages:
+            # Validate message structure
+            if not isinstance(msg, dict) or "role" not in msg or "content" not in msg:
+                logger.warning(f"Skipping invalid message: {msg}")
+                continue
+
+            content, _ = self._scrub_sensitive_content(str(msg.get("content", "")))
+
+            signature = None
+            if self._dedup is not None:
+                signature = self._dedup.signature(msg.get("role", "unknown"), content)
+                duplicate_row = self._dedup.find(signature)
+                if duplicate_row is not None:
+                    duplicates += 1
+                    if self._dedup_action == "merge":
+                        existing = self._entries[duplicate_row]
+                        if msg.get("metadata"):
+                            existing["metadata"] = {**existing["metadata"], **msg["metadata"]}
+                        added_memories.append(existing["id"])
+                    continue
+
+            memory_entry = {
+                "id": self._next_id,
+                "role": msg.get("role", "unknown"),
+                "content": content,
+                "timestamp": msg.get("timestamp") or datetime.now().isoformat(),
+                "metadata": msg.get("metadata") or {},
+            }
+            self._next_id += 1
+
+            row = len(self._entries)
+            if row == self._matrix.shape[0]:
+                # Grow geometrically so appends stay amortized O(1)
+                grown = np.zeros((row * 2, self.dimensions), dtype=np.float32)
+                grown[:row] = self._matrix
+                self._matrix = grown
+            self._matrix[row] = self.embed(str(memory_entry["content"]))
+            self._entries.append(memory_entry)
+            if signature is not None:
+                self._dedup.add(row, signature)
+            added_memories.append(memory_entry["id"])
+
+        logger.debug(
+            f"Added {len(added_memories)} messages to vector memory "
+            f"({duplicates} near-duplicates)"
+        )
+
+        return self._create_success_response(
+            result=added_memories, message=f"Added {len(added_memories)} messages to memory"
+        )
+
+    async def search(self, query: str, limit: int = 5) -> dict:
+        """Search memories by cosine similarity to the query.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results
+
+        Returns:
+            Structured response dict with matching memories (best first)
+        """
+        if not query or not query.strip():
+            return self._create_error_response(
+                error="invalid_query", message="Search query cannot be empty"
+            )
+
+        count = len(self._entries)
+        results: list[dict] = []
+        query_vector = self.embed(query)
+        if count and limit > 0 and query_vector.any():
+            similarities = self._matrix[:count] @ query_vector
+            k = min(limit, count)
+            top = np.argpartition(-similarities, k - 1)[:k]
+            # Order by similarity, newest first on ties
+            top = top[np.lexsort((-top, -similarities[top]))]
+            results = [self._entries[i] for i in top if similarities[i] >= self.min_similarity]
+
+        logger.debug(f"Vector search for '{query}' returned {len(results)} results")
+
+        return self._create_success_response(
+            result=results,
+            message=f"Found {len(results)} matching memories for query: {query}",
+        )
+
+    async def get_all(self) -> dict:
+        """Get all memories from storage.
+
+        Returns:
+            Structured response dict with all memories
+        """
+        return self._create_success_response(
+            result=list(self._entries), message="Retrieved all memories"
+        )
+
+    async def get_recent(self, limit: int = 10) -> dict:
+        """Get recent memories, oldest first.
+
+        Args:
+            limit: Number of recent memories to retrieve
+
+        Returns:
+            Structured response dict with recent memories
+        """
+        recent = list(islice(reversed(self._entries), max(limit, 0)))[::-1]
+        return self._create_success_response(
+            result=recent, message=f"Retrieved {len(recent)} recent memories"
+        )
+
+    async def clear(self) -> dict:
+        """Clear all memories from storage.
+
+        Returns:
+            Structured response dict with success status
+        """
+        count = len(self._entries)
+        self._entries = []
+        if self._dedup is not None:
+            self._dedup.clear()
+        self._matrix = np.zeros((self._INITIAL_CAPACITY, self.dimensions), dtype=np.float32)
+        return self._create_success_response(result=None, message=f"Cleared {count} memories")
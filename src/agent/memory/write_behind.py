@@ -0,0 +1,123 @@
+"""Write-behind queue for slow memory backends.
+
+Backends such as mem0 run LLM fact extraction and embeddings on every write,
+which can take seconds. WriteBehindQueue lets the agent hand writes off and
+finish the turn immediately: a background task performs the writes, coalescing
+whatever accumulated while the previous write was running into one batch.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from agent.observability import record_memory_flush, record_memory_queue_depth
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindQueue:
+    """Bounded background queue that batches message writes.
+
+    Args:
+        writer: Blocking function that stores a batch of messages (run in a thread)
+        max_pending: Maximum queued writes (enqueue waits when full)
+        max_batch: Maximum messages passed to one writer call
+
+    Example:
+        >>> queue = WriteBehindQueue(lambda batch: memory.add(messages=batch))
+        >>> await queue.put([{"role": "user", "content": "My name is Alice"}])
+        >>> await queue.flush()  # e.g. at shutdown
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[list[dict]], object],
+        max_pending: int = 64,
+        max_batch: int = 50,
+    ):
+        self.writer = writer
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.last_flush_seconds: float | None = None
+        self.failed_writes = 0
+        self._queue: asyncio.Queue[list[dict]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._pending_messages = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of messages queued or being written."""
+        return self._pending_messages
+
+    async def put(self, messages: list[dict]) -> None:
+        """Queue messages for writing (waits only if the queue is full).
+
+        Args:
+            messages: Messages to store
+        """
+        if not messages:
+            return
+        queue = self._ensure_worker()
+        await queue.put(messages)
+        self._pending_messages += len(messages)
+        record_memory_queue_depth(len(messages))
+
+    async def flush(self) -> None:
+        """Wait until every queued write has been attempted."""
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush pending writes and stop the background task."""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def _ensure_worker(self) -> asyncio.Queue[list[dict]]:
+        """Start the background task on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            if self._queue is not None and self._pending_messages:
+                # Only possible if a previous event loop exited without flush()
+                logger.warning(f"Dropping {self._pending_messages} unflushed memory writes")
+                record_memory_queue_depth(-self._pending_messages)
+                self._pending_messages = 0
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._worker = loop.create_task(self._run(self._queue))
+        assert self._queue is not None
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[list[dict]]) -> None:
+        """Drain the queue, writing batches as they accumulate."""
+        while True:
+            items = [await queue.get()]
+            batch = list(items[0])
+            # Coalesce writes queued while the previous batch was being written
+            while len(batch) < self.max_batch and not queue.empty():
+                item = queue.get_nowait()
+                items.append(item)
+                batch.extend(item)
+
+            start = time.perf_counter()
+            status = "success"
+            try:
+                await asyncio.to_thread(self.writer, batch)
+            except Exception as e:
+                status = "error"
+                self.failed_writes += len(batch)
+                logger.error(f"Background memory write failed: {e}", exc_info=True)
+            finally:
+                duration = time.perf_counter() - start
+                self.last_flush_seconds = duration
+                self._pending_messages -= len(batch)
+                record_memory_queue_depth(-len(batch))
+                record_memory_flush(duration, status)
+                for _ in items:
+                    queue.task_done()
+            logger.debug(f"Wrote {len(batch)} queued messages in {duration * 1000:.0f}ms")
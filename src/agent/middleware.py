@@ -18,7 +18,8 @@ import json
 import logging
 import time
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from functools import partial
 
 # TYPE_CHECKING import for forward reference
 from typing import TYPE_CHECKING, Any, cast
@@ -29,10 +30,14 @@ from agent_framework import (
     FunctionMiddleware,
 )
 
-from agent.config.manager import load_config
+from agent.config.manager import SettingsSnapshot, get_settings_snapshot
 from agent.config.schema import AgentSettings
+from agent.observability import get_instruments, setup_instruments
+from agent.tools.scheduler import get_tool_scheduler
+from agent.utils.redaction import redact
 
 if TYPE_CHECKING:
+    from agent.observability import AgentInstruments
     from agent.trace_logger import TraceLogger
 
 logger = logging.getLogger(__name__)
@@ -87,6 +92,109 @@ def _extract_model_from_config(config: AgentSettings) -> str | None:
     return None
 
 
+def _current_settings(snapshot: SettingsSnapshot | None) -> AgentSettings:
+    """Get settings of the agent the middleware was created for.
+
+    Args:
+        snapshot: Settings snapshot bound by create_middleware(), if any
+
+    Returns:
+        Agent settings, or the process-wide snapshot for unbound middleware
+    """
+    return snapshot.get() if snapshot is not None else get_settings_snapshot()
+
+
+def _get_instruments(config: AgentSettings) -> "AgentInstruments | None":
+    """Get shared OpenTelemetry instruments when observability is enabled.
+
+    Instruments are normally created by setup_instruments() right after
+    setup_observability() (including auto-detected telemetry); if telemetry is
+    enabled in config but they don't exist yet, they are created on first use.
+
+    Args:
+        config: Agent configuration
+
+    Returns:
+        Shared AgentInstruments, or None if observability is disabled
+    """
+    instruments = get_instruments()
+    if instruments is None and config.enable_otel:
+        instruments = setup_instruments()
+    return instruments
+
+
+def _metric_attributes(config: AgentSettings) -> dict[str, str]:
+    """Build provider/model metric attributes from config.
+
+    Args:
+        config: Agent configuration
+
+    Returns:
+        Attribute dict with provider and model (empty if no provider enabled)
+    """
+    try:
+        provider = config.llm_provider
+    except ValueError:
+        return {}
+    return {"provider": provider, "model": _extract_model_from_config(config) or "unknown"}
+
+
+def _usage_token_counts(usage: Any) -> tuple[int | None, int | None]:
+    """Extract input/output token counts from a UsageDetails-like object.
+
+    Args:
+        usage: Usage details (or None)
+
+    Returns:
+        Tuple of (input_tokens, output_tokens)
+    """
+    if not usage:
+        return None, None
+    input_tokens = getattr(usage, "input_token_count", None)
+    output_tokens = getattr(usage, "output_token_count", None)
+    return (
+        input_tokens if isinstance(input_tokens, int) else None,
+        output_tokens if isinstance(output_tokens, int) else None,
+    )
+
+
+async def _instrument_stream(
+    stream: AsyncIterable[Any],
+    start_time: float,
+    instruments: "AgentInstruments",
+    attributes: dict[str, str],
+) -> AsyncIterator[Any]:
+    """Wrap a streaming agent result to record time-to-first-token and token usage.
+
+    Args:
+        stream: Streaming result (AsyncIterable[AgentRunResponseUpdate])
+        start_time: Request start time (time.time())
+        instruments: Shared instruments
+        attributes: Metric attributes (provider, model)
+
+    Yields:
+        Updates from the wrapped stream, unchanged
+    """
+    first_token_time: float | None = None
+    usage = None
+    async for update in stream:
+        if first_token_time is None and getattr(update, "text", None):
+            first_token_time = time.time()
+            instruments.llm_time_to_first_token.record(first_token_time - start_time, attributes)
+        for content in getattr(update, "contents", None) or []:
+            if getattr(content, "type", None) == "usage":
+                usage = content.details
+        yield update
+
+    input_tokens, output_tokens = _usage_token_counts(usage)
+    instruments.record_token_usage(
+        input_tokens,
+        output_tokens,
+        time.time() - (first_token_time or start_time),
+        attributes,
+    )
+
+
 # ============================================================================
 # Agent-Level Middleware
 # ============================================================================
@@ -95,6 +203,8 @@ def _extract_model_from_config(config: AgentSettings) -> str | None:
 async def agent_run_logging_middleware(
     context: AgentRunContext,
     next: Callable[[AgentRunContext], Awaitable[None]],
+    *,
+    snapshot: SettingsSnapshot | None = None,
 ) -> None:
     """Log agent execution lifecycle and emit LLM request/response events.
 
@@ -108,6 +218,7 @@ async def agent_run_logging_middleware(
     Args:
         context: Agent run context containing messages and state
         next: Next middleware in chain
+        snapshot: Settings of the agent being run (bound by create_middleware())
 
     Example:
         >>> middleware = {"agent": [agent_run_logging_middleware]}
@@ -125,9 +236,11 @@ async def agent_run_logging_middleware(
     # Generate request ID for trace logging
     request_id = str(uuid.uuid4())
 
-    # Load config for trace logging if enabled (reused for request and response)
+    # Settings snapshot for trace logging if enabled (reused for request and response)
     trace_logger = get_trace_logger()
-    config = load_config() if trace_logger else None
+    config = _current_settings(snapshot) if trace_logger else None
+    # Instruments exist once setup_instruments() ran (observability enabled)
+    instruments = get_instruments()
 
     # Emit LLM request event
     llm_event_id = None
@@ -154,7 +267,7 @@ async def agent_run_logging_middleware(
                     else:
                         messages.append({"content": str(msg)})
 
-            # Get model and provider from config (already loaded at middleware start)
+            # Get model and provider from config (snapshot taken at middleware start)
             assert config is not None, "Config should be loaded when trace logger is enabled"
             provider = config.llm_provider
             model = _extract_model_from_config(config)
@@ -227,6 +340,18 @@ async def agent_run_logging_middleware(
         latency_ms = duration * 1000
         logger.debug("Agent run completed successfully")
 
+        # Record LLM throughput metrics (streaming results are measured as consumed)
+        if instruments:
+            attributes = _metric_attributes(config or _current_settings(snapshot))
+            result = getattr(context, "result", None)
+            if getattr(context, "is_streaming", False) is True and result is not None:
+                context.result = _instrument_stream(result, start_time, instruments, attributes)
+            elif result is not None:
+                input_tokens, output_tokens = _usage_token_counts(
+                    getattr(result, "usage_details", None)
+                )
+                instruments.record_token_usage(input_tokens, output_tokens, duration, attributes)
+
         # Emit LLM response event
         if should_show_visualization() and llm_event_id:
             response_event = LLMResponseEvent(duration=duration, event_id=llm_event_id)
@@ -311,7 +436,7 @@ async def agent_run_logging_middleware(
                                 "total_tokens"
                             )
 
-                # Get model from config (loaded once at middleware start)
+                # Get model from config (snapshot taken at middleware start)
                 model = _extract_model_from_config(config) if config else None
 
                 trace_logger.log_response(
@@ -389,6 +514,8 @@ async def agent_observability_middleware(
 async def logging_function_middleware(
     context: FunctionInvocationContext,
     next: Callable,
+    *,
+    snapshot: SettingsSnapshot | None = None,
 ) -> Any:
     """Middleware to log function/tool calls and emit execution events with OpenTelemetry.
 
@@ -398,12 +525,15 @@ async def logging_function_middleware(
     - Emits ToolCompleteEvent on success with result summary
     - Emits ToolErrorEvent on failure
     - Sets tool context for nested event tracking
+    - Runs the tool under its execution policy (concurrency limit, timeout,
+      venue) via the process-wide ToolScheduler, recording queue wait time
     - Creates OpenTelemetry spans for tool execution (when enabled)
     - Only emits events if should_show_visualization() is True
 
     Args:
         context: Function invocation context with function metadata and arguments
         next: Next middleware in chain
+        snapshot: Settings of the agent calling the tool (bound by create_middleware())
 
     Returns:
         Result from tool execution
@@ -412,7 +542,7 @@ async def logging_function_middleware(
         >>> middleware = {"function": [logging_function_middleware]}
         >>> agent = chat_client.create_agent(..., middleware=middleware)
     """
-    from agent_framework.observability import OtelAttr, get_meter, get_tracer
+    from agent_framework.observability import OtelAttr
     from opentelemetry import trace as ot_trace
 
     from agent.display import (
@@ -421,6 +551,7 @@ async def logging_function_middleware(
         ToolStartEvent,
         get_current_tool_event_id,
         get_event_emitter,
+        pop_tool_cache_info,
         set_current_tool_event_id,
         should_show_visualization,
     )
@@ -464,10 +595,10 @@ async def logging_function_middleware(
         set_current_tool_event_id(tool_event_id)
         logger.debug(f"Set tool context: {tool_name} (event_id: {tool_event_id[:8]}...)")
 
-    # Check if observability is enabled
-    config = load_config()
-    tracer = get_tracer(__name__) if config.enable_otel else None
-    meter = get_meter(__name__) if config.enable_otel else None
+    # Check if observability is enabled (cached snapshot, no file read per call)
+    config = _current_settings(snapshot)
+    instruments = _get_instruments(config)
+    tracer = instruments.tracer if instruments else None
 
     start_time = time.time()
 
@@ -476,8 +607,6 @@ async def logging_function_middleware(
     parent_context = None
     if tracer:
         try:
-            from opentelemetry import trace as ot_trace
-
             current_span = ot_trace.get_current_span()
             # If current span looks invalid, try the saved agent span
             if current_span is None or not getattr(current_span, "is_recording", lambda: False)():
@@ -521,39 +650,52 @@ async def logging_function_middleware(
                     else:
                         args_data = str(args)
 
-                    span.set_attribute(
-                        OtelAttr.TOOL_ARGUMENTS,
-                        json.dumps(args_data) if isinstance(args_data, dict) else args_data,
-                    )
+                    args_str = json.dumps(args_data) if isinstance(args_data, dict) else args_data
+                    span.set_attribute(OtelAttr.TOOL_ARGUMENTS, redact(args_str)[0])
 
-            result = await next(context)
+            scheduler = get_tool_scheduler()
+            if scheduler is None:
+                result = await next(context)
+            else:
+                direct_call = (
+                    _direct_call(context) if scheduler.policy(tool_name).venue != "inline" else None
+                )
+                scheduled = await scheduler.run(tool_name, lambda: next(context), direct_call)
+                result = scheduled.result
+                if scheduled.venue != "inline":
+                    # The tool was called directly, bypassing the rest of the chain
+                    context.result = result
+                if instruments:
+                    instruments.tool_queue_wait.record(scheduled.queue_wait, {"tool": tool_name})
+                if span and config.enable_otel:
+                    span.set_attribute("tool.queue_wait", scheduled.queue_wait)
+                    span.set_attribute("tool.venue", scheduled.venue)
             duration = time.time() - start_time
             logger.info(f"Tool call {tool_name} completed successfully ({duration:.2f}s)")
 
             # Record metrics if observability enabled
-            if meter and config.enable_otel:
-                duration_histogram = meter.create_histogram(
-                    name="tool.execution.duration",
-                    description="Tool execution duration in seconds",
-                    unit="s",
-                )
-                duration_histogram.record(duration, {"tool": tool_name, "status": "success"})
+            if instruments:
+                instruments.tool_duration.record(duration, {"tool": tool_name, "status": "success"})
 
             # Set tool result if sensitive data enabled
             if span and config.enable_otel and config.enable_sensitive_data:
                 result_str = json.dumps(result) if isinstance(result, (dict, list)) else str(result)
-                # Truncate to 1000 chars to avoid excessive data
-                span.set_attribute(OtelAttr.TOOL_RESULT, result_str[:1000])
+                # Redact before truncating so a secret cut at the boundary still matches
+                span.set_attribute(OtelAttr.TOOL_RESULT, redact(result_str)[0][:1000])
 
             # Emit tool complete event
             if should_show_visualization() and tool_event_id:
                 # Extract summary from result
                 summary = _extract_tool_summary(tool_name, result)
+                cache = pop_tool_cache_info(tool_event_id)
                 complete_event = ToolCompleteEvent(
                     tool_name=tool_name,
                     result_summary=summary,
                     duration=duration,
                     event_id=tool_event_id,
+                    cache_hit=cache.get("hit"),
+                    cache_hits=cache.get("hits", 0),
+                    cache_misses=cache.get("misses", 0),
                 )
                 get_event_emitter().emit(complete_event)
 
@@ -563,13 +705,8 @@ async def logging_function_middleware(
             logger.error(f"Tool call {tool_name} failed: {e}")
 
             # Record error metrics if observability enabled
-            if meter and config.enable_otel:
-                duration_histogram = meter.create_histogram(
-                    name="tool.execution.duration",
-                    description="Tool execution duration in seconds",
-                    unit="s",
-                )
-                duration_histogram.record(duration, {"tool": tool_name, "status": "error"})
+            if instruments:
+                instruments.tool_duration.record(duration, {"tool": tool_name, "status": "error"})
 
             # Capture exception in span
             if span and config.enable_otel:
@@ -593,6 +730,8 @@ async def logging_function_middleware(
             # Clear tool context when exiting tool (restore parent)
             if should_show_visualization():
                 set_current_tool_event_id(parent_id)
+            if tool_event_id:
+                pop_tool_cache_info(tool_event_id)
                 if parent_id:
                     logger.debug("Restored parent tool context")
                 else:
@@ -615,6 +754,23 @@ def _noop_context_manager() -> Any:
     return nullcontext(None)
 
 
+def _direct_call(context: FunctionInvocationContext) -> tuple[Callable, dict[str, Any]] | None:
+    """Get the tool function and keyword arguments of a call, for thread/process venues.
+
+    Returns:
+        (function, kwargs), or None if the function or arguments are unavailable
+    """
+    func = getattr(context.function, "func", None)
+    args = context.arguments
+    if hasattr(args, "model_dump"):
+        kwargs = args.model_dump()
+    elif isinstance(args, dict):
+        kwargs = dict(args)
+    else:
+        return None
+    return (func, kwargs) if callable(func) else None
+
+
 def _extract_tool_summary(tool_name: str, result: Any) -> str:
     """Extract human-readable summary from tool result.
 
@@ -655,9 +811,13 @@ def _extract_tool_summary(tool_name: str, result: Any) -> str:
 # ============================================================================
 
 
-def create_middleware() -> list:
+def create_middleware(settings: AgentSettings | None = None) -> list:
     """Create default middleware for agent and function levels.
 
+    Args:
+        settings: Settings of the agent the middleware is for. Without them,
+            middleware reads the process-wide settings snapshot.
+
     Returns:
         List of middleware (framework auto-categorizes by type)
 
@@ -667,7 +827,7 @@ def create_middleware() -> list:
 
     Example:
         >>> from agent.middleware import create_middleware
-        >>> middleware = create_middleware()
+        >>> middleware = create_middleware(settings)
         >>> agent = chat_client.create_agent(
         ...     name="Agent",
         ...     instructions="...",
@@ -675,10 +835,20 @@ def create_middleware() -> list:
         ...     middleware=middleware
         ... )
     """
+    if settings is None:
+        return [
+            agent_run_logging_middleware,
+            agent_observability_middleware,
+            logging_function_middleware,
+        ]
+
+    # Per-agent snapshot: agents in one process never read each other's settings
+    snapshot = SettingsSnapshot()
+    snapshot.set(settings)
     return [
-        agent_run_logging_middleware,
+        partial(agent_run_logging_middleware, snapshot=snapshot),
         agent_observability_middleware,
-        logging_function_middleware,
+        partial(logging_function_middleware, snapshot=snapshot),
     ]
 
 
@@ -17,6 +17,9 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Instrumentation scope name shared by middleware tracer and meter
+INSTRUMENTATION_NAME = "agent.middleware"
+
 # Context var to hold the current agent span for cross-task propagation
 _current_agent_span: contextvars.ContextVar[Any] = contextvars.ContextVar(
     "_current_agent_span", default=None
@@ -51,6 +54,232 @@ def get_current_agent_span() -> Any:
         return None
 
 
+class AgentInstruments:
+    """OpenTelemetry tracer and metric instruments used by the middleware pipeline.
+
+    Instruments are created once (when observability is set up) and reused for
+    every tool call, LLM turn, and context provider invocation, instead of being
+    re-created per call.
+
+    Metrics:
+        tool.execution.duration: Tool execution duration (s), by tool and status
+        tool.queue.wait: Time tool calls waited for a concurrency slot (s), by tool
+        llm.time_to_first_token: Time until first streamed text (s), by provider/model
+        llm.output_tokens_per_second: Output token throughput, by provider/model
+        llm.tokens.input: Input tokens consumed, by provider/model
+        llm.tokens.output: Output tokens produced, by provider/model
+        context_provider.duration: Context provider invoking() latency (s), by provider
+        memory.write_queue.depth: Messages waiting in the memory write-behind queue
+        memory.write_queue.flush.duration: Background memory batch write latency (s), by status
+        memory.context.tokens.injected: Memory tokens injected into the prompt
+        memory.context.tokens.saved: Retrieved memory tokens left out (duplicates, budget)
+        memory.dedup.checked: Memory writes checked for near-duplicates, by backend
+        memory.dedup.duplicates: Memory writes found to be near-duplicates, by backend
+    """
+
+    def __init__(self, tracer: Any, meter: Any):
+        """Create instruments from the given tracer and meter.
+
+        Args:
+            tracer: OpenTelemetry tracer for tool spans
+            meter: OpenTelemetry meter used to create metric instruments
+        """
+        self.tracer = tracer
+        self.tool_duration = meter.create_histogram(
+            name="tool.execution.duration",
+            description="Tool execution duration in seconds",
+            unit="s",
+        )
+        self.tool_queue_wait = meter.create_histogram(
+            name="tool.queue.wait",
+            description="Time tool calls waited for a concurrency slot in seconds",
+            unit="s",
+        )
+        self.llm_time_to_first_token = meter.create_histogram(
+            name="llm.time_to_first_token",
+            description="Time from LLM request to first streamed text in seconds",
+            unit="s",
+        )
+        self.llm_output_tokens_per_second = meter.create_histogram(
+            name="llm.output_tokens_per_second",
+            description="LLM output token throughput",
+            unit="{token}/s",
+        )
+        self.llm_input_tokens = meter.create_counter(
+            name="llm.tokens.input",
+            description="LLM input tokens consumed",
+            unit="{token}",
+        )
+        self.llm_output_tokens = meter.create_counter(
+            name="llm.tokens.output",
+            description="LLM output tokens produced",
+            unit="{token}",
+        )
+        self.context_provider_duration = meter.create_histogram(
+            name="context_provider.duration",
+            description="Context provider invoking() latency in seconds",
+            unit="s",
+        )
+        self.memory_queue_depth = meter.create_up_down_counter(
+            name="memory.write_queue.depth",
+            description="Messages waiting in the memory write-behind queue",
+            unit="{message}",
+        )
+        self.memory_flush_duration = meter.create_histogram(
+            name="memory.write_queue.flush.duration",
+            description="Background memory batch write latency in seconds",
+            unit="s",
+        )
+        self.memory_context_tokens_injected = meter.create_counter(
+            name="memory.context.tokens.injected",
+            description="Memory tokens injected into the prompt",
+            unit="{token}",
+        )
+        self.memory_context_tokens_saved = meter.create_counter(
+            name="memory.context.tokens.saved",
+            description="Retrieved memory tokens left out of the prompt",
+            unit="{token}",
+        )
+        self.memory_dedup_checked = meter.create_counter(
+            name="memory.dedup.checked",
+            description="Memory writes checked for near-duplicates",
+            unit="{message}",
+        )
+        self.memory_dedup_duplicates = meter.create_counter(
+            name="memory.dedup.duplicates",
+            description="Memory writes found to be near-duplicates",
+            unit="{message}",
+        )
+
+    def record_token_usage(
+        self,
+        input_tokens: int | None,
+        output_tokens: int | None,
+        generation_seconds: float,
+        attributes: dict[str, str],
+    ) -> None:
+        """Record token counters and output throughput for one LLM turn.
+
+        Args:
+            input_tokens: Input token count (None if unknown)
+            output_tokens: Output token count (None if unknown)
+            generation_seconds: Time spent generating output
+            attributes: Metric attributes (provider, model)
+        """
+        if input_tokens:
+            self.llm_input_tokens.add(input_tokens, attributes)
+        if output_tokens:
+            self.llm_output_tokens.add(output_tokens, attributes)
+            if generation_seconds > 0:
+                self.llm_output_tokens_per_second.record(
+                    output_tokens / generation_seconds, attributes
+                )
+
+
+# Global instruments (created by setup_instruments)
+_instruments: AgentInstruments | None = None
+
+
+def setup_instruments() -> AgentInstruments:
+    """Create the shared middleware instruments.
+
+    Call once after agent_framework.observability.setup_observability() so the
+    instruments bind to the configured providers.
+
+    Returns:
+        The shared AgentInstruments instance
+    """
+    from agent_framework.observability import get_meter, get_tracer
+
+    global _instruments
+    _instruments = AgentInstruments(
+        tracer=get_tracer(INSTRUMENTATION_NAME), meter=get_meter(INSTRUMENTATION_NAME)
+    )
+    return _instruments
+
+
+def get_instruments() -> AgentInstruments | None:
+    """Get the shared middleware instruments.
+
+    Returns:
+        AgentInstruments if setup_instruments() has run, otherwise None
+    """
+    return _instruments
+
+
+def reset_instruments() -> None:
+    """Discard the shared instruments (next setup_instruments() recreates them)."""
+    global _instruments
+    _instruments = None
+
+
+def record_context_provider_duration(provider: str, duration: float) -> None:
+    """Record context provider latency if observability is set up.
+
+    Args:
+        provider: Context provider name (e.g. "memory", "skills")
+        duration: invoking() duration in seconds
+    """
+    instruments = _instruments
+    if instruments is not None:
+        instruments.context_provider_duration.record(duration, {"provider": provider})
+
+
+def record_memory_queue_depth(delta: int) -> None:
+    """Record a change in memory write-behind queue depth if observability is set up.
+
+    Args:
+        delta: Messages added (positive) or written (negative)
+    """
+    instruments = _instruments
+    if instruments is not None:
+        instruments.memory_queue_depth.add(delta)
+
+
+def record_memory_flush(duration: float, status: str) -> None:
+    """Record a background memory batch write if observability is set up.
+
+    Args:
+        duration: Write duration in seconds
+        status: "success" or "error"
+    """
+    instruments = _instruments
+    if instruments is not None:
+        instruments.memory_flush_duration.record(duration, {"status": status})
+
+
+def record_memory_context_tokens(injected: int, saved: int) -> None:
+    """Record memory context token usage for one turn if observability is set up.
+
+    Args:
+        injected: Memory tokens injected into the prompt
+        saved: Retrieved memory tokens left out (already in thread, duplicates, budget)
+    """
+    instruments = _instruments
+    if instruments is not None:
+        if injected:
+            instruments.memory_context_tokens_injected.add(injected)
+        if saved:
+            instruments.memory_context_tokens_saved.add(saved)
+
+
+def record_memory_dedup(duplicate: bool, backend: str) -> None:
+    """Record a near-duplicate check on a memory write if observability is set up.
+
+    The dedup rate is memory.dedup.duplicates / memory.dedup.checked.
+
+    Args:
+        duplicate: Whether the write was a near-duplicate
+        backend: Memory backend name (e.g. "in_memory", "mem0")
+    """
+    instruments = _instruments
+    if instruments is not None:
+        attributes = {"backend": backend}
+        instruments.memory_dedup_checked.add(1, attributes)
+        if duplicate:
+            instruments.memory_dedup_duplicates.add(1, attributes)
+
+
 def check_telemetry_endpoint(endpoint: str | None = None, timeout: float = 0.02) -> bool:
     """Check if telemetry endpoint is reachable.
 
@@ -0,0 +1,169 @@
+"""
+Incremental conversion cache for the Gemini provider.
+
+Every Gemini request re-sends the whole conversation. Converting the full
+history (and the tool list) on every call makes per-turn cost grow with
+history length. This module keeps the converted form of each conversation
+and only converts messages appended since the previous request.
+"""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from operator import is_
+from typing import Any
+
+from agent_framework import ChatMessage, FunctionCallContent
+
+from .types import to_gemini_message, to_gemini_tools
+
+
+def _role_name(message: ChatMessage) -> str:
+    """Return the message role as a plain string."""
+    role = message.role
+    return str(role.value if hasattr(role, "value") else role)
+
+
+class _ConversationState:
+    """Converted form of one conversation (the messages after leading system messages)."""
+
+    def __init__(self) -> None:
+        self.messages: list[ChatMessage] = []
+        self.contents: list[dict[str, Any]] = []
+        self.call_id_to_name: dict[str, str] = {}
+
+    def truncate(self, length: int) -> None:
+        """Keep only the first ``length`` converted messages."""
+        del self.messages[length:]
+        del self.contents[length:]
+        self.call_id_to_name = {}
+        for message in self.messages:
+            self.record_calls(message)
+
+    def record_calls(self, message: ChatMessage) -> None:
+        """Track function call ids so later function results can be named."""
+        for content in getattr(message, "contents", None) or []:
+            if isinstance(content, FunctionCallContent):
+                self.call_id_to_name[content.call_id] = content.name
+
+    def append(self, message: ChatMessage) -> None:
+        """Convert and append one message."""
+        self.record_calls(message)
+        converted = to_gemini_message(message, self.call_id_to_name)
+        self.messages.append(message)
+        self.contents.append({"role": converted["role"], "parts": converted["parts"]})
+
+
+class GeminiConversionCache:
+    """Per-conversation cache of Gemini-formatted messages and tool declarations.
+
+    Conversations are identified by their first non-system message object, so
+    concurrent threads sharing one client keep separate states. Messages are
+    matched by identity (agent-framework threads keep the same ChatMessage
+    objects across turns); only the unmatched tail is converted. Leading system
+    messages (the per-turn instructions message) are always converted fresh.
+
+    Tool declarations are converted once per tool set, keyed by the identity
+    of the tool objects.
+
+    Example:
+        >>> cache = GeminiConversionCache()
+        >>> contents = cache.contents_for(messages)  # converts all messages
+        >>> messages.append(next_message)
+        >>> contents = cache.contents_for(messages)  # converts only next_message
+    """
+
+    def __init__(self, max_conversations: int = 16):
+        """Initialize an empty cache.
+
+        Args:
+            max_conversations: Number of conversations kept (least recently used evicted)
+        """
+        self.max_conversations = max_conversations
+        self._conversations: OrderedDict[int, _ConversationState] = OrderedDict()
+        self._tools_key: tuple[int, ...] | None = None
+        self._tools_ref: tuple[Any, ...] = ()
+        self._tools_converted: list[dict[str, Any]] = []
+        self.converted_messages = 0
+        self.reused_messages = 0
+
+    def contents_for(self, messages: Sequence[ChatMessage]) -> list[dict[str, Any]]:
+        """Return Gemini request contents for ``messages``, converting only new ones.
+
+        Args:
+            messages: Full message list for the request
+
+        Returns:
+            List of Gemini content dictionaries (role + parts)
+        """
+        # Leading system messages are rebuilt every turn; convert them directly
+        lead = 0
+        while lead < len(messages) and _role_name(messages[lead]) == "system":
+            lead += 1
+        contents = [
+            {"role": converted["role"], "parts": converted["parts"]}
+            for converted in (to_gemini_message(m) for m in messages[:lead])
+        ]
+        self.converted_messages += lead
+
+        history = messages[lead:]
+        if not history:
+            return contents
+
+        state = self._get_state(history[0])
+
+        # Fast path: history extends the cached conversation (identity check is
+        # a C-level pointer comparison, far cheaper than re-converting)
+        cached = len(state.messages)
+        if cached > len(history) or not all(map(is_, history[:cached], state.messages)):
+            # Slow path: find the longest identical prefix and drop the rest
+            common = 0
+            limit = min(cached, len(history))
+            while common < limit and history[common] is state.messages[common]:
+                common += 1
+            state.truncate(common)
+            cached = common
+
+        for message in history[cached:]:
+            state.append(message)
+        self.reused_messages += cached
+        self.converted_messages += len(history) - cached
+
+        contents.extend(state.contents)
+        return contents
+
+    def tools_for(self, tools: Sequence[Any]) -> list[dict[str, Any]]:
+        """Return Gemini tool declarations, converting only when the tool set changes.
+
+        Args:
+            tools: Tool list from ChatOptions
+
+        Returns:
+            Gemini tools list (see to_gemini_tools)
+        """
+        key = tuple(id(tool) for tool in tools)
+        if key != self._tools_key:
+            self._tools_converted = to_gemini_tools(list(tools))
+            self._tools_key = key
+            # Hold references so ids cannot be reused by new objects
+            self._tools_ref = tuple(tools)
+        return self._tools_converted
+
+    def clear(self) -> None:
+        """Drop all cached conversations and tool declarations."""
+        self._conversations.clear()
+        self._tools_key = None
+        self._tools_ref = ()
+        self._tools_converted = []
+
+    def _get_state(self, first_message: ChatMessage) -> _ConversationState:
+        """Get (or create) the state for the conversation starting with ``first_message``."""
+        key = id(first_message)
+        state = self._conversations.get(key)
+        if state is None or not state.messages or state.messages[0] is not first_message:
+            state = _ConversationState()
+            self._conversations[key] = state
+            while len(self._conversations) > self.max_conversations:
+                self._conversations.popitem(last=False)
+        else:
+            self._conversations.move_to_end(key)
+        return state
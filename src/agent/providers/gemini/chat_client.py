@@ -5,6 +5,7 @@ This module provides a custom GeminiChatClient that integrates Google's Gemini
 models with the Microsoft Agent Framework by extending BaseChatClient.
 """
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from typing import Any
@@ -19,11 +20,14 @@ from agent_framework import (
 )
 from google import genai
 
+from .cache import GeminiConversionCache
 from .types import (
+    extract_finish_reason,
     extract_usage_metadata,
+    from_gemini_chunk,
     from_gemini_message,
-    to_gemini_message,
-    to_gemini_tools,
+    to_usage_content,
+    to_usage_details,
 )
 
 logger = logging.getLogger(__name__)
@@ -108,29 +112,8 @@ class GeminiChatClient(BaseChatClient):
             self.client = genai.Client(api_key=api_key)
             logger.info("Initialized Gemini client with API key")
 
-    def _build_call_id_mapping(self, messages: list[ChatMessage]) -> dict[str, str]:
-        """Build mapping from function call_id to function name.
-
-        Args:
-            messages: List of chat messages
-
-        Returns:
-            Dictionary mapping call_id to function name
-        """
-        call_id_to_name: dict[str, str] = {}
-        for m in messages:
-            for c in getattr(m, "contents", []) or []:
-                try:
-                    # Lazy import to avoid circular types
-                    from agent_framework import FunctionCallContent
-
-                    if isinstance(c, FunctionCallContent):
-                        call_id_to_name[c.call_id] = c.name
-                except Exception:
-                    # Ignore errors during FunctionCallContent type check
-                    # Not all contents are FunctionCallContent
-                    pass
-        return call_id_to_name
+        # Converted history and tool declarations reused across turns
+        self._conversion_cache = GeminiConversionCache()
 
     def _prepare_options(
         self, messages: list[ChatMessage], chat_options: ChatOptions | None = None
@@ -162,7 +145,7 @@ class GeminiChatClient(BaseChatClient):
             # Handle tools/functions (pass via config for google-genai)
             tools = chat_options.tools() if callable(chat_options.tools) else chat_options.tools
             if tools:
-                config["tools"] = to_gemini_tools(tools)  # type: ignore[arg-type]
+                config["tools"] = self._conversion_cache.tools_for(tools)
 
         return config
 
@@ -183,6 +166,26 @@ class GeminiChatClient(BaseChatClient):
         logger.error(f"Traceback: {traceback.format_exc()}")
         return error
 
+    def _build_contents(self, messages: list[ChatMessage]) -> list[dict[str, Any]]:
+        """Convert chat history to Gemini request contents.
+
+        Messages already converted on a previous turn of the same conversation
+        are reused from the conversion cache; only new messages are converted.
+
+        Args:
+            messages: List of chat messages
+
+        Returns:
+            List of Gemini content dictionaries (role + parts)
+        """
+        return self._conversion_cache.contents_for(messages)
+
+    async def close(self) -> None:
+        """Close the underlying async HTTP client (releases pooled connections)."""
+        aclose = getattr(self.client.aio, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
     async def _inner_get_response(  # type: ignore[override]
         self,
         *,
@@ -192,8 +195,9 @@ class GeminiChatClient(BaseChatClient):
     ) -> ChatResponse:
         """Get non-streaming response from Gemini API.
 
-        This method is required by BaseChatClient and handles synchronous
-        chat completions.
+        This method is required by BaseChatClient. The request is awaited on the
+        SDK's async client (client.aio), so it never blocks the event loop and is
+        cancelled cleanly when the awaiting task is cancelled.
 
         Args:
             messages: List of chat messages
@@ -206,23 +210,13 @@ class GeminiChatClient(BaseChatClient):
             Exception: If API call fails
         """
         try:
-            # Build mapping from function call_id to function name
-            call_id_to_name = self._build_call_id_mapping(messages)
-
-            # Convert messages to Gemini format
-            gemini_messages = [to_gemini_message(msg, call_id_to_name) for msg in messages]
+            contents = self._build_contents(messages)
 
             # Prepare generation config (contains tools when provided)
             config = self._prepare_options(messages, chat_options)
 
-            # Build contents for Gemini API
-            # Note: Gemini expects a list of content objects
-            contents = []
-            for msg in gemini_messages:
-                contents.append({"role": msg["role"], "parts": msg["parts"]})
-
-            # Call Gemini API (synchronous)
-            response = self.client.models.generate_content(
+            # Call Gemini API (async client, non-blocking)
+            response = await self.client.aio.models.generate_content(
                 model=self.model_id,
                 contents=contents,
                 config=config if config else None,  # type: ignore[arg-type]
@@ -234,9 +228,15 @@ class GeminiChatClient(BaseChatClient):
             # Extract usage metadata
             usage = extract_usage_metadata(response)
 
-            # Create ChatResponse with usage_details (let class handle dict -> UsageDetails)
-            return ChatResponse(messages=[chat_message], usage_details=usage or None)  # type: ignore[arg-type]
+            return ChatResponse(
+                messages=[chat_message],
+                model_id=self.model_id,
+                usage_details=to_usage_details(usage),
+                finish_reason=extract_finish_reason(response),
+            )
 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             raise self._handle_gemini_error(e)
 
@@ -249,8 +249,12 @@ class GeminiChatClient(BaseChatClient):
     ) -> AsyncIterator[ChatResponseUpdate]:
         """Get streaming response from Gemini API.
 
-        This method is required by BaseChatClient and handles streaming
-        chat completions, yielding response chunks as they arrive.
+        This method is required by BaseChatClient and yields response chunks as
+        they arrive from the SDK's async stream. Updates carry text, function
+        calls and finish reasons; token usage (reported cumulatively by Gemini on
+        every chunk) is emitted once, as a final UsageContent update. If the
+        consumer stops iterating or the task is cancelled, the underlying HTTP
+        stream is closed.
 
         Args:
             messages: List of chat messages
@@ -262,35 +266,44 @@ class GeminiChatClient(BaseChatClient):
         Raises:
             Exception: If API call fails
         """
+        stream = None
         try:
-            # Build mapping from function call_id to function name
-            call_id_to_name = self._build_call_id_mapping(messages)
-
-            # Convert messages to Gemini format
-            gemini_messages = [to_gemini_message(msg, call_id_to_name) for msg in messages]
+            contents = self._build_contents(messages)
 
             # Prepare generation config (contains tools when provided)
             config = self._prepare_options(messages, chat_options)
 
-            # Build contents for Gemini API
-            contents = []
-            for msg in gemini_messages:
-                contents.append({"role": msg["role"], "parts": msg["parts"]})
-
-            # Call Gemini API with streaming
-            stream = self.client.models.generate_content_stream(
+            # Call Gemini API with async streaming
+            stream = await self.client.aio.models.generate_content_stream(
                 model=self.model_id,
                 contents=contents,
                 config=config if config else None,  # type: ignore[arg-type]
             )
 
             # Yield chunks as they arrive
-            for chunk in stream:
-                if hasattr(chunk, "text") and chunk.text:
-                    yield ChatResponseUpdate(
-                        text=chunk.text,
-                        role="assistant",
-                    )
-
+            last_chunk = None
+            async for chunk in stream:
+                last_chunk = chunk
+                update = from_gemini_chunk(chunk)
+                if update is not None:
+                    update.model_id = self.model_id
+                    yield update
+
+            # Usage metadata is cumulative; report the final totals once
+            usage_content = to_usage_content(last_chunk) if last_chunk is not None else None
+            if usage_content is not None:
+                yield ChatResponseUpdate(
+                    contents=[usage_content],
+                    role="assistant",
+                    model_id=self.model_id,
+                )
+
+        except (asyncio.CancelledError, GeneratorExit):
+            raise
         except Exception as e:
             raise self._handle_gemini_error(e)
+        finally:
+            # Release the HTTP stream on early exit or cancellation
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
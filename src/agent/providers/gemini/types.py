@@ -10,11 +10,27 @@ from typing import Any
 from agent_framework import (
     AIFunction,
     ChatMessage,
+    ChatResponseUpdate,
+    FinishReason,
     FunctionCallContent,
     FunctionResultContent,
     TextContent,
+    UsageContent,
+    UsageDetails,
 )
 
+# Gemini finish reasons -> agent-framework finish reasons
+_FINISH_REASON_MAPPING = {
+    "STOP": FinishReason.STOP,
+    "MAX_TOKENS": FinishReason.LENGTH,
+    "SAFETY": FinishReason.CONTENT_FILTER,
+    "RECITATION": FinishReason.CONTENT_FILTER,
+    "BLOCKLIST": FinishReason.CONTENT_FILTER,
+    "PROHIBITED_CONTENT": FinishReason.CONTENT_FILTER,
+    "SPII": FinishReason.CONTENT_FILTER,
+    "IMAGE_SAFETY": FinishReason.CONTENT_FILTER,
+}
+
 
 def to_gemini_message(
     message: ChatMessage, call_id_to_name: dict[str, str] | None = None
@@ -91,20 +107,16 @@ def to_gemini_message(
     return {"role": gemini_role, "parts": parts}
 
 
-def from_gemini_message(gemini_response: Any) -> ChatMessage:
-    """Convert Gemini response to agent-framework ChatMessage.
+def _contents_from_gemini_response(
+    gemini_response: Any,
+) -> list[TextContent | FunctionCallContent]:
+    """Extract text and function call contents from a Gemini response or stream chunk.
 
     Args:
-        gemini_response: Response object from Gemini API
+        gemini_response: Response (or streaming chunk) object from Gemini API
 
     Returns:
-        ChatMessage for agent-framework
-
-    Example:
-        >>> response = gemini_client.generate_content("Hello")
-        >>> msg = from_gemini_message(response)
-        >>> msg.role
-        'assistant'
+        List of TextContent / FunctionCallContent items (may be empty)
     """
     content_items: list[TextContent | FunctionCallContent] = []
 
@@ -112,7 +124,7 @@ def from_gemini_message(gemini_response: Any) -> ChatMessage:
     if hasattr(gemini_response, "candidates") and gemini_response.candidates:
         candidate = gemini_response.candidates[0]
         if hasattr(candidate, "content") and candidate.content:
-            for part in candidate.content.parts:
+            for part in candidate.content.parts or []:
                 # Text content
                 if hasattr(part, "text") and part.text:
                     content_items.append(TextContent(text=part.text))
@@ -126,10 +138,30 @@ def from_gemini_message(gemini_response: Any) -> ChatMessage:
                         FunctionCallContent(
                             call_id=call_id,
                             name=fc.name,
-                            arguments=dict(fc.args) if hasattr(fc, "args") else {},
+                            arguments=dict(fc.args) if getattr(fc, "args", None) else {},
                         )
                     )
 
+    return content_items
+
+
+def from_gemini_message(gemini_response: Any) -> ChatMessage:
+    """Convert Gemini response to agent-framework ChatMessage.
+
+    Args:
+        gemini_response: Response object from Gemini API
+
+    Returns:
+        ChatMessage for agent-framework
+
+    Example:
+        >>> response = await gemini_client.aio.models.generate_content(...)
+        >>> msg = from_gemini_message(response)
+        >>> msg.role
+        'assistant'
+    """
+    content_items = _contents_from_gemini_response(gemini_response)
+
     # Return ChatMessage with contents list
     # Note: agent-framework uses 'contents' (plural) not 'content'
     if not content_items:
@@ -138,6 +170,66 @@ def from_gemini_message(gemini_response: Any) -> ChatMessage:
     return ChatMessage(role="assistant", contents=content_items)
 
 
+def extract_finish_reason(gemini_response: Any) -> FinishReason | None:
+    """Map the Gemini candidate finish reason to an agent-framework FinishReason.
+
+    Args:
+        gemini_response: Response (or streaming chunk) object from Gemini API
+
+    Returns:
+        FinishReason, or None if the response has not finished (or reason is unknown)
+
+    Example:
+        >>> extract_finish_reason(response)
+        FinishReason(value='stop')
+    """
+    candidates = getattr(gemini_response, "candidates", None)
+    if not candidates:
+        return None
+    reason = getattr(candidates[0], "finish_reason", None)
+    if reason is None:
+        return None
+    # google-genai returns an enum; fall back to the raw string for older SDKs
+    name = str(getattr(reason, "name", None) or getattr(reason, "value", None) or reason)
+    return _FINISH_REASON_MAPPING.get(name.upper())
+
+
+def from_gemini_chunk(chunk: Any) -> ChatResponseUpdate | None:
+    """Convert a Gemini streaming chunk to an agent-framework ChatResponseUpdate.
+
+    Carries text, function calls and finish reason. Usage metadata is not included
+    because Gemini reports cumulative usage on every chunk; callers should emit it
+    once at the end of the stream (see to_usage_content()).
+
+    Args:
+        chunk: Streaming chunk from generate_content_stream()
+
+    Returns:
+        ChatResponseUpdate, or None if the chunk carries nothing to forward
+
+    Example:
+        >>> async for chunk in await client.aio.models.generate_content_stream(...):
+        ...     update = from_gemini_chunk(chunk)
+    """
+    contents = _contents_from_gemini_response(chunk)
+    finish_reason = extract_finish_reason(chunk)
+    if not contents and finish_reason is None:
+        return None
+
+    if finish_reason == FinishReason.STOP and any(
+        isinstance(item, FunctionCallContent) for item in contents
+    ):
+        finish_reason = FinishReason.TOOL_CALLS
+
+    return ChatResponseUpdate(
+        contents=contents,
+        role="assistant",
+        response_id=getattr(chunk, "response_id", None),
+        finish_reason=finish_reason,
+        raw_representation=chunk,
+    )
+
+
 def to_gemini_tools(tools: list[AIFunction]) -> list[dict[str, Any]]:
     """Convert agent-framework AIFunction tools to Gemini function declarations.
 
@@ -218,10 +310,45 @@ def extract_usage_metadata(gemini_response: Any) -> dict[str, Any]:
     """
     usage = {}
 
-    if hasattr(gemini_response, "usage_metadata"):
-        metadata = gemini_response.usage_metadata
+    metadata = getattr(gemini_response, "usage_metadata", None)
+    if metadata is not None:
         usage["prompt_tokens"] = getattr(metadata, "prompt_token_count", 0)
         usage["completion_tokens"] = getattr(metadata, "candidates_token_count", 0)
         usage["total_tokens"] = getattr(metadata, "total_token_count", 0)
 
     return usage
+
+
+def to_usage_details(usage: dict[str, Any]) -> UsageDetails | None:
+    """Convert extract_usage_metadata() output to agent-framework UsageDetails.
+
+    Args:
+        usage: Usage dictionary from extract_usage_metadata()
+
+    Returns:
+        UsageDetails with input/output/total token counts, or None if empty
+
+    Example:
+        >>> to_usage_details({"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15})
+        UsageDetails(input_token_count=10, output_token_count=5, total_token_count=15)
+    """
+    if not usage:
+        return None
+    return UsageDetails(
+        input_token_count=usage.get("prompt_tokens") or 0,
+        output_token_count=usage.get("completion_tokens") or 0,
+        total_token_count=usage.get("total_tokens") or 0,
+    )
+
+
+def to_usage_content(gemini_response: Any) -> UsageContent | None:
+    """Build a UsageContent from a Gemini response's usage metadata.
+
+    Args:
+        gemini_response: Response (or final streaming chunk) object from Gemini API
+
+    Returns:
+        UsageContent, or None if the response carries no usage metadata
+    """
+    details = to_usage_details(extract_usage_metadata(gemini_response))
+    return UsageContent(details=details) if details else None
@@ -0,0 +1,156 @@
+"""Persistent cache of discovered skills for fast Agent startup.
+
+Loading skills reads and YAML-parses every SKILL.md, validates the manifest
+and globs the scripts directory, on every Agent start. SkillCache keeps the
+result per skill directory in one compact JSON file, keyed by a fingerprint
+of the directory: the modification times of the skill directory, SKILL.md
+and scripts/ (adding or removing a script changes the directory mtime) and,
+for installed plugins, the commit SHA recorded in the skill registry. An
+unchanged skill is loaded from the cache without touching its files.
+
+Cached entries hold the manifest as validated JSON, the discovered scripts
+and the token count of the skill's documentation, so the documentation
+index does not recount tokens either.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout or manifest schema changes
+CACHE_VERSION = 2
+
+
+def skill_fingerprint(skill_path: Path, commit_sha: str | None = None) -> list[Any]:
+    """Fingerprint a skill directory for cache validation.
+
+    Args:
+        skill_path: Skill directory containing SKILL.md
+        commit_sha: Registry commit SHA for installed plugins
+
+    Returns:
+        JSON-serializable fingerprint (changes when the skill may have changed)
+
+    Raises:
+        OSError: If the skill directory or SKILL.md cannot be stat'ed
+    """
+    manifest_stat = (skill_path / "SKILL.md").stat()
+    try:
+        scripts_mtime: int | None = (skill_path / "scripts").stat().st_mtime_ns
+    except OSError:
+        scripts_mtime = None
+    return [
+        skill_path.stat().st_mtime_ns,
+        manifest_stat.st_mtime_ns,
+        manifest_stat.st_size,
+        scripts_mtime,
+        commit_sha,
+    ]
+
+
+class SkillCache:
+    """JSON file cache of skill manifests, scripts and documentation metadata.
+
+    Attributes:
+        path: Cache file path
+        hits: Skills loaded from the cache
+        misses: Skills that had to be parsed
+
+    Example:
+        >>> cache = SkillCache(Path("~/.agent/skills/cache.json"))
+        >>> entry = cache.get(skill_path, fingerprint)
+        >>> if entry is None:
+        ...     cache.put(skill_path, fingerprint, {"manifest": {...}, "scripts": []})
+        >>> cache.save()
+    """
+
+    def __init__(self, path: Path):
+        """Load the cache file (a missing or unreadable file is an empty cache).
+
+        Args:
+            path: Cache file path
+        """
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable skill cache {self.path}: {e}")
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._entries = data.get("skills") or {}
+
+    def __len__(self) -> int:
+        """Return the number of cached skills."""
+        return len(self._entries)
+
+    def get(self, skill_path: Path, fingerprint: list[Any]) -> dict[str, Any] | None:
+        """Get the cached entry of a skill if its fingerprint still matches.
+
+        Args:
+            skill_path: Skill directory
+            fingerprint: Current fingerprint (see skill_fingerprint())
+
+        Returns:
+            Cached entry dict, or None on a miss
+        """
+        key = str(skill_path)
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry.get("fingerprint") == fingerprint:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def put(self, skill_path: Path, fingerprint: list[Any], entry: dict[str, Any]) -> None:
+        """Store the loaded data of a skill.
+
+        Args:
+            skill_path: Skill directory
+            fingerprint: Fingerprint the data was loaded at
+            entry: JSON-serializable data (manifest, scripts, tokens)
+        """
+        key = str(skill_path)
+        self._seen.add(key)
+        self._entries[key] = {**entry, "fingerprint": fingerprint}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed, dropping skills not seen since it was loaded.
+
+        Writes go to a temporary file that replaces the cache atomically, so
+        concurrent agents never read a partial file. Errors are logged, not
+        raised: the cache is an optimization.
+        """
+        stale = set(self._entries) - self._seen
+        if not self._dirty and not stale:
+            return
+        for key in stale:
+            del self._entries[key]
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps(
+                    {"version": CACHE_VERSION, "skills": self._entries},
+                    separators=(",", ":"),
+                    default=str,
+                )
+            )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write skill cache {self.path}: {e}")
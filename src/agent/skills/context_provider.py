@@ -7,15 +7,29 @@ user queries and trigger matching, avoiding constant token overhead.
 
 import logging
 import re
+import time
 from collections.abc import MutableSequence
 from typing import Any
 
 from agent_framework import ChatMessage, Context, ContextProvider
 
+from agent.observability import record_context_provider_duration
 from agent.skills.documentation_index import SkillDocumentationIndex
 
 logger = logging.getLogger(__name__)
 
+# Capability questions ("what can you do?") -> skill registry
+_SKILL_INFO_PATTERN = re.compile(
+    r"\bwhat.*(?:can|could).*(?:you|u).*do\b"
+    r"|\b(?:show|list).*capabilities\b"
+    r"|\bwhat.*skills?\b"
+)
+
+# "Show all skills" escape hatch -> full documentation (capped)
+_ALL_SKILLS_PATTERN = re.compile(
+    r"\bshow.*all.*skills?\b|\blist.*all.*skills?\b|\ball.*skill.*(?:documentation|docs)\b"
+)
+
 
 class SkillContextProvider(ContextProvider):
     """Progressive skill documentation with on-demand registry.
@@ -41,6 +55,7 @@ class SkillContextProvider(ContextProvider):
         memory_manager: Any | None = None,
         max_skills: int = 3,
         max_all_skills: int = 10,
+        token_budget: int = 3000,
     ):
         """Initialize skill context provider.
 
@@ -49,11 +64,13 @@ class SkillContextProvider(ContextProvider):
             memory_manager: Optional memory manager for conversation context (unused)
             max_skills: Maximum number of skills to inject when matched (default: 3)
             max_all_skills: Cap for "show all skills" to prevent overflow (default: 10)
+            token_budget: Maximum tokens of matched skill documentation (default: 3000)
         """
         self.skill_docs = skill_docs
         self.memory_manager = memory_manager  # For conversation context (future use)
         self.max_skills = max_skills
         self.max_all_skills = max_all_skills
+        self.token_budget = token_budget
 
     async def invoking(
         self, messages: ChatMessage | MutableSequence[ChatMessage], **kwargs: Any
@@ -64,6 +81,21 @@ class SkillContextProvider(ContextProvider):
             messages: Current conversation messages
             **kwargs: Additional context
 
+        Returns:
+            Context with appropriate skill documentation
+        """
+        start_time = time.perf_counter()
+        try:
+            return self._select_context(messages)
+        finally:
+            record_context_provider_duration("skills", time.perf_counter() - start_time)
+
+    def _select_context(self, messages: ChatMessage | MutableSequence[ChatMessage]) -> Context:
+        """Select skill documentation tier for the latest user message.
+
+        Args:
+            messages: Current conversation messages
+
         Returns:
             Context with appropriate skill documentation
         """
@@ -80,15 +112,16 @@ class SkillContextProvider(ContextProvider):
         if self._wants_all_skills(current_message):
             return self._inject_all_skills_capped()
 
-        # 4. Match skills based on current message
+        # 4. Match skills based on current message, most relevant first
         relevant_skills = self._match_skills_safely(current_message.lower())
 
         # 5. Build response based on matches
         if relevant_skills:
-            # Inject full documentation for matched skills
-            docs = self._build_skill_documentation(relevant_skills[: self.max_skills])
+            # Inject full documentation for the top matches within the token budget
+            selected = self._select_within_budget(relevant_skills)
+            docs = self._build_skill_documentation(selected)
             logger.debug(
-                f"Injecting {len(relevant_skills[:self.max_skills])} skill(s) documentation"
+                f"Injecting {len(selected)} of {len(relevant_skills)} matched skill(s) documentation"
             )
             return Context(instructions=docs)
         elif self.skill_docs.has_skills():
@@ -119,14 +152,7 @@ class SkillContextProvider(ContextProvider):
             True if at least one skill has more than just its name as a keyword,
             or has verbs or patterns defined.
         """
-        for skill in self.skill_docs.get_all_metadata():
-            triggers = skill.get("triggers", {})
-            keywords = triggers.get("keywords", [])
-            # The first keyword is always the skill name (auto-added by model_post_init)
-            # Explicit triggers exist if there are additional keywords, verbs, or patterns
-            if len(keywords) > 1 or triggers.get("verbs") or triggers.get("patterns"):
-                return True
-        return False
+        return self.skill_docs.get_matcher().has_explicit_triggers
 
     def _inject_skill_registry(self) -> Context:
         """Inject skill registry with brief descriptions for LLM-driven discovery."""
@@ -147,105 +173,52 @@ class SkillContextProvider(ContextProvider):
 
     def _wants_skill_info(self, message: str) -> bool:
         """Check if user is asking about capabilities."""
-        info_patterns = [
-            r"\bwhat.*(?:can|could).*(?:you|u).*do\b",
-            r"\b(?:show|list).*capabilities\b",
-            r"\bwhat.*skills?\b",
-        ]
-        message_lower = message.lower()
-        return any(re.search(pattern, message_lower) for pattern in info_patterns)
+        return _SKILL_INFO_PATTERN.search(message.lower()) is not None
 
     def _wants_all_skills(self, message: str) -> bool:
         """Check if user wants to see all skill documentation."""
-        all_patterns = [
-            r"\bshow.*all.*skills?\b",
-            r"\blist.*all.*skills?\b",
-            r"\ball.*skill.*(?:documentation|docs)\b",
-        ]
-        message_lower = message.lower()
-        return any(re.search(pattern, message_lower) for pattern in all_patterns)
+        return _ALL_SKILLS_PATTERN.search(message.lower()) is not None
 
     def _match_skills_safely(self, context: str) -> list[dict]:
-        """Match skills with word boundaries and error handling.
+        """Match skills against the precompiled trigger matcher.
+
+        Names, keywords and verbs match on word boundaries; invalid regex
+        patterns were already skipped when the matcher was built. Matches are
+        ranked by trigger strength and BM25 relevance of the skill's
+        documentation (see SkillTriggerMatcher.rank()).
 
         Args:
             context: User message text (lowercase)
 
         Returns:
-            List of matched skill metadata dictionaries
+            List of matched skill metadata dictionaries, most relevant first
         """
-        matched = []
-        seen = set()
+        return [skill for skill, _ in self.skill_docs.get_matcher().rank(context)]
 
-        for skill in self.skill_docs.get_all_metadata():
-            skill_id = skill["name"]
-            if skill_id in seen:
-                continue
-
-            skill_name_lower = skill["name"].lower()
-            triggers = skill.get("triggers", {})
+    def _select_within_budget(self, skills: list[dict]) -> list[dict]:
+        """Pick the top ranked skills whose documentation fits the token budget.
 
-            # Check if triggers dict is effectively empty (no keywords, verbs, or patterns)
-            has_triggers = bool(
-                triggers.get("keywords") or triggers.get("verbs") or triggers.get("patterns")
-            )
-
-            # If no triggers defined, only match by skill name (restrictive fallback)
-            if not has_triggers:
-                try:
-                    if re.search(rf"\b{re.escape(skill_name_lower)}\b", context):
-                        matched.append(skill)
-                        seen.add(skill_id)
-                except re.error as e:
-                    logger.warning(f"Regex error matching skill name '{skill_name_lower}': {e}")
-                continue
+        The most relevant skill is always included; a less relevant skill
+        that does not fit is skipped, so a smaller one after it may still use
+        the remaining budget.
 
-            # Strategy 1: Skill name mentioned (word boundary)
-            try:
-                if re.search(rf"\b{re.escape(skill_name_lower)}\b", context):
-                    matched.append(skill)
-                    seen.add(skill_id)
-                    continue
-            except re.error as e:
-                logger.warning(f"Regex error matching skill name '{skill_name_lower}': {e}")
-
-            # Strategy 2: Keyword triggers (word boundary)
-            for keyword in triggers.get("keywords", []):
-                try:
-                    if re.search(rf"\b{re.escape(keyword.lower())}\b", context):
-                        matched.append(skill)
-                        seen.add(skill_id)
-                        break
-                except re.error as e:
-                    logger.warning(f"Regex error matching keyword '{keyword}': {e}")
-
-            if skill_id in seen:
-                continue
+        Args:
+            skills: Matched skill metadata dictionaries, most relevant first
 
-            # Strategy 3: Verb triggers (word boundary)
-            for verb in triggers.get("verbs", []):
-                try:
-                    if re.search(rf"\b{re.escape(verb.lower())}\b", context):
-                        matched.append(skill)
-                        seen.add(skill_id)
-                        break
-                except re.error as e:
-                    logger.warning(f"Regex error matching verb '{verb}': {e}")
-
-            if skill_id in seen:
+        Returns:
+            At most max_skills skills, in ranked order
+        """
+        selected: list[dict] = []
+        used = 0
+        for skill in skills:
+            if len(selected) >= self.max_skills:
+                break
+            tokens = skill.get("tokens", 0)
+            if selected and used + tokens > self.token_budget:
                 continue
-
-            # Strategy 4: Pattern matching (with error handling)
-            for pattern in triggers.get("patterns", []):
-                try:
-                    if re.search(pattern, context, re.IGNORECASE):
-                        matched.append(skill)
-                        seen.add(skill_id)
-                        break
-                except re.error as e:
-                    logger.warning(f"Invalid regex pattern for {skill_id}: {pattern} - {e}")
-
-        return matched
+            selected.append(skill)
+            used += tokens
+        return selected
 
     def _build_skill_documentation(self, skills: list[dict]) -> str:
         """Build full documentation for matched skills.
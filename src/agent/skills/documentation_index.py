@@ -8,6 +8,22 @@ from dataclasses import dataclass
 from typing import Any
 
 from agent.skills.manifest import SkillManifest
+from agent.skills.trigger_matcher import SkillTriggerMatcher
+from agent.utils.tokens import count_tokens
+
+
+def section_tokens(name: str, instructions: str) -> int:
+    """Count the tokens of a skill's documentation section as injected into context.
+
+    Args:
+        name: Canonical skill name
+        instructions: Skill instructions (SKILL.md body)
+
+    Returns:
+        Token count of the section
+    """
+    # Same layout as SkillContextProvider._build_skill_documentation
+    return count_tokens(f"### {name}\n\n{instructions}\n")
 
 
 @dataclass
@@ -18,6 +34,12 @@ class SkillDocumentation:
     brief_description: str
     triggers: dict[str, list[str]]  # {keywords: [], verbs: [], patterns: []}
     instructions: str
+    tokens: int = 0  # Tokens of the injected documentation section
+
+    def __post_init__(self) -> None:
+        """Precompute the token count of the documentation section."""
+        if not self.tokens:
+            self.tokens = section_tokens(self.name, self.instructions)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for context provider."""
@@ -26,6 +48,7 @@ class SkillDocumentation:
             "brief_description": self.brief_description,
             "triggers": self.triggers,
             "instructions": self.instructions,
+            "tokens": self.tokens,
         }
 
 
@@ -35,6 +58,8 @@ class SkillDocumentationIndex:
     Separate from SkillRegistry to avoid mixing persistent install
     metadata with runtime documentation. This index is built at agent
     initialization and used by SkillContextProvider for progressive disclosure.
+    Skill triggers are compiled into a SkillTriggerMatcher on first use after
+    the index changes.
 
     Example:
         >>> skill_docs = SkillDocumentationIndex()
@@ -48,13 +73,16 @@ class SkillDocumentationIndex:
 
     def __init__(self) -> None:
         self._skills: dict[str, SkillDocumentation] = {}
+        self._matcher: SkillTriggerMatcher | None = None
 
-    def add_skill(self, name: str, manifest: SkillManifest) -> None:
+    def add_skill(self, name: str, manifest: SkillManifest, tokens: int | None = None) -> None:
         """Add skill documentation from manifest.
 
         Args:
             name: Canonical skill name (normalized)
             manifest: Parsed SkillManifest with instructions and triggers
+            tokens: Precomputed section_tokens() of the skill (e.g. from the skill
+                cache); counted if omitted
         """
         # Convert triggers to dict format with consistent structure
         triggers_dict = {
@@ -68,7 +96,9 @@ class SkillDocumentationIndex:
             brief_description=manifest.brief_description or manifest.description[:80],
             triggers=triggers_dict,
             instructions=manifest.instructions,
+            tokens=tokens or 0,
         )
+        self._matcher = None
 
     def get_all_metadata(self) -> list[dict[str, Any]]:
         """Get all skill metadata for matching.
@@ -79,6 +109,16 @@ class SkillDocumentationIndex:
         """
         return [skill.to_dict() for skill in self._skills.values()]
 
+    def get_matcher(self) -> SkillTriggerMatcher:
+        """Get the compiled trigger matcher for the current skills.
+
+        Returns:
+            SkillTriggerMatcher, rebuilt only after skills were added.
+        """
+        if self._matcher is None:
+            self._matcher = SkillTriggerMatcher(self.get_all_metadata())
+        return self._matcher
+
     def has_skills(self) -> bool:
         """Check if any skills are loaded.
 
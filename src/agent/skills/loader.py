@@ -1,7 +1,8 @@
 """Skill loader for discovering and loading skills.
 
 This module handles skill discovery, manifest parsing, script metadata collection,
-and dynamic toolset importing.
+and dynamic toolset importing. With a SkillCache, manifests and script metadata
+of unchanged skills are loaded from the cache instead of being re-parsed.
 """
 
 import importlib.util
@@ -9,6 +10,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from agent.skills.cache import SkillCache, skill_fingerprint
 from agent.skills.errors import SkillManifestError
 from agent.skills.manifest import SkillManifest, parse_skill_manifest
 from agent.skills.registry import SkillRegistry
@@ -17,6 +19,8 @@ from agent.tools.toolset import AgentToolset
 
 if TYPE_CHECKING:
     from agent.skills.documentation_index import SkillDocumentationIndex
+    from agent.skills.result_cache import ScriptResultCache
+    from agent.skills.script_pool import ScriptWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +38,25 @@ class SkillLoader:
         >>> toolsets, script_tools, skill_instructions = loader.load_enabled_skills()
     """
 
-    def __init__(self, config: Any):
+    def __init__(
+        self,
+        config: Any,
+        cache: SkillCache | None = None,
+        worker_pool: "ScriptWorkerPool | None" = None,
+        result_cache: "ScriptResultCache | None" = None,
+    ):
         """Initialize skill loader.
 
         Args:
             config: AgentSettings with skill paths and enabled skills list
+            cache: Optional skill cache used by load_enabled_skills()
+            worker_pool: Optional warm script runner pool for the script wrapper toolset
+            result_cache: Optional script result cache for the script wrapper toolset
         """
         self.config = config
+        self.cache = cache
+        self.worker_pool = worker_pool
+        self.result_cache = result_cache
         self.registry = SkillRegistry()
         self._loaded_scripts: dict[str, list[dict[str, Any]]] = {}
 
@@ -75,7 +91,8 @@ class SkillLoader:
             manifest: Parsed SKILL.md manifest
 
         Returns:
-            List of script metadata dicts with 'name' and 'path' keys
+            List of script metadata dicts with 'name' and 'path' keys, plus
+            'cache_ttl' for scripts the manifest declares cacheable
         """
         scripts_dir = skill_path / "scripts"
         if not scripts_dir.exists() or not scripts_dir.is_dir():
@@ -133,6 +150,15 @@ class SkillLoader:
                 script_name = script_file.stem  # Remove .py extension
                 scripts.append({"name": script_name, "path": script_file})
 
+        # Result cache TTLs of idempotent scripts
+        cache_ttls = {
+            normalize_script_name(name).removesuffix(".py"): ttl
+            for name, ttl in manifest.cacheable.items()
+        }
+        for script in scripts:
+            if script["name"] in cache_ttls:
+                script["cache_ttl"] = cache_ttls[script["name"]]
+
         return scripts
 
     def _should_ignore_script(self, script_path: Path, ignore_patterns: list[str]) -> bool:
@@ -224,16 +250,92 @@ class SkillLoader:
         manifest = parse_skill_manifest(skill_path)
 
         # Load toolsets (if any)
+        toolsets = self._import_toolsets(skill_path, manifest)
+
+        # Discover scripts (metadata only, don't load code)
+        scripts = self.discover_scripts(skill_path, manifest)
+
+        return manifest, toolsets, scripts
+
+    def _import_toolsets(self, skill_path: Path, manifest: SkillManifest) -> list[AgentToolset]:
+        """Import and instantiate all toolsets declared by a skill.
+
+        Args:
+            skill_path: Path to skill directory
+            manifest: Parsed SKILL.md manifest
+
+        Returns:
+            Successfully instantiated toolsets
+        """
         toolsets = []
         for toolset_def in manifest.toolsets:
             toolset = self._import_toolset(skill_path, manifest.name, toolset_def)
             if toolset is not None:
                 toolsets.append(toolset)
+        return toolsets
 
-        # Discover scripts (metadata only, don't load code)
-        scripts = self.discover_scripts(skill_path, manifest)
+    def _load_skill_metadata(
+        self, skill_path: Path, commit_sha: str | None = None
+    ) -> tuple[SkillManifest, list[dict[str, Any]], int | None]:
+        """Load a skill's manifest and script metadata, from the cache when valid.
 
-        return manifest, toolsets, scripts
+        Args:
+            skill_path: Path to skill directory containing SKILL.md
+            commit_sha: Registry commit SHA of an installed plugin (cache key)
+
+        Returns:
+            Tuple of (manifest, script_metadata, documentation_tokens); tokens
+            is None without a cache
+
+        Raises:
+            SkillManifestError: If manifest is invalid
+        """
+        if self.cache is None:
+            manifest = parse_skill_manifest(skill_path)
+            return manifest, self.discover_scripts(skill_path, manifest), None
+
+        from agent.skills.documentation_index import section_tokens
+
+        try:
+            fingerprint = skill_fingerprint(skill_path, commit_sha)
+        except OSError:
+            manifest = parse_skill_manifest(skill_path)
+            return manifest, self.discover_scripts(skill_path, manifest), None
+
+        entry = self.cache.get(skill_path, fingerprint)
+        if entry is not None:
+            try:
+                manifest = SkillManifest.model_validate(entry["manifest"])
+                scripts = [{**script, "path": Path(script["path"])} for script in entry["scripts"]]
+                return manifest, scripts, entry.get("tokens")
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Ignoring invalid skill cache entry for {skill_path}: {e}")
+
+        manifest = parse_skill_manifest(skill_path)
+        scripts = self.discover_scripts(skill_path, manifest)
+        tokens = section_tokens(normalize_skill_name(manifest.name), manifest.instructions)
+        self.cache.put(
+            skill_path,
+            fingerprint,
+            {
+                "manifest": manifest.model_dump(mode="json"),
+                "scripts": [{**script, "path": str(script["path"])} for script in scripts],
+                "tokens": tokens,
+            },
+        )
+        return manifest, scripts, tokens
+
+    def _registry_commit_shas(self) -> dict[str, str]:
+        """Map installed skill paths to their registry commit SHAs."""
+        try:
+            return {
+                str(Path(entry.installed_path).resolve()): entry.commit_sha
+                for entry in self.registry.list()
+                if entry.commit_sha
+            }
+        except Exception as e:
+            logger.debug(f"Could not read skill registry commit SHAs: {e}")
+            return {}
 
     def load_enabled_skills(self) -> tuple[list[AgentToolset], Any, "SkillDocumentationIndex"]:
         """Load all enabled skills based on configuration.
@@ -312,10 +414,13 @@ class SkillLoader:
         from agent.skills.documentation_index import SkillDocumentationIndex
 
         skill_docs = SkillDocumentationIndex()
+        commit_shas = self._registry_commit_shas() if self.cache is not None else {}
 
         for skill_dir in bundled_skill_dirs + plugin_skill_dirs:
             try:
-                manifest, toolsets, scripts = self.load_skill(skill_dir)
+                manifest, scripts, tokens = self._load_skill_metadata(
+                    skill_dir, commit_shas.get(str(skill_dir.resolve()))
+                )
                 canonical_name = normalize_skill_name(manifest.name)
 
                 # Three-state logic for bundled skills (plugins always enabled if in config)
@@ -337,7 +442,8 @@ class SkillLoader:
                         )
                         continue
 
-                # Load the skill
+                # Load the skill (toolsets are only imported for skills that load)
+                toolsets = self._import_toolsets(skill_dir, manifest)
                 all_toolsets.extend(toolsets)
                 if scripts:
                     all_scripts[canonical_name] = scripts
@@ -345,7 +451,7 @@ class SkillLoader:
 
                 # Add skill to documentation index for progressive disclosure
                 # Always add, even if instructions are empty - skill may have triggers/toolsets/scripts
-                skill_docs.add_skill(canonical_name, manifest)
+                skill_docs.add_skill(canonical_name, manifest, tokens=tokens)
 
                 logger.info(
                     f"Loaded {'bundled' if is_bundled else 'plugin'} skill '{manifest.name}': "
@@ -359,12 +465,21 @@ class SkillLoader:
                 logger.error(f"Unexpected error loading skill from {skill_dir}: {e}", exc_info=True)
                 continue
 
+        if self.cache is not None:
+            logger.debug(f"Skill cache: {self.cache.hits} hits, {self.cache.misses} misses")
+            self.cache.save()
+
         # Create script wrapper toolset if we have scripts
         script_wrapper = None
         if all_scripts:
             from agent.skills.script_tools import ScriptToolset
 
-            script_wrapper = ScriptToolset(self.config, all_scripts)
+            script_wrapper = ScriptToolset(
+                self.config,
+                all_scripts,
+                worker_pool=self.worker_pool,
+                result_cache=self.result_cache,
+            )
 
         return all_toolsets, script_wrapper, skill_docs
 
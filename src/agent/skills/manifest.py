@@ -53,6 +53,7 @@ class SkillManifest(BaseModel):
         scripts: List of script names (auto-discovered if omitted)
         scripts_ignore: Glob patterns to exclude from script discovery
         permissions: Environment variable allowlist for script execution
+        cacheable: Idempotent scripts whose results may be cached (name -> TTL seconds)
 
     Example:
         >>> manifest = SkillManifest(
@@ -77,6 +78,7 @@ class SkillManifest(BaseModel):
     scripts: list[str] | None = None  # None = auto-discover
     scripts_ignore: list[str] = Field(default_factory=list)
     permissions: dict[str, list[str]] = Field(default_factory=dict)
+    cacheable: dict[str, int] = Field(default_factory=dict)  # script name -> TTL seconds
 
     # Markdown instructions (not in YAML, extracted separately)
     instructions: str = ""
@@ -142,6 +144,15 @@ class SkillManifest(BaseModel):
                 raise ValueError(f"Toolset '{toolset}' must be in 'module:Class' format")
         return v
 
+    @field_validator("cacheable")
+    @classmethod
+    def validate_cacheable(cls, v: dict[str, int]) -> dict[str, int]:
+        """Validate result cache TTLs are positive."""
+        for script, ttl in v.items():
+            if ttl <= 0:
+                raise ValueError(f"Cache TTL for script '{script}' must be positive, got {ttl}")
+        return v
+
     @field_validator("scripts")
     @classmethod
     def validate_scripts(cls, v: list[str] | None) -> list[str] | None:
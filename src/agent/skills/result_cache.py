@@ -0,0 +1,220 @@
+"""Result cache for idempotent skill scripts.
+
+LLMs often call the same script with the same arguments several times in a
+session (lookups, reference data), and every call ran the script again.
+Skills opt scripts in with a TTL in SKILL.md::
+
+    cacheable:
+      lookup: 3600  # seconds
+
+ScriptResultCache memoizes successful responses keyed by a hash of the
+script's content plus its arguments, so editing a script invalidates its
+results. Recently used results are kept in an in-memory LRU in front of a
+SQLite file under the agent data dir, which keeps results across sessions.
+script_help output is always cached (without expiry) by script hash.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS script_results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_script_results_last_used ON script_results(last_used);
+"""
+
+
+class ScriptResultCache:
+    """Two-level (memory LRU + SQLite) cache of script tool responses.
+
+    Attributes:
+        path: Path to the SQLite cache file
+        max_entries: Maximum number of results kept on disk
+        max_memory_entries: Maximum number of results kept in memory
+        hits: Lookups served from the cache
+        misses: Lookups that had to run the script
+
+    Example:
+        >>> cache = ScriptResultCache(Path("~/.agent/script_results.db"))
+        >>> key = cache.key(script_path, "run", ["--city", "Paris", "--json"])
+        >>> response = cache.get(key)
+        >>> if response is None:
+        ...     response = run_script()
+        ...     cache.put(key, response, ttl=3600)
+    """
+
+    def __init__(self, path: Path, max_entries: int = 1000, max_memory_entries: int = 128):
+        """Open (or create) the cache file and drop expired results.
+
+        Args:
+            path: SQLite database file
+            max_entries: Maximum number of results kept on disk
+            max_memory_entries: Maximum number of results kept in memory
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_memory_entries = max_memory_entries
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # key -> (response, expires_at)
+        self._memory: OrderedDict[str, tuple[dict[str, Any], float | None]] = OrderedDict()
+        # script path -> ((mtime_ns, size), content hash)
+        self._script_hashes: dict[Path, tuple[tuple[int, int], str]] = {}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM script_results WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+        row = self._conn.execute("SELECT COUNT(*), MAX(last_used) FROM script_results").fetchone()
+        self._count = int(row[0])
+        self._clock = int(row[1] or 0)
+
+    def __len__(self) -> int:
+        """Return the number of results stored on disk."""
+        return self._count
+
+    def key(self, script_path: Path, kind: str, args: list[str]) -> str:
+        """Build the cache key for a script invocation.
+
+        Args:
+            script_path: Path to the script (its content is hashed)
+            kind: Invocation kind ("run" or "help")
+            args: Script arguments
+
+        Returns:
+            Hex SHA-256 digest
+
+        Raises:
+            OSError: If the script cannot be read
+        """
+        payload = json.dumps([self._script_hash(script_path), kind, args])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            The cached response, or None on a miss or if it expired
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                response, expires_at = cached
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM script_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                self.misses += 1
+                return None
+
+            response = json.loads(row[0])
+            self._remember(key, response, row[1])
+            self._clock += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE script_results SET last_used = ? WHERE key = ?", (self._clock, key)
+                )
+            self.hits += 1
+            return response
+
+    def put(self, key: str, response: dict[str, Any], ttl: float | None = None) -> None:
+        """Store a response, evicting least recently used results if full.
+
+        Args:
+            key: Cache key from key()
+            response: JSON-serializable tool response
+            ttl: Seconds the response stays valid (None = until the script changes)
+        """
+        expires_at = time.time() + ttl if ttl is not None else None
+        try:
+            value = json.dumps(response)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching script result: {e}")
+            return
+
+        with self._lock:
+            self._remember(key, response, expires_at)
+            try:
+                with self._conn:
+                    self._clock += 1
+                    exists = self._conn.execute(
+                        "SELECT 1 FROM script_results WHERE key = ?", (key,)
+                    ).fetchone()
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO script_results "
+                        "(key, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                        (key, value, expires_at, self._clock),
+                    )
+                    if exists is None:
+                        self._count += 1
+                    if self._count > self.max_entries:
+                        overflow = self._count - self.max_entries + self.max_entries // 20
+                        cursor = self._conn.execute(
+                            "DELETE FROM script_results WHERE key IN "
+                            "(SELECT key FROM script_results ORDER BY last_used LIMIT ?)",
+                            (overflow,),
+                        )
+                        self._count -= cursor.rowcount
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to store script result in {self.path}: {e}")
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": self._count}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, key: str, response: dict[str, Any], expires_at: float | None) -> None:
+        """Add a response to the in-memory LRU."""
+        self._memory[key] = (response, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _script_hash(self, script_path: Path) -> str:
+        """Hash a script's content, rehashing only when its mtime or size changes."""
+        stat = script_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._script_hashes.get(script_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        digest = hashlib.sha256(script_path.read_bytes()).hexdigest()
+        self._script_hashes[script_path] = (signature, digest)
+        return digest
@@ -0,0 +1,245 @@
+"""Streaming, size-capped capture of skill script output.
+
+ScriptOutput receives stdout/stderr chunks while a script runs instead of
+buffering everything with communicate(): stdout is decoded incrementally and
+capped at max_output bytes (feed() returns False once the cap is hit so the
+caller can kill the script), stderr keeps only its last max_output bytes, and
+the latest output line is reported to a progress callback.
+
+With json_output, the stdout JSON document is scanned as it arrives and
+parsed as soon as its closing bracket is read, while the script may still be
+running.
+"""
+
+import codecs
+import json
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+# Minimum seconds between progress callbacks
+PROGRESS_INTERVAL = 0.25
+
+# Maximum characters of an output line reported as progress
+PROGRESS_LINE_LIMIT = 120
+
+_JSON_STRUCTURE = re.compile(r'[\[\]{}"\\]')
+
+
+class _JSONDocumentScanner:
+    """Find where a top-level JSON object or array ends, across chunks.
+
+    Only structural characters are inspected; the document itself is parsed
+    with json.loads once it is complete.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.offset = 0  # Characters consumed by previous chunks
+        self.started = False
+        self.failed = False  # Not an object/array document (e.g. a scalar)
+        self.end: int | None = None  # Offset just past the closing bracket
+
+    def feed(self, text: str) -> int | None:
+        """Scan the next chunk of text.
+
+        Returns:
+            End offset of the document if it completed in this chunk, else None
+        """
+        if self.end is not None or self.failed:
+            return None
+
+        position = 0
+        if not self.started:
+            stripped = len(text) - len(text.lstrip())
+            if stripped == len(text):
+                self.offset += len(text)
+                return None
+            if text[stripped] not in "[{":
+                self.failed = True
+                return None
+            self.started = True
+            position = stripped
+
+        skip_to = 0
+        if self.escape:
+            self.escape = False
+            skip_to = 1
+        for match in _JSON_STRUCTURE.finditer(text, position):
+            index = match.start()
+            if index < skip_to:
+                continue
+            char = match.group()
+            if self.in_string:
+                if char == "\\":
+                    if index + 1 == len(text):
+                        self.escape = True
+                    skip_to = index + 2
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "[{":
+                self.depth += 1
+            elif char in "]}":
+                self.depth -= 1
+                if self.depth <= 0:
+                    self.end = self.offset + index + 1
+                    self.offset += len(text)
+                    return self.end
+
+        self.offset += len(text)
+        return None
+
+
+class ScriptOutput:
+    """Bounded stdout/stderr capture for one script run.
+
+    Attributes:
+        max_output: Maximum stdout bytes kept (the script is stopped beyond it)
+        truncated: True if stdout exceeded max_output
+        stdout_bytes: Total stdout bytes received (up to the cap)
+
+    Example:
+        >>> output = ScriptOutput(max_output=1024, json_output=True)
+        >>> output.feed("stdout", b'{"ok": ')
+        True
+        >>> output.feed("stdout", b"true}\\n")
+        True
+        >>> output.json_value()
+        {'ok': True}
+    """
+
+    def __init__(
+        self,
+        max_output: int,
+        json_output: bool = False,
+        on_progress: Callable[[str], None] | None = None,
+    ):
+        """Initialize capture.
+
+        Args:
+            max_output: Maximum stdout bytes kept
+            json_output: Scan stdout for a JSON document while streaming
+            on_progress: Called with the latest output line (throttled)
+        """
+        self.max_output = max_output
+        self.truncated = False
+        self.stdout_bytes = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._stdout_parts: list[str] = []
+        self._stderr = bytearray()
+        self._on_progress = on_progress
+        self._last_progress = 0.0
+        self._partial_lines = {"stdout": "", "stderr": ""}
+
+        self._scanner = _JSONDocumentScanner() if json_output else None
+        self._json_parsed = False
+        self._json_value: Any = None
+        self._json_trailing = False
+
+    def feed(self, stream: str, data: bytes) -> bool:
+        """Add a chunk of output.
+
+        Args:
+            stream: "stdout" or "stderr"
+            data: Raw output bytes
+
+        Returns:
+            False once stdout exceeded max_output (the caller should stop the
+            script), True otherwise
+        """
+        if stream == "stderr":
+            self._stderr += data
+            if len(self._stderr) > self.max_output:
+                del self._stderr[: len(self._stderr) - self.max_output]
+            self._report_progress(stream, data.decode("utf-8", errors="replace"))
+            return True
+
+        if self.truncated:
+            return False
+        remaining = self.max_output - self.stdout_bytes
+        if len(data) > remaining:
+            data = data[:remaining]
+            self.truncated = True
+        self.stdout_bytes += len(data)
+
+        text = self._decoder.decode(data, final=self.truncated)
+        if text:
+            self._add_stdout(text)
+            self._report_progress(stream, text)
+        return not self.truncated
+
+    def finish(self) -> None:
+        """Flush the decoder after the script exits."""
+        text = self._decoder.decode(b"", final=True)
+        if text:
+            self._add_stdout(text)
+
+    @property
+    def stdout(self) -> str:
+        """Get decoded stdout (up to max_output bytes)."""
+        if len(self._stdout_parts) > 1:
+            self._stdout_parts = ["".join(self._stdout_parts)]
+        return self._stdout_parts[0] if self._stdout_parts else ""
+
+    @property
+    def stderr(self) -> str:
+        """Get decoded stderr (its last max_output bytes)."""
+        return self._stderr.decode("utf-8", errors="replace")
+
+    def json_value(self) -> Any:
+        """Get the JSON value of stdout.
+
+        Returns the document parsed while streaming when stdout held exactly
+        one JSON object or array; otherwise parses stdout as a whole.
+
+        Raises:
+            json.JSONDecodeError: If stdout is not a single JSON value
+        """
+        if self._json_parsed and not self._json_trailing:
+            return self._json_value
+        return json.loads(self.stdout)
+
+    def _add_stdout(self, text: str) -> None:
+        """Store decoded stdout and advance the JSON scanner."""
+        self._stdout_parts.append(text)
+        if self._scanner is None:
+            return
+
+        if self._json_parsed:
+            if text.strip():
+                self._json_trailing = True
+            return
+
+        end = self._scanner.feed(text)
+        if end is None:
+            return
+        stdout = self.stdout
+        try:
+            self._json_value = json.loads(stdout[:end])
+        except json.JSONDecodeError:
+            self._scanner.failed = True
+            return
+        self._json_parsed = True
+        self._json_trailing = bool(stdout[end:].strip())
+
+    def _report_progress(self, stream: str, text: str) -> None:
+        """Report the latest complete output line, at most every PROGRESS_INTERVAL."""
+        if self._on_progress is None:
+            return
+
+        lines = (self._partial_lines[stream] + text).split("\n")
+        self._partial_lines[stream] = lines[-1][-PROGRESS_LINE_LIMIT:]
+        complete = [line.strip() for line in lines[:-1] if line.strip()]
+        if not complete:
+            return
+
+        now = time.monotonic()
+        if now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        self._on_progress(complete[-1][:PROGRESS_LINE_LIMIT])
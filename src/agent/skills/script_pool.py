@@ -0,0 +1,302 @@
+"""Pool of warm runner processes for skill scripts.
+
+`uv run script.py` resolves the script's PEP 723 environment and starts a
+fresh interpreter on every call, which costs hundreds of milliseconds to
+seconds before the script does any work. ScriptWorkerPool resolves each
+script's environment once per agent process (`uv sync --script`, then
+`uv python find --script` for its interpreter) and keeps runner processes
+(see script_worker.py) alive in that interpreter with the script's imports
+already loaded. A run is dispatched to an idle runner over its pipes and
+executed in a forked child, so repeated calls take milliseconds. Output is
+streamed back into a ScriptOutput while the script runs.
+
+Runners idle for longer than the TTL are reaped. Scripts whose environment
+cannot be resolved (uv missing or too old) and platforms without os.fork()
+are not pooled: run() returns None and the caller falls back to `uv run`.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from agent.skills.script_output import ScriptOutput
+
+logger = logging.getLogger(__name__)
+
+WORKER_PATH = Path(__file__).with_name("script_worker.py")
+
+# Timeout for resolving a script's environment (may download dependencies)
+RESOLVE_TIMEOUT = 300.0
+
+
+@dataclass
+class _Worker:
+    """A runner process serving one script."""
+
+    process: asyncio.subprocess.Process
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    def close(self) -> None:
+        """Ask the runner to exit (it stops when its stdin closes)."""
+        if self.alive and self.process.stdin is not None:
+            self.process.stdin.close()
+
+    def kill(self) -> None:
+        """Kill the runner and any script run in progress (its process group)."""
+        if self.alive:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+
+class ScriptWorkerPool:
+    """Warm runner processes for skill scripts, keyed by script path.
+
+    Example:
+        >>> pool = ScriptWorkerPool(idle_ttl=300)
+        >>> output = ScriptOutput(max_output=1_048_576)
+        >>> returncode = await pool.run(Path("scripts/status.py"), ["--json"], 60, output)
+        >>> if returncode is not None:
+        ...     print(output.stdout)
+        >>> await pool.close()
+    """
+
+    def __init__(self, idle_ttl: float = 300.0, max_idle: int = 2, uv_executable: str = "uv"):
+        """Initialize worker pool.
+
+        Args:
+            idle_ttl: Seconds an idle runner is kept before it is reaped
+            max_idle: Idle runners kept per script (extra ones exit after use)
+            uv_executable: uv executable used to resolve script environments
+        """
+        self.idle_ttl = idle_ttl
+        self.max_idle = max_idle
+        self.uv_executable = uv_executable
+        self._interpreters: dict[Path, str | None] = {}
+        self._resolving: dict[Path, asyncio.Future[str | None]] = {}
+        self._idle: dict[Path, list[_Worker]] = {}
+        self._reap_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def idle_count(self) -> int:
+        """Get number of idle runners across all scripts."""
+        return sum(len(workers) for workers in self._idle.values())
+
+    async def run(
+        self, script_path: Path, args: list[str], timeout: float, output: ScriptOutput
+    ) -> int | None:
+        """Run a script in a warm runner.
+
+        When output reports its size cap exceeded, the run (and its runner)
+        is killed and -SIGKILL is returned.
+
+        Args:
+            script_path: Path to the PEP 723 script
+            args: Script arguments
+            timeout: Seconds before the run (and its runner) is killed
+            output: Capture receiving the script's output while it runs
+
+        Returns:
+            Exit code of the script, or None if the script cannot be pooled
+            and should be run with `uv run` instead
+
+        Raises:
+            TimeoutError: If the run exceeds timeout
+            RuntimeError: If the runner died during the run
+        """
+        if not hasattr(os, "fork"):
+            return None
+
+        interpreter = await self._get_interpreter(script_path)
+        if interpreter is None:
+            return None
+
+        worker = self._acquire(script_path)
+        if worker is None:
+            try:
+                worker = await self._spawn(script_path, interpreter)
+            except OSError as e:
+                logger.debug(f"Not pooling {script_path.name}: cannot start runner: {e}")
+                self._interpreters[script_path] = None
+                return None
+
+        try:
+            returncode = await asyncio.wait_for(
+                self._request(worker, args, output), timeout=timeout
+            )
+        except TimeoutError:
+            worker.kill()
+            await worker.process.wait()
+            raise
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            worker.kill()
+            await worker.process.wait()
+            raise RuntimeError(f"Script runner failed: {e}") from e
+
+        if returncode is None:
+            # Output cap hit: stop the run with its runner
+            worker.kill()
+            await worker.process.wait()
+            return -signal.SIGKILL
+
+        self._release(script_path, worker)
+        return returncode
+
+    async def close(self) -> None:
+        """Stop all idle runners."""
+        if self._reap_handle is not None:
+            self._reap_handle.cancel()
+            self._reap_handle = None
+        workers = [worker for workers in self._idle.values() for worker in workers]
+        self._idle.clear()
+        for worker in workers:
+            worker.close()
+        for worker in workers:
+            try:
+                await asyncio.wait_for(worker.process.wait(), timeout=5)
+            except TimeoutError:
+                worker.kill()
+
+    async def _get_interpreter(self, script_path: Path) -> str | None:
+        """Get the interpreter of a script's environment, resolving it once."""
+        if script_path in self._interpreters:
+            return self._interpreters[script_path]
+
+        # Concurrent first calls share one resolution
+        pending = self._resolving.get(script_path)
+        if pending is None:
+            pending = asyncio.ensure_future(self._resolve_interpreter(script_path))
+            self._resolving[script_path] = pending
+            pending.add_done_callback(lambda _: self._resolving.pop(script_path, None))
+        interpreter = await asyncio.shield(pending)
+        self._interpreters[script_path] = interpreter
+        return interpreter
+
+    async def _resolve_interpreter(self, script_path: Path) -> str | None:
+        """Create a script's environment with uv and return its interpreter.
+
+        Returns:
+            Interpreter path, or None if uv cannot resolve the environment
+        """
+        try:
+            for command in (["sync", "--script"], ["python", "find", "--script"]):
+                process = await asyncio.create_subprocess_exec(
+                    self.uv_executable,
+                    *command,
+                    str(script_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=script_path.parent,
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(
+                        process.communicate(), timeout=RESOLVE_TIMEOUT
+                    )
+                except TimeoutError:
+                    process.kill()
+                    raise
+                if process.returncode != 0:
+                    logger.debug(
+                        f"Not pooling {script_path.name}: uv {' '.join(command)} failed: "
+                        f"{stderr.decode('utf-8', errors='replace')[-500:]}"
+                    )
+                    return None
+        except (OSError, TimeoutError) as e:
+            logger.debug(f"Not pooling {script_path.name}: {e}")
+            return None
+
+        interpreter = stdout.decode("utf-8").strip()
+        logger.debug(f"Resolved environment for {script_path.name}: {interpreter}")
+        return interpreter or None
+
+    async def _spawn(self, script_path: Path, interpreter: str) -> _Worker:
+        """Start a runner for a script."""
+        process = await asyncio.create_subprocess_exec(
+            interpreter,
+            str(WORKER_PATH),
+            str(script_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=script_path.parent,
+            start_new_session=True,  # Own process group, killed as a whole on timeout
+        )
+        return _Worker(process)
+
+    async def _request(self, worker: _Worker, args: list[str], output: ScriptOutput) -> int | None:
+        """Send one run request to a runner and stream its output frames.
+
+        Returns:
+            Exit code of the script, or None if output asked to stop the run
+        """
+        process = worker.process
+        assert process.stdin is not None and process.stdout is not None
+        process.stdin.write(json.dumps({"args": args}).encode() + b"\n")
+        await process.stdin.drain()
+
+        while True:
+            header = json.loads(await process.stdout.readline())
+            if "returncode" in header:
+                return header["returncode"]
+            data = await process.stdout.readexactly(header["size"])
+            if not output.feed(header["stream"], data):
+                return None
+
+    def _acquire(self, script_path: Path) -> _Worker | None:
+        """Take an idle runner for a script, if one is alive."""
+        self._reap()
+        workers = self._idle.get(script_path, [])
+        while workers:
+            worker = workers.pop()
+            if worker.alive:
+                return worker
+        return None
+
+    def _release(self, script_path: Path, worker: _Worker) -> None:
+        """Return a runner to the idle pool, or stop it if the pool is full."""
+        workers = self._idle.setdefault(script_path, [])
+        if not worker.alive:
+            return
+        if len(workers) >= self.max_idle:
+            worker.close()
+            return
+        worker.last_used = time.monotonic()
+        workers.append(worker)
+        self._schedule_reap()
+
+    def _schedule_reap(self) -> None:
+        """Reap idle runners once the TTL elapses."""
+        if self._reap_handle is None:
+            loop = asyncio.get_running_loop()
+            self._reap_handle = loop.call_later(self.idle_ttl, self._on_reap_timer)
+
+    def _on_reap_timer(self) -> None:
+        self._reap_handle = None
+        self._reap()
+        if self.idle_count:
+            self._schedule_reap()
+
+    def _reap(self) -> None:
+        """Stop runners idle for longer than the TTL."""
+        deadline = time.monotonic() - self.idle_ttl
+        for script_path, workers in list(self._idle.items()):
+            keep = []
+            for worker in workers:
+                if worker.alive and worker.last_used > deadline:
+                    keep.append(worker)
+                else:
+                    worker.close()
+            if keep:
+                self._idle[script_path] = keep
+            else:
+                del self._idle[script_path]
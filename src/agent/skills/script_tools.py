@@ -2,18 +2,56 @@
 
 Provides generic tools for progressive disclosure: script_list, script_help, script_run.
 These tools enable LLMs to discover and execute standalone scripts without loading
-their code into context.
+their code into context. With a ScriptWorkerPool, scripts run in warm runner
+processes instead of a cold `uv run` per call.
+
+Script output is streamed into a size-capped ScriptOutput: a script exceeding
+max_script_output is stopped, and its latest output line is shown as progress
+in the execution tree.
+
+With a ScriptResultCache, script_help output and script_run results of
+scripts their skill declares cacheable are served from the cache. The hit
+flag and cache counters are reported to the execution tree, not returned to
+the model.
 """
 
 import asyncio
 import json as json_module
+import os
+import signal
+from collections.abc import Callable
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 from pydantic import Field
 
+from agent.display.events import (
+    ToolProgressEvent,
+    get_current_tool_event_id,
+    get_event_emitter,
+    report_tool_cache_info,
+)
+from agent.skills.script_output import ScriptOutput
 from agent.skills.security import normalize_script_name, normalize_skill_name
-from agent.tools.toolset import AgentToolset
+from agent.tools.toolset import AgentToolset, ToolPolicy
+
+if TYPE_CHECKING:
+    from agent.skills.result_cache import ScriptResultCache
+    from agent.skills.script_pool import ScriptWorkerPool
+
+# Bytes read from script output pipes at a time
+STREAM_CHUNK_SIZE = 65536
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill a `uv run` process and the script it started."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
 
 
 class ScriptToolset(AgentToolset):
@@ -28,16 +66,32 @@ class ScriptToolset(AgentToolset):
         >>> tools = toolset.get_tools()
     """
 
-    def __init__(self, config: Any, scripts: dict[str, list[dict[str, Any]]]):
+    # Each call runs a subprocess: bound bursts of parallel calls
+    tool_policies = {
+        "script_help": ToolPolicy(max_concurrency=4),
+        "script_run": ToolPolicy(max_concurrency=4),
+    }
+
+    def __init__(
+        self,
+        config: Any,
+        scripts: dict[str, list[dict[str, Any]]],
+        worker_pool: "ScriptWorkerPool | None" = None,
+        result_cache: "ScriptResultCache | None" = None,
+    ):
         """Initialize script toolset.
 
         Args:
             config: AgentSettings with script execution settings
             scripts: Dict mapping skill names to script metadata lists
                      Format: {skill_name: [{"name": str, "path": Path}, ...]}
+            worker_pool: Optional pool of warm script runners (cold `uv run` if None)
+            result_cache: Optional cache of help output and cacheable script results
         """
         super().__init__(config)
         self.scripts = scripts
+        self.worker_pool = worker_pool
+        self.result_cache = result_cache
 
         # Execution safety limits (use config values with safe defaults)
         self.timeout = getattr(config, "script_timeout", 60)
@@ -164,38 +218,35 @@ class ScriptToolset(AgentToolset):
                     message=f"Script '{script_name}' not found in skill '{skill_name}'",
                 )
 
-            # Execute with --help
-            cmd = [self._get_uv_executable(), "run", str(script_path), "--help"]
-
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=script_path.parent,
-            )
+            cache_key = self._cache_key(script_path, "help", [])
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
 
+            # Execute with --help
+            output = ScriptOutput(self.max_output)
             try:
-                stdout, stderr = await asyncio.wait_for(result.communicate(), timeout=self.timeout)
+                returncode = await self._execute(script_path, ["--help"], output)
             except TimeoutError:
-                result.kill()
                 return self._create_error_response(
                     error="timeout",
                     message=f"Script help timed out after {self.timeout}s",
                 )
 
-            stdout_text = stdout.decode("utf-8")
-            stderr_text = stderr.decode("utf-8")
+            stdout_text = output.stdout
+            stderr_text = output.stderr
 
-            if result.returncode != 0:
+            if returncode != 0:
                 return self._create_error_response(
                     error="execution_failed",
-                    message=f"Script help failed with exit code {result.returncode}\nstderr: {stderr_text[-500:]}",
+                    message=f"Script help failed with exit code {returncode}\nstderr: {stderr_text[-500:]}",
                 )
 
-            return self._create_success_response(
+            response = self._create_success_response(
                 result={"help_text": stdout_text, "usage": stdout_text},
                 message=f"Retrieved help for {script_name}",
             )
+            return self._store_response(cache_key, response)
 
         except Exception as e:
             return self._create_error_response(
@@ -265,58 +316,76 @@ class ScriptToolset(AgentToolset):
             canonical_skill = normalize_skill_name(skill_name)
             canonical_script = normalize_script_name(script_name)
 
-            # Find script path
-            script_path = self._find_script(canonical_skill, canonical_script)
-            if script_path is None:
+            # Find script
+            script = self._find_script_entry(canonical_skill, canonical_script)
+            if script is None:
                 return self._create_error_response(
                     error="not_found",
                     message=f"Script '{script_name}' not found in skill '{skill_name}'",
                 )
+            script_path: Path = script["path"]
 
-            # Build command
-            cmd = [self._get_uv_executable(), "run", str(script_path)] + args
+            # Build arguments
+            script_args = list(args)
             if json_output:
-                cmd.append("--json")
-
-            # Execute script
-            result = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=script_path.parent,
-            )
+                script_args.append("--json")
 
+            # Only scripts the skill declares cacheable are served from the cache
+            cache_ttl = script.get("cache_ttl")
+            cache_key = (
+                self._cache_key(script_path, "run", script_args) if cache_ttl is not None else None
+            )
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
+
+            # Execute script (output is streamed and capped at max_output)
+            output = ScriptOutput(
+                self.max_output,
+                json_output=json_output,
+                on_progress=self._progress_reporter(f"script_run ({script_name})"),
+            )
             try:
-                stdout, stderr = await asyncio.wait_for(result.communicate(), timeout=self.timeout)
+                returncode = await self._execute(script_path, script_args, output)
             except TimeoutError:
-                result.kill()
                 return self._create_error_response(
                     error="timeout",
                     message=f"Script timed out after {self.timeout}s",
                 )
 
-            stdout_text = stdout.decode("utf-8")
-            stderr_text = stderr.decode("utf-8")
+            stdout_text = output.stdout
+            stderr_text = output.stderr
 
-            # Check output size
-            if len(stdout_text) > self.max_output:
-                stdout_text = stdout_text[: self.max_output]
-                stderr_text += f"\nWarning: Output truncated at {self.max_output} bytes"
+            # The script was stopped at the output cap
+            if output.truncated:
+                if json_output:
+                    return self._create_error_response(
+                        error="output_too_large",
+                        message=f"Script output exceeded {self.max_output} bytes and was stopped",
+                    )
+                return self._create_success_response(
+                    result=stdout_text,
+                    message=(
+                        f"Executed {script_name} script "
+                        f"(output truncated at {self.max_output} bytes)"
+                    ),
+                )
 
             # Handle non-zero exit code
-            if result.returncode != 0:
+            if returncode != 0:
                 return self._create_error_response(
                     error="execution_failed",
-                    message=f"Script failed with exit code {result.returncode}\nstderr: {stderr_text[-500:]}",
+                    message=f"Script failed with exit code {returncode}\nstderr: {stderr_text[-500:]}",
                 )
 
             # Parse JSON if requested
             if json_output:
                 try:
-                    parsed = json_module.loads(stdout_text)
-                    return self._create_success_response(
+                    parsed = output.json_value()
+                    response = self._create_success_response(
                         result=parsed, message=f"Executed {script_name} script"
                     )
+                    return self._store_response(cache_key, response, cache_ttl)
                 except json_module.JSONDecodeError:
                     return self._create_error_response(
                         error="parse_error",
@@ -324,15 +393,92 @@ class ScriptToolset(AgentToolset):
                     )
             else:
                 # Return plain text
-                return self._create_success_response(
+                response = self._create_success_response(
                     result=stdout_text, message=f"Executed {script_name} script"
                 )
+                return self._store_response(cache_key, response, cache_ttl)
 
         except Exception as e:
             return self._create_error_response(
                 error="execution_failed", message=f"Failed to execute script: {e}"
             )
 
+    async def _execute(self, script_path: Path, args: list[str], output: ScriptOutput) -> int:
+        """Run a script, in a warm runner when possible, else with `uv run`.
+
+        Output is streamed into output; the script is killed once output
+        reports its size cap exceeded.
+
+        Args:
+            script_path: Path to script
+            args: Script arguments
+            output: Capture for the script's stdout and stderr
+
+        Returns:
+            Exit code of the script
+
+        Raises:
+            TimeoutError: If the script exceeds the timeout (it is killed)
+        """
+        if self.worker_pool is not None:
+            returncode = await self.worker_pool.run(script_path, args, self.timeout, output)
+            if returncode is not None:
+                output.finish()
+                return returncode
+
+        cmd = [self._get_uv_executable(), "run", str(script_path), *args]
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=script_path.parent,
+            start_new_session=True,  # Own process group: uv and the script are killed together
+        )
+
+        async def pump(stream: str, reader: asyncio.StreamReader) -> None:
+            capped = False
+            while chunk := await reader.read(STREAM_CHUNK_SIZE):
+                # Keep draining after the cap so the pipe never fills up
+                if not capped and not output.feed(stream, chunk):
+                    capped = True
+                    _kill_process_group(process)
+
+        assert process.stdout is not None and process.stderr is not None
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    pump("stdout", process.stdout),
+                    pump("stderr", process.stderr),
+                    process.wait(),
+                ),
+                timeout=self.timeout,
+            )
+        except TimeoutError:
+            _kill_process_group(process)
+            raise
+
+        output.finish()
+        return process.returncode if process.returncode is not None else -1
+
+    def _progress_reporter(self, label: str) -> Callable[[str], None] | None:
+        """Create a callback forwarding output lines to the execution tree.
+
+        Args:
+            label: Tool label shown with the progress
+
+        Returns:
+            Progress callback, or None outside a displayed tool call
+        """
+        event_id = get_current_tool_event_id()
+        if event_id is None:
+            return None
+        emitter = get_event_emitter()
+
+        def report(line: str) -> None:
+            emitter.emit(ToolProgressEvent(event_id=event_id, tool_name=label, message=line))
+
+        return report
+
     def _find_script(self, canonical_skill: str, canonical_script: str) -> Path | None:
         """Find script path by canonical skill and script names.
 
@@ -343,6 +489,20 @@ class ScriptToolset(AgentToolset):
         Returns:
             Path to script or None if not found
         """
+        script = self._find_script_entry(canonical_skill, canonical_script)
+        if script is None:
+            return None
+        script_path: Path = script["path"]
+        return script_path
+
+    def _find_script_entry(
+        self, canonical_skill: str, canonical_script: str
+    ) -> dict[str, Any] | None:
+        """Find script metadata by canonical skill and script names.
+
+        Returns:
+            Script metadata dict ('name', 'path', optional 'cache_ttl') or None
+        """
         if canonical_skill not in self.scripts:
             return None
 
@@ -350,11 +510,44 @@ class ScriptToolset(AgentToolset):
 
         for script in self.scripts[canonical_skill]:
             if script["name"] == script_stem:
-                script_path: Path = script["path"]
-                return script_path
+                return script
 
         return None
 
+    def _cache_key(self, script_path: Path, kind: str, args: list[str]) -> str | None:
+        """Get the result cache key of an invocation (None when not cached)."""
+        if self.result_cache is None:
+            return None
+        try:
+            return self.result_cache.key(script_path, kind, args)
+        except OSError:
+            return None
+
+    def _cached_response(self, cache_key: str | None) -> dict | None:
+        """Get a cached response, reporting a cache hit."""
+        if cache_key is None or self.result_cache is None:
+            return None
+        response = self.result_cache.get(cache_key)
+        if response is None:
+            return None
+        self._report_cache(hit=True)
+        return response
+
+    def _store_response(
+        self, cache_key: str | None, response: dict, ttl: float | None = None
+    ) -> dict:
+        """Cache a successful response, reporting a cache miss."""
+        if cache_key is None or self.result_cache is None:
+            return response
+        self.result_cache.put(cache_key, response, ttl)
+        self._report_cache(hit=False)
+        return response
+
+    def _report_cache(self, hit: bool) -> None:
+        """Report the cache hit flag and counters to the execution tree."""
+        assert self.result_cache is not None
+        report_tool_cache_info(hit, self.result_cache.hits, self.result_cache.misses)
+
     def _get_uv_executable(self) -> str:
         """Get uv executable path.
 
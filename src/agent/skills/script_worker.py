@@ -0,0 +1,163 @@
+"""Warm runner process for a skill script (executed by ScriptWorkerPool).
+
+Started once per script with the interpreter of the script's resolved uv
+environment::
+
+    <env python> script_worker.py <script_path>
+
+The worker imports the script's top-level dependencies once, then serves run
+requests over its stdin/stdout pipes. Each request is one JSON line::
+
+    {"args": ["--name", "Alice", "--json"]}
+
+and is executed in a forked child (fresh copy of the warm interpreter, so
+script state never leaks between runs) with the given argv and stdin from
+/dev/null. Output is streamed back while the script runs, as frames of one
+JSON header line followed by raw bytes, and the run ends with its exit code::
+
+    {"stream": "stdout", "size": 42}\\n<42 bytes>
+    {"stream": "stderr", "size": 7}\\n<7 bytes>
+    {"returncode": 0}\\n
+
+The worker exits when its stdin is closed. This file must only use the
+standard library: it runs inside the script's environment, not the agent's.
+"""
+
+import ast
+import importlib
+import json
+import os
+import runpy
+import selectors
+import sys
+import traceback
+from typing import BinaryIO
+
+# Maximum bytes per output frame
+CHUNK_SIZE = 65536
+
+
+def _top_level_imports(script_path: str) -> list[str]:
+    """List the absolute modules imported at the top level of a script."""
+    try:
+        with open(script_path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), script_path)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.append(node.module)
+    return modules
+
+
+def _prewarm(script_path: str) -> None:
+    """Import the script's dependencies so forked runs start warm (best effort)."""
+    for module in _top_level_imports(script_path):
+        try:
+            importlib.import_module(module)
+        except Exception:  # noqa: BLE001 - a failing import surfaces when the script runs
+            pass
+
+
+def _run_child(script_path: str, args: list[str], stdout_fd: int, stderr_fd: int) -> None:
+    """Run the script as __main__ in a forked child and exit with its status."""
+    code = 0
+    try:
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        sys.argv = [script_path, *args]
+        runpy.run_path(script_path, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException as e:  # noqa: BLE001 - report like the interpreter would
+        # Start the traceback at the script, not at this runner
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename != script_path:
+            tb = tb.tb_next
+        traceback.print_exception(type(e), e, tb or e.__traceback__)
+        code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code & 0xFF)
+
+
+def _write_frame(protocol: BinaryIO, header: dict, data: bytes = b"") -> None:
+    """Write one response frame."""
+    protocol.write(json.dumps(header).encode() + b"\n" + data)
+    protocol.flush()
+
+
+def _run(script_path: str, args: list[str], protocol: BinaryIO) -> int:
+    """Run the script once in a forked child, streaming its output frames."""
+    stdout_read, stdout_write = os.pipe()
+    stderr_read, stderr_write = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        os.close(stdout_read)
+        os.close(stderr_read)
+        _run_child(script_path, args, stdout_write, stderr_write)
+    os.close(stdout_write)
+    os.close(stderr_write)
+
+    streams = {stdout_read: "stdout", stderr_read: "stderr"}
+    with selectors.DefaultSelector() as selector:
+        for fd in streams:
+            selector.register(fd, selectors.EVENT_READ)
+        while streams:
+            for key, _ in selector.select():
+                data = os.read(key.fd, CHUNK_SIZE)
+                if data:
+                    _write_frame(protocol, {"stream": streams[key.fd], "size": len(data)}, data)
+                else:
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+                    del streams[key.fd]
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def main() -> None:
+    """Serve run requests for the script given on the command line."""
+    script_path = os.path.abspath(sys.argv[1])
+    # Import like `python script.py`: the script's directory, not this one
+    sys.path[0] = os.path.dirname(script_path)
+
+    # Keep the protocol channel private: anything else printed to stdout
+    # (e.g. by imports) goes to stderr instead of corrupting responses
+    protocol = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    requests = sys.stdin.buffer
+
+    _prewarm(script_path)
+
+    for line in requests:
+        try:
+            args = [str(arg) for arg in json.loads(line).get("args", [])]
+            returncode = _run(script_path, args, protocol)
+        except Exception:  # noqa: BLE001 - keep serving; report as a failed run
+            error = traceback.format_exc().encode()
+            _write_frame(protocol, {"stream": "stderr", "size": len(error)}, error)
+            returncode = 1
+        _write_frame(protocol, {"returncode": returncode})
+
+
+if __name__ == "__main__":
+    main()
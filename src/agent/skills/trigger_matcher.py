@@ -0,0 +1,197 @@
+"""Precompiled trigger matching for skill documentation injection.
+
+SkillContextProvider checks every user message against every skill's name,
+keywords, verbs and regex patterns. SkillTriggerMatcher compiles those
+triggers once, when the skill index changes, instead of building a regex per
+trigger per message.
+
+Name, keyword and verb triggers match as whole words (``\\bterm\\b``). A term
+that starts and ends with a word character matches exactly where it begins at
+the start of a word run of the message and ends at the end of one, so the
+message is split into word runs once and terms are looked up by their first
+word, a dict access per word regardless of how many skills are installed.
+Terms starting or ending with punctuation ("c++", ".net") have looser
+boundary semantics and keep a precompiled regex. Pattern triggers are
+compiled once.
+
+rank() orders matched skills by relevance: the strength of the triggers that
+fired (a skill's name outweighs its keywords, which outweigh verbs and
+patterns) plus the BM25 score of the message against the skill's brief
+description and instructions, normalized to [0, 1] so it reorders skills
+with similar trigger strength without overriding a stronger trigger.
+"""
+
+import logging
+import re
+from typing import Any
+
+from agent.utils.text_index import InvertedIndex
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Trigger strength per trigger kind (a term listed under several kinds counts once,
+# with its strongest kind)
+NAME_WEIGHT = 3.0
+KEYWORD_WEIGHT = 2.0
+VERB_WEIGHT = 1.0
+PATTERN_WEIGHT = 1.0
+
+
+class SkillTriggerMatcher:
+    """Trigger automaton over a fixed set of skills.
+
+    Attributes:
+        skills: Skill metadata dicts, in match order
+        has_explicit_triggers: True if any skill has keywords beyond its name,
+            verbs or patterns
+
+    Example:
+        >>> matcher = SkillTriggerMatcher(skill_docs.get_all_metadata())
+        >>> [s["name"] for s in matcher.match("please calculate 2+2")]
+        ['calculator']
+        >>> [s["name"] for s, _ in matcher.rank("calculate the weather")]
+        ['weather', 'calculator']
+    """
+
+    def __init__(self, skills: list[dict[str, Any]]):
+        """Compile the triggers of skills.
+
+        Invalid regex patterns are logged and skipped.
+
+        Args:
+            skills: Skill metadata dicts (see SkillDocumentationIndex.get_all_metadata())
+        """
+        self.skills = skills
+        self.has_explicit_triggers = False
+        # First word of a term -> (term, skill position, weight) candidates
+        self._terms_by_word: dict[str, list[tuple[str, int, float]]] = {}
+        # Terms without word characters at both ends: (compiled, skill position, weight)
+        self._term_patterns: list[tuple[re.Pattern[str], int, float]] = []
+        # Skill position -> compiled pattern triggers
+        self._patterns: dict[int, list[re.Pattern[str]]] = {}
+        # BM25 over brief description and instructions, by skill position
+        self._index = InvertedIndex(recency_weight=0.0)
+
+        for position, skill in enumerate(skills):
+            triggers = skill.get("triggers") or {}
+            keywords = triggers.get("keywords") or []
+            verbs = triggers.get("verbs") or []
+            patterns = triggers.get("patterns") or []
+            # The first keyword is always the skill name (auto-added by model_post_init)
+            if len(keywords) > 1 or verbs or patterns:
+                self.has_explicit_triggers = True
+
+            terms: dict[str, float] = {}
+            for term, weight in (
+                *((verb, VERB_WEIGHT) for verb in verbs),
+                *((keyword, KEYWORD_WEIGHT) for keyword in keywords),
+                (skill["name"], NAME_WEIGHT),
+            ):
+                term = term.lower()
+                terms[term] = max(weight, terms.get(term, 0.0))
+            for term, weight in terms.items():
+                self._add_term(term, position, weight)
+            self._index.add(
+                position, f"{skill.get('brief_description', '')} {skill.get('instructions', '')}"
+            )
+
+            compiled = []
+            for pattern in patterns:
+                try:
+                    compiled.append(re.compile(pattern, re.IGNORECASE))
+                except re.error as e:
+                    logger.warning(f"Invalid regex pattern for {skill['name']}: {pattern} - {e}")
+            if compiled:
+                self._patterns[position] = compiled
+
+    def _add_term(self, term: str, position: int, weight: float) -> None:
+        """Index a whole-word trigger term for the skill at position."""
+        first = _WORD_PATTERN.match(term)
+        if first is not None and _WORD_PATTERN.fullmatch(term[-1]):
+            self._terms_by_word.setdefault(first.group(), []).append((term, position, weight))
+        else:
+            self._term_patterns.append((re.compile(rf"\b{re.escape(term)}\b"), position, weight))
+
+    def _trigger_strengths(self, text: str) -> dict[int, float]:
+        """Sum the weights of the distinct triggers each skill matches in text."""
+        strengths: dict[int, float] = {}
+        seen: set[tuple[str, int]] = set()
+
+        runs = list(_WORD_PATTERN.finditer(text))
+        if runs:
+            ends = {run.end() for run in runs}
+            for run in runs:
+                candidates = self._terms_by_word.get(run.group())
+                if not candidates:
+                    continue
+                start = run.start()
+                for term, position, weight in candidates:
+                    if (
+                        (term, position) not in seen
+                        and start + len(term) in ends
+                        and text.startswith(term, start)
+                    ):
+                        seen.add((term, position))
+                        strengths[position] = strengths.get(position, 0.0) + weight
+
+        for compiled, position, weight in self._term_patterns:
+            if compiled.search(text):
+                strengths[position] = strengths.get(position, 0.0) + weight
+
+        for position, patterns in self._patterns.items():
+            if any(p.search(text) for p in patterns):
+                strengths[position] = strengths.get(position, 0.0) + PATTERN_WEIGHT
+
+        return strengths
+
+    def _unique(self, positions: list[int]) -> list[int]:
+        """Filter skill positions, keeping the first skill of each name."""
+        result = []
+        names = set()
+        for position in positions:
+            name = self.skills[position]["name"]
+            if name not in names:
+                names.add(name)
+                result.append(position)
+        return result
+
+    def match(self, message: str) -> list[dict[str, Any]]:
+        """Find the skills triggered by a message.
+
+        Args:
+            message: User message text
+
+        Returns:
+            Matched skill metadata dicts, in skill order (one per name)
+        """
+        positions = self._unique(sorted(self._trigger_strengths(message.lower())))
+        return [self.skills[position] for position in positions]
+
+    def rank(self, message: str) -> list[tuple[dict[str, Any], float]]:
+        """Find the skills triggered by a message, most relevant first.
+
+        Args:
+            message: User message text
+
+        Returns:
+            (skill metadata dict, relevance score) tuples, best first
+            (one per name; ties keep skill order)
+        """
+        strengths = self._trigger_strengths(message.lower())
+        if not strengths:
+            return []
+
+        bm25 = {
+            position: score
+            for position, score in self._index.search(message, limit=len(self.skills))
+            if position in strengths
+        }
+        top = max(bm25.values(), default=0.0) or 1.0
+        scores = {
+            position: strength + bm25.get(position, 0.0) / top
+            for position, strength in strengths.items()
+        }
+        ranked = sorted(scores, key=lambda position: (-scores[position], position))
+        return [(self.skills[position], scores[position]) for position in self._unique(ranked)]
@@ -1,5 +1,6 @@
 """Tool implementations for Agent."""
 
-from agent.tools.toolset import AgentToolset
+from agent.tools.scheduler import ToolScheduler
+from agent.tools.toolset import AgentToolset, ToolPolicy
 
-__all__ = ["AgentToolset"]
+__all__ = ["AgentToolset", "ToolPolicy", "ToolScheduler"]
@@ -7,7 +7,7 @@ execution to the LLM.
 Key Features:
 - Workspace sandboxing with path traversal protection
 - Structured directory listing and file reading
-- Text search with literal and regex support
+- Parallel, gitignore-aware text search with literal and regex support
 - Guarded write operations (disabled by default)
 - Surgical text editing with safety checks
 - Cross-platform path handling
@@ -15,6 +15,7 @@ Key Features:
 All operations are sandboxed to workspace_root (defaults to current directory).
 """
 
+import asyncio
 import logging
 import os
 import re
@@ -25,7 +26,8 @@ from typing import Annotated, Any
 from pydantic import Field
 
 from agent.config.schema import AgentSettings
-from agent.tools.toolset import AgentToolset
+from agent.tools.search import TextMatcher, TextSearchEngine, compile_glob
+from agent.tools.toolset import AgentToolset, ToolPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +52,15 @@ class FileSystemTools(AgentToolset):
         {'success': True, 'result': {'entries': [...], 'truncated': False}}
     """
 
+    # Tools run their blocking file I/O in worker threads (asyncio.to_thread).
+    # Searches walk whole trees, so few run at once; writes are serialized.
+    tool_policies = {
+        "search_text": ToolPolicy(max_concurrency=2),
+        "write_file": ToolPolicy(max_concurrency=1),
+        "apply_text_edit": ToolPolicy(max_concurrency=1),
+        "create_directory": ToolPolicy(max_concurrency=1),
+    }
+
     def __init__(self, settings: AgentSettings):
         """Initialize FileSystemTools with settings.
 
@@ -58,6 +69,7 @@ class FileSystemTools(AgentToolset):
         """
         super().__init__(settings)
         self._workspace_root_cache: Path | None = None
+        self._search_engine: TextSearchEngine | None = None
 
     def get_tools(self) -> list:
         """Get list of filesystem tools.
@@ -115,6 +127,12 @@ class FileSystemTools(AgentToolset):
         self._workspace_root_cache = workspace_root
         return self._workspace_root_cache
 
+    def _get_search_engine(self) -> TextSearchEngine:
+        """Get the search engine for the workspace (created on first search)."""
+        if self._search_engine is None:
+            self._search_engine = TextSearchEngine(self._get_workspace_root())
+        return self._search_engine
+
     def _resolve_path(self, relative_path: str) -> dict | Path:
         """Resolve and validate path within workspace boundaries.
 
@@ -244,6 +262,10 @@ class FileSystemTools(AgentToolset):
         self, path: Annotated[str, Field(description="Path relative to workspace root")] = "."
     ) -> dict:
         """Get file/directory metadata within workspace. Returns exists, type, size, permissions, timestamps."""
+        return await asyncio.to_thread(self._get_path_info, path)
+
+    def _get_path_info(self, path: str) -> dict:
+        """Get path metadata (blocking)."""
         # Resolve and validate path
         resolved = self._resolve_path(path)
         if isinstance(resolved, dict):
@@ -363,6 +385,14 @@ class FileSystemTools(AgentToolset):
         ] = False,
     ) -> dict:
         """List directory contents within workspace with metadata. Supports recursive traversal. Default: 200 entries max, excludes hidden files. Returns entries with type and size."""
+        return await asyncio.to_thread(
+            self._list_directory, path, recursive, max_entries, include_hidden
+        )
+
+    def _list_directory(
+        self, path: str, recursive: bool, max_entries: int, include_hidden: bool
+    ) -> dict:
+        """List a directory (blocking)."""
         # Cap max_entries at 500
         max_entries = min(max_entries, 500)
 
@@ -531,6 +561,10 @@ class FileSystemTools(AgentToolset):
         max_lines: Annotated[int, Field(description="Maximum lines to read")] = 200,
     ) -> dict:
         """Read text file within workspace by line range. Paths relative to workspace root. Default: first 200 lines. Returns content with truncation flag for large files."""
+        return await asyncio.to_thread(self._read_file, path, start_line, max_lines)
+
+    def _read_file(self, path: str, start_line: int, max_lines: int) -> dict:
+        """Read a line range of a file (blocking)."""
         # Cap max_lines at 1000
         max_lines = min(max_lines, 1000)
 
@@ -638,7 +672,7 @@ class FileSystemTools(AgentToolset):
     """
     {
       "name": "search_text",
-      "description": "Search text patterns across files in workspace. Supports literal (default) and regex modes. Case-sensitive by default. Max 50 matches. Returns matches with file, line, snippet.",
+      "description": "Search text patterns across files in workspace. Supports literal (default) and regex modes. Case-sensitive by default. Skips gitignored paths. Max 50 matches. Returns matches with file, line, snippet, and files_searched (files scanned before the match limit was reached).",
       "parameters": {
         "type": "object",
         "properties": {
@@ -688,7 +722,7 @@ class FileSystemTools(AgentToolset):
         use_regex: Annotated[bool, Field(description="Enable regex mode")] = False,
         case_sensitive: Annotated[bool, Field(description="Case-sensitive search")] = True,
     ) -> dict:
-        """Search text patterns across files in workspace. Supports literal (default) and regex modes. Case-sensitive by default. Max 50 matches. Returns matches with file, line, snippet."""
+        """Search text patterns across files in workspace. Supports literal (default) and regex modes. Case-sensitive by default. Skips gitignored paths. Max 50 matches. Returns matches with file, line, snippet, and files_searched (files scanned before the match limit was reached)."""
 
         # Resolve and validate path
         resolved = self._resolve_path(path)
@@ -699,137 +733,48 @@ class FileSystemTools(AgentToolset):
         if not resolved.exists():
             return self._create_error_response(error="not_found", message=f"Path not found: {path}")
 
-        # Compile regex if needed
-        regex_pattern = None
-        if use_regex:
-            try:
-                flags = 0 if case_sensitive else re.IGNORECASE
-                regex_pattern = re.compile(query, flags)
-            except re.error as e:
-                return self._create_error_response(
-                    error="invalid_regex", message=f"Invalid regex pattern '{query}': {str(e)}"
-                )
+        # Compile query
+        try:
+            matcher = TextMatcher(query, use_regex=use_regex, case_sensitive=case_sensitive)
+        except re.error as e:
+            return self._create_error_response(
+                error="invalid_regex", message=f"Invalid regex pattern '{query}': {str(e)}"
+            )
 
-        # Collect files to search
-        files_to_search = []
-        workspace_root = self._get_workspace_root()
+        # Compile file pattern
+        try:
+            glob_regex = compile_glob(glob)
+        except re.error as e:
+            return self._create_error_response(
+                error="invalid_glob", message=f"Invalid glob pattern '{glob}': {str(e)}"
+            )
 
+        if not resolved.is_file() and not resolved.is_dir():
+            return self._create_error_response(
+                error="invalid_path_type", message=f"Path is neither file nor directory: {path}"
+            )
+
+        # Walk and scan in parallel off the event loop
         try:
-            if resolved.is_file():
-                # Single file search
-                files_to_search = [resolved]
-            elif resolved.is_dir():
-                # Directory search with glob filtering
-                # Use pathlib's glob matching instead of fnmatch for ** support
-                if glob == "**/*" or glob == "*":
-                    # Match all files (optimization)
-                    for file_path in resolved.rglob("*"):
-                        if file_path.is_file():
-                            files_to_search.append(file_path)
-                else:
-                    # Use glob pattern matching
-                    for file_path in resolved.glob(glob):
-                        if file_path.is_file():
-                            files_to_search.append(file_path)
-                    # Also try rglob if glob contains **
-                    if "**" in glob:
-                        for file_path in resolved.glob(glob):
-                            if file_path.is_file() and file_path not in files_to_search:
-                                files_to_search.append(file_path)
-            else:
-                return self._create_error_response(
-                    error="invalid_path_type", message=f"Path is neither file nor directory: {path}"
-                )
+            search = await asyncio.to_thread(
+                self._get_search_engine().search, resolved, matcher, glob_regex, max_matches
+            )
         except (OSError, PermissionError) as e:
             return self._create_error_response(
                 error="os_error", message=f"Error accessing path {path}: {str(e)}"
             )
 
-        # Search files
-        matches: list[dict[str, Any]] = []
-        files_searched = 0
-        truncated = False
-
-        for file_path in files_to_search:
-            if len(matches) >= max_matches:
-                truncated = True
-                break
-
-            files_searched += 1
-
-            try:
-                # Skip binary files (check for null bytes in first 8KB)
-                with open(file_path, "rb") as f:
-                    sample = f.read(8192)
-                    if b"\x00" in sample:
-                        continue  # Skip binary file
-
-                # Search file contents
-                with open(file_path, encoding="utf-8", errors="replace") as f:
-                    for line_num, line in enumerate(f, start=1):
-                        if len(matches) >= max_matches:
-                            truncated = True
-                            break
-
-                        # Perform search
-                        if use_regex:
-                            # Regex search
-                            if regex_pattern is not None:
-                                match_obj = regex_pattern.search(line)
-                            else:
-                                match_obj = None
-                            if match_obj:
-                                match_start = match_obj.start()
-                                match_end = match_obj.end()
-                            else:
-                                continue
-                        else:
-                            # Literal search
-                            search_line = line if case_sensitive else line.lower()
-                            search_query = query if case_sensitive else query.lower()
-
-                            match_start = search_line.find(search_query)
-                            if match_start == -1:
-                                continue
-                            match_end = match_start + len(search_query)
-
-                        # Truncate snippet to 200 chars
-                        snippet = line.strip()
-                        if len(snippet) > 200:
-                            snippet = snippet[:200] + "..."
-
-                        # Get relative path for result
-                        relative_path = file_path.relative_to(workspace_root)
-
-                        matches.append(
-                            {
-                                "file": str(relative_path),
-                                "line": line_num,
-                                "snippet": snippet,
-                                "match_start": match_start,
-                                "match_end": match_end,
-                            }
-                        )
-
-            except (OSError, PermissionError):
-                # Skip files we can't read
-                continue
-            except Exception as e:
-                # Log unexpected errors but continue searching
-                logger.warning(f"Unexpected error searching {file_path}: {e}")
-                continue
-
         result = {
             "query": query,
             "use_regex": use_regex,
-            "files_searched": files_searched,
-            "matches": matches,
-            "truncated": truncated,
+            "files_searched": search.files_searched,
+            "matches": search.matches,
+            "truncated": search.truncated,
         }
 
         return self._create_success_response(
             result=result,
-            message=f"Found {len(matches)} matches in {files_searched} files",
+            message=f"Found {len(search.matches)} matches in {search.files_searched} files",
         )
 
     """
@@ -865,6 +810,10 @@ class FileSystemTools(AgentToolset):
         mode: Annotated[str, Field(description="Write mode: create, overwrite, append")] = "create",
     ) -> dict:
         """Write file within workspace with safety checks. Requires filesystem_writes_enabled. Supports create/overwrite/append modes. Returns bytes written and mode used."""
+        return await asyncio.to_thread(self._write_file, path, content, mode)
+
+    def _write_file(self, path: str, content: str, mode: str) -> dict:
+        """Write a file (blocking)."""
         # Check if writes are enabled
         if not self.config.filesystem_writes_enabled:
             return self._create_error_response(
@@ -976,6 +925,14 @@ class FileSystemTools(AgentToolset):
         replace_all: Annotated[bool, Field(description="Replace all occurrences")] = False,
     ) -> dict:
         """Apply exact text replacement in file within workspace. Requires filesystem_writes_enabled and exact match. Use replace_all for multiple occurrences. Returns replacement count and size delta."""
+        return await asyncio.to_thread(
+            self._apply_text_edit, path, expected_text, replacement_text, replace_all
+        )
+
+    def _apply_text_edit(
+        self, path: str, expected_text: str, replacement_text: str, replace_all: bool
+    ) -> dict:
+        """Replace text in a file (blocking)."""
         # Check if writes are enabled
         if not self.config.filesystem_writes_enabled:
             return self._create_error_response(
@@ -1134,6 +1091,10 @@ class FileSystemTools(AgentToolset):
         parents: Annotated[bool, Field(description="Create parent directories if needed")] = True,
     ) -> dict:
         """Create directory within workspace with optional parent creation. Requires filesystem_writes_enabled. Idempotent (success if exists). Returns created flag."""
+        return await asyncio.to_thread(self._create_directory, path, parents)
+
+    def _create_directory(self, path: str, parents: bool) -> dict:
+        """Create a directory (blocking)."""
         # Check if writes are enabled
         if not self.config.filesystem_writes_enabled:
             return self._create_error_response(
@@ -0,0 +1,286 @@
+"""Central scheduler enforcing tool execution policies.
+
+When the model issues several tool calls in parallel, they all start at once:
+a burst of script_run or search_text calls can oversubscribe CPU and file
+descriptors, and tools doing blocking I/O stall the event loop for every
+other call. ToolScheduler runs each call under its toolset's ToolPolicy
+(per-tool concurrency limit, timeout and venue) and an agent-wide
+concurrency limit, and reports how long the call waited for a slot.
+
+Async tools always run on the caller's event loop, with the rest of the
+middleware chain; they offload their own blocking work (asyncio.to_thread).
+The thread and process venues call a plain sync tool function directly.
+
+The Agent registers its toolsets with a scheduler and makes it process-wide
+(set_tool_scheduler); logging_function_middleware runs every tool call
+through it. Without a scheduler, tools run inline without limits.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import multiprocessing
+import pickle
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any
+
+from agent.tools.toolset import AgentToolset, ToolPolicy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLICY = ToolPolicy()
+
+# Set while a scheduled call runs, so nested tool calls run under their parent's slot
+_in_scheduled_call: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "in_scheduled_call", default=False
+)
+
+
+@dataclass
+class ScheduledCall:
+    """Outcome of a scheduled tool call.
+
+    Attributes:
+        result: Tool result
+        queue_wait: Seconds the call waited for a concurrency slot
+        venue: Venue the call ran in ("inline", "thread" or "process")
+    """
+
+    result: Any
+    queue_wait: float
+    venue: str
+
+
+async def _await_call(call: Callable[[], Awaitable[Any]]) -> Any:
+    return await call()
+
+
+def _is_sync_call(direct_call: tuple[Callable[..., Any], dict[str, Any]] | None) -> bool:
+    """Check a direct call is a plain sync function (may run in a thread or process)."""
+    return direct_call is not None and not inspect.iscoroutinefunction(direct_call[0])
+
+
+def _invoke_in_process(func: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
+    """Call a tool function in a worker process (process venue)."""
+    result = func(**kwargs)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
+
+
+class ToolScheduler:
+    """Run tool calls under their execution policies.
+
+    Calls first wait for a slot of their tool's limit, then for a slot of the
+    agent-wide limit. Tool calls made while another scheduled call runs
+    (nested tools) bypass the limits, since their parent already holds a slot.
+
+    The thread and process venues apply to plain sync tool functions, which
+    are called directly (bypassing the rest of the middleware chain). Async
+    tools, and calls without a direct function, run inline on the caller's
+    event loop whatever their venue.
+
+    A timed-out call stops being awaited and releases its slots; a call in the
+    thread or process venue cannot be interrupted and finishes in the
+    background.
+
+    Example:
+        >>> scheduler = ToolScheduler(max_concurrency=8)
+        >>> scheduler.register(FileSystemTools(settings))
+        >>> scheduled = await scheduler.run("search_text", lambda: next(context))
+        >>> scheduled.result, scheduled.queue_wait
+    """
+
+    def __init__(self, max_concurrency: int = 8, process_workers: int = 2):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrency: Maximum tool calls running at once across all tools
+                (also the thread pool size)
+            process_workers: Size of the process pool for the process venue
+        """
+        self.max_concurrency = max_concurrency
+        self.process_workers = process_workers
+        self._policies: dict[str, ToolPolicy] = {}
+        self._unpicklable: set[str] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        self._tool_limits: dict[str, asyncio.Semaphore] = {}
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    def register(self, toolset: AgentToolset) -> None:
+        """Register the execution policies of a toolset's tools.
+
+        Args:
+            toolset: Toolset whose get_tool_policies() are enforced
+        """
+        for tool_name, policy in toolset.get_tool_policies().items():
+            self._policies[tool_name] = policy
+
+    def policy(self, tool_name: str) -> ToolPolicy:
+        """Get the execution policy of a tool (unlimited and inline if undeclared)."""
+        return self._policies.get(tool_name, DEFAULT_POLICY)
+
+    async def run(
+        self,
+        tool_name: str,
+        call: Callable[[], Awaitable[Any]],
+        direct_call: tuple[Callable[..., Any], dict[str, Any]] | None = None,
+    ) -> ScheduledCall:
+        """Run a tool call under its policy.
+
+        Args:
+            tool_name: Name of the tool
+            call: Starts the tool call (e.g. the next middleware)
+            direct_call: Tool function and keyword arguments, called instead of
+                call in the thread and process venues when the function is sync
+                (in a thread if they can't be pickled for a process)
+
+        Returns:
+            ScheduledCall with the result, queue wait and venue
+
+        Raises:
+            TimeoutError: If the call exceeds the policy timeout
+        """
+        policy = self.policy(tool_name)
+        if _in_scheduled_call.get():
+            result, venue = await self._execute(tool_name, policy, call, direct_call)
+            return ScheduledCall(result, 0.0, venue)
+
+        self._bind_loop()
+        tool_limit = self._tool_limit(tool_name, policy)
+        queued_at = time.perf_counter()
+        async with tool_limit if tool_limit is not None else nullcontext():
+            async with self._global_limit:
+                queue_wait = time.perf_counter() - queued_at
+                if queue_wait > 0.1:
+                    logger.debug(f"Tool call {tool_name} waited {queue_wait:.2f}s for a slot")
+                token = _in_scheduled_call.set(True)
+                try:
+                    result, venue = await self._execute(tool_name, policy, call, direct_call)
+                finally:
+                    _in_scheduled_call.reset(token)
+        return ScheduledCall(result, queue_wait, venue)
+
+    def shutdown(self) -> None:
+        """Shut down the thread and process pools."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    async def _execute(
+        self,
+        tool_name: str,
+        policy: ToolPolicy,
+        call: Callable[[], Awaitable[Any]],
+        direct_call: tuple[Callable[..., Any], dict[str, Any]] | None,
+    ) -> tuple[Any, str]:
+        """Run a call in its venue, enforcing the policy timeout."""
+        loop = asyncio.get_running_loop()
+        venue = policy.venue
+        if venue != "inline" and not _is_sync_call(direct_call):
+            # Async work stays on this loop, where its middleware state lives
+            venue = "inline"
+        if venue == "process" and not self._can_pickle(tool_name, direct_call):
+            venue = "thread"
+
+        if venue == "inline":
+            pending: Awaitable[Any] = _await_call(call)
+        else:
+            assert direct_call is not None
+            func, kwargs = direct_call
+            if venue == "process":
+                pending = loop.run_in_executor(
+                    self._get_process_pool(), _invoke_in_process, func, kwargs
+                )
+            else:
+                context = contextvars.copy_context()
+                pending = loop.run_in_executor(
+                    self._get_thread_pool(), context.run, functools.partial(func, **kwargs)
+                )
+
+        try:
+            return await asyncio.wait_for(pending, timeout=policy.timeout), venue
+        except TimeoutError:
+            raise TimeoutError(f"Tool '{tool_name}' timed out after {policy.timeout}s") from None
+
+    def _can_pickle(
+        self, tool_name: str, direct_call: tuple[Callable[..., Any], dict[str, Any]] | None
+    ) -> bool:
+        """Check a process venue call can be sent to a worker process."""
+        if direct_call is None or tool_name in self._unpicklable:
+            return False
+        try:
+            pickle.dumps(direct_call)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug(f"Running {tool_name} in a thread: cannot send it to a process: {e}")
+            self._unpicklable.add(tool_name)
+            return False
+        return True
+
+    def _bind_loop(self) -> None:
+        """Recreate the semaphores when calls move to another event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._global_limit = asyncio.Semaphore(self.max_concurrency)
+            self._tool_limits.clear()
+
+    def _tool_limit(self, tool_name: str, policy: ToolPolicy) -> asyncio.Semaphore | None:
+        """Get the semaphore limiting a tool's concurrent calls."""
+        if policy.max_concurrency is None:
+            return None
+        limit = self._tool_limits.get(tool_name)
+        if limit is None:
+            limit = asyncio.Semaphore(policy.max_concurrency)
+            self._tool_limits[tool_name] = limit
+        return limit
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="agent-tool"
+            )
+        return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            # spawn: forking a process running an event loop and threads is unsafe
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
+
+
+# Process-wide scheduler (set by the Agent, used by the function middleware)
+_scheduler: ToolScheduler | None = None
+
+
+def get_tool_scheduler() -> ToolScheduler | None:
+    """Get the process-wide tool scheduler.
+
+    Returns:
+        ToolScheduler, or None if tools run without policies
+    """
+    return _scheduler
+
+
+def set_tool_scheduler(scheduler: ToolScheduler | None) -> None:
+    """Set the process-wide tool scheduler.
+
+    Args:
+        scheduler: Scheduler used for tool calls (None to run tools unscheduled)
+    """
+    global _scheduler
+    _scheduler = scheduler
@@ -0,0 +1,579 @@
+"""Parallel, gitignore-aware text search behind FileSystemTools.search_text.
+
+Searching used to materialize every file under the path with rglob("*"),
+then open each file twice (binary sniff, then text read) and test it line by
+line. TextSearchEngine instead:
+
+- walks directories in parallel on a thread pool with os.scandir, pruning
+  hidden directories (including .git) and paths excluded by .gitignore files
+  from the workspace root down
+- scans files on the same pool: each file is memory-mapped once, binary files
+  (NUL byte in the first 8 KB) are skipped, and files that cannot contain a
+  match are rejected before being decoded
+- hands results back in path order and stops scanning once max_matches is
+  reached
+
+Results are deterministic: the first max_matches matches in sorted path order.
+"""
+
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path, PurePath
+from typing import Any
+
+# Bytes checked for NUL to detect binary files
+BINARY_SNIFF_BYTES = 8192
+
+# Maximum characters of a matching line returned as snippet
+SNIPPET_LIMIT = 200
+
+# Regex constructs whose meaning changes when the whole file is searched at once
+_LINE_ONLY_REGEX = ("(?<", "\\A", "\\Z")
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a glob pattern ('*', '?', '[...]', '**') into a regex (no anchors).
+
+    '*' and '?' do not match '/', '**/' matches zero or more directories and a
+    trailing '**' matches everything below.
+    """
+    parts: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == "*":
+            if pattern.startswith("**", i):
+                if i + 2 == n:
+                    parts.append(".*")
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    parts.append("(?:.*/)?")
+                    i += 3
+                    continue
+            while i < n and pattern[i] == "*":
+                i += 1
+            parts.append("[^/]*")
+            continue
+        if char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1 : end]
+                if body[0] == "!":
+                    body = "^" + body[1:]
+                parts.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif char == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
+
+
+def compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a search glob matched against '/'-separated paths relative to the search root.
+
+    Follows Path.glob semantics: '*.py' matches top-level files only,
+    '**/*.py' matches at any depth. A bare '*' matches all files, like '**/*'.
+
+    Raises:
+        re.error: If the pattern is malformed (e.g. a reversed range '[z-a]')
+    """
+    if pattern == "*":
+        pattern = "**/*"
+    return re.compile(_translate_glob(pattern.lstrip("/")) + r"\Z")
+
+
+@dataclass
+class _IgnoreRule:
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+class GitIgnore:
+    """Rules of one .gitignore file.
+
+    Supports comments, negation ('!'), directory-only rules (trailing '/'),
+    anchored rules (containing '/') and '**'.
+
+    Attributes:
+        base: Directory of the .gitignore, relative to the workspace root
+            ('/'-separated, '' for the root)
+    """
+
+    def __init__(self, base: str, lines: list[str]):
+        """Parse .gitignore lines.
+
+        Args:
+            base: Directory of the .gitignore relative to the workspace root
+            lines: Lines of the .gitignore file
+        """
+        self.base = base
+        self.rules: list[_IgnoreRule] = []
+        for line in lines:
+            line = line.rstrip("\n\r")
+            if not line.endswith("\\ "):
+                line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            regex = _translate_glob(line.lstrip("/"))
+            if not anchored:
+                regex = "(?:.*/)?" + regex
+            self.rules.append(_IgnoreRule(re.compile(regex + r"\Z"), negate, dir_only))
+
+    @classmethod
+    def from_file(cls, path: str, base: str) -> "GitIgnore | None":
+        """Load a .gitignore file, if it exists and has rules."""
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                gitignore = cls(base, f.readlines())
+        except OSError:
+            return None
+        return gitignore if gitignore.rules else None
+
+    def match(self, path: str, is_dir: bool) -> bool | None:
+        """Check a path against the rules.
+
+        Args:
+            path: Path relative to the workspace root ('/'-separated)
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored, False if re-included by a negated rule, None if
+            no rule applies
+        """
+        if self.base:
+            if not path.startswith(self.base + "/"):
+                return None
+            path = path[len(self.base) + 1 :]
+        result = None
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(path):
+                result = not rule.negate
+        return result
+
+
+def _is_ignored(ignores: tuple[GitIgnore, ...], path: str, is_dir: bool) -> bool:
+    """Check a path against .gitignore files (deeper files take precedence)."""
+    ignored = False
+    for gitignore in ignores:
+        result = gitignore.match(path, is_dir)
+        if result is not None:
+            ignored = result
+    return ignored
+
+
+class TextMatcher:
+    """Literal or regex line matcher with whole-file rejection.
+
+    Raises:
+        re.error: If use_regex is set and the query is not a valid regex
+    """
+
+    def __init__(self, query: str, use_regex: bool = False, case_sensitive: bool = True):
+        """Compile the query.
+
+        Args:
+            query: Literal text or regex pattern
+            use_regex: Treat query as a regex
+            case_sensitive: Match case
+        """
+        self.query = query
+        self.use_regex = use_regex
+        self.case_sensitive = case_sensitive
+        self.needle = query if case_sensitive else query.lower()
+        self.regex: re.Pattern[str] | None = None
+        self._file_regex: re.Pattern[str] | None = None
+        self._needle_bytes: bytes | None = None
+
+        if use_regex:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            self.regex = re.compile(query, flags)
+            # A line match implies a match in the whole file, except for
+            # constructs that look past line boundaries
+            if not any(token in query for token in _LINE_ONLY_REGEX):
+                self._file_regex = re.compile(query, flags | re.MULTILINE)
+        elif case_sensitive and not any(char in query for char in "\r\n\ufffd"):
+            self._needle_bytes = query.encode("utf-8")
+
+    def may_match(self, data: bytes | mmap.mmap) -> bool:
+        """Cheaply check raw file content could contain a match (no false negatives)."""
+        if self._needle_bytes is None:
+            return True
+        return data.find(self._needle_bytes) != -1
+
+    def find_lines(self, text: str, limit: int) -> tuple[list[tuple[int, str, int, int]], bool]:
+        """Find matching lines of a file.
+
+        Args:
+            text: Decoded file content with '\\n' line endings
+            limit: Maximum number of matching lines
+
+        Returns:
+            ([(line number, line, match start, match end), ...], True if the
+            limit was reached before the end of the file)
+        """
+        if self.use_regex:
+            if self._file_regex is not None and self._file_regex.search(text) is None:
+                return [], False
+            return self._find_by_line(text, limit)
+        if not self.needle:
+            return self._find_by_line(text, limit)
+        if self.case_sensitive:
+            return self._find_literal(text, text, limit)
+        haystack = text.lower()
+        if len(haystack) != len(text):
+            # Lowercasing changed offsets: match line by line instead
+            return self._find_by_line(text, limit)
+        return self._find_literal(text, haystack, limit)
+
+    def _find_literal(
+        self, text: str, haystack: str, limit: int
+    ) -> tuple[list[tuple[int, str, int, int]], bool]:
+        """Find lines containing the needle by searching the whole file."""
+        results: list[tuple[int, str, int, int]] = []
+        needle = self.needle
+        line_num = 1
+        counted_to = 0
+        pos = haystack.find(needle)
+        while pos != -1:
+            line_start = haystack.rfind("\n", 0, pos) + 1
+            line_end = haystack.find("\n", pos)
+            line_end = len(haystack) if line_end == -1 else line_end + 1
+            start = haystack.find(needle, line_start, line_end)
+            if start != -1 and start + len(needle) <= line_end:
+                line_num += haystack.count("\n", counted_to, line_start)
+                counted_to = line_start
+                start -= line_start
+                results.append((line_num, text[line_start:line_end], start, start + len(needle)))
+                if len(results) >= limit:
+                    return results, line_end < len(haystack)
+            pos = haystack.find(needle, line_end)
+        return results, False
+
+    def _find_by_line(self, text: str, limit: int) -> tuple[list[tuple[int, str, int, int]], bool]:
+        """Test each line on its own."""
+        results: list[tuple[int, str, int, int]] = []
+        lines = text.split("\n")
+        last = len(lines) - 1
+        if lines[last] == "":
+            lines.pop()
+            last -= 1
+        for index, line in enumerate(lines):
+            if index < last or text.endswith("\n"):
+                line += "\n"
+            if self.regex is not None:
+                match = self.regex.search(line)
+                if match is None:
+                    continue
+                start, end = match.start(), match.end()
+            else:
+                start = line.lower().find(self.needle)
+                if start == -1:
+                    continue
+                end = start + len(self.needle)
+            results.append((index + 1, line, start, end))
+            if len(results) >= limit:
+                return results, index < last
+        return results, False
+
+
+@dataclass
+class SearchResult:
+    """Outcome of a search.
+
+    Attributes:
+        matches: Match dicts (file, line, snippet, match_start, match_end)
+        files_searched: Files scanned, in walk order, before the search stopped
+            at max_matches (all walked files when it did not stop early)
+        truncated: True if the search stopped at max_matches with content left
+    """
+
+    matches: list[dict[str, Any]] = field(default_factory=list)
+    files_searched: int = 0
+    truncated: bool = False
+
+
+class TextSearchEngine:
+    """Search files under a workspace in parallel.
+
+    Example:
+        >>> engine = TextSearchEngine(Path("/home/user/project"))
+        >>> result = engine.search(Path("/home/user/project/src"), TextMatcher("TODO"))
+        >>> result.matches[0]
+        {'file': 'src/app.py', 'line': 12, 'snippet': '# TODO: ...', ...}
+    """
+
+    def __init__(self, workspace_root: Path, max_workers: int | None = None):
+        """Initialize engine.
+
+        Args:
+            workspace_root: Workspace root (.gitignore files are read from here
+                down, result paths are relative to it)
+            max_workers: Thread pool size (defaults to min(32, CPUs + 4))
+        """
+        self.workspace_root = workspace_root
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._pool: ThreadPoolExecutor | None = None
+
+    def search(
+        self,
+        root: Path,
+        matcher: TextMatcher,
+        glob: str | re.Pattern[str] = "**/*",
+        max_matches: int = 50,
+    ) -> SearchResult:
+        """Search a file, or the files under a directory matching glob.
+
+        Args:
+            root: File or directory to search (under the workspace root)
+            matcher: Compiled query
+            glob: File pattern relative to root (or compiled with compile_glob)
+            max_matches: Stop after this many matches
+
+        Returns:
+            SearchResult
+
+        Raises:
+            OSError: If root cannot be listed
+        """
+        if root.is_file():
+            files = [(self._workspace_relative(root), str(root))]
+        else:
+            files = self.walk(root, glob)
+        result = SearchResult()
+        if max_matches <= 0:
+            result.truncated = bool(files)
+            return result
+
+        pool = self._get_pool()
+        pending_files = iter(files)
+        in_flight: deque[Future[tuple[list[dict[str, Any]], bool]]] = deque()
+
+        def submit_next() -> bool:
+            file = next(pending_files, None)
+            if file is None:
+                return False
+            rel, path = file
+            in_flight.append(pool.submit(self._scan_file, path, rel, matcher, max_matches))
+            return True
+
+        for _ in range(self.max_workers * 4):
+            if not submit_next():
+                break
+
+        try:
+            while in_flight:
+                file_matches, more = in_flight.popleft().result()
+                result.files_searched += 1
+                remaining = max_matches - len(result.matches)
+                result.matches.extend(file_matches[:remaining])
+                if len(result.matches) >= max_matches:
+                    result.truncated = (
+                        more or len(file_matches) > remaining or bool(in_flight) or submit_next()
+                    )
+                    break
+                submit_next()
+        finally:
+            for future in in_flight:
+                future.cancel()
+        return result
+
+    def walk(self, root: Path, glob: str | re.Pattern[str] = "**/*") -> list[tuple[str, str]]:
+        """List files under a directory matching glob, in sorted path order.
+
+        Hidden directories and paths excluded by .gitignore are skipped.
+
+        Args:
+            root: Directory to walk
+            glob: File pattern relative to root (or compiled with compile_glob)
+
+        Returns:
+            (path relative to the workspace root, file path) tuples
+
+        Raises:
+            OSError: If root cannot be listed
+        """
+        glob_regex = compile_glob(glob) if isinstance(glob, str) else glob
+        root_rel = self._workspace_relative(root)
+        ignores = self._parent_ignores(root_rel)
+        pool = self._get_pool()
+
+        files, subdirs = self._list_directory(
+            str(root), root_rel, "", ignores, glob_regex, strict=True
+        )
+        pending = {pool.submit(self._list_directory, *subdir, glob_regex) for subdir in subdirs}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_files, subdirs = future.result()
+                files.extend(dir_files)
+                pending.update(
+                    pool.submit(self._list_directory, *subdir, glob_regex) for subdir in subdirs
+                )
+
+        files.sort()
+        return files
+
+    def close(self) -> None:
+        """Shut down the thread pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _list_directory(
+        self,
+        directory: str,
+        rel: str,
+        glob_rel: str,
+        ignores: tuple[GitIgnore, ...],
+        glob_regex: re.Pattern[str],
+        strict: bool = False,
+    ) -> tuple[list[tuple[str, str]], list[tuple[str, str, str, tuple[GitIgnore, ...]]]]:
+        """List one directory.
+
+        Args:
+            directory: Directory path
+            rel: Directory relative to the workspace root ('' for the root)
+            glob_rel: Directory relative to the search root ('' for the root)
+            ignores: .gitignore files applying to the directory
+            glob_regex: Compiled search glob
+            strict: Raise instead of skipping a directory that cannot be listed
+
+        Returns:
+            ([(file rel, file path), ...], [(subdir path, rel, glob_rel, ignores), ...])
+        """
+        own = GitIgnore.from_file(os.path.join(directory, ".gitignore"), rel)
+        if own is not None:
+            ignores = (*ignores, own)
+
+        files: list[tuple[str, str]] = []
+        subdirs: list[tuple[str, str, str, tuple[GitIgnore, ...]]] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    entry_rel = f"{rel}/{name}" if rel else name
+                    entry_glob_rel = f"{glob_rel}/{name}" if glob_rel else name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name.startswith(".") or _is_ignored(ignores, entry_rel, True):
+                                continue
+                            subdirs.append((entry.path, entry_rel, entry_glob_rel, ignores))
+                        elif entry.is_file():
+                            if _is_ignored(ignores, entry_rel, False):
+                                continue
+                            if glob_regex.match(entry_glob_rel):
+                                files.append((entry_rel, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            if strict:
+                raise
+        return files, subdirs
+
+    def _scan_file(
+        self, path: str, rel: str, matcher: TextMatcher, limit: int
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Search one file.
+
+        Args:
+            path: File path
+            rel: File path relative to the workspace root ('/'-separated)
+            matcher: Compiled query
+            limit: Maximum number of matches
+
+        Returns:
+            (match dicts, True if the limit was reached before the end of the file)
+        """
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return [], False
+                data: bytes | mmap.mmap
+                try:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    data = f.read()
+                try:
+                    if data.find(b"\x00", 0, BINARY_SNIFF_BYTES) != -1:
+                        return [], False
+                    if not matcher.may_match(data):
+                        return [], False
+                    text = data[:].decode("utf-8", errors="replace")
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+        except OSError:
+            return [], False
+
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        lines, more = matcher.find_lines(text, limit)
+        if not lines:
+            return [], False
+
+        relative_path = str(PurePath(rel))
+        matches = []
+        for line_num, line, start, end in lines:
+            snippet = line.strip()
+            if len(snippet) > SNIPPET_LIMIT:
+                snippet = snippet[:SNIPPET_LIMIT] + "..."
+            matches.append(
+                {
+                    "file": relative_path,
+                    "line": line_num,
+                    "snippet": snippet,
+                    "match_start": start,
+                    "match_end": end,
+                }
+            )
+        return matches, more
+
+    def _parent_ignores(self, rel: str) -> tuple[GitIgnore, ...]:
+        """Load .gitignore files from the workspace root down to (excluding) a directory."""
+        ignores = []
+        parts = rel.split("/") if rel else []
+        for depth in range(len(parts)):
+            base = "/".join(parts[:depth])
+            gitignore = GitIgnore.from_file(
+                os.path.join(self.workspace_root, *parts[:depth], ".gitignore"), base
+            )
+            if gitignore is not None:
+                ignores.append(gitignore)
+        return tuple(ignores)
+
+    def _workspace_relative(self, path: Path) -> str:
+        """Get a path relative to the workspace root, '/'-separated ('' for the root)."""
+        rel = path.relative_to(self.workspace_root).as_posix()
+        return "" if rel == "." else rel
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="agent-search"
+            )
+        return self._pool
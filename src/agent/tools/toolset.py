@@ -3,15 +3,59 @@
 This module provides the abstract base class for creating toolsets. Toolsets
 encapsulate related tools with shared dependencies, avoiding global state and
 enabling dependency injection for testing.
+
+Toolsets can also declare an execution policy per tool (ToolPolicy): how many
+calls may run at once, a timeout, and where the call runs (inline on the
+event loop, or, for sync tool functions, in a thread pool or a process pool).
+Policies are enforced centrally by the ToolScheduler in the function middleware.
 """
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, ClassVar, Literal
 
 from agent.config.schema import AgentSettings
 from agent.utils.responses import create_error_response, create_success_response
 
+ToolVenue = Literal["inline", "thread", "process"]
+TOOL_VENUES: tuple[str, ...] = ("inline", "thread", "process")
+
+
+@dataclass(frozen=True)
+class ToolPolicy:
+    """Execution policy of one tool.
+
+    Attributes:
+        max_concurrency: Maximum concurrent calls of the tool (None = unlimited)
+        timeout: Seconds before a call fails with TimeoutError (None = no limit)
+        venue: Where calls run: "inline" on the event loop, "thread" in a
+            thread pool (sync tools doing blocking I/O), or "process" in a
+            process pool (sync CPU-bound tools whose toolset and arguments can
+            be pickled; falls back to "thread" otherwise). Async tools always
+            run inline and offload blocking work themselves.
+
+    Example:
+        >>> ToolPolicy(max_concurrency=2, timeout=30)
+    """
+
+    max_concurrency: int | None = None
+    timeout: float | None = None
+    venue: ToolVenue = "inline"
+
+    def __post_init__(self) -> None:
+        """Validate policy values.
+
+        Raises:
+            ValueError: If a limit is not positive or the venue is unknown
+        """
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {self.max_concurrency}")
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {self.timeout}")
+        if self.venue not in TOOL_VENUES:
+            raise ValueError(f"Invalid tool venue: {self.venue}. Valid venues: {TOOL_VENUES}")
+
 
 class AgentToolset(ABC):
     """Base class for Agent toolsets.
@@ -22,6 +66,9 @@ class AgentToolset(ABC):
     Each toolset receives an AgentSettings instance with all necessary
     configuration, making it easy to mock in tests.
 
+    Tools without an entry in tool_policies run inline without limits other
+    than the agent-wide tool concurrency limit.
+
     Example:
         >>> class MyTools(AgentToolset):
         ...     def get_tools(self):
@@ -32,8 +79,13 @@ class AgentToolset(ABC):
         ...             result=f"Processed: {arg}",
         ...             message="Tool executed successfully"
         ...         )
+        ...
+        ...     tool_policies = {"my_tool": ToolPolicy(max_concurrency=2, timeout=30)}
     """
 
+    # Execution policies by tool name
+    tool_policies: ClassVar[dict[str, ToolPolicy]] = {}
+
     def __init__(self, settings: AgentSettings):
         """Initialize toolset with settings.
 
@@ -66,6 +118,17 @@ class AgentToolset(ABC):
         """
         pass
 
+    def get_tool_policies(self) -> dict[str, ToolPolicy]:
+        """Get execution policies of this toolset's tools, by tool name.
+
+        Returns tool_policies by default; override to derive policies from
+        settings.
+
+        Returns:
+            Dict mapping tool names to their ToolPolicy
+        """
+        return dict(self.tool_policies)
+
     def _create_success_response(self, result: Any, message: str = "") -> dict:
         """Create standardized success response.
 
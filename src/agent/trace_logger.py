@@ -2,6 +2,7 @@
 
 Provides structured JSON logging of LLM interactions with token usage,
 timing, and optional message content for offline analysis and optimization.
+Logged content is scrubbed of secrets (API keys, tokens, passwords).
 """
 
 import json
@@ -10,6 +11,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from agent.utils.redaction import redact, redact_value
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,7 +75,7 @@ class TraceLogger:
         # Add message data if enabled
         if self.include_messages and messages:
             trace_entry["message_count"] = len(messages)
-            trace_entry["messages"] = messages
+            trace_entry["messages"] = redact_value(messages)
         elif messages:
             # Include count but not content
             trace_entry["message_count"] = len(messages)
@@ -80,7 +83,7 @@ class TraceLogger:
         # Add response data
         if response_content is not None:
             if self.include_messages:
-                trace_entry["response"] = response_content
+                trace_entry["response"] = redact(response_content)[0]
             else:
                 # Include length but not content
                 trace_entry["response_length"] = len(response_content)
@@ -141,11 +144,11 @@ class TraceLogger:
 
         if self.include_messages:
             trace_entry["message_count"] = len(messages)
-            trace_entry["messages"] = messages
+            trace_entry["messages"] = redact_value(messages)
 
             # Add system instructions if provided
             if system_instructions:
-                trace_entry["system_instructions"] = system_instructions
+                trace_entry["system_instructions"] = redact(system_instructions)[0]
                 trace_entry["system_instructions_length"] = len(system_instructions)
                 trace_entry["system_instructions_tokens_est"] = len(system_instructions) // 4
 
@@ -194,7 +197,7 @@ class TraceLogger:
         }
 
         if self.include_messages:
-            trace_entry["response"] = response_content
+            trace_entry["response"] = redact(response_content)[0]
         else:
             trace_entry["response_length"] = len(response_content)
 
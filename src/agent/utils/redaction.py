@@ -0,0 +1,164 @@
+"""Single-pass redaction of secrets (API keys, tokens, passwords).
+
+Memory backends, trace logs and telemetry span attributes all need to strip
+credentials from text that can be large (tool outputs of several MB). Running
+one regex per secret pattern rescans the whole text for every pattern; this
+module combines the patterns into one alternation and only tries it where a
+pattern can start.
+
+Each pattern is registered with a literal, lowercase anchor that every match
+begins with ("sk", "bearer", ...). The text is lowercased once and the
+anchors are located with str.find, which skips through clean text at memchr
+speed; the combined regex is then matched only at those positions, left to
+right, without overlapping. Non-ASCII text falls back to a single regex scan,
+because IGNORECASE matching and str.lower() disagree on a few characters
+(e.g. the Kelvin sign matches "k").
+"""
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+REDACTED = "[REDACTED]"
+
+# (anchor, pattern) pairs; every match of a pattern starts with its anchor
+DEFAULT_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("sk", r"sk[-_][a-zA-Z0-9_]{20,}"),  # API keys (sk_...)
+    ("bearer", r"bearer\s+[a-zA-Z0-9\-._~+/]+=*"),  # Bearer tokens
+    ("api", r'api[_-]?key["\s:=]+[a-zA-Z0-9\-._~+/]+'),  # API key assignments
+    ("token", r'token["\s:=]+[a-zA-Z0-9\-._~+/]{20,}'),  # Token assignments
+    ("password", r'password["\s:=]+\S+'),  # Password assignments
+)
+
+
+class Redactor:
+    """Precompiled multi-pattern secret scanner.
+
+    Attributes:
+        anchors: Distinct literal prefixes the patterns start with
+        replacement: Text substituted for each match
+
+    Example:
+        >>> Redactor().redact("Authorization: Bearer abc.def")
+        ('Authorization: [REDACTED]', 1)
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[tuple[str, str]] = DEFAULT_PATTERNS,
+        replacement: str = REDACTED,
+    ):
+        """Compile the scanner.
+
+        Args:
+            patterns: (anchor, regex) pairs; matching is case-insensitive and
+                every match of a regex must start with its (lowercase) anchor
+            replacement: Text substituted for each match
+
+        Raises:
+            ValueError: If no patterns are given or an anchor is empty
+        """
+        patterns = list(patterns)
+        if not patterns:
+            raise ValueError("Redactor needs at least one pattern")
+        if not all(anchor for anchor, _ in patterns):
+            raise ValueError("Redaction anchors must be non-empty")
+        self.anchors = tuple(dict.fromkeys(anchor.lower() for anchor, _ in patterns))
+        self.replacement = replacement
+        self._pattern = re.compile(
+            "|".join(f"(?:{pattern})" for _, pattern in patterns), re.IGNORECASE
+        )
+
+    def redact(self, text: str) -> tuple[str, int]:
+        """Replace secrets in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Tuple of (redacted_text, number_of_redactions)
+        """
+        if not text:
+            return text, 0
+        if not text.isascii():
+            return self._pattern.subn(self.replacement, text)
+
+        lower = text.lower()
+        starts: list[int] = []
+        for anchor in self.anchors:
+            position = lower.find(anchor)
+            while position != -1:
+                starts.append(position)
+                position = lower.find(anchor, position + 1)
+        if not starts:
+            return text, 0
+        starts.sort()
+
+        parts: list[str] = []
+        end = 0
+        match = self._pattern.match
+        for start in starts:
+            if start < end:
+                continue
+            found = match(text, start)
+            if found is not None:
+                parts.append(text[end:start])
+                parts.append(self.replacement)
+                end = found.end()
+        if not parts:
+            return text, 0
+        parts.append(text[end:])
+        return "".join(parts), len(parts) // 2
+
+    def redact_value(self, value: Any) -> Any:
+        """Redact strings inside a JSON-like value.
+
+        Dicts, lists and tuples are copied with their string items redacted
+        (dict keys are kept); other values are returned unchanged.
+
+        Args:
+            value: String or container to scan
+
+        Returns:
+            Redacted copy of the value
+        """
+        if isinstance(value, str):
+            return self.redact(value)[0]
+        if isinstance(value, dict):
+            return {key: self.redact_value(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.redact_value(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self.redact_value(item) for item in value)
+        return value
+
+
+_default_redactor = Redactor()
+
+
+def redact(text: str) -> tuple[str, int]:
+    """Replace secrets in text using the default patterns.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Tuple of (redacted_text, number_of_redactions)
+
+    Example:
+        >>> redact("password=hunter2 and more")
+        ('[REDACTED] and more', 1)
+    """
+    return _default_redactor.redact(text)
+
+
+def redact_value(value: Any) -> Any:
+    """Redact strings inside a JSON-like value using the default patterns.
+
+    Args:
+        value: String or container to scan
+
+    Returns:
+        Redacted copy of the value
+    """
+    return _default_redactor.redact_value(value)
@@ -0,0 +1,185 @@
+"""Inverted index with BM25 ranking for keyword search.
+
+This module provides the incremental index used by InMemoryStore and the
+skill trigger matcher, and the tokenizer shared by the memory backends.
+Documents are tokenized once when added, so a search only touches the
+postings of the query terms instead of scanning every document.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Function words carry no retrieval signal but appear in most memories; keeping
+# them out of the index keeps postings short and searches fast
+STOPWORDS = frozenset(
+    "a an and are as at be but by do for from has have i if in is it its me my "
+    "of on or so that the this to was we were what when where which who will "
+    "with you your".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized (case-folded, punctuation-free) terms.
+
+    Stopwords are dropped.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms in order of appearance
+
+    Example:
+        >>> tokenize("Nice to meet you, Alice!")
+        ['nice', 'meet', 'alice']
+    """
+    return [t for t in _TOKEN_PATTERN.findall(text.casefold()) if t not in STOPWORDS]
+
+
+class InvertedIndex:
+    """Incremental inverted index scored with BM25 plus a recency boost.
+
+    Document ids are integers that increase with insertion order; the recency
+    boost favours higher ids so that, among equally relevant memories, newer
+    ones rank first.
+
+    Attributes:
+        k1: BM25 term-frequency saturation
+        b: BM25 document-length normalization
+        recency_weight: Maximum relative boost given to the newest document
+
+    Example:
+        >>> index = InvertedIndex()
+        >>> index.add(0, "My name is Alice")
+        >>> index.search("alice", limit=5)  # [(0, score)]
+    """
+
+    # Terms present in more than this fraction of documents are only scored on
+    # candidates found through rarer query terms (when those fill the limit)
+    COMMON_TERM_RATIO = 0.25
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, recency_weight: float = 0.1):
+        """Initialize an empty index.
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization
+            recency_weight: Maximum relative boost given to the newest document
+        """
+        self.k1 = k1
+        self.b = b
+        self.recency_weight = recency_weight
+        self._postings: dict[str, dict[int, int]] = {}
+        self._doc_lengths: dict[int, int] = {}
+        self._total_length = 0
+        self._max_doc_id = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self._doc_lengths)
+
+    def add(self, doc_id: int, text: str) -> None:
+        """Index a document.
+
+        Args:
+            doc_id: Unique, increasing document id
+            text: Document text
+        """
+        if doc_id in self._doc_lengths:
+            self.remove(doc_id)
+        terms = tokenize(text)
+        for term, count in Counter(terms).items():
+            self._postings.setdefault(term, {})[doc_id] = count
+        self._doc_lengths[doc_id] = len(terms)
+        self._total_length += len(terms)
+        self._max_doc_id = max(self._max_doc_id, doc_id)
+
+    def remove(self, doc_id: int, text: str | None = None) -> None:
+        """Remove a document from the index.
+
+        Args:
+            doc_id: Document id to remove
+            text: Original document text (avoids scanning all postings when given)
+        """
+        length = self._doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        terms = set(tokenize(text)) if text is not None else list(self._postings)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None and postings.pop(doc_id, None) is not None:
+                if not postings:
+                    del self._postings[term]
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self._postings.clear()
+        self._doc_lengths.clear()
+        self._total_length = 0
+        self._max_doc_id = 0
+
+    def search(self, query: str, limit: int = 5) -> list[tuple[int, float]]:
+        """Return the best matching documents for a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            List of (doc_id, score) tuples, best first
+        """
+        doc_count = len(self._doc_lengths)
+        if not doc_count or limit <= 0:
+            return []
+
+        query_terms = {t for t in tokenize(query) if t in self._postings}
+        if not query_terms:
+            return []
+
+        # Rare terms select candidates; common terms only add to their scores
+        common_df = max(1, int(doc_count * self.COMMON_TERM_RATIO))
+        rare = [t for t in query_terms if len(self._postings[t]) <= common_df]
+        common = [t for t in query_terms if t not in rare] if rare else []
+        selecting = rare or list(query_terms)
+
+        avg_length = self._total_length / doc_count or 1.0
+        k1, b = self.k1, self.b
+        doc_lengths = self._doc_lengths
+        scores: dict[int, float] = {}
+
+        for term in selecting:
+            postings = self._postings[term]
+            idf = self._idf(len(postings), doc_count)
+            for doc_id, tf in postings.items():
+                norm = k1 * (1 - b + b * doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        # With enough candidates, common terms only re-score them (documents
+        # matching nothing but low-idf terms cannot fill the top results)
+        full = len(scores) < limit
+        for term in common:
+            postings = self._postings[term]
+            idf = self._idf(len(postings), doc_count)
+            candidates = postings.items() if full else [(d, postings.get(d, 0)) for d in scores]
+            for doc_id, tf in candidates:
+                if tf:
+                    norm = k1 * (1 - b + b * doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        max_id = self._max_doc_id or 1
+        weight = self.recency_weight
+        return heapq.nlargest(
+            limit,
+            ((doc_id, score * (1 + weight * doc_id / max_id)) for doc_id, score in scores.items()),
+            key=lambda item: (item[1], item[0]),
+        )
+
+    @staticmethod
+    def _idf(doc_freq: int, doc_count: int) -> float:
+        """BM25 inverse document frequency (non-negative variant)."""
+        return math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
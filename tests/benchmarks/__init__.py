@@ -0,0 +1 @@
+"""Performance benchmarks (opt-in, see conftest.py)."""
@@ -0,0 +1,33 @@
+"""Benchmark configuration.
+
+Benchmarks time hot paths and print the results. They are skipped unless
+RUN_BENCHMARKS=1 is set, so the regular suite stays fast:
+
+    RUN_BENCHMARKS=1 uv run pytest -m benchmark -s
+"""
+
+import os
+import time
+from collections.abc import Callable
+
+import pytest
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip benchmarks unless explicitly enabled."""
+    if os.getenv("RUN_BENCHMARKS") == "1":
+        return
+    skip = pytest.mark.skip(reason="benchmarks are opt-in (set RUN_BENCHMARKS=1)")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Return the fastest wall-clock time (seconds) of ``repeat`` calls to ``func``."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
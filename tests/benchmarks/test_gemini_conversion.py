@@ -0,0 +1,50 @@
+"""Benchmark: per-turn Gemini request building on long conversations."""
+
+from unittest.mock import patch
+
+import pytest
+from agent_framework import ChatMessage, TextContent
+
+from agent.providers.gemini import GeminiChatClient
+from agent.providers.gemini.cache import GeminiConversionCache
+from tests.benchmarks.conftest import best_of
+
+
+def _conversation(length: int) -> list[ChatMessage]:
+    return [
+        ChatMessage(
+            role="user" if i % 2 == 0 else "assistant",
+            contents=[TextContent(text=f"message {i} " + "lorem ipsum " * 20)],
+        )
+        for i in range(length)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.providers
+@pytest.mark.parametrize("length", [50, 500, 1000])
+@patch("agent.providers.gemini.chat_client.genai.Client")
+def test_build_contents_incremental_vs_full(mock_client_class, length):
+    """Building the next turn's request stays cheap as the history grows."""
+    client = GeminiChatClient(model_id="gemini-2.5-flash", api_key="bench")
+    history = _conversation(length)
+    system = ChatMessage(role="system", text="You are helpful.")
+    client._build_contents([system, *history])  # warm the cache
+
+    def next_turn() -> None:
+        history.append(ChatMessage(role="user", text="next"))
+        fresh_system = ChatMessage(role="system", text="You are helpful.")
+        client._build_contents([fresh_system, *history])
+
+    def full_conversion() -> None:
+        GeminiConversionCache().contents_for([system, *history])
+
+    incremental = best_of(next_turn, repeat=20)
+    full = best_of(full_conversion, repeat=5)
+    print(
+        f"\nhistory={length:5d}: incremental {incremental * 1e6:8.1f} us/turn, "
+        f"full {full * 1e6:8.1f} us/turn"
+    )
+
+    if length >= 500:
+        assert incremental < full / 5
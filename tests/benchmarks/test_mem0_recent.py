@@ -0,0 +1,54 @@
+"""Benchmark: Mem0Store.get_recent from the recent window vs. fetch-all-and-sort."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from agent.config.schema import AgentSettings
+from agent.memory.mem0_store import Mem0Store
+from tests.benchmarks.conftest import best_of
+
+
+def _store_with_memories(size: int) -> Mem0Store:
+    """Build a Mem0Store whose (mocked) namespace holds ``size`` memories."""
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    results = [
+        {
+            "id": f"mem-{i}",
+            "memory": f"Fact number {i}",
+            "created_at": (start + timedelta(seconds=i)).isoformat(),
+            "metadata": {},
+        }
+        for i in range(size)
+    ]
+    config = AgentSettings(memory_enabled=True, memory_type="mem0")
+    with patch("agent.memory.mem0_store.create_memory_instance") as mock_create:
+        mock_create.return_value = Mock()
+        store = Mem0Store(config)
+    store.memory.get_all.return_value = {"results": results}
+    return store
+
+
+@pytest.mark.benchmark
+@pytest.mark.memory
+@pytest.mark.parametrize("size", [10_000, 100_000])
+def test_recent_window_vs_fetch_all(size):
+    """Recent retrieval cost does not grow with the number of stored memories."""
+    store = _store_with_memories(size)
+
+    def uncached() -> None:
+        store._recent = None
+        asyncio.run(store.get_recent(limit=10))
+
+    full = best_of(uncached, repeat=3)
+    result = asyncio.run(store.get_recent(limit=10))  # window is loaded now
+    cached = best_of(lambda: asyncio.run(store.get_recent(limit=10)), repeat=5)
+    print(
+        f"\nmemories={size:7d}: window {cached * 1e3:8.3f} ms, "
+        f"fetch-all-and-sort {full * 1e3:8.3f} ms"
+    )
+
+    assert result["result"][0]["id"] == f"mem-{size - 1}"
+    assert cached * 10 < full
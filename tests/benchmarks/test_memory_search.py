@@ -0,0 +1,48 @@
+"""Benchmark: InMemoryStore keyword search vs. the previous linear scan."""
+
+import asyncio
+import random
+
+import pytest
+
+from agent.config.schema import AgentSettings
+from agent.memory.store import InMemoryStore
+from tests.benchmarks.conftest import best_of
+
+_WORDS = [f"word{i}" for i in range(5000)] + ["the", "a", "is", "and", "to"] * 200
+
+
+def _linear_scan(memories: list[dict], query: str, limit: int) -> list[dict]:
+    """Previous implementation: substring test per keyword per memory."""
+    keywords = query.lower().split()
+    matches = []
+    for memory in memories:
+        content_lower = memory.get("content", "").lower()
+        match_count = sum(1 for keyword in keywords if keyword in content_lower)
+        if match_count > 0:
+            matches.append((memory, match_count))
+    matches.sort(key=lambda x: (x[1], x[0].get("timestamp", "")), reverse=True)
+    return [match[0] for match in matches[:limit]]
+
+
+@pytest.mark.benchmark
+@pytest.mark.memory
+@pytest.mark.parametrize("size", [1_000, 10_000, 100_000])
+def test_indexed_search_vs_linear_scan(size):
+    """Indexed search stays fast as the number of memories grows."""
+    rng = random.Random(0)
+    store = InMemoryStore(AgentSettings(memory_enabled=True))
+    messages = [
+        {"role": "user", "content": " ".join(rng.choices(_WORDS, k=20))} for _ in range(size)
+    ]
+    asyncio.run(store.add(messages))
+    query = "what is word42 and word4242"  # stopwords are not indexed
+
+    indexed = best_of(lambda: asyncio.run(store.search(query, limit=5)), repeat=5)
+    linear = best_of(lambda: _linear_scan(store.memories, query, 5), repeat=3)
+    print(
+        f"\nmemories={size:7d}: indexed {indexed * 1e3:8.3f} ms, "
+        f"linear scan {linear * 1e3:8.3f} ms"
+    )
+
+    assert indexed < linear
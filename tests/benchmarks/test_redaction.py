@@ -0,0 +1,51 @@
+"""Benchmark: single-pass secret redaction vs. one regex per pattern on MB-sized text."""
+
+import random
+import re
+
+import pytest
+
+from agent.utils.redaction import DEFAULT_PATTERNS, REDACTED, redact
+from tests.benchmarks.conftest import best_of
+
+# The per-pattern loop Mem0Store used before the shared redactor
+_SEPARATE = [re.compile(pattern, re.IGNORECASE) for _, pattern in DEFAULT_PATTERNS]
+
+
+def _redact_separately(text: str) -> str:
+    for pattern in _SEPARATE:
+        if pattern.search(text):
+            text = pattern.sub(REDACTED, text)
+    return text
+
+
+def _tool_output(size: int, secret_every: int) -> str:
+    """Build log-like tool output of ``size`` chars with a secret every N lines."""
+    rng = random.Random(0)
+    words = ["build", "step", "token", "count", "ok", "passed", "api", "request", "42", "ms"]
+    secrets = ["password=hunter2", "Bearer abc.def.ghi", "api_key: k-" + "9" * 16]
+    lines = []
+    length = 0
+    while length < size:
+        line = " ".join(rng.choices(words, k=12))
+        if secret_every and len(lines) % secret_every == 0:
+            line += " " + rng.choice(secrets)
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)[:size]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("secret_every", [0, 50, 1])
+def test_single_pass_vs_per_pattern(secret_every):
+    """Redaction throughput on 4 MB of tool output, clean to secret-dense."""
+    text = _tool_output(4_000_000, secret_every)
+
+    single = best_of(lambda: redact(text), repeat=3)
+    separate = best_of(lambda: _redact_separately(text), repeat=3)
+    print(
+        f"\nsecret every {secret_every or '-':>3} lines: single-pass "
+        f"{len(text) / single / 1e6:7.1f} MB/s, per-pattern {len(text) / separate / 1e6:7.1f} MB/s"
+    )
+
+    assert redact(text)[0].count(REDACTED) == _redact_separately(text).count(REDACTED)
@@ -0,0 +1,68 @@
+"""Benchmark: TextSearchEngine vs. the previous serial rglob scan of search_text."""
+
+import pytest
+
+from agent.tools.search import TextMatcher, TextSearchEngine
+from tests.benchmarks.conftest import best_of
+
+_SOURCE = "".join(f"def function_{i}(value):\n    return value * {i}\n\n" for i in range(40))
+
+
+def _serial_scan(root, query: str, max_matches: int) -> tuple[int, int]:
+    """Previous implementation: rglob everything, then scan files line by line."""
+    files = [path for path in root.rglob("*") if path.is_file()]
+    matches = 0
+    files_searched = 0
+    for path in files:
+        if matches >= max_matches:
+            break
+        files_searched += 1
+        with open(path, "rb") as f:
+            if b"\x00" in f.read(8192):
+                continue
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if matches >= max_matches:
+                    break
+                if line.find(query) != -1:
+                    matches += 1
+    return matches, files_searched
+
+
+def _make_monorepo(root, files: int) -> None:
+    """Create a monorepo with 80% tracked sources and 20% ignored dependencies."""
+    (root / ".gitignore").write_text("node_modules/\n*.pyc\n")
+    per_dir = 100
+    for i in range(files // per_dir):
+        ignored = i % 5 == 4
+        directory = root / ("node_modules" if ignored else "packages") / f"pkg{i:04d}"
+        directory.mkdir(parents=True)
+        for j in range(per_dir):
+            (directory / f"module{j:03d}.py").write_text(_SOURCE)
+    (root / "packages" / "pkg0003" / "module099.py").write_text(_SOURCE + "RARE_TOKEN\n")
+
+
+@pytest.mark.benchmark
+@pytest.mark.tools
+@pytest.mark.parametrize("files", [10_000, 100_000])
+def test_search_engine_vs_serial_scan(tmp_path, files):
+    """Parallel, gitignore-aware search beats the serial scan on large trees."""
+    _make_monorepo(tmp_path, files)
+    engine = TextSearchEngine(tmp_path)
+    try:
+        # Rare token: every tracked file is scanned
+        full = best_of(lambda: engine.search(tmp_path, TextMatcher("RARE_TOKEN")), repeat=3)
+        serial = best_of(lambda: _serial_scan(tmp_path, "RARE_TOKEN", 50), repeat=1)
+        # Common token: scanning stops at max_matches
+        early = best_of(lambda: engine.search(tmp_path, TextMatcher("return")), repeat=3)
+        result = engine.search(tmp_path, TextMatcher("RARE_TOKEN"))
+    finally:
+        engine.close()
+    print(
+        f"\nfiles={files:7d}: engine {full * 1e3:9.1f} ms, serial scan {serial * 1e3:9.1f} ms, "
+        f"early stop {early * 1e3:7.1f} ms"
+    )
+
+    assert [m["file"] for m in result.matches] == ["packages/pkg0003/module099.py"]
+    assert full < serial
+    assert early < full
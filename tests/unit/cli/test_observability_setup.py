@@ -11,6 +11,15 @@ import pytest
 from agent.config.schema import AgentSettings
 
 
+@pytest.fixture(autouse=True)
+def reset_instruments():
+    """Discard middleware instruments created by setup calls."""
+    from agent.observability import reset_instruments
+
+    yield
+    reset_instruments()
+
+
 @pytest.fixture
 def mock_settings_otel_disabled():
     """Config with telemetry disabled."""
@@ -305,6 +314,7 @@ class TestObservabilitySpanCreation:
     @pytest.mark.asyncio
     @patch("agent.cli.execution.load_config_with_env")
     @patch("agent_framework.observability.setup_observability")
+    @patch("agent.observability.setup_instruments")
     @patch("agent_framework.observability.get_tracer")
     @patch("agent.cli.execution.Agent")
     @patch("agent.cli.execution.setup_session_logging")
@@ -315,6 +325,7 @@ class TestObservabilitySpanCreation:
         mock_logging,
         mock_agent,
         mock_tracer,
+        mock_setup_instruments,
         mock_setup_otel,
         mock_settings_loader,
         mock_settings_otel_explicit,
@@ -9,9 +9,11 @@ import pytest
 
 from agent.config.manager import (
     ConfigurationError,
+    SettingsSnapshot,
     deep_merge,
     get_config_path,
     load_config,
+    load_config_with_env,
     merge_with_env,
     save_config,
     validate_config,
@@ -146,6 +148,86 @@ class TestSaveConfig:
         assert loaded.telemetry.enabled is True
 
 
+class TestSettingsSnapshot:
+    """Test SettingsSnapshot caching."""
+
+    def _write(self, config_path, model, mtime_ns):
+        config_path.write_text(
+            json.dumps({"providers": {"enabled": ["openai"], "openai": {"model": model}}})
+        )
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_get_loads_once_while_file_unchanged(self, tmp_path):
+        """Test repeated get() calls do not reload unchanged file."""
+        config_path = tmp_path / "settings.json"
+        self._write(config_path, "gpt-4o", 1_000_000_000)
+        snapshot = SettingsSnapshot(config_path)
+
+        with patch(
+            "agent.config.manager.load_config_with_env", wraps=load_config_with_env
+        ) as mock_load:
+            first = snapshot.get()
+            second = snapshot.get()
+
+        assert first is second
+        assert first.providers.openai.model == "gpt-4o"
+        assert mock_load.call_count == 1
+
+    def test_get_reloads_when_mtime_changes(self, tmp_path):
+        """Test get() reloads settings after the file mtime changes."""
+        config_path = tmp_path / "settings.json"
+        self._write(config_path, "gpt-4o", 1_000_000_000)
+        snapshot = SettingsSnapshot(config_path)
+        assert snapshot.get().providers.openai.model == "gpt-4o"
+
+        self._write(config_path, "gpt-5-mini", 2_000_000_000)
+
+        assert snapshot.get().providers.openai.model == "gpt-5-mini"
+
+    def test_set_pins_settings_until_file_changes(self, tmp_path):
+        """Test set() serves injected settings until the file changes."""
+        config_path = tmp_path / "settings.json"
+        self._write(config_path, "gpt-4o", 1_000_000_000)
+        snapshot = SettingsSnapshot(config_path)
+        injected = AgentSettings()
+
+        snapshot.set(injected)
+        assert snapshot.get() is injected
+
+        self._write(config_path, "gpt-5-mini", 2_000_000_000)
+        assert snapshot.get() is not injected
+
+    def test_set_without_settings_file(self, tmp_path):
+        """Test set() works when the settings file does not exist."""
+        snapshot = SettingsSnapshot(tmp_path / "missing.json")
+        injected = AgentSettings()
+
+        snapshot.set(injected)
+
+        assert snapshot.get() is injected
+
+    def test_invalid_file_keeps_previous_snapshot(self, tmp_path):
+        """Test an invalid edit keeps serving the last good settings."""
+        config_path = tmp_path / "settings.json"
+        self._write(config_path, "gpt-4o", 1_000_000_000)
+        snapshot = SettingsSnapshot(config_path)
+        good = snapshot.get()
+
+        config_path.write_text("{invalid json")
+        os.utime(config_path, ns=(2_000_000_000, 2_000_000_000))
+
+        assert snapshot.get() is good
+
+    def test_invalid_file_without_snapshot_raises(self, tmp_path):
+        """Test an invalid file raises when there is nothing cached."""
+        config_path = tmp_path / "settings.json"
+        config_path.write_text("{invalid json")
+        snapshot = SettingsSnapshot(config_path)
+
+        with pytest.raises(ConfigurationError):
+            snapshot.get()
+
+
 class TestMergeWithEnv:
     """Test merge_with_env function."""
 
@@ -199,6 +199,13 @@ class TestAgentSettings:
         assert settings.memory.type == "mem0"
         assert settings.memory.history_limit == 50
 
+    def test_tool_max_concurrency_validation(self):
+        """Test tool concurrency limit defaults and must be at least 1."""
+        assert AgentSettings().agent.tool_max_concurrency == 8
+        assert AgentSettings(agent={"tool_max_concurrency": 2}).agent.tool_max_concurrency == 2
+        with pytest.raises(ValidationError):
+            AgentSettings(agent={"tool_max_concurrency": 0})
+
     def test_json_schema_export(self):
         """Test JSON schema export."""
         schema = AgentSettings.get_json_schema()
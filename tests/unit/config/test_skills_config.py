@@ -135,6 +135,28 @@ class TestSkillsConfiguration:
         assert settings.skills.disabled_bundled == []
         assert isinstance(settings.skills.user_dir, str)
 
+    def test_context_token_budget_validation(self):
+        """Test that the skill context token budget must be positive."""
+        from pydantic import ValidationError
+
+        from agent.config.schema import SkillsConfig
+
+        assert AgentSettings().skills.context_token_budget == 3000
+        assert SkillsConfig(context_token_budget=500).context_token_budget == 500
+        with pytest.raises(ValidationError):
+            SkillsConfig(context_token_budget=0)
+
+    def test_script_worker_ttl_validation(self):
+        """Test that warm script runners can be disabled but the TTL cannot be negative."""
+        from pydantic import ValidationError
+
+        from agent.config.schema import SkillsConfig
+
+        assert AgentSettings().skills.script_worker_ttl == 300
+        assert SkillsConfig(script_worker_ttl=0).script_worker_ttl == 0
+        with pytest.raises(ValidationError):
+            SkillsConfig(script_worker_ttl=-1)
+
 
 @pytest.mark.unit
 @pytest.mark.config
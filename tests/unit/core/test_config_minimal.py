@@ -208,6 +208,18 @@ class TestMinimalConfigSerialization:
         # Minimal should be much smaller (at least 50% reduction)
         assert len(minimal_json) < len(verbose_json) * 0.5
 
+    def test_tuning_fields_only_included_when_changed(self):
+        """Test that performance tuning fields are omitted at their defaults."""
+        settings = AgentSettings()
+        settings.memory.max_entries = 500
+
+        data = json.loads(settings.model_dump_json_minimal())
+
+        assert data["memory"]["max_entries"] == 500
+        assert "eviction_policy" not in data["memory"]
+        assert "tool_max_concurrency" not in data["agent"]
+        assert "script_worker_ttl" not in data["skills"]
+
     def test_multiple_enabled_providers_all_included(self):
         """Test that all enabled providers are included."""
         settings = AgentSettings()
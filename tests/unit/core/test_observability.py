@@ -55,3 +55,79 @@ class TestSpanContextHelpers:
 
         set_current_agent_span(None)
         assert get_current_agent_span() is None
+
+
+@pytest.mark.unit
+class TestAgentInstruments:
+    """Tests for shared middleware instruments."""
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        """Reset shared instruments around each test."""
+        from agent.observability import reset_instruments
+
+        reset_instruments()
+        yield
+        reset_instruments()
+
+    def test_instruments_created_once(self):
+        """Test all instruments are created up front from the meter."""
+        from unittest.mock import MagicMock
+
+        from agent.observability import AgentInstruments
+
+        meter = MagicMock()
+        AgentInstruments(tracer=MagicMock(), meter=meter)
+
+        histograms = {c.kwargs["name"] for c in meter.create_histogram.call_args_list}
+        counters = {c.kwargs["name"] for c in meter.create_counter.call_args_list}
+        assert histograms == {
+            "tool.execution.duration",
+            "tool.queue.wait",
+            "llm.time_to_first_token",
+            "llm.output_tokens_per_second",
+            "context_provider.duration",
+            "memory.write_queue.flush.duration",
+        }
+        assert counters == {
+            "llm.tokens.input",
+            "llm.tokens.output",
+            "memory.context.tokens.injected",
+            "memory.context.tokens.saved",
+            "memory.dedup.checked",
+            "memory.dedup.duplicates",
+        }
+        meter.create_up_down_counter.assert_called_once()
+
+    def test_record_token_usage(self):
+        """Test token counters and throughput are recorded with attributes."""
+        from unittest.mock import MagicMock
+
+        from agent.observability import AgentInstruments
+
+        meter = MagicMock()
+        meter.create_histogram.side_effect = lambda **kwargs: MagicMock()
+        meter.create_counter.side_effect = lambda **kwargs: MagicMock()
+        instruments = AgentInstruments(tracer=MagicMock(), meter=meter)
+        attrs = {"provider": "openai", "model": "gpt-5-mini"}
+
+        instruments.record_token_usage(100, 50, 2.0, attrs)
+
+        instruments.llm_input_tokens.add.assert_called_once_with(100, attrs)
+        instruments.llm_output_tokens.add.assert_called_once_with(50, attrs)
+        instruments.llm_output_tokens_per_second.record.assert_called_once_with(25.0, attrs)
+
+    def test_setup_and_get_instruments(self):
+        """Test setup_instruments stores a shared instance."""
+        from agent.observability import get_instruments, setup_instruments
+
+        assert get_instruments() is None
+        instruments = setup_instruments()
+        assert get_instruments() is instruments
+
+    def test_record_context_provider_duration_noop_without_setup(self):
+        """Test context provider latency recording is a no-op when not set up."""
+        from agent.observability import record_context_provider_duration
+
+        # Should not raise
+        record_context_provider_duration("memory", 0.01)
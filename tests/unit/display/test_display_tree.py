@@ -11,6 +11,7 @@ from agent.display.events import (
     LLMResponseEvent,
     ToolCompleteEvent,
     ToolErrorEvent,
+    ToolProgressEvent,
     ToolStartEvent,
     get_event_emitter,
 )
@@ -277,6 +278,25 @@ class TestExecutionTreeDisplay:
         assert node.metadata["summary"] == "Success"
         assert node.metadata["duration"] == 0.5
 
+    @pytest.mark.asyncio
+    async def test_handle_tool_progress_event(self):
+        """Test handling tool progress event."""
+        display = ExecutionTreeDisplay()
+
+        await display._handle_event(LLMRequestEvent(message_count=1))
+        tool_start = ToolStartEvent(tool_name="script_run")
+        await display._handle_event(tool_start)
+
+        progress = ToolProgressEvent(
+            event_id=tool_start.event_id, tool_name="script_run", message="fetched [3/10]"
+        )
+        await display._handle_event(progress)
+
+        node = display._node_map[tool_start.event_id]
+        assert node.status == "in_progress"
+        assert node.metadata["progress"] == "fetched [3/10]"
+        assert "fetched [3/10]" in display._render_node(node).plain
+
     @pytest.mark.asyncio
     async def test_handle_tool_error_event(self):
         """Test handling tool error event."""
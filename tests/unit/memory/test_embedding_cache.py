@@ -0,0 +1,105 @@
+"""Unit tests for agent.memory.embedding_cache module."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from agent.memory.embedding_cache import CachedEmbedder, EmbeddingCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an embedding cache in a temporary directory."""
+    cache = EmbeddingCache(tmp_path / "embedding_cache.db", max_entries=100)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_key_depends_on_model_text_and_action(self):
+        """Test keys are stable and distinguish model, text and memory action."""
+        key = EmbeddingCache.key("model-a", "hello")
+
+        assert key == EmbeddingCache.key("model-a", "hello")
+        assert key != EmbeddingCache.key("model-b", "hello")
+        assert key != EmbeddingCache.key("model-a", "hello!")
+        assert key != EmbeddingCache.key("model-a", "hello", "search")
+
+    def test_get_and_put_round_trip(self, cache):
+        """Test stored vectors come back (as float32) and counters are updated."""
+        key = cache.key("model", "text")
+
+        assert cache.get(key) is None
+        cache.put(key, [0.5, -0.25, 1.0])
+
+        assert cache.get(key) == [0.5, -0.25, 1.0]
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_put_existing_key_does_not_grow_cache(self, cache):
+        """Test overwriting an entry keeps the count unchanged."""
+        key = cache.key("model", "text")
+        cache.put(key, [1.0])
+        cache.put(key, [2.0])
+
+        assert len(cache) == 1
+        assert cache.get(key) == [2.0]
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test embeddings survive reopening the cache file."""
+        path = tmp_path / "embedding_cache.db"
+        first = EmbeddingCache(path)
+        first.put(first.key("model", "text"), [0.125])
+        first.close()
+
+        second = EmbeddingCache(path)
+        try:
+            assert len(second) == 1
+            assert second.get(second.key("model", "text")) == [0.125]
+        finally:
+            second.close()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the cache stays bounded and keeps recently read entries."""
+        cache = EmbeddingCache(tmp_path / "embedding_cache.db", max_entries=20)
+        try:
+            keys = [cache.key("model", f"text {i}") for i in range(20)]
+            for key in keys:
+                cache.put(key, [1.0])
+            cache.get(keys[0])  # most recently used now
+
+            cache.put(cache.key("model", "one more"), [1.0])
+
+            assert len(cache) <= 20
+            assert cache.get(keys[0]) == [1.0]
+            assert cache.get(keys[1]) is None
+        finally:
+            cache.close()
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestCachedEmbedder:
+    """Tests for CachedEmbedder."""
+
+    def test_repeated_text_embedded_once(self, cache):
+        """Test the wrapped embedder is only called on a cache miss."""
+        embedder = Mock()
+        embedder.embed.return_value = [0.5, 0.5]
+        cached = CachedEmbedder(embedder, cache, "model")
+
+        assert cached.embed("My name is Alice", "add") == [0.5, 0.5]
+        assert cached.embed("My name is Alice", "add") == [0.5, 0.5]
+
+        embedder.embed.assert_called_once_with("My name is Alice", "add")
+        assert cache.hits == 1
+
+    def test_delegates_other_attributes(self, cache):
+        """Test attributes mem0 reads from the embedder are passed through."""
+        embedder = Mock()
+        embedder.config.embedding_dims = 1536
+
+        assert CachedEmbedder(embedder, cache, "model").config.embedding_dims == 1536
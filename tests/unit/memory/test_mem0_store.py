@@ -1,11 +1,13 @@
 """Unit tests for Mem0Store class."""
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
 from agent.config.schema import AgentSettings
 from agent.memory.mem0_store import Mem0Store
+from agent.memory.store import InMemoryStore
 
 
 @pytest.fixture
@@ -195,6 +197,53 @@ class TestMem0Store:
         assert result["success"] is False
         assert "storage_error" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_add_deferred_queues_filtered_messages(self, mem0_store):
+        """Test add_deferred returns before mem0 is called and flush() writes."""
+        messages = [
+            {"role": "system", "content": "System prompt"},
+            {"role": "user", "content": "My key is sk-abcdefghijklmnopqrstuvwxyz"},
+        ]
+
+        result = await mem0_store.add_deferred(messages)
+
+        assert result["success"] is True
+        assert "Queued 1 messages" in result["message"]
+
+        await mem0_store.flush()
+
+        mem0_store.memory.add.assert_called_once()
+        call_args = mem0_store.memory.add.call_args
+        stored = call_args.kwargs["messages"]
+        assert [m["role"] for m in stored] == ["user"]
+        assert "sk-abc" not in stored[0]["content"]
+        assert call_args.kwargs["user_id"] == "test-user:test-project"
+        await mem0_store.write_queue.close()
+
+    @pytest.mark.asyncio
+    async def test_add_skips_near_duplicates_of_written_messages(self, mem0_config):
+        """Test repeated messages are not sent to mem0 again (no extraction cost)."""
+        mem0_config.memory.dedup_enabled = True
+        with patch("agent.memory.mem0_store.create_memory_instance") as mock_create:
+            mem0_store = Mem0Store(mem0_config)
+            mem0_store.memory = mock_create.return_value
+            mem0_store.memory.add.return_value = None
+
+            await mem0_store.add([{"role": "user", "content": "I live in Oslo"}])
+            result = await mem0_store.add([{"role": "user", "content": "i live in Oslo."}])
+
+        assert result["result"] == []
+        mem0_store.memory.add.assert_called_once()
+        assert mem0_store._dedup.dedup_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_add_deferred_empty_messages_returns_error(self, mem0_store):
+        """Test add_deferred validates input like add()."""
+        result = await mem0_store.add_deferred([])
+
+        assert result["success"] is False
+        assert result["error"] == "invalid_input"
+
     @pytest.mark.asyncio
     async def test_search_by_semantic_query(self, mem0_store):
         """Test searching memories by semantic similarity."""
@@ -284,6 +333,82 @@ class TestMem0Store:
         assert result["result"][0]["content"] == "Newest"
         assert result["result"][1]["content"] == "Middle"
 
+    @pytest.mark.asyncio
+    async def test_get_recent_served_from_window_after_first_call(self, mem0_store):
+        """Test get_recent only reads the whole namespace once."""
+        mem0_store.memory.get_all.return_value = {
+            "results": [
+                {"id": "mem-1", "memory": "Oldest", "created_at": "2025-01-01", "metadata": {}},
+                {"id": "mem-2", "memory": "Newest", "created_at": "2025-01-02", "metadata": {}},
+            ]
+        }
+
+        first = await mem0_store.get_recent(limit=2)
+        second = await mem0_store.get_recent(limit=5)
+
+        assert [m["content"] for m in first["result"]] == ["Newest", "Oldest"]
+        assert [m["content"] for m in second["result"]] == ["Newest", "Oldest"]
+        mem0_store.memory.get_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_recent_window_tracks_add_events(self, mem0_store):
+        """Test memories added, updated and deleted through add() update the window."""
+        mem0_store.memory.get_all.return_value = {
+            "results": [
+                {"id": "mem-1", "memory": "Likes tea", "created_at": "2025-01-01"},
+                {"id": "mem-2", "memory": "Lives in Oslo", "created_at": "2025-01-02"},
+            ]
+        }
+        await mem0_store.get_recent()
+
+        mem0_store.memory.add.return_value = {
+            "results": [
+                {"id": "mem-3", "memory": "Name is Alice", "event": "ADD"},
+                {"id": "mem-1", "memory": "Likes coffee", "event": "UPDATE"},
+                {"id": "mem-2", "memory": "Lives in Oslo", "event": "DELETE"},
+            ]
+        }
+        await mem0_store.add([{"role": "user", "content": "I'm Alice and prefer coffee now"}])
+
+        result = await mem0_store.get_recent(limit=10)
+
+        assert [m["content"] for m in result["result"]] == ["Likes coffee", "Name is Alice"]
+        mem0_store.memory.get_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_recent_reloads_when_limit_exceeds_window(self, mem0_store):
+        """Test a limit beyond the window falls back to fetching the namespace."""
+        mem0_store.RECENT_WINDOW = 2
+        mem0_store.memory.get_all.return_value = {
+            "results": [
+                {"id": f"mem-{i}", "memory": f"Fact {i}", "created_at": f"2025-01-0{i}"}
+                for i in range(1, 5)
+            ]
+        }
+
+        await mem0_store.get_recent(limit=2)
+        await mem0_store.get_recent(limit=2)
+        assert mem0_store.memory.get_all.call_count == 1
+
+        result = await mem0_store.get_recent(limit=4)
+        assert [m["content"] for m in result["result"]] == [f"Fact {i}" for i in (4, 3, 2, 1)]
+        assert mem0_store.memory.get_all.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_recent_window_invalidated_by_clear(self, mem0_store):
+        """Test clear() drops the window so the next call re-reads mem0."""
+        mem0_store.memory.get_all.return_value = {
+            "results": [{"id": "mem-1", "memory": "Old", "created_at": "2025-01-01"}]
+        }
+        await mem0_store.get_recent()
+
+        await mem0_store.clear()
+        mem0_store.memory.get_all.return_value = {"results": []}
+        result = await mem0_store.get_recent()
+
+        assert result["result"] == []
+        assert mem0_store.memory.get_all.call_count == 2
+
     @pytest.mark.asyncio
     async def test_clear_removes_all_memories(self, mem0_store):
         """Test clear removes all memories from storage."""
@@ -342,6 +467,97 @@ class TestMem0Store:
         # Should fall back to get_recent (which calls get_all)
         mem0_store.memory.get_all.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_background_init_does_not_block_constructor(self, mem0_config):
+        """Test background=True returns before mem0 is created."""
+        release = threading.Event()
+        mock_memory = Mock()
+        mock_memory.search.return_value = {"results": [{"id": "m1", "memory": "Likes tea"}]}
+
+        def slow_create(config):
+            release.wait(timeout=5)
+            return mock_memory
+
+        with patch("agent.memory.mem0_store.create_memory_instance", side_effect=slow_create):
+            store = Mem0Store(mem0_config, background=True)
+            assert store.is_ready is False
+
+            release.set()
+            result = await store.search("tea")
+
+        assert store.is_ready is True
+        assert result["result"][0]["content"] == "Likes tea"
+
+    @pytest.mark.asyncio
+    async def test_retrieve_for_context_skips_injection_while_initializing(self, mem0_config):
+        """Test the prompt does not wait for mem0 past READY_TIMEOUT."""
+        release = threading.Event()
+
+        def slow_create(config):
+            release.wait(timeout=5)
+            return Mock()
+
+        with patch("agent.memory.mem0_store.create_memory_instance", side_effect=slow_create):
+            store = Mem0Store(mem0_config, background=True)
+            store.READY_TIMEOUT = 0.01
+
+            result = await store.retrieve_for_context([{"role": "user", "content": "Hi"}])
+
+            assert result["success"] is True
+            assert result["result"] == []
+            assert store.is_ready is False
+            release.set()
+
+    @pytest.mark.asyncio
+    async def test_deferred_writes_wait_for_background_init(self, mem0_config):
+        """Test writes queued during initialization reach mem0 once it is ready."""
+        release = threading.Event()
+        mock_memory = Mock()
+
+        def slow_create(config):
+            release.wait(timeout=5)
+            return mock_memory
+
+        with patch("agent.memory.mem0_store.create_memory_instance", side_effect=slow_create):
+            store = Mem0Store(mem0_config, background=True)
+            result = await store.add_deferred([{"role": "user", "content": "I like tea"}])
+            assert result["success"] is True
+
+            release.set()
+            await store.flush()
+
+        mock_memory.add.assert_called_once()
+        await store.write_queue.close()
+
+    @pytest.mark.asyncio
+    async def test_deferred_writes_reach_fallback_on_event_loop(self, mem0_config):
+        """Test queued writes go to the fallback store on the loop that uses it."""
+        release = threading.Event()
+        add_threads = []
+        original_add = InMemoryStore.add
+
+        def failing_create(config):
+            release.wait(timeout=5)
+            raise ImportError("mem0ai is not installed")
+
+        async def recording_add(self, messages):
+            add_threads.append(threading.get_ident())
+            return await original_add(self, messages)
+
+        with (
+            patch("agent.memory.mem0_store.create_memory_instance", side_effect=failing_create),
+            patch.object(InMemoryStore, "add", recording_add),
+        ):
+            store = Mem0Store(mem0_config, background=True)
+            await store.add_deferred([{"role": "user", "content": "I like tea"}])
+
+            release.set()
+            await store.flush()
+
+        assert add_threads == [threading.get_ident()]
+        assert len(store._fallback) == 1
+        await store.write_queue.close()
+
     @pytest.mark.asyncio
     async def test_namespace_isolation(self):
         """Test that different users have isolated namespaces."""
@@ -191,6 +191,38 @@ class TestMem0Utils:
             assert call_args["vector_store"]["config"]["api_key"] == "mem0-key"
             assert call_args["vector_store"]["config"]["org_id"] == "org-123"
 
+    def test_embedding_cache_wraps_embedder(self, tmp_path):
+        """Test the mem0 embedder is wrapped with the on-disk embedding cache."""
+        from agent.memory.embedding_cache import CachedEmbedder
+        from agent.memory.mem0_utils import _enable_embedding_cache, get_embedding_cache_path
+
+        config = _create_openai_config()
+        config.memory.mem0.storage_path = str(tmp_path / "chroma_db")
+        memory = Mock()
+        embedder = memory.embedding_model
+
+        _enable_embedding_cache(memory, config, "text-embedding-3-small")
+
+        assert isinstance(memory.embedding_model, CachedEmbedder)
+        assert memory.embedding_model.embedder is embedder
+        assert get_embedding_cache_path(config) == tmp_path / "embedding_cache.db"
+        memory.embedding_model.cache.close()
+
+    def test_embedding_cache_disabled(self, tmp_path):
+        """Test embedding_cache_entries=0 leaves the embedder untouched."""
+        from agent.memory.mem0_utils import _enable_embedding_cache
+
+        config = _create_openai_config()
+        config.memory.mem0.storage_path = str(tmp_path / "chroma_db")
+        config.memory.embedding_cache_entries = 0
+        memory = Mock()
+        embedder = memory.embedding_model
+
+        _enable_embedding_cache(memory, config, "text-embedding-3-small")
+
+        assert memory.embedding_model is embedder
+        assert not (tmp_path / "embedding_cache.db").exists()
+
     def test_create_memory_instance_missing_import_raises(self):
         """Test create_memory_instance raises clear error when mem0 not installed."""
         config = _create_openai_config()
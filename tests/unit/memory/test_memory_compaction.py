@@ -0,0 +1,150 @@
+"""Unit tests for agent.memory.compaction module."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from agent.memory.compaction import (
+    ChatClientSummarizer,
+    ExtractiveSummarizer,
+    MemoryCompactor,
+    create_compactor,
+    is_digest,
+)
+from agent.memory.sqlite_store import SQLiteMemoryStore
+
+OLD = (datetime.now() - timedelta(days=3)).isoformat()
+
+
+def _aged(contents: list[str]) -> list[dict]:
+    """Build messages with a timestamp older than the default minimum age."""
+    return [{"role": "user", "content": c, "timestamp": OLD} for c in contents]
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestSummarizers:
+    """Tests for the digest summarizers."""
+
+    @pytest.mark.asyncio
+    async def test_extractive_keeps_central_sentences_in_order(self):
+        """Test sentences sharing terms with the batch win, in original order."""
+        summarize = ExtractiveSummarizer(max_sentences=2)
+        memories = [
+            {"role": "user", "content": "I deploy the API with Docker. The weather is nice."},
+            {"role": "assistant", "content": "Docker images for the API are built in CI."},
+            {"role": "user", "content": "The API Docker deploy runs nightly."},
+        ]
+
+        summary = await summarize(memories)
+
+        assert "weather" not in summary
+        assert summary.index("I deploy") < summary.index("nightly")
+
+    @pytest.mark.asyncio
+    async def test_chat_client_summarizer_falls_back_on_error(self):
+        """Test LLM failures fall back to the extractive summary."""
+        chat_client = AsyncMock()
+        chat_client.get_response.side_effect = RuntimeError("rate limited")
+        summarize = ChatClientSummarizer(chat_client)
+
+        summary = await summarize([{"role": "user", "content": "I use Python."}])
+
+        assert summary == "user: I use Python."
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestMemoryCompactor:
+    """Tests for MemoryCompactor with InMemoryStore."""
+
+    @pytest.mark.asyncio
+    async def test_compacts_full_batches_of_aged_memories(self, memory_store):
+        """Test aged memories become a digest with provenance; fresh ones stay raw."""
+        await memory_store.add(_aged([f"Python fact number {i}." for i in range(5)]))
+        await memory_store.add([{"role": "user", "content": "Fresh Python note"}])
+        compactor = MemoryCompactor(ExtractiveSummarizer(), batch_size=4)
+
+        result = await compactor.compact(memory_store)
+
+        assert result["success"] is True
+        assert len(result["result"]) == 1
+        live = memory_store.memories
+        digests = [m for m in live if is_digest(m)]
+        assert len(digests) == 1
+        assert digests[0]["metadata"]["source_ids"] == [0, 1, 2, 3]
+        # One aged leftover (incomplete batch) + fresh note + digest
+        assert len(live) == 3
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_compact_below_batch_size(self, memory_store):
+        """Test no digest is created until a full batch has aged."""
+        await memory_store.add(_aged(["one", "two"]))
+
+        result = await MemoryCompactor(ExtractiveSummarizer(), batch_size=4).compact(memory_store)
+
+        assert result["success"] is True
+        assert result["result"] == []
+        assert len(memory_store) == 2
+
+    @pytest.mark.asyncio
+    async def test_search_prefers_digests_and_falls_back_to_archive(self, memory_store):
+        """Test archived originals are only searched when live results are short."""
+        await memory_store.add(_aged(["Deploy uses Docker.", "Docker runs nightly.", "zebra"]))
+        summarizer = AsyncMock(return_value="Docker deploys nightly.")
+        await MemoryCompactor(summarizer, batch_size=3).compact(memory_store)
+
+        top = await memory_store.search("docker", limit=1)
+        assert is_digest(top["result"][0])
+
+        fallback = await memory_store.search("zebra", limit=5)
+        assert fallback["result"][0]["content"] == "zebra"
+        assert fallback["result"][0]["metadata"]["compacted_into"]
+
+    @pytest.mark.asyncio
+    async def test_archive_survives_save_and_restore(self, memory_store, memory_config):
+        """Test get_all includes archived originals and add() re-archives them."""
+        from agent.memory import InMemoryStore
+
+        await memory_store.add(_aged(["alpha", "beta"]))
+        await MemoryCompactor(ExtractiveSummarizer(), batch_size=2).compact(memory_store)
+        saved = (await memory_store.get_all())["result"]
+
+        restored = InMemoryStore(memory_config)
+        await restored.add(saved)
+
+        assert len(saved) == 3
+        assert len(restored) == 1
+        assert is_digest(restored.memories[0])
+        assert restored.memories[0]["timestamp"] != OLD
+
+    @pytest.mark.asyncio
+    async def test_unsupported_backend_reports_error(self, memory_config, tmp_path):
+        """Test backends without digest support return not_supported."""
+        store = SQLiteMemoryStore(memory_config, db_path=tmp_path / "memories.db")
+        await store.add([{"role": "user", "content": c} for c in ("alpha", "beta")])
+
+        compactor = MemoryCompactor(ExtractiveSummarizer(), min_age=timedelta(0), batch_size=2)
+        result = await compactor.compact(store)
+
+        store.close()
+        assert result["success"] is False
+        assert result["error"] == "not_supported"
+
+    def test_create_compactor_from_config(self, memory_config):
+        """Test the summarizer and limits come from memory settings."""
+        memory_config.memory.compaction_min_age_hours = 2
+        memory_config.memory.compaction_batch_size = 10
+
+        compactor = create_compactor(memory_config)
+
+        assert isinstance(compactor.summarizer, ExtractiveSummarizer)
+        assert compactor.min_age == timedelta(hours=2)
+        assert compactor.batch_size == 10
+
+        memory_config.memory.compaction_summarizer = "llm"
+        with pytest.raises(ValueError):
+            create_compactor(memory_config)
+        compactor = create_compactor(memory_config, chat_client=AsyncMock())
+        assert isinstance(compactor.summarizer, ChatClientSummarizer)
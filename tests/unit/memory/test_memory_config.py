@@ -123,6 +123,78 @@ class TestMemoryConfiguration:
 
             assert env_overrides["memory"]["type"] == "custom_type"
 
+    def test_merge_env_memory_capacity_from_env_vars(self):
+        """Test merge_with_env loads in-memory capacity and eviction policy."""
+        settings = AgentSettings()
+        env_vars = {"MEMORY_MAX_ENTRIES": "500", "MEMORY_EVICTION_POLICY": "role_weighted"}
+
+        with patch.dict(os.environ, env_vars, clear=False):
+            env_overrides = merge_with_env(settings)
+
+        assert env_overrides["memory"]["max_entries"] == 500
+        assert env_overrides["memory"]["eviction_policy"] == "role_weighted"
+
+    def test_config_memory_capacity_validation(self):
+        """Test invalid capacity and eviction policy are rejected."""
+        from pydantic import ValidationError
+
+        from agent.config.schema import MemoryConfig
+
+        assert MemoryConfig().max_entries == 10000
+        assert MemoryConfig().eviction_policy == "lru"
+        with pytest.raises(ValidationError):
+            MemoryConfig(max_entries=0)
+        with pytest.raises(ValidationError):
+            MemoryConfig(eviction_policy="random")
+
+    def test_context_token_budget_from_env_and_validation(self):
+        """Test the memory context token budget can be set and must be positive."""
+        from pydantic import ValidationError
+
+        from agent.config.schema import MemoryConfig
+
+        with patch.dict(os.environ, {"MEMORY_CONTEXT_TOKEN_BUDGET": "500"}, clear=False):
+            env_overrides = merge_with_env(AgentSettings())
+
+        assert env_overrides["memory"]["context_token_budget"] == 500
+        assert AgentSettings().memory_context_token_budget == 2000
+        with pytest.raises(ValidationError):
+            MemoryConfig(context_token_budget=0)
+
+    def test_dedup_settings_from_env_and_validation(self):
+        """Test near-duplicate detection can be configured and is validated."""
+        from pydantic import ValidationError
+
+        from agent.config.schema import MemoryConfig
+
+        env = {"MEMORY_DEDUP_ENABLED": "true", "MEMORY_DEDUP_MAX_DISTANCE": "5"}
+        with patch.dict(os.environ, env, clear=False):
+            env_overrides = merge_with_env(AgentSettings())
+
+        assert env_overrides["memory"]["dedup_enabled"] is True
+        assert env_overrides["memory"]["dedup_max_distance"] == 5
+        assert MemoryConfig().dedup_enabled is False
+        with pytest.raises(ValidationError):
+            MemoryConfig(dedup_max_distance=64)
+        with pytest.raises(ValidationError):
+            MemoryConfig(dedup_min_similarity=0)
+        with pytest.raises(ValidationError):
+            MemoryConfig(dedup_action="replace")
+
+    def test_embedding_cache_entries_from_env_and_validation(self):
+        """Test the mem0 embedding cache size can be set and disabled, not negative."""
+        from pydantic import ValidationError
+
+        from agent.config.schema import MemoryConfig
+
+        with patch.dict(os.environ, {"MEMORY_EMBEDDING_CACHE_ENTRIES": "0"}, clear=False):
+            env_overrides = merge_with_env(AgentSettings())
+
+        assert env_overrides["memory"]["embedding_cache_entries"] == 0
+        assert MemoryConfig().embedding_cache_entries == 10000
+        with pytest.raises(ValidationError):
+            MemoryConfig(embedding_cache_entries=-1)
+
     def test_merge_env_memory_type_defaults_to_in_memory(self):
         """Test merge_with_env defaults memory_type to in_memory."""
         settings = AgentSettings()
@@ -0,0 +1,173 @@
+"""Unit tests for agent.memory.dedup module."""
+
+import pytest
+
+from agent.memory import InMemoryStore
+from agent.memory.dedup import NearDuplicateDetector, create_detector, simhash
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestNearDuplicateDetector:
+    """Tests for SimHash fingerprints and the LSH index."""
+
+    def test_simhash_ignores_case_punctuation_and_stopwords(self):
+        """Test trivially different texts get the same fingerprint."""
+        assert simhash("My name is Alice") == simhash("my name is ALICE!")
+        assert simhash("My name is Alice") != simhash("My name is Bob")
+        assert simhash("...") == 0
+
+    def test_finds_fingerprints_within_max_distance(self):
+        """Test banding finds any fingerprint within max_distance bits."""
+        detector = NearDuplicateDetector(max_distance=3, min_similarity=1.0)
+        terms = frozenset({"alpha"})
+        base = 0x0123456789ABCDEF
+        detector.add("a", (base, terms))
+
+        # Flip one bit in each of three different bands
+        near = base ^ (1 << 0) ^ (1 << 20) ^ (1 << 40)
+        far = near ^ (1 << 60)
+
+        assert detector.find((near, terms)) == "a"
+        assert detector.find((far, terms)) is None
+        assert detector.checked == 2
+        assert detector.duplicates == 1
+        assert detector.dedup_rate == 0.5
+
+    def test_short_messages_need_similar_terms(self):
+        """Test numbered variants are not merged even if fingerprints are close."""
+        detector = NearDuplicateDetector(max_distance=15)
+        for i in range(50):
+            signature = detector.signature("user", f"fact {i}")
+            assert detector.find(signature) is None
+            detector.add(i, signature)
+
+        assert detector.find(detector.signature("user", "Fact 7.")) == 7
+
+    def test_role_is_part_of_signature(self):
+        """Test an assistant echo does not merge into the user's message."""
+        detector = NearDuplicateDetector()
+        detector.add(1, detector.signature("user", "I live in Oslo"))
+
+        assert detector.find(detector.signature("assistant", "I live in Oslo")) is None
+
+    def test_remove_and_clear(self):
+        """Test removed memories are no longer matched."""
+        detector = NearDuplicateDetector()
+        signature = detector.signature("user", "I live in Oslo")
+        detector.add(1, signature)
+        detector.remove(1)
+        detector.remove(1)  # no-op
+
+        assert detector.find(signature) is None
+        detector.add(2, signature)
+        detector.clear()
+        assert len(detector) == 0
+
+    def test_create_detector_respects_config(self, memory_config):
+        """Test thresholds come from settings and dedup can be disabled."""
+        memory_config.memory.dedup_enabled = True
+        memory_config.memory.dedup_max_distance = 5
+        memory_config.memory.dedup_min_similarity = 0.9
+        detector = create_detector(memory_config, backend="in_memory")
+
+        assert detector.max_distance == 5
+        assert detector.min_similarity == 0.9
+
+        memory_config.memory.dedup_enabled = False
+        assert create_detector(memory_config, backend="in_memory") is None
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestInMemoryStoreDedup:
+    """Tests for near-duplicate handling on InMemoryStore.add()."""
+
+    @pytest.fixture
+    def dedup_config(self, memory_config):
+        """Create config with near-duplicate detection enabled."""
+        memory_config.memory.dedup_enabled = True
+        return memory_config
+
+    @pytest.fixture
+    def dedup_store(self, dedup_config):
+        """Create InMemoryStore with near-duplicate detection enabled."""
+        return InMemoryStore(dedup_config)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default_keeps_repeated_turns(self, memory_store):
+        """Test repeated conversation turns stay in history order by default."""
+        turns = [
+            {"role": "user", "content": "continue"},
+            {"role": "assistant", "content": "Here is part two"},
+            {"role": "user", "content": "continue"},
+        ]
+
+        await memory_store.add(turns)
+        recent = (await memory_store.get_recent(limit=3))["result"]
+
+        assert [m["content"] for m in recent] == ["continue", "Here is part two", "continue"]
+
+    @pytest.mark.asyncio
+    async def test_none_metadata(self, dedup_store):
+        """Test messages with metadata None are stored and deduplicated."""
+        await dedup_store.add([{"role": "user", "content": "I live in Oslo", "metadata": None}])
+        result = await dedup_store.add(
+            [{"role": "user", "content": "i live in oslo", "metadata": None}]
+        )
+
+        assert result["success"] is True
+        assert len(dedup_store) == 1
+        assert dedup_store.memories[0]["metadata"] == {}
+
+    @pytest.mark.asyncio
+    async def test_merge_returns_existing_id_and_updates_metadata(self, dedup_store):
+        """Test a repeated message merges into the stored memory."""
+        first = await dedup_store.add([{"role": "user", "content": "I prefer dark roast coffee"}])
+        second = await dedup_store.add(
+            [
+                {
+                    "role": "user",
+                    "content": "I prefer dark-roast coffee!",
+                    "metadata": {"session": "s2"},
+                }
+            ]
+        )
+
+        assert second["result"] == first["result"]
+        assert len(dedup_store) == 1
+        assert dedup_store.memories[0]["metadata"] == {"session": "s2"}
+
+    @pytest.mark.asyncio
+    async def test_restore_does_not_duplicate(self, dedup_store, sample_messages):
+        """Test re-adding persisted memories (session restore) keeps one copy."""
+        await dedup_store.add(sample_messages)
+        saved = (await dedup_store.get_all())["result"]
+
+        await dedup_store.add(saved)
+
+        assert len(dedup_store) == len(sample_messages)
+
+    @pytest.mark.asyncio
+    async def test_skip_action_drops_duplicates(self, dedup_config):
+        """Test the skip action stores nothing for a duplicate."""
+        dedup_config.memory.dedup_action = "skip"
+        store = InMemoryStore(dedup_config)
+        await store.add([{"role": "user", "content": "I live in Oslo"}])
+
+        result = await store.add([{"role": "user", "content": "i live in oslo"}])
+
+        assert result["result"] == []
+        assert len(store) == 1
+
+    @pytest.mark.asyncio
+    async def test_evicted_memories_are_not_matched(self, dedup_config):
+        """Test eviction removes memories from the detector."""
+        dedup_config.memory.max_entries = 1
+        store = InMemoryStore(dedup_config)
+        await store.add([{"role": "user", "content": "I live in Oslo"}])
+        await store.add([{"role": "user", "content": "I work remotely"}])
+
+        result = await store.add([{"role": "user", "content": "I live in Oslo"}])
+
+        assert result["result"] == [2]
@@ -1,12 +1,28 @@
 """Unit tests for memory integration with Agent."""
 
 import pytest
-from agent_framework import ChatMessage
+from agent_framework import BaseChatClient, ChatMessage, ChatResponse, ChatResponseUpdate
 
 from agent.agent import Agent
 from agent.config.schema import AgentSettings
 from agent.memory import InMemoryStore, MemoryManager
-from agent.memory.context_provider import MemoryContextProvider
+from agent.memory.context_provider import CONTEXT_HEADER, MemoryContextProvider
+
+
+class RecordingChatClient(BaseChatClient):
+    """Chat client that acknowledges each prompt and records the instructions sent."""
+
+    def __init__(self):
+        super().__init__()
+        self.instructions: list[str] = []
+
+    async def _inner_get_response(self, *, messages, chat_options, **kwargs):
+        self.instructions.append(chat_options.instructions or "")
+        return ChatResponse(messages=ChatMessage(role="assistant", text="Noted"))
+
+    async def _inner_get_streaming_response(self, *, messages, chat_options, **kwargs):
+        self.instructions.append(chat_options.instructions or "")
+        yield ChatResponseUpdate(role="assistant", text="Noted")
 
 
 def _create_test_config(memory_enabled=True, memory_type="in_memory"):
@@ -284,3 +300,78 @@ class TestMemoryContextProvider:
         # Each memory appears as "user: Python message N"
         memory_count = context.instructions.count("user:")
         assert memory_count <= 2  # Should respect limit=2
+
+    @pytest.mark.asyncio
+    async def test_context_provider_skips_memories_already_in_thread(self, memory_config):
+        """Verify memories of earlier turns in the running thread are not injected again."""
+        store = InMemoryStore(memory_config)
+        await store.add([{"role": "assistant", "content": "Python is a solid choice for work"}])
+        client = RecordingChatClient()
+        agent = Agent(settings=_create_test_config(), chat_client=client, memory_manager=store)
+        thread = agent.agent.get_new_thread()
+
+        await agent.run("I use Python at work", thread=thread)
+        await agent.run("Tell me about Python", thread=thread)
+
+        memory_context = client.instructions[-1].split(CONTEXT_HEADER)[1]
+        assert "solid choice" in memory_context
+        assert "I use Python at work" not in memory_context
+
+        # A new thread does not contain the earlier turn, so it is injected there
+        async for _ in agent.run_stream("Tell me about Python"):
+            pass
+
+        assert "I use Python at work" in client.instructions[-1]
+
+    @pytest.mark.asyncio
+    async def test_context_provider_collapses_near_duplicates(self, memory_config):
+        """Verify near-duplicate memories are injected only once."""
+        # Disable write-time dedup so both copies reach the store
+        memory_config.memory.dedup_enabled = False
+        store = InMemoryStore(memory_config)
+        provider = MemoryContextProvider(store, history_limit=5)
+
+        await store.add(
+            [
+                {"role": "user", "content": "My favorite language is Python"},
+                {"role": "user", "content": "my favorite language is Python!"},
+            ]
+        )
+
+        context = await provider.invoking([ChatMessage(role="user", content="Python?")])
+
+        assert context.instructions.lower().count("favorite language") == 1
+
+    @pytest.mark.asyncio
+    async def test_context_provider_respects_token_budget(self, memory_config):
+        """Verify injected memory stays within the token budget."""
+        store = InMemoryStore(memory_config)
+        provider = MemoryContextProvider(store, history_limit=10, token_budget=40)
+
+        await store.add(
+            [{"role": "user", "content": f"Python fact {i}: " + "detail " * 10} for i in range(10)]
+        )
+
+        context = await provider.invoking([ChatMessage(role="user", content="Python")])
+
+        assert context.instructions is not None
+        assert provider.last_tokens_injected <= 40
+        assert context.instructions.count("user:") < 10
+        assert provider.last_tokens_saved > 0
+
+    @pytest.mark.asyncio
+    async def test_context_provider_stores_turns_with_add_deferred(self, memory_config):
+        """Verify invoked() hands messages to add_deferred (non-blocking for slow backends)."""
+        from unittest.mock import AsyncMock
+
+        store = InMemoryStore(memory_config)
+        store.add_deferred = AsyncMock(wraps=store.add_deferred)
+        provider = MemoryContextProvider(store, history_limit=5)
+
+        await provider.invoked(
+            ChatMessage(role="user", text="I live in Oslo"),
+            ChatMessage(role="assistant", text="Noted!"),
+        )
+
+        store.add_deferred.assert_awaited_once()
+        assert len(store.memories) == 2
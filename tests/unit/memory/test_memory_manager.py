@@ -76,6 +76,34 @@ class TestMemoryManager:
         assert hasattr(memory_store, "clear")
         assert callable(memory_store.clear)
 
+    @pytest.mark.asyncio
+    async def test_add_deferred_defaults_to_add(self, memory_store):
+        """Test backends without a write queue store deferred writes immediately."""
+        result = await memory_store.add_deferred([{"role": "user", "content": "Hello"}])
+
+        assert result["success"] is True
+        assert len(memory_store.memories) == 1
+
+        # flush() is a no-op for synchronous backends
+        await memory_store.flush()
+        assert len(memory_store.memories) == 1
+
+    @pytest.mark.asyncio
+    async def test_add_redacts_secrets(self, memory_store, memory_config, tmp_path):
+        """Test local backends redact secrets before storage."""
+        from agent.memory.sqlite_store import SQLiteMemoryStore
+
+        messages = [{"role": "user", "content": "My password=super_secret_123 is set"}]
+        sqlite_store = SQLiteMemoryStore(memory_config, db_path=tmp_path / "memories.db")
+
+        for store in (memory_store, sqlite_store):
+            await store.add(messages)
+            stored = (await store.get_all())["result"][0]["content"]
+            assert "super_secret_123" not in stored
+            assert stored == "My [REDACTED] is set"
+
+        sqlite_store.close()
+
 
 @pytest.mark.unit
 @pytest.mark.memory
@@ -102,6 +130,28 @@ class TestCreateMemoryManager:
 
         assert isinstance(manager, InMemoryStore)
 
+    def test_create_memory_manager_vector_local(self, memory_config):
+        """Test factory creates LocalVectorStore for vector_local."""
+        from agent.memory.vector_store import LocalVectorStore
+
+        memory_config.memory.type = "vector_local"
+
+        manager = create_memory_manager(memory_config)
+
+        assert isinstance(manager, LocalVectorStore)
+
+    def test_create_memory_manager_sqlite(self, memory_config, tmp_path):
+        """Test factory creates SQLiteMemoryStore for sqlite."""
+        from agent.memory import SQLiteMemoryStore
+
+        memory_config.memory.type = "sqlite"
+        memory_config.agent.data_dir = str(tmp_path)
+
+        manager = create_memory_manager(memory_config)
+
+        assert isinstance(manager, SQLiteMemoryStore)
+        manager.close()
+
     def test_create_memory_manager_passes_config(self, memory_config):
         """Test factory passes config to manager."""
         manager = create_memory_manager(memory_config)
@@ -149,27 +199,53 @@ class TestCreateMemoryManager:
         config.providers.openai.api_key = "test"
         config.memory.type = "mem0"
 
-        with patch("agent.memory.mem0_store.create_memory_instance") as mock_create:
+        with (
+            patch("agent.memory.importlib.util.find_spec", return_value=Mock()),
+            patch("agent.memory.mem0_store.create_memory_instance") as mock_create,
+        ):
             mock_create.return_value = Mock()
 
             manager = create_memory_manager(config)
 
             assert isinstance(manager, Mem0Store)
+            assert manager._ready.wait(timeout=5)
+            assert manager.memory is mock_create.return_value
+
+    def test_create_memory_manager_mem0_fallback_when_not_installed(self):
+        """Test factory falls back to InMemoryStore when mem0 is not installed."""
+        config = AgentSettings()
+        config.providers.enabled = ["openai"]
+        config.providers.openai.api_key = "test"
+        config.memory.type = "mem0"
+
+        with patch("agent.memory.importlib.util.find_spec", return_value=None):
+            manager = create_memory_manager(config)
 
-    def test_create_memory_manager_mem0_fallback_on_error(self):
-        """Test factory falls back to InMemoryStore when Mem0Store fails."""
+        # Should fall back to InMemoryStore
+        assert isinstance(manager, InMemoryStore)
+
+    @pytest.mark.asyncio
+    async def test_create_memory_manager_mem0_fallback_on_error(self):
+        """Test Mem0Store degrades to InMemoryStore when background init fails."""
         config = AgentSettings()
         config.providers.enabled = ["openai"]
         config.providers.openai.api_key = "test"
         config.memory.type = "mem0"
 
-        with patch("agent.memory.mem0_store.create_memory_instance") as mock_create:
+        with (
+            patch("agent.memory.importlib.util.find_spec", return_value=Mock()),
+            patch("agent.memory.mem0_store.create_memory_instance") as mock_create,
+        ):
             mock_create.side_effect = Exception("Connection failed")
 
             manager = create_memory_manager(config)
+            await manager.add([{"role": "user", "content": "Remember me"}])
 
-            # Should fall back to InMemoryStore
-            assert isinstance(manager, InMemoryStore)
+        # Writes and reads are served by the InMemoryStore fallback
+        assert isinstance(manager._fallback, InMemoryStore)
+        result = await manager.search("Remember")
+        assert result["success"] is True
+        assert len(result["result"]) == 1
 
     def test_create_memory_manager_default_to_in_memory(self):
         """Test factory defaults to InMemoryStore for unknown types."""
@@ -146,6 +146,26 @@ class TestInMemoryStore:
         # Message matching one keyword should be second
         assert result["result"][1]["content"] == "I like Python"
 
+    @pytest.mark.asyncio
+    async def test_search_ignores_punctuation(self, memory_store):
+        """Test search matches terms regardless of surrounding punctuation."""
+        await memory_store.add([{"role": "assistant", "content": "Nice to meet you, Alice!"}])
+
+        result = await memory_store.search("alice?", limit=5)
+
+        assert len(result["result"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_search_after_clear_returns_nothing(self, memory_store, sample_messages):
+        """Test the search index is reset by clear()."""
+        await memory_store.add(sample_messages)
+        await memory_store.clear()
+        await memory_store.add([{"role": "user", "content": "Something else"}])
+
+        result = await memory_store.search("Alice", limit=5)
+
+        assert result["result"] == []
+
     @pytest.mark.asyncio
     async def test_search_respects_limit(self, memory_store):
         """Test search respects limit parameter."""
@@ -400,3 +420,91 @@ class TestInMemoryStore:
         assert result["success"] is True
         # Should find Python-related memories
         assert any("Python" in mem["content"] for mem in result["result"])
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestInMemoryStoreCapacity:
+    """Tests for bounded capacity, eviction policies and ID stability."""
+
+    def _store(self, memory_config, max_entries, policy="lru"):
+        memory_config.memory.max_entries = max_entries
+        memory_config.memory.eviction_policy = policy
+        return InMemoryStore(memory_config)
+
+    @pytest.mark.asyncio
+    async def test_store_never_exceeds_capacity(self, memory_config):
+        """Test the store evicts once it grows past max_entries."""
+        store = self._store(memory_config, max_entries=100)
+
+        for i in range(500):
+            await store.add([{"role": "user", "content": f"fact {i}"}])
+
+        assert len(store) <= 100
+        # Newest memories survive under LRU
+        assert store.memories[-1]["content"] == "fact 499"
+
+    @pytest.mark.asyncio
+    async def test_lru_keeps_recently_retrieved_memories(self, memory_config):
+        """Test retrieval protects a memory from LRU eviction."""
+        store = self._store(memory_config, max_entries=3)
+        await store.add([{"role": "user", "content": "my favourite colour is teal"}])
+        await store.add([{"role": "user", "content": "filler one"}])
+        await store.add([{"role": "user", "content": "filler two"}])
+
+        await store.search("teal")
+        await store.add([{"role": "user", "content": "filler three"}])
+
+        contents = [m["content"] for m in store.memories]
+        assert "my favourite colour is teal" in contents
+        assert "filler one" not in contents
+        # Evicted memories are gone from the search index too
+        assert (await store.search("one"))["result"] == []
+
+    @pytest.mark.asyncio
+    async def test_role_weighted_evicts_tool_output_first(self, memory_config):
+        """Test role_weighted prefers evicting low-value roles."""
+        store = self._store(memory_config, max_entries=2, policy="role_weighted")
+        await store.add(
+            [
+                {"role": "user", "content": "I live in Oslo"},
+                {"role": "tool", "content": "ls output"},
+                {"role": "user", "content": "I work remotely"},
+            ]
+        )
+
+        assert [m["role"] for m in store.memories] == ["user", "user"]
+
+    @pytest.mark.asyncio
+    async def test_custom_eviction_policy(self, memory_config):
+        """Test a callable policy can be plugged in directly."""
+        memory_config.memory.max_entries = 2
+        # Evict the newest entries first
+        store = InMemoryStore(memory_config, eviction_policy=lambda entry, now: -entry.id)
+
+        await store.add([{"role": "user", "content": f"m{i}"} for i in range(3)])
+
+        assert [m["content"] for m in store.memories] == ["m0", "m1"]
+
+    @pytest.mark.asyncio
+    async def test_ids_are_monotonic_across_eviction_and_clear(self, memory_config):
+        """Test IDs are never reused."""
+        store = self._store(memory_config, max_entries=2)
+        first = await store.add([{"role": "user", "content": f"m{i}"} for i in range(3)])
+        await store.clear()
+        second = await store.add([{"role": "user", "content": "after clear"}])
+
+        assert first["result"] == [0, 1, 2]
+        assert second["result"] == [3]
+        assert store.memories[0]["id"] == 3
+
+    @pytest.mark.asyncio
+    async def test_entries_use_slots(self, memory_store):
+        """Test entries are compact slot-based objects."""
+        from agent.memory.store import MemoryEntry
+
+        await memory_store.add([{"role": "user", "content": "hello"}])
+
+        entry = next(iter(memory_store._entries.values()))
+        assert isinstance(entry, MemoryEntry)
+        assert not hasattr(entry, "__dict__")
@@ -0,0 +1,116 @@
+"""Unit tests for agent.memory.sqlite_store module."""
+
+import pytest
+
+from agent.memory.sqlite_store import SQLiteMemoryStore
+
+
+@pytest.fixture
+def sqlite_store(memory_config, tmp_path):
+    """Create SQLiteMemoryStore under a temporary data directory."""
+    memory_config.agent.data_dir = str(tmp_path)
+    store = SQLiteMemoryStore(memory_config)
+    yield store
+    store.close()
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestSQLiteMemoryStore:
+    """Tests for SQLiteMemoryStore class."""
+
+    def test_database_created_in_memory_dir_with_wal(self, sqlite_store, tmp_path):
+        """Test the database lives under memory_dir and uses WAL journaling."""
+        assert sqlite_store.db_path == tmp_path / "memory" / "memories.db"
+        assert sqlite_store.db_path.exists()
+        mode = sqlite_store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    @pytest.mark.asyncio
+    async def test_add_returns_ids_and_preserves_fields(self, sqlite_store):
+        """Test added memories round-trip with role, content and metadata."""
+        result = await sqlite_store.add(
+            [
+                {"role": "user", "content": "My name is Alice", "metadata": {"k": 1}},
+                {"invalid": "message"},
+            ]
+        )
+
+        assert result["success"] is True
+        assert result["result"] == [1]
+        memory = (await sqlite_store.get_all())["result"][0]
+        assert memory["role"] == "user"
+        assert memory["content"] == "My name is Alice"
+        assert memory["metadata"] == {"k": 1}
+        assert "T" in memory["timestamp"]
+
+    @pytest.mark.asyncio
+    async def test_add_empty_messages_returns_error(self, sqlite_store):
+        """Test adding no messages returns error."""
+        result = await sqlite_store.add([])
+
+        assert result["success"] is False
+        assert result["error"] == "invalid_input"
+
+    @pytest.mark.asyncio
+    async def test_search_uses_full_text_ranking(self, sqlite_store):
+        """Test FTS5 search ranks memories matching more terms first."""
+        await sqlite_store.add(
+            [
+                {"role": "user", "content": "I like Python"},
+                {"role": "user", "content": "Python and Java"},
+                {"role": "user", "content": "Learning"},
+            ]
+        )
+
+        result = await sqlite_store.search("Python Java", limit=5)
+
+        assert [m["content"] for m in result["result"]] == ["Python and Java", "I like Python"]
+
+    @pytest.mark.asyncio
+    async def test_search_treats_query_as_plain_text(self, sqlite_store):
+        """Test FTS5 operators in user text do not break the query."""
+        await sqlite_store.add([{"role": "user", "content": "deploy NEAR the AND gate"}])
+
+        result = await sqlite_store.search('gate" OR (NEAR*', limit=5)
+
+        assert result["success"] is True
+        assert len(result["result"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_search_empty_query_returns_error(self, sqlite_store):
+        """Test searching with empty query returns error."""
+        result = await sqlite_store.search("   ")
+
+        assert result["success"] is False
+        assert result["error"] == "invalid_query"
+
+    @pytest.mark.asyncio
+    async def test_get_recent_and_clear(self, sqlite_store, sample_messages):
+        """Test recent retrieval order and clearing (including the FTS index)."""
+        await sqlite_store.add(sample_messages)
+
+        recent = await sqlite_store.get_recent(limit=2)
+        assert [m["content"] for m in recent["result"]] == [
+            sample_messages[2]["content"],
+            sample_messages[3]["content"],
+        ]
+
+        cleared = await sqlite_store.clear()
+        assert "Cleared 4 memories" in cleared["message"]
+        assert (await sqlite_store.search("Alice"))["result"] == []
+        # IDs are not reused after clear
+        assert (await sqlite_store.add([{"role": "user", "content": "x"}]))["result"] == [5]
+
+    @pytest.mark.asyncio
+    async def test_memories_survive_reopen(self, sqlite_store, memory_config):
+        """Test memories persist without an explicit save step."""
+        await sqlite_store.add([{"role": "user", "content": "I prefer dark roast coffee"}])
+
+        reopened = SQLiteMemoryStore(memory_config)
+        try:
+            result = await reopened.search("coffee", limit=5)
+        finally:
+            reopened.close()
+
+        assert result["result"][0]["content"] == "I prefer dark roast coffee"
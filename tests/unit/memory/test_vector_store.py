@@ -0,0 +1,137 @@
+"""Unit tests for agent.memory.vector_store module."""
+
+import numpy as np
+import pytest
+
+from agent.memory.vector_store import LocalVectorStore
+
+
+@pytest.fixture
+def vector_store(memory_config):
+    """Create LocalVectorStore instance."""
+    memory_config.memory.type = "vector_local"
+    return LocalVectorStore(memory_config)
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestLocalVectorStore:
+    """Tests for LocalVectorStore class."""
+
+    def test_embed_is_normalized_and_deterministic(self, vector_store):
+        """Test vectors are unit length and stable across calls."""
+        first = vector_store.embed("I prefer dark roast coffee")
+        second = vector_store.embed("I prefer dark roast coffee")
+
+        assert first.dtype == np.float32
+        assert np.isclose(np.linalg.norm(first), 1.0)
+        assert np.array_equal(first, second)
+        assert not vector_store.embed("!!!").any()
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_by_similarity(self, vector_store):
+        """Test the most similar memory is returned first."""
+        await vector_store.add(
+            [
+                {"role": "user", "content": "My favourite colour is teal"},
+                {"role": "user", "content": "I work as a backend engineer"},
+                {"role": "user", "content": "I prefer dark roast coffee"},
+            ]
+        )
+
+        result = await vector_store.search("what coffee do I prefer?", limit=2)
+
+        assert result["success"] is True
+        assert result["result"][0]["content"] == "I prefer dark roast coffee"
+
+    @pytest.mark.asyncio
+    async def test_search_matches_inflections(self, vector_store):
+        """Test character n-grams give fuzzy matches a keyword index would miss."""
+        await vector_store.add(
+            [
+                {"role": "user", "content": "I enjoy running marathons"},
+                {"role": "user", "content": "The build uses docker"},
+            ]
+        )
+
+        result = await vector_store.search("marathon runner", limit=1)
+
+        assert result["result"][0]["content"] == "I enjoy running marathons"
+
+    @pytest.mark.asyncio
+    async def test_search_drops_unrelated_memories(self, vector_store):
+        """Test results below the similarity floor are not returned."""
+        await vector_store.add([{"role": "user", "content": "kubernetes cluster"}])
+
+        result = await vector_store.search("zebra", limit=5)
+
+        assert result["result"] == []
+
+    @pytest.mark.asyncio
+    async def test_search_empty_query_returns_error(self, vector_store):
+        """Test searching with empty query returns error."""
+        result = await vector_store.search("  ")
+
+        assert result["success"] is False
+        assert result["error"] == "invalid_query"
+
+    @pytest.mark.asyncio
+    async def test_matrix_grows_past_initial_capacity(self, vector_store):
+        """Test adds beyond the preallocated rows keep earlier vectors."""
+        count = LocalVectorStore._INITIAL_CAPACITY + 10
+        await vector_store.add([{"role": "user", "content": f"note {i}"} for i in range(count)])
+        await vector_store.add([{"role": "user", "content": "unique pelican fact"}])
+
+        result = await vector_store.search("pelican", limit=1)
+
+        assert len(vector_store) == count + 1
+        assert result["result"][0]["content"] == "unique pelican fact"
+
+    @pytest.mark.asyncio
+    async def test_get_recent_clear_and_ids(self, vector_store, sample_messages):
+        """Test recent retrieval order, clearing, and monotonic IDs."""
+        await vector_store.add(sample_messages)
+
+        recent = await vector_store.get_recent(limit=2)
+        assert [m["id"] for m in recent["result"]] == [2, 3]
+
+        await vector_store.clear()
+        assert (await vector_store.get_all())["result"] == []
+        added = await vector_store.add([{"role": "user", "content": "again"}])
+        assert added["result"] == [4]
+
+    @pytest.mark.asyncio
+    async def test_round_trips_through_memory_persistence(
+        self, vector_store, memory_config, memory_persistence, sample_messages
+    ):
+        """Test memories saved via MemoryPersistence restore into a new store."""
+        await vector_store.add(sample_messages)
+        path = memory_persistence.get_memory_path("session-1")
+        await memory_persistence.save((await vector_store.get_all())["result"], path)
+
+        restored = LocalVectorStore(memory_config)
+        await restored.add(await memory_persistence.load(path))
+
+        result = await restored.search("python programming", limit=1)
+        assert result["result"][0]["content"] == "I like Python programming"
+
+    @pytest.mark.asyncio
+    async def test_restore_keeps_saved_timestamps(self, vector_store):
+        """Test restored memories keep their saved timestamp instead of the restore time."""
+        await vector_store.add(
+            [{"role": "user", "content": "Old turn", "timestamp": "2024-01-01T09:00:00"}]
+        )
+
+        result = await vector_store.get_all()
+        assert result["result"][0]["timestamp"] == "2024-01-01T09:00:00"
+
+    @pytest.mark.asyncio
+    async def test_retrieve_for_context_uses_vector_search(self, vector_store, sample_messages):
+        """Test default retrieve_for_context goes through vector search."""
+        await vector_store.add(sample_messages)
+
+        result = await vector_store.retrieve_for_context(
+            [{"role": "user", "content": "Who is Alice?"}], limit=2
+        )
+
+        assert any("Alice" in m["content"] for m in result["result"])
@@ -0,0 +1,105 @@
+"""Unit tests for agent.memory.write_behind module."""
+
+import asyncio
+import threading
+
+import pytest
+
+from agent.memory.write_behind import WriteBehindQueue
+
+
+@pytest.mark.unit
+@pytest.mark.memory
+class TestWriteBehindQueue:
+    """Tests for WriteBehindQueue."""
+
+    @pytest.mark.asyncio
+    async def test_put_returns_before_write_completes(self):
+        """Test enqueueing does not wait for the (slow) writer."""
+        release = threading.Event()
+        written: list[list[dict]] = []
+
+        def writer(batch):
+            release.wait(timeout=5)
+            written.append(batch)
+
+        queue = WriteBehindQueue(writer)
+        await queue.put([{"role": "user", "content": "a"}])
+
+        assert written == []
+        assert queue.depth == 1
+
+        release.set()
+        await queue.flush()
+        assert written == [[{"role": "user", "content": "a"}]]
+        assert queue.depth == 0
+        assert queue.last_flush_seconds is not None
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_queued_during_a_write_are_batched(self):
+        """Test turns that pile up behind a slow write are coalesced into one batch."""
+        release = threading.Event()
+        written: list[list[dict]] = []
+
+        def writer(batch):
+            release.wait(timeout=5)
+            written.append([m["content"] for m in batch])
+
+        queue = WriteBehindQueue(writer)
+        await queue.put([{"role": "user", "content": "turn1"}])
+        await asyncio.sleep(0.01)  # first batch is now in flight
+        await queue.put([{"role": "user", "content": "turn2"}])
+        await queue.put([{"role": "user", "content": "turn3"}])
+
+        release.set()
+        await queue.flush()
+
+        assert written == [["turn1"], ["turn2", "turn3"]]
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_writer_errors_are_counted_and_do_not_stop_queue(self):
+        """Test a failed batch is logged and later batches still run."""
+        calls = []
+
+        def writer(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise RuntimeError("extraction failed")
+
+        queue = WriteBehindQueue(writer)
+        await queue.put([{"role": "user", "content": "a"}])
+        await queue.flush()
+        await queue.put([{"role": "user", "content": "b"}])
+        await queue.flush()
+
+        assert len(calls) == 2
+        assert queue.failed_writes == 1
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_applies_backpressure(self):
+        """Test put waits once max_pending writes are queued."""
+        release = threading.Event()
+        queue = WriteBehindQueue(lambda batch: release.wait(timeout=5), max_pending=1)
+
+        await queue.put([{"role": "user", "content": "in flight"}])
+        await asyncio.sleep(0.01)
+        await queue.put([{"role": "user", "content": "queued"}])
+
+        blocked = asyncio.create_task(queue.put([{"role": "user", "content": "waits"}]))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_without_writes_is_noop(self):
+        """Test flushing an unused queue returns immediately."""
+        queue = WriteBehindQueue(lambda batch: None)
+
+        await queue.flush()
+        await queue.close()
@@ -1,10 +1,11 @@
 """Unit tests for agent.middleware module."""
 
 import asyncio
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from agent.config.schema import AgentSettings
 from agent.middleware import (
     agent_observability_middleware,
     agent_run_logging_middleware,
@@ -35,6 +36,28 @@ class TestCreateMiddleware:
         assert agent_observability_middleware in middleware
         assert logging_function_middleware in middleware
 
+    @pytest.mark.asyncio
+    async def test_create_middleware_binds_agent_settings(self):
+        """Test middleware created for one agent never reads another agent's settings."""
+        first = AgentSettings()
+        second = AgentSettings()
+        second.telemetry.enabled = True
+        first_tool_middleware = create_middleware(first)[2]
+        create_middleware(second)
+
+        context = Mock()
+        context.function = Mock()
+        context.function.name = "test_tool"
+        context.arguments = {}
+
+        async def mock_next(ctx):
+            return {"message": "ok"}
+
+        with patch("agent.middleware._get_instruments", return_value=None) as get_instruments:
+            await first_tool_middleware(context, mock_next)
+
+        assert get_instruments.call_args.args[0] is first
+
     def test_create_function_middleware_returns_list(self):
         """Test create_function_middleware returns list (backward compatibility)."""
         function_mw = create_function_middleware()
@@ -77,6 +100,24 @@ class TestAgentRunLoggingMiddleware:
 
         assert next_called is True
 
+    @pytest.mark.asyncio
+    async def test_settings_not_read_without_trace_logger(self):
+        """Test settings are not read on runs without trace logging or telemetry."""
+        context = Mock()
+        context.messages = []
+
+        async def mock_next(ctx):
+            pass
+
+        with (
+            patch("agent.middleware.get_trace_logger", return_value=None),
+            patch("agent.middleware.get_instruments", return_value=None),
+            patch("agent.middleware.get_settings_snapshot") as get_settings,
+        ):
+            await agent_run_logging_middleware(context, mock_next)
+
+        get_settings.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_middleware_emits_llm_request_event_when_visualization_enabled(self):
         """Test middleware emits LLM request event when visualization enabled."""
@@ -339,6 +380,72 @@ class TestLoggingFunctionMiddleware:
         # Should use same event_id
         assert complete_event.event_id == start_event.event_id
 
+    @pytest.mark.asyncio
+    async def test_middleware_reports_result_cache_stats(self):
+        """Test ToolCompleteEvent carries result cache hit/miss counts."""
+        from agent.display import ExecutionContext, set_execution_context
+        from agent.display.events import get_event_emitter, report_tool_cache_info
+
+        set_execution_context(ExecutionContext(show_visualization=True))
+
+        context = Mock()
+        context.function = Mock()
+        context.function.name = "script_run"
+        context.arguments = {}
+
+        async def mock_next(ctx):
+            report_tool_cache_info(hit=True, hits=4, misses=2)
+            return {"message": "Executed"}
+
+        result = await logging_function_middleware(context, mock_next)
+
+        emitter = get_event_emitter()
+        emitter.get_event_nowait()
+        complete_event = emitter.get_event_nowait()
+
+        assert result == {"message": "Executed"}
+        assert complete_event.cache_hit is True
+        assert (complete_event.cache_hits, complete_event.cache_misses) == (4, 2)
+
+    @pytest.mark.asyncio
+    async def test_middleware_runs_tool_under_scheduler_policy(self):
+        """Test tool calls run through the tool scheduler and honor policy timeouts."""
+        from agent.display import ExecutionContext, set_execution_context
+        from agent.display.events import ToolErrorEvent, get_event_emitter
+        from agent.tools.scheduler import ToolScheduler, set_tool_scheduler
+        from agent.tools.toolset import AgentToolset, ToolPolicy
+
+        class SlowTools(AgentToolset):
+            tool_policies = {"slow_tool": ToolPolicy(timeout=0.01)}
+
+            def get_tools(self):
+                return []
+
+        set_execution_context(ExecutionContext(show_visualization=True))
+        scheduler = ToolScheduler()
+        scheduler.register(SlowTools(None))
+        set_tool_scheduler(scheduler)
+
+        context = Mock()
+        context.function = Mock()
+        context.function.name = "slow_tool"
+        context.arguments = {}
+
+        async def mock_next(ctx):
+            await asyncio.sleep(1)
+
+        try:
+            with pytest.raises(TimeoutError):
+                await logging_function_middleware(context, mock_next)
+        finally:
+            set_tool_scheduler(None)
+
+        emitter = get_event_emitter()
+        emitter.get_event_nowait()
+        error_event = emitter.get_event_nowait()
+        assert isinstance(error_event, ToolErrorEvent)
+        assert "timed out" in error_event.error_message
+
     @pytest.mark.asyncio
     async def test_middleware_emits_tool_error_event_on_failure(self):
         """Test middleware emits ToolErrorEvent on exception."""
@@ -554,3 +661,107 @@ class TestLoggingFunctionMiddleware:
 
         assert isinstance(event, ToolStartEvent)
         assert event.arguments == {}  # Should default to empty dict
+
+
+@pytest.mark.unit
+@pytest.mark.middleware
+class TestMiddlewareMetrics:
+    """Tests for OpenTelemetry metrics recorded by middleware."""
+
+    @pytest.fixture
+    def instruments(self):
+        """Install mock instruments as the shared instance."""
+        from unittest.mock import MagicMock, patch
+
+        from agent.observability import AgentInstruments
+
+        meter = MagicMock()
+        meter.create_histogram.side_effect = lambda **kwargs: MagicMock()
+        meter.create_counter.side_effect = lambda **kwargs: MagicMock()
+        instruments = AgentInstruments(tracer=MagicMock(), meter=meter)
+        with patch("agent.middleware.get_instruments", return_value=instruments):
+            yield instruments
+
+    @pytest.fixture
+    def otel_settings(self):
+        """Settings snapshot with telemetry enabled."""
+        from unittest.mock import patch
+
+        from agent.config.schema import AgentSettings
+
+        settings = AgentSettings()
+        settings.providers.enabled = ["openai"]
+        settings.providers.openai.model = "gpt-5-mini"
+        settings.telemetry.enabled = True
+        with patch("agent.middleware.get_settings_snapshot", return_value=settings):
+            yield settings
+
+    @pytest.mark.asyncio
+    async def test_tool_duration_reuses_instrument(self, instruments, otel_settings):
+        """Test tool calls record on the shared histogram without creating instruments."""
+        context = Mock()
+        context.function = Mock()
+        context.function.name = "test_tool"
+        context.arguments = {}
+
+        async def mock_next(ctx):
+            return {"message": "ok"}
+
+        await logging_function_middleware(context, mock_next)
+        await logging_function_middleware(context, mock_next)
+
+        assert instruments.tool_duration.record.call_count == 2
+        _, attrs = instruments.tool_duration.record.call_args.args
+        assert attrs == {"tool": "test_tool", "status": "success"}
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_token_usage_recorded(self, instruments, otel_settings):
+        """Test token counters are recorded from non-streaming results."""
+        context = Mock(spec=["messages", "result", "is_streaming"])
+        context.messages = []
+        context.is_streaming = False
+
+        async def mock_next(ctx):
+            ctx.result = Mock(spec=["text", "usage_details"])
+            ctx.result.text = "Hi"
+            ctx.result.usage_details = Mock(input_token_count=120, output_token_count=30)
+
+        await agent_run_logging_middleware(context, mock_next)
+
+        attrs = {"provider": "openai", "model": "gpt-5-mini"}
+        instruments.llm_input_tokens.add.assert_called_once_with(120, attrs)
+        instruments.llm_output_tokens.add.assert_called_once_with(30, attrs)
+
+    @pytest.mark.asyncio
+    async def test_streaming_records_time_to_first_token(self, instruments, otel_settings):
+        """Test streaming results are wrapped to record TTFT and usage."""
+        from agent_framework import AgentRunResponseUpdate, TextContent, UsageContent, UsageDetails
+
+        updates = [
+            AgentRunResponseUpdate(contents=[TextContent(text="Hel")]),
+            AgentRunResponseUpdate(contents=[TextContent(text="lo")]),
+            AgentRunResponseUpdate(
+                contents=[
+                    UsageContent(details=UsageDetails(input_token_count=10, output_token_count=2))
+                ]
+            ),
+        ]
+
+        async def stream():
+            for update in updates:
+                yield update
+
+        context = Mock(spec=["messages", "result", "is_streaming"])
+        context.messages = []
+        context.is_streaming = True
+
+        async def mock_next(ctx):
+            ctx.result = stream()
+
+        await agent_run_logging_middleware(context, mock_next)
+        received = [update async for update in context.result]
+
+        assert received == updates
+        instruments.llm_time_to_first_token.record.assert_called_once()
+        instruments.llm_input_tokens.add.assert_called_once()
+        instruments.llm_output_tokens.add.assert_called_once()
@@ -107,7 +107,7 @@ class TestMiddlewareTraceLogging:
             ctx.result.text = "Test response"
             ctx.result.usage_details = None
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -158,7 +158,7 @@ class TestMiddlewareTraceLogging:
         async def mock_next(ctx):
             ctx.result = result
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -209,7 +209,7 @@ class TestMiddlewareTraceLogging:
         async def mock_next(ctx):
             ctx.result = result
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -253,7 +253,7 @@ class TestMiddlewareTraceLogging:
             raise ValueError("API rate limit exceeded")
 
         # Should raise the exception
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             with pytest.raises(ValueError, match="API rate limit exceeded"):
                 await agent_run_logging_middleware(context, mock_next_that_fails)
@@ -322,7 +322,7 @@ class TestMiddlewareTraceLogging:
             pass
 
         # Should not raise
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -375,7 +375,7 @@ class TestMiddlewareTraceLogging:
         async def mock_next(ctx):
             ctx.result = result
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -419,7 +419,7 @@ class TestMiddlewareTraceLogging:
         async def mock_next(ctx):
             ctx.result = result
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -458,7 +458,7 @@ class TestMiddlewareTraceLogging:
         async def mock_next(ctx):
             ctx.response = response
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -500,7 +500,7 @@ class TestMiddlewareTraceLogging:
             await asyncio.sleep(0.05)  # Simulate 50ms delay
             ctx.response = response
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -556,7 +556,7 @@ class TestMiddlewareTraceLogging:
         async def mock_next(ctx):
             ctx.result = result
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -617,7 +617,7 @@ class TestMiddlewareTraceLogging:
         async def mock_next(ctx):
             ctx.result = result
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
@@ -675,7 +675,7 @@ class TestMiddlewareTraceLogging:
         async def mock_next(ctx):
             ctx.result = result
 
-        with patch("agent.middleware.load_config") as MockConfig:
+        with patch("agent.middleware.get_settings_snapshot") as MockConfig:
             MockConfig.return_value = mock_settings
             await agent_run_logging_middleware(context, mock_next)
 
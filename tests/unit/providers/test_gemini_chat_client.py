@@ -1,6 +1,7 @@
 """Unit tests for Gemini chat client."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from agent_framework import ChatMessage, FunctionCallContent, Role, TextContent
@@ -17,6 +18,34 @@ from agent.providers.gemini.types import (
 pytest_plugins = ["tests.fixtures.gemini"]
 
 
+def _make_chunk(text=None, function_call=None, finish_reason=None, usage=None):
+    """Build a google-genai response chunk for streaming tests."""
+    from google.genai import types
+
+    parts = []
+    if text:
+        parts.append(types.Part(text=text))
+    if function_call:
+        parts.append(types.Part(function_call=types.FunctionCall(**function_call)))
+    usage_metadata = (
+        types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=usage[0],
+            candidates_token_count=usage[1],
+            total_token_count=sum(usage),
+        )
+        if usage
+        else None
+    )
+    return types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=types.Content(role="model", parts=parts), finish_reason=finish_reason
+            )
+        ],
+        usage_metadata=usage_metadata,
+    )
+
+
 @pytest.mark.unit
 @pytest.mark.providers
 class TestGeminiChatClientInitialization:
@@ -52,6 +81,19 @@ class TestGeminiChatClientInitialization:
             vertexai=True, project=gemini_project_id, location=gemini_location
         )
 
+    @pytest.mark.asyncio
+    @patch("agent.providers.gemini.chat_client.genai.Client")
+    async def test_close_closes_async_client(self, mock_client_class, gemini_api_key, gemini_model):
+        """Test close() releases the SDK's async HTTP client."""
+        mock_client = MagicMock()
+        mock_client.aio.aclose = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
+        await client.close()
+
+        mock_client.aio.aclose.assert_awaited_once()
+
     def test_initialization_without_api_key_fails(self, gemini_model):
         """Test initialization fails without API key."""
         with pytest.raises(ValueError, match="API key authentication requires api_key"):
@@ -265,7 +307,7 @@ class TestGeminiChatClientResponse:
         mock_response.candidates = [mock_candidate]
         mock_response.usage_metadata = None
 
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         # Create client and test
         client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
@@ -276,7 +318,36 @@ class TestGeminiChatClientResponse:
         assert response is not None
         assert len(response.messages) == 1
         assert response.messages[0].role == Role.ASSISTANT
-        mock_client.models.generate_content.assert_called_once()
+        assert response.usage_details is None
+        mock_client.aio.models.generate_content.assert_awaited_once()
+        mock_client.models.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("agent.providers.gemini.chat_client.genai.Client")
+    async def test_inner_get_response_maps_usage_and_finish_reason(
+        self, mock_client_class, gemini_api_key, gemini_model
+    ):
+        """Test usage metadata maps to UsageDetails token counts."""
+        from agent_framework import FinishReason
+        from google.genai import types
+
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_client.aio.models.generate_content = AsyncMock(
+            return_value=_make_chunk(
+                text="Done", finish_reason=types.FinishReason.MAX_TOKENS, usage=(20, 7)
+            )
+        )
+
+        client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
+        message = ChatMessage(role="user", contents=[TextContent(text="Test")])
+
+        response = await client._inner_get_response(messages=[message], chat_options=MagicMock())
+
+        assert response.usage_details.input_token_count == 20
+        assert response.usage_details.output_token_count == 7
+        assert response.usage_details.total_token_count == 27
+        assert response.finish_reason == FinishReason.LENGTH
 
     @pytest.mark.asyncio
     @patch("agent.providers.gemini.chat_client.genai.Client")
@@ -286,7 +357,7 @@ class TestGeminiChatClientResponse:
         """Test _inner_get_response handles errors."""
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.models.generate_content.side_effect = Exception("API Error")
+        mock_client.aio.models.generate_content = AsyncMock(side_effect=Exception("API Error"))
 
         client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
         message = ChatMessage(role="user", contents=[TextContent(text="Test")])
@@ -309,13 +380,15 @@ class TestGeminiChatClientStreaming:
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
 
-        # Create mock stream chunks
-        mock_chunk1 = MagicMock()
-        mock_chunk1.text = "Hello "
-        mock_chunk2 = MagicMock()
-        mock_chunk2.text = "world"
+        # Create stream chunks
+        mock_chunk1 = _make_chunk(text="Hello ")
+        mock_chunk2 = _make_chunk(text="world")
 
-        mock_client.models.generate_content_stream.return_value = iter([mock_chunk1, mock_chunk2])
+        async def mock_stream():
+            for chunk in [mock_chunk1, mock_chunk2]:
+                yield chunk
+
+        mock_client.aio.models.generate_content_stream = AsyncMock(return_value=mock_stream())
 
         client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
         message = ChatMessage(role="user", contents=[TextContent(text="Test")])
@@ -330,6 +403,119 @@ class TestGeminiChatClientStreaming:
         # ChatResponseUpdate has 'text' attribute
         assert chunks[0].text == "Hello "
         assert chunks[1].text == "world"
+        mock_client.models.generate_content_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("agent.providers.gemini.chat_client.genai.Client")
+    async def test_streaming_carries_function_calls_finish_reason_and_usage(
+        self, mock_client_class, gemini_api_key, gemini_model
+    ):
+        """Test streamed updates include function calls, finish reason and final usage."""
+        from agent_framework import ChatResponse, FinishReason
+
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        from google.genai import types
+
+        chunks = [
+            _make_chunk(text="Let me check", usage=(12, 2)),
+            _make_chunk(
+                function_call={"name": "get_weather", "args": {"city": "Paris"}, "id": "call_1"},
+                finish_reason=types.FinishReason.STOP,
+                usage=(12, 9),
+            ),
+        ]
+
+        async def mock_stream():
+            for chunk in chunks:
+                yield chunk
+
+        mock_client.aio.models.generate_content_stream = AsyncMock(return_value=mock_stream())
+
+        client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
+        message = ChatMessage(role="user", contents=[TextContent(text="Weather?")])
+
+        updates = [
+            update
+            async for update in client._inner_get_streaming_response(
+                messages=[message], chat_options=MagicMock()
+            )
+        ]
+
+        assert updates[0].text == "Let me check"
+        function_calls = [c for c in updates[1].contents if isinstance(c, FunctionCallContent)]
+        assert function_calls[0].name == "get_weather"
+        assert function_calls[0].call_id == "call_1"
+        assert function_calls[0].arguments == {"city": "Paris"}
+        assert updates[1].finish_reason == FinishReason.TOOL_CALLS
+
+        # Usage is reported once (final cumulative totals), not per chunk
+        response = ChatResponse.from_chat_response_updates(updates)
+        assert response.usage_details.input_token_count == 12
+        assert response.usage_details.output_token_count == 9
+
+    @pytest.mark.asyncio
+    @patch("agent.providers.gemini.chat_client.genai.Client")
+    async def test_streaming_closes_sdk_stream_on_early_exit(
+        self, mock_client_class, gemini_api_key, gemini_model
+    ):
+        """Test the SDK stream is closed when the consumer stops early."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        closed = False
+
+        async def mock_stream():
+            nonlocal closed
+            try:
+                for text in ["a", "b", "c"]:
+                    yield _make_chunk(text=text)
+            finally:
+                closed = True
+
+        mock_client.aio.models.generate_content_stream = AsyncMock(return_value=mock_stream())
+
+        client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
+        message = ChatMessage(role="user", contents=[TextContent(text="Test")])
+
+        stream = client._inner_get_streaming_response(messages=[message], chat_options=MagicMock())
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first.text == "a"
+        assert closed is True
+
+    @pytest.mark.asyncio
+    @patch("agent.providers.gemini.chat_client.genai.Client")
+    async def test_concurrent_requests_do_not_block_event_loop(
+        self, mock_client_class, gemini_api_key, gemini_model
+    ):
+        """Test concurrent requests overlap instead of serializing on the event loop."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.candidates = []
+        mock_response.usage_metadata = None
+
+        async def slow_generate(**kwargs):
+            await asyncio.sleep(0.1)
+            return mock_response
+
+        mock_client.aio.models.generate_content = slow_generate
+
+        client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
+        message = ChatMessage(role="user", contents=[TextContent(text="Test")])
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(
+            *[
+                client._inner_get_response(messages=[message], chat_options=MagicMock())
+                for _ in range(5)
+            ]
+        )
+
+        # Five 100ms requests should overlap (well under the 500ms serialized time)
+        assert loop.time() - start < 0.4
 
 
 @pytest.mark.unit
@@ -364,3 +550,112 @@ class TestGeminiOptionsMapping:
         tools = config["tools"]
         assert isinstance(tools, list) and tools
         assert "function_declarations" in tools[0]
+
+
+@pytest.mark.unit
+@pytest.mark.providers
+class TestGeminiConversionCache:
+    """Tests for incremental message and tool conversion across turns."""
+
+    def _history(self, length):
+        return [
+            ChatMessage(role="user" if i % 2 == 0 else "assistant", text=f"m{i}")
+            for i in range(length)
+        ]
+
+    def test_only_new_messages_are_converted(self):
+        from agent.providers.gemini.cache import GeminiConversionCache
+
+        cache = GeminiConversionCache()
+        history = self._history(10)
+        first = cache.contents_for([ChatMessage(role="system", text="sys"), *history])
+
+        history.append(ChatMessage(role="user", text="new"))
+        with patch(
+            "agent.providers.gemini.cache.to_gemini_message", wraps=to_gemini_message
+        ) as spy:
+            second = cache.contents_for([ChatMessage(role="system", text="sys"), *history])
+
+        # Fresh system message + the one appended message
+        assert spy.call_count == 2
+        assert second[:-1] == first
+        assert second[-1]["parts"] == [{"text": "new"}]
+
+    def test_matches_full_conversion(self):
+        from agent.providers.gemini.cache import GeminiConversionCache
+
+        cache = GeminiConversionCache()
+        history = [
+            ChatMessage(role="user", text="run it"),
+            ChatMessage(
+                role="assistant",
+                contents=[FunctionCallContent(call_id="c1", name="do_thing", arguments={})],
+            ),
+        ]
+        cache.contents_for(history)
+
+        from agent_framework import FunctionResultContent
+
+        history.append(
+            ChatMessage(role="tool", contents=[FunctionResultContent(call_id="c1", result="ok")])
+        )
+        contents = cache.contents_for(history)
+
+        # Function result names resolved from the call converted on the previous turn
+        expected = to_gemini_message(history[2], {"c1": "do_thing"})
+        assert contents[2]["parts"] == expected["parts"]
+
+    def test_edited_history_reconverts_from_divergence(self):
+        from agent.providers.gemini.cache import GeminiConversionCache
+
+        cache = GeminiConversionCache()
+        history = self._history(6)
+        cache.contents_for(history)
+
+        history[4] = ChatMessage(role="user", text="edited")
+        with patch(
+            "agent.providers.gemini.cache.to_gemini_message", wraps=to_gemini_message
+        ) as spy:
+            contents = cache.contents_for(history)
+
+        assert spy.call_count == 2
+        assert contents[4]["parts"] == [{"text": "edited"}]
+        assert len(contents) == 6
+
+    def test_separate_conversations_keep_separate_state(self):
+        from agent.providers.gemini.cache import GeminiConversionCache
+
+        cache = GeminiConversionCache()
+        a, b = self._history(3), self._history(5)
+        cache.contents_for(a)
+        cache.contents_for(b)
+
+        with patch(
+            "agent.providers.gemini.cache.to_gemini_message", wraps=to_gemini_message
+        ) as spy:
+            assert len(cache.contents_for(a)) == 3
+            assert len(cache.contents_for(b)) == 5
+
+        assert spy.call_count == 0
+
+    @patch("agent.providers.gemini.chat_client.genai.Client")
+    def test_tool_declarations_converted_once(
+        self, mock_client_class, gemini_api_key, gemini_model
+    ):
+        from agent_framework import ChatOptions, ai_function
+
+        @ai_function
+        async def do_thing(name: str) -> dict:
+            return {"done": True}
+
+        client = GeminiChatClient(model_id=gemini_model, api_key=gemini_api_key)
+        chat_options = ChatOptions(tools=[do_thing])
+
+        with patch(
+            "agent.providers.gemini.cache.to_gemini_tools", return_value=[{"x": 1}]
+        ) as convert:
+            first = client._prepare_options([], chat_options)
+            second = client._prepare_options([], chat_options)
+
+        assert convert.call_count == 1
+        assert first["tools"] is second["tools"]
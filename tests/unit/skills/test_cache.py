@@ -0,0 +1,114 @@
+"""Unit tests for the persistent skill cache."""
+
+import json
+import os
+
+import pytest
+
+from agent.skills.cache import CACHE_VERSION, SkillCache, skill_fingerprint
+
+
+@pytest.fixture
+def skill_dir(tmp_path):
+    """Create a minimal skill directory."""
+    skill = tmp_path / "skills" / "weather"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: weather\ndescription: Weather\n---\n")
+    return skill
+
+
+def _touch(path, offset_ns: int) -> None:
+    """Move a path's mtime forward (filesystems may have coarse timestamps)."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset_ns))
+
+
+@pytest.mark.unit
+@pytest.mark.skills
+class TestSkillFingerprint:
+    """Test skill directory fingerprints."""
+
+    def test_stable_for_unchanged_skill(self, skill_dir):
+        """Should return the same fingerprint for an unchanged skill."""
+        assert skill_fingerprint(skill_dir) == skill_fingerprint(skill_dir)
+
+    def test_changes_with_manifest_scripts_and_sha(self, skill_dir):
+        """Should change when SKILL.md, scripts/ or the commit SHA change."""
+        original = skill_fingerprint(skill_dir)
+
+        _touch(skill_dir / "SKILL.md", 1_000_000_000)
+        edited = skill_fingerprint(skill_dir)
+        assert edited != original
+
+        (skill_dir / "scripts").mkdir()
+        with_scripts = skill_fingerprint(skill_dir)
+        assert with_scripts != edited
+
+        assert skill_fingerprint(skill_dir, "abc123") != with_scripts
+
+    def test_missing_manifest_raises(self, tmp_path):
+        """Should raise OSError for a directory without SKILL.md."""
+        with pytest.raises(OSError):
+            skill_fingerprint(tmp_path)
+
+
+@pytest.mark.unit
+@pytest.mark.skills
+class TestSkillCache:
+    """Test SkillCache persistence and validation."""
+
+    def test_round_trip(self, tmp_path, skill_dir):
+        """Should return saved entries while the fingerprint matches."""
+        path = tmp_path / "cache.json"
+        fingerprint = skill_fingerprint(skill_dir)
+
+        cache = SkillCache(path)
+        assert cache.get(skill_dir, fingerprint) is None
+        cache.put(skill_dir, fingerprint, {"manifest": {"name": "weather"}, "tokens": 5})
+        cache.save()
+
+        reloaded = SkillCache(path)
+        entry = reloaded.get(skill_dir, fingerprint)
+
+        assert entry["manifest"] == {"name": "weather"}
+        assert entry["tokens"] == 5
+        assert reloaded.get(skill_dir, [*fingerprint[:-1], "other-sha"]) is None
+        assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+    def test_save_prunes_unseen_skills(self, tmp_path, skill_dir):
+        """Should drop entries of skills that were not looked up since loading."""
+        path = tmp_path / "cache.json"
+        cache = SkillCache(path)
+        cache.put(skill_dir, [1], {"manifest": {}})
+        cache.put(tmp_path / "removed", [2], {"manifest": {}})
+        cache.save()
+
+        cache = SkillCache(path)
+        cache.get(skill_dir, [1])
+        cache.save()
+
+        assert len(SkillCache(path)) == 1
+
+    def test_unreadable_or_outdated_file_is_empty(self, tmp_path, skill_dir):
+        """Should ignore corrupt files and caches written by another version."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+        assert len(SkillCache(path)) == 0
+
+        path.write_text(
+            json.dumps(
+                {"version": CACHE_VERSION + 1, "skills": {str(skill_dir): {"fingerprint": [1]}}}
+            )
+        )
+        assert len(SkillCache(path)) == 0
+
+    def test_save_errors_are_logged(self, tmp_path, caplog):
+        """Should log instead of raising when the cache cannot be written."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        cache = SkillCache(blocker / "cache.json")
+        cache.put(tmp_path, [1], {"manifest": {}})
+
+        cache.save()
+
+        assert "Failed to write skill cache" in caplog.text
@@ -497,3 +497,37 @@ async def test_hello_extended_triggers():
     messages = [MockMessage("user", "use hola for greeting")]
     result = await provider.invoking(messages)
     assert "hello-extended" in result.instructions
+
+
+@pytest.mark.unit
+@pytest.mark.skills
+@pytest.mark.asyncio
+async def test_injects_most_relevant_skills_within_token_budget():
+    """Test matched skills are ranked and selected under the token budget."""
+    docs = SkillDocumentationIndex()
+    docs.add_skill(
+        "generic",
+        SkillManifest(
+            name="generic",
+            description="Generic helper",
+            triggers=SkillTriggers(verbs=["deploy"]),
+            instructions="# generic\n\n" + "Long generic guidance. " * 200,
+        ),
+    )
+    docs.add_skill(
+        "deployer",
+        SkillManifest(
+            name="deployer",
+            description="Deploy services",
+            triggers=SkillTriggers(keywords=["deploy"]),
+            instructions="# deployer\n\nDeploy services to production.",
+        ),
+    )
+
+    provider = SkillContextProvider(docs, max_skills=3, token_budget=200)
+    result = await provider.invoking([MockMessage("user", "deploy the deployer to production")])
+
+    # deployer is named in the message and ranks first; generic does not fit the budget
+    assert result.instructions.startswith("## Relevant Skill Documentation")
+    assert "### deployer" in result.instructions
+    assert "### generic" not in result.instructions
@@ -1,9 +1,10 @@
 """Unit tests for skill loader."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from agent.skills.cache import SkillCache
 from agent.skills.errors import SkillManifestError
 from agent.skills.loader import SkillLoader
 from agent.skills.manifest import SkillManifest
@@ -81,6 +82,25 @@ class TestSkillLoader:
         assert "status" in script_names
         assert "markets" in script_names
 
+    def test_discover_scripts_cache_ttl(self, mock_settings, tmp_path):
+        """Should attach cache TTLs to scripts the manifest declares cacheable."""
+        loader = SkillLoader(mock_settings)
+
+        skill_path = tmp_path / "test-skill"
+        scripts_dir = skill_path / "scripts"
+        scripts_dir.mkdir(parents=True)
+        (scripts_dir / "lookup.py").write_text("# lookup")
+        (scripts_dir / "update.py").write_text("# update")
+
+        manifest = SkillManifest(
+            name="test-skill", description="test", cacheable={"lookup.py": 600}
+        )
+
+        scripts = {s["name"]: s for s in loader.discover_scripts(skill_path, manifest)}
+
+        assert scripts["lookup"]["cache_ttl"] == 600
+        assert "cache_ttl" not in scripts["update"]
+
     def test_discover_scripts_explicit_list(self, mock_settings, tmp_path):
         """Should use explicit script list from manifest."""
         loader = SkillLoader(mock_settings)
@@ -693,3 +713,67 @@ class TestLoadEnabledSkills:
         metadata = skill_docs.get_all_metadata()
         assert len(metadata) == 1
         assert metadata[0]["name"] == "api-skill"
+
+    def test_load_with_cache_reuses_parsed_skills(self, mock_settings, tmp_path):
+        """Should load unchanged skills from the cache and re-parse edited ones."""
+        bundled_dir = tmp_path / "bundled"
+        skill1 = bundled_dir / "skill1"
+        (skill1 / "scripts").mkdir(parents=True)
+        (skill1 / "SKILL.md").write_text(
+            "---\nname: skill1\ndescription: test skill 1\n---\n\nUse skill1."
+        )
+        (skill1 / "scripts" / "status.py").write_text("print('ok')\n")
+
+        mock_settings.skills.disabled_bundled = []
+        mock_settings.skills.bundled_dir = str(bundled_dir)
+        mock_settings.skills.plugins = []
+        mock_settings.skills.user_dir = None
+
+        cache_path = tmp_path / "skills_cache.json"
+        _, first_wrapper, first_docs = SkillLoader(
+            mock_settings, cache=SkillCache(cache_path)
+        ).load_enabled_skills()
+        assert cache_path.exists()
+
+        cache = SkillCache(cache_path)
+        _, script_wrapper, skill_docs = SkillLoader(
+            mock_settings, cache=cache
+        ).load_enabled_skills()
+
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert script_wrapper.script_count == first_wrapper.script_count == 1
+        assert skill_docs.get_all_metadata() == first_docs.get_all_metadata()
+
+        (skill1 / "SKILL.md").write_text(
+            "---\nname: skill1\ndescription: edited skill 1\n---\n\nUse skill1 again."
+        )
+        cache = SkillCache(cache_path)
+        _, _, skill_docs = SkillLoader(mock_settings, cache=cache).load_enabled_skills()
+
+        assert cache.misses == 1
+        assert skill_docs.get_all_metadata()[0]["brief_description"] == "edited skill 1"
+
+    def test_disabled_skill_toolsets_not_imported(self, mock_settings, tmp_path):
+        """Should not import toolsets of bundled skills that are not loaded."""
+        bundled_dir = tmp_path / "bundled"
+        skill1 = bundled_dir / "skill1"
+        (skill1 / "toolsets").mkdir(parents=True)
+        (skill1 / "SKILL.md").write_text(
+            "---\nname: skill1\ndescription: test\ndefault_enabled: false\n"
+            "toolsets:\n  - toolsets.broken:BrokenToolset\n---\n"
+        )
+        (skill1 / "toolsets" / "broken.py").write_text("raise RuntimeError('imported')\n")
+
+        mock_settings.skills.disabled_bundled = []
+        mock_settings.skills.enabled_bundled = []
+        mock_settings.skills.bundled_dir = str(bundled_dir)
+        mock_settings.skills.plugins = []
+        mock_settings.skills.user_dir = None
+
+        loader = SkillLoader(mock_settings)
+        with patch.object(loader, "_import_toolset") as import_toolset:
+            toolsets, _, skill_docs = loader.load_enabled_skills()
+
+        import_toolset.assert_not_called()
+        assert toolsets == []
+        assert not skill_docs.has_skills()
@@ -123,6 +123,15 @@ class TestSkillManifest:
         manifest = SkillManifest(name="test", description="test")
         assert manifest.scripts is None
 
+    def test_cacheable_script_ttls(self):
+        """Should accept positive per-script cache TTLs and reject others."""
+        manifest = SkillManifest(name="test", description="test", cacheable={"lookup": 3600})
+        assert manifest.cacheable == {"lookup": 3600}
+        assert SkillManifest(name="test", description="test").cacheable == {}
+
+        with pytest.raises(ValidationError):
+            SkillManifest(name="test", description="test", cacheable={"lookup": 0})
+
 
 class TestSkillRegistryEntry:
     """Test SkillRegistryEntry Pydantic model."""
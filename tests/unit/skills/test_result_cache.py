@@ -0,0 +1,125 @@
+"""Unit tests for the skill script result cache."""
+
+import pytest
+
+from agent.skills.result_cache import ScriptResultCache
+
+
+@pytest.fixture
+def script(tmp_path):
+    """Create a script whose content is hashed into cache keys."""
+    path = tmp_path / "lookup.py"
+    path.write_text("print('v1')\n")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a result cache in a temporary directory."""
+    cache = ScriptResultCache(tmp_path / "cache" / "script_results.db")
+    yield cache
+    cache.close()
+
+
+@pytest.mark.unit
+@pytest.mark.skills
+class TestScriptResultCache:
+    """Test ScriptResultCache lookups, expiry and invalidation."""
+
+    def test_miss_then_hit(self, cache, script):
+        """Should count a miss before a result is stored and a hit after."""
+        key = cache.key(script, "run", ["--city", "Paris"])
+
+        assert cache.get(key) is None
+        cache.put(key, {"success": True, "result": "sunny"})
+
+        assert cache.get(key) == {"success": True, "result": "sunny"}
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_key_depends_on_kind_and_args(self, cache, script):
+        """Should key help and runs, and different arguments, separately."""
+        keys = {
+            cache.key(script, "help", []),
+            cache.key(script, "run", []),
+            cache.key(script, "run", ["--json"]),
+        }
+
+        assert len(keys) == 3
+
+    def test_script_edit_invalidates(self, cache, script):
+        """Should not serve results of a previous version of the script."""
+        key = cache.key(script, "run", [])
+        cache.put(key, {"success": True, "result": "v1"})
+
+        script.write_text("print('version 2')\n")
+
+        assert cache.key(script, "run", []) != key
+
+    def test_expired_result_not_served(self, cache, script, monkeypatch):
+        """Should treat results past their TTL as misses."""
+        clock = [1000.0]
+        monkeypatch.setattr("agent.skills.result_cache.time.time", lambda: clock[0])
+        key = cache.key(script, "run", [])
+        cache.put(key, {"success": True}, ttl=60)
+
+        clock[0] += 59
+        assert cache.get(key) is not None
+        clock[0] += 2
+        assert cache.get(key) is None
+
+    def test_results_persist_across_instances(self, tmp_path, script):
+        """Should serve results stored by a previous agent session."""
+        path = tmp_path / "script_results.db"
+        first = ScriptResultCache(path)
+        first.put(first.key(script, "help", []), {"success": True, "result": "usage"})
+        first.close()
+
+        second = ScriptResultCache(path)
+        try:
+            assert second.get(second.key(script, "help", [])) == {
+                "success": True,
+                "result": "usage",
+            }
+            assert len(second) == 1
+        finally:
+            second.close()
+
+    def test_expired_results_purged_on_open(self, tmp_path, script, monkeypatch):
+        """Should drop expired results when the cache file is opened."""
+        clock = [1000.0]
+        monkeypatch.setattr("agent.skills.result_cache.time.time", lambda: clock[0])
+        path = tmp_path / "script_results.db"
+        first = ScriptResultCache(path)
+        first.put(first.key(script, "run", []), {"success": True}, ttl=60)
+        first.close()
+
+        clock[0] += 3600
+        second = ScriptResultCache(path)
+        try:
+            assert len(second) == 0
+        finally:
+            second.close()
+
+    def test_memory_and_disk_bounded(self, tmp_path, script):
+        """Should evict least recently used results beyond the limits."""
+        cache = ScriptResultCache(tmp_path / "r.db", max_entries=20, max_memory_entries=5)
+        try:
+            keys = [cache.key(script, "run", [str(i)]) for i in range(30)]
+            for i, key in enumerate(keys):
+                cache.put(key, {"result": i})
+
+            assert len(cache._memory) == 5
+            assert len(cache) <= 20
+            assert cache.get(keys[0]) is None
+            assert cache.get(keys[-1]) == {"result": 29}
+        finally:
+            cache.close()
+
+    def test_unserializable_response_not_cached(self, cache, script):
+        """Should skip responses that cannot be stored as JSON."""
+        key = cache.key(script, "run", [])
+        cache.put(key, {"result": object()})
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
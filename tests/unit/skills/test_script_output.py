@@ -0,0 +1,82 @@
+"""Unit tests for streaming script output capture."""
+
+import json
+
+import pytest
+
+from agent.skills.script_output import ScriptOutput
+
+
+def _feed_chunks(output: ScriptOutput, data: bytes, size: int) -> None:
+    for start in range(0, len(data), size):
+        output.feed("stdout", data[start : start + size])
+    output.finish()
+
+
+@pytest.mark.unit
+@pytest.mark.skills
+class TestScriptOutput:
+    """Test ScriptOutput capture and incremental JSON parsing."""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 1000])
+    def test_json_parsed_across_chunks(self, size):
+        """Should parse a JSON document split at any point, including in escapes."""
+        value = {"text": 'quote " and \\ backslash ]}', "items": [1, {"nested": "é"}]}
+        output = ScriptOutput(10_000, json_output=True)
+
+        _feed_chunks(output, (json.dumps(value, ensure_ascii=False) + "\n").encode(), size)
+
+        assert output.json_value() == value
+        assert output._json_parsed
+
+    def test_json_trailing_output_rejected(self):
+        """Should reject stdout holding more than one JSON value, like json.loads."""
+        output = ScriptOutput(1000, json_output=True)
+        _feed_chunks(output, b'{"a": 1}\n{"b": 2}\n', 4)
+
+        with pytest.raises(json.JSONDecodeError):
+            output.json_value()
+
+    @pytest.mark.parametrize("stdout", [b"42", b'"text"', b"  null "])
+    def test_json_scalars(self, stdout):
+        """Should still accept top-level JSON scalars."""
+        output = ScriptOutput(1000, json_output=True)
+        _feed_chunks(output, stdout, 2)
+
+        assert output.json_value() == json.loads(stdout)
+
+    def test_stdout_capped(self):
+        """Should keep at most max_output bytes and ask the caller to stop."""
+        output = ScriptOutput(5)
+
+        assert output.feed("stdout", b"abc") is True
+        assert output.feed("stdout", "dé€".encode()) is False
+        output.finish()
+
+        assert output.truncated
+        assert output.stdout_bytes == 5
+        assert output.stdout == "abcd�"
+
+    def test_stderr_keeps_tail(self):
+        """Should keep the last max_output bytes of stderr without stopping the script."""
+        output = ScriptOutput(4)
+
+        assert output.feed("stderr", b"first\n") is True
+        assert output.feed("stderr", b"last") is True
+
+        assert output.stderr == "last"
+        assert not output.truncated
+
+    def test_progress_reports_latest_complete_line(self, monkeypatch):
+        """Should report the latest complete line, throttled."""
+        clock = iter([10.0, 10.1, 11.0])
+        monkeypatch.setattr("agent.skills.script_output.time.monotonic", lambda: next(clock))
+        lines = []
+        output = ScriptOutput(1000, on_progress=lines.append)
+
+        output.feed("stderr", b"step 1\nste")
+        output.feed("stderr", b"p 2\n")
+        output.feed("stdout", b"partial")
+        output.feed("stdout", b" line\n\n")
+
+        assert lines == ["step 1", "partial line"]
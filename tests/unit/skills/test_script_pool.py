@@ -0,0 +1,127 @@
+"""Unit tests for the warm skill script worker pool."""
+
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agent.skills.script_output import ScriptOutput
+from agent.skills.script_pool import ScriptWorkerPool
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="warm runners need os.fork")
+
+SCRIPT = """\
+import argparse
+import json
+import os
+import sys
+import time
+
+RUNS = []
+RUNS.append(1)
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--name", default="world")
+parser.add_argument("--sleep", type=float, default=0)
+parser.add_argument("--fail", action="store_true")
+args = parser.parse_args()
+
+time.sleep(args.sleep)
+if args.fail:
+    print("bad input", file=sys.stderr)
+    sys.exit(3)
+print(json.dumps({"name": args.name, "runner": os.getppid(), "runs": len(RUNS)}))
+"""
+
+
+async def _run(pool, script, args, timeout=10, max_output=1_048_576):
+    """Run a script in the pool, returning (returncode, output)."""
+    output = ScriptOutput(max_output)
+    returncode = await pool.run(script, args, timeout, output)
+    return returncode, output
+
+
+@pytest.fixture
+def script(tmp_path):
+    """Create a script runnable with the current interpreter."""
+    path = tmp_path / "greet.py"
+    path.write_text(SCRIPT)
+    return path
+
+
+@pytest.fixture
+async def pool():
+    """Create a pool whose environments resolve to the current interpreter."""
+    pool = ScriptWorkerPool(idle_ttl=60)
+    with patch.object(pool, "_resolve_interpreter", AsyncMock(return_value=sys.executable)):
+        yield pool
+    await pool.close()
+
+
+@pytest.mark.unit
+@pytest.mark.skills
+class TestScriptWorkerPool:
+    """Test ScriptWorkerPool execution and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_run_reuses_warm_runner(self, pool, script):
+        """Should serve repeated runs from one runner with fresh script state."""
+        returncode, output = await _run(pool, script, ["--name", "a"])
+        first = json.loads(output.stdout)
+        second = json.loads((await _run(pool, script, ["--name", "b"]))[1].stdout)
+
+        assert (returncode, output.stderr) == (0, "")
+        assert first["name"] == "a" and second["name"] == "b"
+        assert first["runner"] == second["runner"]
+        assert second["runs"] == 1
+        assert pool.idle_count == 1
+
+    @pytest.mark.asyncio
+    async def test_run_reports_exit_code_and_stderr(self, pool, script):
+        """Should return the script's exit code and stderr."""
+        returncode, output = await _run(pool, script, ["--fail"])
+
+        assert returncode == 3
+        assert output.stdout == ""
+        assert output.stderr == "bad input\n"
+
+    @pytest.mark.asyncio
+    async def test_output_cap_stops_run(self, pool, script):
+        """Should kill the run once its output exceeds the cap."""
+        returncode, output = await _run(pool, script, ["--name", "x" * 100], max_output=20)
+
+        assert returncode < 0
+        assert output.truncated
+        assert len(output.stdout) == 20
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_runner(self, pool, script):
+        """Should kill the runner of a run that times out."""
+        with pytest.raises(TimeoutError):
+            await _run(pool, script, ["--sleep", "30"], timeout=0.5)
+
+        assert pool.idle_count == 0
+        returncode, _ = await _run(pool, script, [])
+        assert returncode == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_runners_reaped_after_ttl(self, pool, script):
+        """Should stop runners idle for longer than the TTL."""
+        pool.idle_ttl = 0.1
+        await asyncio.gather(*(_run(pool, script, []) for _ in range(3)))
+        assert pool.idle_count == pool.max_idle
+
+        await asyncio.sleep(0.3)
+
+        assert pool.idle_count == 0
+
+    @pytest.mark.asyncio
+    async def test_unresolved_environment_not_pooled(self, script):
+        """Should return None when uv cannot resolve the script's environment."""
+        pool = ScriptWorkerPool(uv_executable=str(script.parent / "missing-uv"))
+
+        assert (await _run(pool, script, []))[0] is None
+        assert pool.idle_count == 0
@@ -1,6 +1,9 @@
 """Unit tests for script wrapper tools."""
 
+import asyncio
 import json
+import sys
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -9,6 +12,25 @@ import pytest
 from agent.skills.script_tools import ScriptToolset
 
 
+def _stream(data: bytes) -> asyncio.StreamReader:
+    """Create a finished stream holding data."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def _mock_process(stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0) -> Mock:
+    """Create a mock subprocess streaming the given output."""
+    process = Mock()
+    process.stdout = _stream(stdout)
+    process.stderr = _stream(stderr)
+    process.wait = AsyncMock(return_value=returncode)
+    process.returncode = returncode
+    process.kill = MagicMock()
+    return process
+
+
 @pytest.fixture
 def mock_settings():
     """Create mock config."""
@@ -112,9 +134,7 @@ class TestScriptHelp:
         toolset = ScriptToolset(mock_settings, sample_scripts)
 
         # Mock subprocess
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(b"Usage: status.py [OPTIONS]", b""))
-        mock_process.returncode = 0
+        mock_process = _mock_process(b"Usage: status.py [OPTIONS]", b"", returncode=0)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await toolset.script_help("kalshi-markets", "status")
@@ -137,16 +157,20 @@ class TestScriptHelp:
         toolset = ScriptToolset(mock_settings, sample_scripts)
         toolset.timeout = 0.1  # Very short timeout
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(side_effect=TimeoutError())
-        mock_process.kill = MagicMock()
+        # Script that never finishes
+        mock_process = _mock_process(returncode=0)
+        mock_process.stdout = asyncio.StreamReader()
+        mock_process.wait = AsyncMock(side_effect=asyncio.Event().wait)
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            with patch("asyncio.wait_for", side_effect=TimeoutError()):
-                result = await toolset.script_help("kalshi-markets", "status")
+        with (
+            patch("asyncio.create_subprocess_exec", return_value=mock_process),
+            patch("agent.skills.script_tools._kill_process_group") as mock_kill,
+        ):
+            result = await toolset.script_help("kalshi-markets", "status")
 
         assert result["success"] is False
         assert result["error"] == "timeout"
+        mock_kill.assert_called_once_with(mock_process)
 
 
 class TestScriptRun:
@@ -158,9 +182,7 @@ class TestScriptRun:
         toolset = ScriptToolset(mock_settings, sample_scripts)
 
         output_data = {"status": "operational", "timestamp": "2025-01-01T00:00:00Z"}
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(json.dumps(output_data).encode(), b""))
-        mock_process.returncode = 0
+        mock_process = _mock_process(json.dumps(output_data).encode(), b"", returncode=0)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await toolset.script_run("kalshi-markets", "status")
@@ -173,9 +195,7 @@ class TestScriptRun:
         """Should return plain text if json=False."""
         toolset = ScriptToolset(mock_settings, sample_scripts)
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(b"Plain text output", b""))
-        mock_process.returncode = 0
+        mock_process = _mock_process(b"Plain text output", b"", returncode=0)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await toolset.script_run("kalshi-markets", "status", json_output=False)
@@ -188,9 +208,7 @@ class TestScriptRun:
         """Should pass arguments to script."""
         toolset = ScriptToolset(mock_settings, sample_scripts)
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(b'{"result": "ok"}', b""))
-        mock_process.returncode = 0
+        mock_process = _mock_process(b'{"result": "ok"}', b"", returncode=0)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
             await toolset.script_run("kalshi-markets", "status", args=["--verbose", "--debug"])
@@ -216,9 +234,7 @@ class TestScriptRun:
         """Should return parse error for invalid JSON."""
         toolset = ScriptToolset(mock_settings, sample_scripts)
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(b"Not JSON", b""))
-        mock_process.returncode = 0
+        mock_process = _mock_process(b"Not JSON", b"", returncode=0)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await toolset.script_run("kalshi-markets", "status", json_output=True)
@@ -231,9 +247,7 @@ class TestScriptRun:
         """Should handle non-zero exit code."""
         toolset = ScriptToolset(mock_settings, sample_scripts)
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(b"", b"Error message"))
-        mock_process.returncode = 1
+        mock_process = _mock_process(b"", b"Error message", returncode=1)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await toolset.script_run("kalshi-markets", "status")
@@ -264,9 +278,7 @@ class TestNameNormalization:
         """Should handle script names with/without .py extension."""
         toolset = ScriptToolset(mock_settings, sample_scripts)
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(b"Help text", b""))
-        mock_process.returncode = 0
+        mock_process = _mock_process(b"Help text", b"", returncode=0)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             # Both formats should work
@@ -275,3 +287,262 @@ class TestNameNormalization:
 
         assert result1["success"] is True
         assert result2["success"] is True
+
+
+class TestOutputStreaming:
+    """Test streaming, size-capped script output capture."""
+
+    @pytest.mark.asyncio
+    async def test_output_cap_stops_script(self, mock_settings, sample_scripts):
+        """Should stop a script once its output exceeds max_output."""
+        toolset = ScriptToolset(mock_settings, sample_scripts)
+        toolset.max_output = 10
+
+        mock_process = _mock_process(b"0123456789abcdef", returncode=-9)
+
+        with (
+            patch("asyncio.create_subprocess_exec", return_value=mock_process),
+            patch("agent.skills.script_tools._kill_process_group") as mock_kill,
+        ):
+            text_result = await toolset.script_run("kalshi-markets", "status", json_output=False)
+
+        mock_kill.assert_called_once_with(mock_process)
+        assert text_result["success"] is True
+        assert text_result["result"] == "0123456789"
+        assert "truncated" in text_result["message"]
+
+        mock_process = _mock_process(b"[1, 2, 3, 4, 5]")
+        with (
+            patch("asyncio.create_subprocess_exec", return_value=mock_process),
+            patch("agent.skills.script_tools._kill_process_group"),
+        ):
+            json_result = await toolset.script_run("kalshi-markets", "status")
+
+        assert json_result["success"] is False
+        assert json_result["error"] == "output_too_large"
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix-specific test")
+    async def test_output_cap_kills_script_started_by_uv(self, mock_settings, tmp_path):
+        """Should kill the script itself, not only the uv wrapper, at the output cap."""
+        script = tmp_path / "flood.py"
+        script.write_text(
+            "import sys, time\n"
+            "sys.stdout.write('x' * 100_000)\n"
+            "sys.stdout.flush()\n"
+            "time.sleep(30)\n"
+        )
+        # Stand-in for `uv run`: runs the script as a child process, like uv does
+        fake_uv = tmp_path / "uv"
+        fake_uv.write_text(f'#!/bin/sh\nshift\n"{sys.executable}" "$@"\nexit $?\n')
+        fake_uv.chmod(0o755)
+
+        toolset = ScriptToolset(mock_settings, {"flood-skill": [{"name": "flood", "path": script}]})
+        toolset.max_output = 1000
+        toolset.timeout = 20
+
+        with patch.object(toolset, "_get_uv_executable", return_value=str(fake_uv)):
+            started = time.monotonic()
+            result = await toolset.script_run("flood-skill", "flood", json_output=False)
+
+        assert time.monotonic() - started < 10
+        assert result["success"] is True
+        assert result["result"] == "x" * 1000
+        assert "truncated" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_progress_reaches_execution_tree(self, mock_settings, sample_scripts):
+        """Should emit output lines as progress events of the running tool."""
+        from agent.display.events import ToolProgressEvent, set_current_tool_event_id
+
+        toolset = ScriptToolset(mock_settings, sample_scripts)
+        emitter = Mock()
+        mock_process = _mock_process(b"", b"fetching markets\n", returncode=1)
+
+        set_current_tool_event_id("tool-1")
+        try:
+            with (
+                patch("agent.skills.script_tools.get_event_emitter", return_value=emitter),
+                patch("asyncio.create_subprocess_exec", return_value=mock_process),
+            ):
+                await toolset.script_run("kalshi-markets", "status")
+        finally:
+            set_current_tool_event_id(None)
+
+        event = emitter.emit.call_args[0][0]
+        assert isinstance(event, ToolProgressEvent)
+        assert event.event_id == "tool-1"
+        assert event.message == "fetching markets"
+
+
+class TestWorkerPoolDispatch:
+    """Test dispatching script runs to a warm worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_run_uses_worker_pool(self, mock_settings, sample_scripts):
+        """Should run scripts in the pool instead of spawning uv run."""
+
+        async def run(script_path, args, timeout, output):
+            output.feed("stdout", b'{"status": "ok"}')
+            return 0
+
+        pool = Mock()
+        pool.run = AsyncMock(side_effect=run)
+        toolset = ScriptToolset(mock_settings, sample_scripts, worker_pool=pool)
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            result = await toolset.script_run("kalshi-markets", "status", args=["--live"])
+
+        mock_exec.assert_not_called()
+        script_path, args, timeout, _ = pool.run.call_args[0]
+        assert script_path == Path("/fake/kalshi-markets/scripts/status.py")
+        assert (args, timeout) == (["--live", "--json"], 60)
+        assert result["result"] == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_uv_run(self, mock_settings, sample_scripts):
+        """Should use uv run for scripts the pool cannot run."""
+        pool = Mock()
+        pool.run = AsyncMock(return_value=None)
+        toolset = ScriptToolset(mock_settings, sample_scripts, worker_pool=pool)
+
+        mock_process = _mock_process(b"Usage: status.py", b"", returncode=0)
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            result = await toolset.script_help("kalshi-markets", "status")
+
+        assert mock_exec.call_args[0][:2] == ("uv", "run")
+        assert result["result"]["help_text"] == "Usage: status.py"
+
+    @pytest.mark.asyncio
+    async def test_pool_timeout(self, mock_settings, sample_scripts):
+        """Should report pool timeouts like uv run timeouts."""
+        pool = Mock()
+        pool.run = AsyncMock(side_effect=TimeoutError())
+        toolset = ScriptToolset(mock_settings, sample_scripts, worker_pool=pool)
+
+        result = await toolset.script_run("kalshi-markets", "status")
+
+        assert result["success"] is False
+        assert result["error"] == "timeout"
+
+
+class TestResultCaching:
+    """Test serving script_help and cacheable script_run results from the cache."""
+
+    @pytest.fixture
+    def scripts(self, tmp_path):
+        """Create real scripts (their content is hashed), one declared cacheable."""
+        lookup = tmp_path / "lookup.py"
+        lookup.write_text("# lookup")
+        update = tmp_path / "update.py"
+        update.write_text("# update")
+        return {
+            "data-skill": [
+                {"name": "lookup", "path": lookup, "cache_ttl": 600},
+                {"name": "update", "path": update},
+            ]
+        }
+
+    @pytest.fixture
+    def result_cache(self, tmp_path):
+        """Create a result cache in a temporary directory."""
+        from agent.skills.result_cache import ScriptResultCache
+
+        cache = ScriptResultCache(tmp_path / "script_results.db")
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def tool_event(self):
+        """Run inside a displayed tool call, so cache info is reported."""
+        from agent.display.events import set_current_tool_event_id
+
+        set_current_tool_event_id("tool-1")
+        yield "tool-1"
+        set_current_tool_event_id(None)
+
+    @pytest.mark.asyncio
+    async def test_help_always_cached(self, mock_settings, scripts, result_cache, tool_event):
+        """Should run --help once per script version."""
+        from agent.display.events import pop_tool_cache_info
+
+        toolset = ScriptToolset(mock_settings, scripts, result_cache=result_cache)
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=lambda *a, **k: _mock_process(b"Usage: update.py"),
+        ) as mock_exec:
+            first = await toolset.script_help("data-skill", "update")
+            first_info = pop_tool_cache_info(tool_event)
+            second = await toolset.script_help("data-skill", "update")
+            second_info = pop_tool_cache_info(tool_event)
+
+        assert mock_exec.call_count == 1
+        assert second == first
+        assert first_info == {"hit": False, "hits": 0, "misses": 1}
+        assert second_info == {"hit": True, "hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_cache_info_not_returned_to_model(
+        self, mock_settings, scripts, result_cache, tool_event
+    ):
+        """Should keep changing cache counters out of otherwise identical results."""
+        from agent.display.events import pop_tool_cache_info
+
+        toolset = ScriptToolset(mock_settings, scripts, result_cache=result_cache)
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=lambda *a, **k: _mock_process(b'{"value": 1}'),
+        ):
+            results = [await toolset.script_run("data-skill", "lookup") for _ in range(3)]
+
+        assert results[0] == results[1] == results[2]
+        assert "cache" not in results[0]
+        assert pop_tool_cache_info(tool_event) == {"hit": True, "hits": 2, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_run_cached_only_when_cacheable(self, mock_settings, scripts, result_cache):
+        """Should cache runs of cacheable scripts per argument list."""
+        from agent.display.events import pop_tool_cache_info
+
+        toolset = ScriptToolset(mock_settings, scripts, result_cache=result_cache)
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=lambda *a, **k: _mock_process(b'{"value": 1}'),
+        ) as mock_exec:
+            first = await toolset.script_run("data-skill", "lookup", args=["a"])
+            cached = await toolset.script_run("data-skill", "lookup", args=["a"])
+            assert mock_exec.call_count == 1
+            assert result_cache.stats()["hits"] == 1
+
+            await toolset.script_run("data-skill", "lookup", args=["b"])
+            assert mock_exec.call_count == 2
+
+            uncached = await toolset.script_run("data-skill", "update")
+            await toolset.script_run("data-skill", "update")
+            assert mock_exec.call_count == 4
+
+        assert cached == first
+        assert cached["result"] == {"value": 1}
+        assert uncached["result"] == {"value": 1}
+        assert result_cache.stats()["misses"] == 2
+        # Outside a displayed tool call nothing is reported
+        assert pop_tool_cache_info("tool-1") == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_runs_not_cached(self, mock_settings, scripts, result_cache):
+        """Should run the script again after a failure."""
+        toolset = ScriptToolset(mock_settings, scripts, result_cache=result_cache)
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=lambda *a, **k: _mock_process(b"", b"boom", returncode=1),
+        ) as mock_exec:
+            await toolset.script_run("data-skill", "lookup")
+            result = await toolset.script_run("data-skill", "lookup")
+
+        assert mock_exec.call_count == 2
+        assert result["success"] is False
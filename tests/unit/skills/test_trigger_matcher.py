@@ -0,0 +1,139 @@
+"""Unit tests for precompiled skill trigger matching."""
+
+import re
+
+import pytest
+
+from agent.skills.documentation_index import SkillDocumentationIndex
+from agent.skills.manifest import SkillManifest, SkillTriggers
+from agent.skills.trigger_matcher import SkillTriggerMatcher
+
+
+def _skill(name: str, keywords=(), verbs=(), patterns=()) -> dict:
+    """Build skill metadata as returned by SkillDocumentationIndex."""
+    return {
+        "name": name,
+        "triggers": {
+            "keywords": [*keywords, name],
+            "verbs": list(verbs),
+            "patterns": list(patterns),
+        },
+    }
+
+
+def _names(skills: list[dict]) -> list[str]:
+    return [skill["name"] for skill in skills]
+
+
+@pytest.mark.unit
+@pytest.mark.skills
+class TestSkillTriggerMatcher:
+    """Test SkillTriggerMatcher matching semantics."""
+
+    def test_terms_match_whole_words_only(self):
+        """Should match keywords and verbs on word boundaries, case-insensitively."""
+        matcher = SkillTriggerMatcher([_skill("runner-tool", keywords=["run"], verbs=["Fetch"])])
+
+        assert _names(matcher.match("RUN the tests")) == ["runner-tool"]
+        assert _names(matcher.match("please fetch it")) == ["runner-tool"]
+        assert matcher.match("I like running and fetching") == []
+
+    def test_multi_word_and_hyphenated_terms(self):
+        """Should match terms spanning several words, including the skill name."""
+        matcher = SkillTriggerMatcher(
+            [_skill("hello-extended"), _skill("searcher", keywords=["web search"])]
+        )
+
+        assert _names(matcher.match("use hello-extended now")) == ["hello-extended"]
+        assert _names(matcher.match("do a web search.")) == ["searcher"]
+        assert matcher.match("web searches") == []
+        assert matcher.match("hello-extendedx") == []
+
+    @pytest.mark.parametrize("term", ["c++", ".net", "-x", "go!"])
+    def test_terms_with_punctuation_edges(self, term):
+        """Should keep regex word-boundary semantics for terms not bounded by word chars."""
+        matcher = SkillTriggerMatcher([_skill("tool", keywords=[term])])
+        reference = re.compile(rf"\b{re.escape(term)}\b")
+
+        for message in [f"use {term} now", f"asp{term}x", f"x{term}", term]:
+            expected = ["tool"] if reference.search(message) else []
+            assert _names(matcher.match(message)) == expected
+
+    def test_patterns_and_skill_order(self):
+        """Should try compiled patterns and return matches in skill order."""
+        matcher = SkillTriggerMatcher(
+            [
+                _skill("calculator", patterns=[r"\d+\s*[\+\-]\s*\d+"]),
+                _skill("greeter", verbs=["say"]),
+            ]
+        )
+
+        assert _names(matcher.match("say what 2 + 2 is")) == ["calculator", "greeter"]
+
+    def test_invalid_patterns_skipped_at_build_time(self, caplog):
+        """Should log invalid regex patterns once and ignore them when matching."""
+        matcher = SkillTriggerMatcher([_skill("bad-regex", patterns=["[invalid(regex"])])
+
+        assert "Invalid regex pattern for bad-regex" in caplog.text
+        assert matcher.match("[invalid(regex") == []
+
+    def test_rank_orders_by_trigger_strength(self):
+        """Should rank a skill named in the message above one matched by a verb."""
+        matcher = SkillTriggerMatcher(
+            [_skill("converter", verbs=["convert"]), _skill("weather", keywords=["forecast"])]
+        )
+
+        ranked = matcher.rank("convert the weather forecast")
+
+        assert _names([skill for skill, _ in ranked]) == ["weather", "converter"]
+        assert ranked[0][1] > ranked[1][1]
+
+    def test_rank_breaks_ties_with_documentation_relevance(self):
+        """Should prefer the skill whose documentation matches the message better."""
+        skills = [
+            {**_skill("alpha", keywords=["report"]), "instructions": "Format tables."},
+            {
+                **_skill("beta", keywords=["report"]),
+                "instructions": "Build sales report charts from quarterly sales data.",
+            },
+        ]
+
+        ranked = SkillTriggerMatcher(skills).rank("report quarterly sales")
+
+        assert _names([skill for skill, _ in ranked]) == ["beta", "alpha"]
+
+    def test_explicit_triggers_flag(self):
+        """Should report explicit triggers only beyond the auto-added name keyword."""
+        assert SkillTriggerMatcher([_skill("weather")]).has_explicit_triggers is False
+        assert SkillTriggerMatcher([_skill("weather", verbs=["forecast"])]).has_explicit_triggers
+
+
+@pytest.mark.unit
+@pytest.mark.skills
+class TestDocumentationIndexMatcher:
+    """Test matcher caching on SkillDocumentationIndex."""
+
+    def test_matcher_rebuilt_after_add_skill(self):
+        """Should reuse the compiled matcher until the index changes."""
+        docs = SkillDocumentationIndex()
+        docs.add_skill(
+            "calculator",
+            SkillManifest(
+                name="calculator",
+                description="Perform mathematical calculations",
+                triggers=SkillTriggers(verbs=["calculate"]),
+            ),
+        )
+        matcher = docs.get_matcher()
+        assert docs.get_matcher() is matcher
+
+        docs.add_skill(
+            "weather", SkillManifest(name="weather", description="Get weather information")
+        )
+
+        assert docs.get_matcher() is not matcher
+        assert all(skill["tokens"] > 0 for skill in docs.get_all_metadata())
+        assert _names(docs.get_matcher().match("weather and calculate")) == [
+            "calculator",
+            "weather",
+        ]
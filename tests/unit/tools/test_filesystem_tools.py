@@ -9,7 +9,9 @@ Comprehensive test suite covering:
 """
 
 import logging
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -132,6 +134,23 @@ class TestFileSystemToolsInitialization:
         assert fs_tools_readonly.apply_text_edit in tools_list
         assert fs_tools_readonly.create_directory in tools_list
 
+    @pytest.mark.asyncio
+    async def test_file_io_runs_off_event_loop(self, fs_tools_readonly):
+        """Test tools run inline but do their blocking file I/O in a worker thread."""
+        io_threads = []
+        resolve_path = FileSystemTools._resolve_path
+
+        def recording_resolve(self, relative_path):
+            io_threads.append(threading.get_ident())
+            return resolve_path(self, relative_path)
+
+        with patch.object(FileSystemTools, "_resolve_path", recording_resolve):
+            result = await fs_tools_readonly.get_path_info(".")
+
+        assert result["success"] is True
+        assert io_threads and threading.get_ident() not in io_threads
+        assert all(policy.venue == "inline" for policy in FileSystemTools.tool_policies.values())
+
     def test_workspace_root_caching(self, fs_tools_readonly, temp_workspace):
         """Test workspace root is cached after first access."""
         # Access workspace root
@@ -744,6 +763,22 @@ class TestSearchText:
         for match in matches:
             assert match["file"].endswith(".py")
 
+    @pytest.mark.asyncio
+    async def test_search_text_star_glob_is_recursive(self, fs_tools_readonly, sample_files):
+        """Test glob '*' searches subdirectories, like the default '**/*'."""
+        result = await fs_tools_readonly.search_text("Content in subdir", path=".", glob="*")
+
+        assert result["success"] is True
+        assert [m["file"] for m in result["result"]["matches"]] == ["subdir/file3.txt"]
+
+    @pytest.mark.asyncio
+    async def test_search_text_glob_invalid(self, fs_tools_readonly, sample_files):
+        """Test malformed glob pattern returns error."""
+        result = await fs_tools_readonly.search_text("Hello", path=".", glob="[z-a]*")
+
+        assert result["success"] is False
+        assert result["error"] == "invalid_glob"
+
     @pytest.mark.asyncio
     async def test_search_text_max_matches(self, fs_tools_readonly, temp_workspace):
         """Test max_matches limit is enforced."""
@@ -781,6 +816,21 @@ class TestSearchText:
         assert len(result["result"]["matches"]) == 0
         assert result["result"]["truncated"] is False
 
+    @pytest.mark.asyncio
+    async def test_search_text_skips_ignored_and_hidden_dirs(
+        self, fs_tools_readonly, temp_workspace
+    ):
+        """Test .gitignore'd paths and hidden directories are not searched."""
+        (temp_workspace / ".gitignore").write_text("dist/\n*.min.js\n")
+        for name in ["dist/app.js", "app.min.js", ".venv/lib.py", "src/app.js"]:
+            (temp_workspace / name).parent.mkdir(parents=True, exist_ok=True)
+            (temp_workspace / name).write_text("MATCH\n")
+
+        result = await fs_tools_readonly.search_text("MATCH", path=".")
+
+        assert result["success"] is True
+        assert [m["file"] for m in result["result"]["matches"]] == [str(Path("src/app.js"))]
+
     @pytest.mark.asyncio
     async def test_search_text_single_file(self, fs_tools_readonly, sample_files):
         """Test searching in a single file instead of directory."""
@@ -0,0 +1,168 @@
+"""Unit tests for agent.tools.scheduler module."""
+
+import asyncio
+import contextvars
+import os
+import threading
+
+import pytest
+
+from agent.tools.scheduler import ToolScheduler
+from agent.tools.toolset import AgentToolset, ToolPolicy
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+class PolicyTools(AgentToolset):
+    """Toolset declaring execution policies for scheduler tests."""
+
+    tool_policies = {
+        "limited": ToolPolicy(max_concurrency=2),
+        "slow": ToolPolicy(timeout=0.05),
+        "blocking": ToolPolicy(venue="thread"),
+        "compute": ToolPolicy(venue="process"),
+    }
+
+    def get_tools(self) -> list:
+        return []
+
+
+class ConcurrencyProbe:
+    """Tool call body recording the peak number of concurrent calls."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self) -> str:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.02)
+        self.running -= 1
+        return "done"
+
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler with the test toolset registered."""
+    scheduler = ToolScheduler(max_concurrency=8)
+    scheduler.register(PolicyTools(None))
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.tools
+class TestToolPolicy:
+    """Tests for ToolPolicy validation."""
+
+    def test_defaults_run_inline_unlimited(self):
+        """Test default policy has no limits and runs inline."""
+        policy = ToolPolicy()
+
+        assert (policy.max_concurrency, policy.timeout, policy.venue) == (None, None, "inline")
+
+    @pytest.mark.parametrize("kwargs", [{"max_concurrency": 0}, {"timeout": 0}, {"venue": "gpu"}])
+    def test_invalid_policy_rejected(self, kwargs):
+        """Test invalid limits and venues raise ValueError."""
+        with pytest.raises(ValueError):
+            ToolPolicy(**kwargs)
+
+
+@pytest.mark.unit
+@pytest.mark.tools
+class TestToolScheduler:
+    """Tests for ToolScheduler."""
+
+    def test_undeclared_tool_gets_default_policy(self, scheduler):
+        """Test tools without a declared policy run inline without limits."""
+        assert scheduler.policy("limited").max_concurrency == 2
+        assert scheduler.policy("other") == ToolPolicy()
+
+    @pytest.mark.asyncio
+    async def test_tool_concurrency_limited(self, scheduler):
+        """Test calls beyond a tool's limit wait in the queue."""
+        probe = ConcurrencyProbe()
+
+        calls = await asyncio.gather(*(scheduler.run("limited", probe) for _ in range(5)))
+
+        assert probe.peak == 2
+        assert all(call.result == "done" for call in calls)
+        assert max(call.queue_wait for call in calls) > 0.01
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_limited(self):
+        """Test the agent-wide limit applies across tools."""
+        scheduler = ToolScheduler(max_concurrency=1)
+        probe = ConcurrencyProbe()
+
+        await asyncio.gather(scheduler.run("a", probe), scheduler.run("b", probe))
+
+        assert probe.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_nested_calls_bypass_limits(self):
+        """Test a tool calling a tool runs under its parent's slot instead of deadlocking."""
+        scheduler = ToolScheduler(max_concurrency=1)
+
+        async def parent() -> str:
+            child = await scheduler.run("child", lambda: asyncio.sleep(0, result="child"))
+            return f"parent of {child.result}"
+
+        call = await asyncio.wait_for(scheduler.run("parent", parent), timeout=1)
+
+        assert call.result == "parent of child"
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, scheduler):
+        """Test calls exceeding the policy timeout raise TimeoutError."""
+        with pytest.raises(TimeoutError, match="'slow' timed out after 0.05s"):
+            await scheduler.run("slow", lambda: asyncio.sleep(1))
+
+        # Slots are released after a timeout
+        assert (await scheduler.run("limited", lambda: asyncio.sleep(0, result=1))).result == 1
+
+    @pytest.mark.asyncio
+    async def test_thread_venue_runs_off_event_loop(self, scheduler):
+        """Test thread venue calls run in a worker thread with the caller's context."""
+        request_id.set("req-1")
+
+        def blocking() -> tuple[int, str]:
+            return threading.get_ident(), request_id.get()
+
+        call = await scheduler.run("blocking", ConcurrencyProbe(), direct_call=(blocking, {}))
+
+        assert call.venue == "thread"
+        assert call.result[0] != threading.get_ident()
+        assert call.result[1] == "req-1"
+
+    @pytest.mark.asyncio
+    async def test_async_tool_runs_inline_in_thread_venue(self, scheduler):
+        """Test async tools stay on the caller's event loop whatever their venue."""
+
+        async def tool() -> int:
+            return threading.get_ident()
+
+        call = await scheduler.run("blocking", tool, direct_call=(tool, {}))
+        without_function = await scheduler.run("blocking", tool)
+
+        assert call.venue == without_function.venue == "inline"
+        assert call.result == without_function.result == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_process_venue_runs_in_worker_process(self, scheduler):
+        """Test process venue calls run the tool function in a worker process."""
+        call = await scheduler.run("compute", ConcurrencyProbe(), direct_call=(os.getpid, {}))
+
+        assert call.venue == "process"
+        assert call.result != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_process_call_runs_in_thread(self, scheduler):
+        """Test process venue falls back to a thread when the call cannot be pickled."""
+        probe = ConcurrencyProbe()
+
+        call = await scheduler.run("compute", probe, direct_call=(lambda: "x", {}))
+
+        assert call.venue == "thread"
+        assert call.result == "x"
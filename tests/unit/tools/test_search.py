@@ -0,0 +1,207 @@
+"""Unit tests for agent.tools.search module."""
+
+import pytest
+
+from agent.tools.search import GitIgnore, TextMatcher, TextSearchEngine, compile_glob
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Create a small repository-like workspace.
+
+    Structure:
+        workspace/
+            .gitignore          (build/, *.log, !keep.log, /top.txt)
+            app.py
+            top.txt
+            debug.log
+            keep.log
+            .env
+            .git/config
+            .cache/data.txt
+            build/out.py
+            src/
+                .gitignore      (generated/)
+                main.py
+                top.txt
+                generated/gen.py
+                deep/util.py
+    """
+    root = tmp_path / "workspace"
+    files = {
+        ".gitignore": "# comment\nbuild/\n*.log\n!keep.log\n/top.txt\n",
+        "app.py": "def app():\n    return 'needle'\n",
+        "top.txt": "needle\n",
+        "debug.log": "needle\n",
+        "keep.log": "needle\n",
+        ".env": "needle\n",
+        ".git/config": "needle\n",
+        ".cache/data.txt": "needle\n",
+        "build/out.py": "needle\n",
+        "src/.gitignore": "generated/\n",
+        "src/main.py": "import os\n\nprint('needle')\n",
+        "src/top.txt": "needle\n",
+        "src/generated/gen.py": "needle\n",
+        "src/deep/util.py": "needle = 1\n",
+    }
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+@pytest.fixture
+def engine(workspace):
+    """Create a search engine for the workspace."""
+    engine = TextSearchEngine(workspace, max_workers=4)
+    yield engine
+    engine.close()
+
+
+def _files(engine, root, glob="**/*"):
+    return [rel for rel, _ in engine.walk(root, glob)]
+
+
+@pytest.mark.unit
+@pytest.mark.tools
+class TestGlobAndIgnoreRules:
+    """Tests for glob translation and .gitignore parsing."""
+
+    @pytest.mark.parametrize(
+        "pattern,path,expected",
+        [
+            ("*.py", "app.py", True),
+            ("*.py", "src/main.py", False),
+            ("*", "src/deep/util.py", True),
+            ("**/*.py", "app.py", True),
+            ("**/*.py", "src/deep/util.py", True),
+            ("src/**/*.py", "src/main.py", True),
+            ("src/**/*.py", "src/deep/util.py", True),
+            ("src/**/*.py", "app.py", False),
+            ("file?.[tc]xt", "file1.txt", True),
+            ("file?.[!t]xt", "file1.txt", False),
+        ],
+    )
+    def test_compile_glob(self, pattern, path, expected):
+        """Test globs follow Path.glob semantics (except a bare '*', which is recursive)."""
+        assert bool(compile_glob(pattern).match(path)) is expected
+
+    def test_gitignore_rules(self):
+        """Test unanchored, anchored, directory-only and negated rules."""
+        gitignore = GitIgnore("src", ["*.log", "!keep.log", "/dist", "cache/", "docs/**/*.md"])
+
+        assert gitignore.match("src/a/b.log", False) is True
+        assert gitignore.match("src/keep.log", False) is False
+        assert gitignore.match("src/dist", True) is True
+        assert gitignore.match("src/a/dist", True) is None
+        assert gitignore.match("src/a/cache", True) is True
+        assert gitignore.match("src/a/cache", False) is None
+        assert gitignore.match("src/docs/x/y.md", False) is True
+        assert gitignore.match("other/a.log", False) is None
+
+
+@pytest.mark.unit
+@pytest.mark.tools
+class TestTextSearchEngine:
+    """Tests for TextSearchEngine."""
+
+    def test_walk_prunes_hidden_and_ignored(self, engine, workspace):
+        """Test hidden directories and .gitignore'd paths are skipped."""
+        assert _files(engine, workspace) == [
+            ".env",
+            ".gitignore",
+            "app.py",
+            "keep.log",
+            "src/.gitignore",
+            "src/deep/util.py",
+            "src/main.py",
+            "src/top.txt",
+        ]
+
+    def test_walk_applies_parent_gitignores(self, engine, workspace):
+        """Test .gitignore files above the search root still apply."""
+        (workspace / "src" / "debug.log").write_text("needle\n")
+
+        assert _files(engine, workspace / "src", "**/*.log") == []
+
+    def test_walk_glob_relative_to_search_root(self, engine, workspace):
+        """Test globs are matched relative to the searched directory."""
+        assert _files(engine, workspace / "src", "*.py") == ["src/main.py"]
+
+    def test_search_literal(self, engine, workspace):
+        """Test literal matches report line numbers and character offsets."""
+        result = engine.search(workspace, TextMatcher("needle"), glob="**/*.py")
+
+        assert [(m["file"], m["line"]) for m in result.matches] == [
+            ("app.py", 2),
+            ("src/deep/util.py", 1),
+            ("src/main.py", 3),
+        ]
+        assert result.matches[0]["snippet"] == "return 'needle'"
+        assert (result.matches[0]["match_start"], result.matches[0]["match_end"]) == (12, 18)
+        assert result.files_searched == 3
+        assert result.truncated is False
+
+    def test_search_stops_at_max_matches(self, engine, workspace):
+        """Test scanning stops once max_matches is reached."""
+        for i in range(50):
+            (workspace / f"many{i:02d}.txt").write_text("needle\nneedle\n")
+
+        result = engine.search(workspace, TextMatcher("needle"), max_matches=5)
+
+        assert len(result.matches) == 5
+        assert result.truncated is True
+        assert result.files_searched < 10
+        assert [m["file"] for m in result.matches] == [
+            ".env",
+            "app.py",
+            "keep.log",
+            "many00.txt",
+            "many00.txt",
+        ]
+
+    def test_search_skips_binary_files(self, engine, workspace):
+        """Test files with a NUL byte in their first block are skipped."""
+        (workspace / "blob.bin").write_bytes(b"\x00needle\n")
+
+        result = engine.search(workspace / "blob.bin", TextMatcher("needle"))
+
+        assert result.matches == []
+        assert result.files_searched == 1
+
+    @pytest.mark.parametrize(
+        "matcher",
+        [
+            TextMatcher("NÉEDLE", case_sensitive=False),
+            TextMatcher(r"n[e-é]+dle\b", use_regex=True),
+            TextMatcher(r"(?<!\w)néedle", use_regex=True),
+        ],
+    )
+    def test_search_matches_line_by_line_semantics(self, engine, workspace, matcher):
+        """Test offsets are character based and lines split on any newline style."""
+        (workspace / "notes.txt").write_bytes("héllo\r\nsay néedle\rnéedle\n".encode())
+
+        result = engine.search(workspace / "notes.txt", matcher)
+
+        assert [(m["line"], m["match_start"]) for m in result.matches] == [(2, 4), (3, 0)]
+
+    def test_search_matches_same_lines_as_naive_scan(self, engine, workspace):
+        """Test whole-file matching finds exactly the lines a per-line scan finds."""
+        text = "ab\nxabx\n\nab ab\nAB\na\nb\nab"
+        (workspace / "mix.txt").write_text(text)
+        lines = text.split("\n")
+
+        for query, case_sensitive in [("ab", True), ("ab", False), ("", True)]:
+            needle = query if case_sensitive else query.lower()
+            expected = [
+                i + 1
+                for i, line in enumerate(lines)
+                if needle in (line if case_sensitive else line.lower())
+            ]
+            matcher = TextMatcher(query, case_sensitive=case_sensitive)
+            result = engine.search(workspace / "mix.txt", matcher, max_matches=100)
+            assert [m["line"] for m in result.matches] == expected, query
+
+        # Literal queries never match across lines
+        assert engine.search(workspace / "mix.txt", TextMatcher("a\nb")).matches == []
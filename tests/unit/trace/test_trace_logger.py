@@ -590,3 +590,21 @@ class TestEdgeCases:
 
         entry = json.loads(trace_file.read_text().strip())
         assert entry["messages"][0]["content"] == "Hello 世界 🌍"
+
+    def test_log_redacts_secrets(self, tmp_path: Path):
+        """Test logged messages, instructions and responses are scrubbed of secrets."""
+        trace_file = tmp_path / "trace.log"
+        logger = TraceLogger(trace_file=trace_file, include_messages=True)
+
+        logger.log_request(
+            request_id="req-1",
+            messages=[{"role": "user", "content": "password=hunter2"}],
+            system_instructions="Use Bearer abc123xyz789",
+        )
+        logger.log_response(request_id="req-1", response_content="api_key: k-42")
+
+        text = trace_file.read_text()
+        assert "hunter2" not in text
+        assert "abc123xyz789" not in text
+        assert "k-42" not in text
+        assert text.count("[REDACTED]") == 3
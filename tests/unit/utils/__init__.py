@@ -0,0 +1 @@
+"""Unit tests for utils module."""
@@ -0,0 +1,78 @@
+"""Unit tests for agent.utils.redaction module."""
+
+import pytest
+
+from agent.utils.redaction import REDACTED, Redactor, redact, redact_value
+
+
+@pytest.mark.unit
+class TestRedact:
+    """Tests for the default secret patterns."""
+
+    @pytest.mark.parametrize(
+        "text,secret",
+        [
+            ("My API key is sk_test_1234567890abcdefghij", "sk_test_"),
+            ("Use Bearer abc123xyz789 for auth", "abc123xyz789"),
+            ('config: {"api_key": "k-42"}', "k-42"),
+            ("TOKEN=abcdefghijklmnopqrstuvwxyz", "abcdefghijklmnopqrstuvwxyz"),
+            ("password: super_secret_123", "super_secret_123"),
+        ],
+    )
+    def test_redacts_default_patterns(self, text, secret):
+        """Test each default pattern is redacted, case-insensitively."""
+        redacted, count = redact(text)
+
+        assert count == 1
+        assert REDACTED in redacted
+        assert secret not in redacted
+
+    def test_clean_text_is_unchanged(self):
+        """Test text mentioning anchors without secrets is returned as-is."""
+        text = "The token budget and the sk tool are documented; passwords are hashed."
+
+        assert redact(text) == (text, 0)
+        assert redact("") == ("", 0)
+
+    def test_multiple_secrets_in_one_pass(self):
+        """Test all secrets are redacted and surrounding text is kept."""
+        text = "a password=x1 b Bearer t.k c sk-" + "z" * 24 + " d"
+
+        redacted, count = redact(text)
+
+        assert count == 3
+        assert redacted == f"a {REDACTED} b {REDACTED} c {REDACTED} d"
+
+    def test_non_ascii_text(self):
+        """Test non-ASCII text is still redacted."""
+        redacted, count = redact("Привет, password=секрет")
+
+        assert count == 1
+        assert "секрет" not in redacted
+
+    def test_redact_value_recurses_into_containers(self):
+        """Test strings nested in dicts and lists are redacted; keys and non-strings kept."""
+        value = {"messages": [{"content": "password=hunter2", "n": 1}], "password": ("ok",)}
+
+        assert redact_value(value) == {
+            "messages": [{"content": REDACTED, "n": 1}],
+            "password": ("ok",),
+        }
+
+
+@pytest.mark.unit
+class TestRedactor:
+    """Tests for custom Redactor instances."""
+
+    def test_custom_patterns_and_replacement(self):
+        """Test custom anchors, patterns and replacement text."""
+        redactor = Redactor([("ghp_", r"ghp_[A-Za-z0-9]{8,}")], replacement="***")
+
+        assert redactor.redact("push with GHP_abcdefgh12") == ("push with ***", 1)
+
+    def test_requires_anchored_patterns(self):
+        """Test missing patterns or empty anchors are rejected."""
+        with pytest.raises(ValueError):
+            Redactor([])
+        with pytest.raises(ValueError):
+            Redactor([("", r"\d+")])
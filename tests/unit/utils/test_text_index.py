@@ -0,0 +1,82 @@
+"""Unit tests for agent.utils.text_index module."""
+
+import pytest
+
+from agent.utils.text_index import InvertedIndex, tokenize
+
+
+@pytest.mark.unit
+class TestTokenize:
+    """Tests for query/document normalization."""
+
+    def test_casefolds_and_strips_punctuation(self):
+        assert tokenize("Nice to meet you, ALICE!") == ["nice", "meet", "alice"]
+
+    def test_empty_text(self):
+        assert tokenize("  ...  ") == []
+
+
+@pytest.mark.unit
+class TestInvertedIndex:
+    """Tests for InvertedIndex."""
+
+    def test_search_returns_matching_documents(self):
+        index = InvertedIndex()
+        index.add(0, "My name is Alice")
+        index.add(1, "I like Python")
+
+        results = index.search("alice", limit=5)
+
+        assert [doc_id for doc_id, _ in results] == [0]
+
+    def test_rare_terms_outrank_common_terms(self):
+        index = InvertedIndex()
+        for i in range(20):
+            index.add(i, f"python note {i}")
+        index.add(20, "python and rust")
+
+        results = index.search("python rust", limit=3)
+
+        assert results[0][0] == 20
+        assert len(results) == 3
+
+    def test_shorter_documents_score_higher(self):
+        index = InvertedIndex(recency_weight=0.0)
+        index.add(0, "alice " + "filler " * 30)
+        index.add(1, "alice likes tea")
+
+        assert index.search("alice", limit=2)[0][0] == 1
+
+    def test_recency_breaks_ties(self):
+        index = InvertedIndex()
+        index.add(0, "python tips")
+        index.add(1, "python tips")
+
+        assert [doc_id for doc_id, _ in index.search("python", limit=2)] == [1, 0]
+
+    def test_common_only_matches_fill_remaining_slots(self):
+        index = InvertedIndex()
+        for i in range(10):
+            index.add(i, "python")
+        index.add(10, "java")
+
+        results = index.search("python java", limit=5)
+
+        assert results[0][0] == 10
+        assert len(results) == 5
+
+    def test_remove_and_clear(self):
+        index = InvertedIndex()
+        index.add(0, "alpha beta")
+        index.add(1, "beta gamma")
+
+        index.remove(0, "alpha beta")
+        assert index.search("alpha", limit=5) == []
+        assert [d for d, _ in index.search("beta", limit=5)] == [1]
+
+        index.remove(1)
+        assert len(index) == 0
+
+        index.add(2, "delta")
+        index.clear()
+        assert index.search("delta", limit=5) == []